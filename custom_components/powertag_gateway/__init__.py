@@ -7,18 +7,31 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform, CONF_HOST, CONF_PORT, CONF_INTERNAL_URL
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.typing import ConfigType
 from pymodbus.exceptions import ConnectionException
 
 from .const import (
     CONF_CLIENT,
+    CONF_COORDINATOR,
+    CONF_INVENTORY,
     DOMAIN,
     CONF_TYPE_OF_GATEWAY,
     CONF_DEVICE_UNIQUE_ID_VERSION,
+    CONF_POOL_SIZE,
+    CONF_PIPELINE_WINDOW,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_PIPELINE_WINDOW,
 )
+from .coordinator import PowerTagCoordinator, PollingTier, DEFAULT_INTERVALS
+from .inventory import Inventory, InventoryStore, use_register_map
 from .schneider_modbus import SchneiderModbus, TypeOfGateway
+from .services import async_setup_services
 
 PLATFORMS = [Platform.BINARY_SENSOR, Platform.BUTTON, Platform.SENSOR]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -28,6 +41,12 @@ class UniqueIdVersion(Enum):
     V2 = auto()
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the services, once for all gateways."""
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up EcoStruxure PowerTag Link Gateway from a config entry."""
     hass.data.setdefault(DOMAIN, {})
@@ -47,22 +66,109 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     else:
         unique_id_version = UniqueIdVersion(unique_id_version_val)
 
+    pool_size = entry.options.get(CONF_POOL_SIZE, DEFAULT_POOL_SIZE)
+    pipeline_window = entry.options.get(CONF_PIPELINE_WINDOW, DEFAULT_PIPELINE_WINDOW)
+    intervals = {tier: entry.options.get(tier.value, DEFAULT_INTERVALS[tier]) for tier in PollingTier}
+
+    client = SchneiderModbus(host, type_of_gateway, port, pool_size=pool_size, pipeline_window=pipeline_window)
     try:
-        client = await SchneiderModbus.create(host, type_of_gateway, port)
+        # The serial number lives on the gateway itself, so it's known before the synthesis table is found
+        gateway_serial = await client.serial_number()
+        store = InventoryStore(hass, gateway_serial) if gateway_serial else None
+        if store is not None:
+            await store.async_load()
+
+        await client.locate_synthetic_table(store.synthetic_slave_id if store else None)
+
+        inventory = None
+        if store is not None:
+            await store.async_save_synthetic_slave_id(client.synthetic_slave_id)
+            inventory = store.inventory
+
+        if inventory is None:
+            inventory = await Inventory.create(client, presentation_url)
+            if store is not None:
+                await store.async_save_inventory(inventory)
+        else:
+            _LOGGER.debug(f"Using the stored inventory of {gateway_serial}, will verify it in the background")
+            entry.async_create_background_task(
+                hass,
+                async_revalidate_inventory(hass, entry, client, store, inventory, presentation_url),
+                f"{DOMAIN} revalidate inventory",
+            )
     except ConnectionException as e:
+        client.close()
         raise ConfigEntryNotReady from e
 
+    use_register_map(client, inventory)
+
+    gateway_device = inventory.gateway_device
+    device_registry = dr.async_get(hass)
+    device_registry.async_get_or_create(
+        config_entry_id=entry.entry_id,
+        identifiers=gateway_device["identifiers"],
+        manufacturer=gateway_device.get("manufacturer"),
+        model=gateway_device.get("model"),
+        name=gateway_device.get("name"),
+        sw_version=gateway_device.get("sw_version"),
+        hw_version=gateway_device.get("hw_version"),
+        configuration_url=gateway_device.get("configuration_url"),
+        serial_number=gateway_device.get("serial_number"),
+    )
+
     hass.data[DOMAIN][entry.entry_id] = {
         CONF_CLIENT: client,
+        CONF_INVENTORY: inventory,
+        CONF_COORDINATOR: PowerTagCoordinator(hass, client, intervals),
         CONF_INTERNAL_URL: presentation_url,
         CONF_DEVICE_UNIQUE_ID_VERSION: unique_id_version,
     }
 
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # All entities have registered themselves by now, so the first cycle can fetch everything at once
+    entry.async_create_background_task(
+        hass, hass.data[DOMAIN][entry.entry_id][CONF_COORDINATOR].async_refresh(), f"{DOMAIN} first refresh"
+    )
+
     return True
 
 
+async def async_revalidate_inventory(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    client: SchneiderModbus,
+    store: InventoryStore,
+    inventory: Inventory,
+    presentation_url: str,
+):
+    """Rescans the gateway, and reloads the entry if its devices changed since the inventory was stored."""
+    try:
+        latest = await Inventory.create(client, presentation_url, known=inventory)
+    except Exception as e:
+        _LOGGER.warning(f"Could not verify the stored inventory: {e}")
+        return
+
+    if latest.gateway_serial != inventory.gateway_serial:
+        _LOGGER.debug("Gateway did not respond while verifying the stored inventory, keeping it")
+        return
+
+    if latest.as_dict() == inventory.as_dict():
+        _LOGGER.debug("The stored inventory is up to date")
+        return
+
+    _LOGGER.info("The devices of the gateway have changed, reloading...")
+    await store.async_save_inventory(latest)
+    hass.config_entries.async_schedule_reload(entry.entry_id)
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when its options have changed."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
     if data is None:
@@ -73,8 +179,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     client = data.get(CONF_CLIENT)
     if client is not None:
         try:
-            if getattr(client, "client", None) is not None:
-                client.client.close()
+            client.close()
         except Exception as err:
             _LOGGER.warning("Error while closing Modbus client: %s", err)
     hass.data[DOMAIN].pop(entry.entry_id)
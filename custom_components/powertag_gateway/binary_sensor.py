@@ -2,15 +2,22 @@ import logging
 
 from homeassistant.components.binary_sensor import BinarySensorEntity, BinarySensorDeviceClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_INTERNAL_URL
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import CONF_CLIENT, DOMAIN, UniqueIdVersion
+from .const import CONF_INVENTORY, EVENT_ALARM_RAISED, EVENT_ALARM_CLEARED
 from .device_features import FeatureClass
-from .entity_base import WirelessDeviceEntity, GatewayEntity, async_setup_entities, gateway_device_info
-from .schneider_modbus import SchneiderModbus, LinkStatus, PanelHealth, TypeOfGateway
+from .entity_base import WirelessDeviceEntity, GatewayEntity, async_setup_entities
+from .schneider_modbus import (
+    SchneiderModbus,
+    LinkStatus,
+    PanelHealth,
+    TypeOfGateway,
+    AlarmDetails,
+    alarm_transitions,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,13 +37,13 @@ async def async_setup_entry(
     """Set up PowerTag Link Gateway from a config entry."""
 
     binary_sensors = list_binary_sensors()
-    entities = await async_setup_entities(hass, config_entry, binary_sensors)
+    entities = async_setup_entities(hass, config_entry, binary_sensors)
 
     data = hass.data[DOMAIN][config_entry.entry_id]
-    presentation_url = data[CONF_INTERNAL_URL]
     client = data[CONF_CLIENT]
-    gateway_device = await gateway_device_info(client, presentation_url)
-    gateway_serial = await client.serial_number()
+    inventory = data[CONF_INVENTORY]
+    gateway_device = inventory.gateway_device
+    gateway_serial = inventory.gateway_serial
 
     entities.extend([gateway_entity for gateway_entity
                      in [GatewayStatus(client, gateway_device, gateway_serial), GatewayHealth(client, gateway_device, gateway_serial)]
@@ -94,28 +101,59 @@ class PowerTagRadioCommunicationValid(WirelessDeviceEntity, BinarySensorEntity):
         return type_of_gateway in [TypeOfGateway.SMARTLINK, TypeOfGateway.POWERTAG_LINK, TypeOfGateway.PANEL_SERVER]
 
 
-class PowerTagAlarm(WirelessDeviceEntity, BinarySensorEntity):
+class AlarmEntity(WirelessDeviceEntity, BinarySensorEntity):
+    """Alarms of a device, which only change state when its bitmask does.
+
+    Fires an event for each alarm that is raised or cleared since the previous update, so automations don't need to
+    compare attributes.
+    """
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _bitmask: int | None = None
 
+    async def async_update(self):
+        bitmask = await self._client.tag_alarm_bitmask(self._modbus_index)
+        if not self._handle_availability(bitmask) or bitmask == self._bitmask:
+            return
+        # The first bitmask is what the alarms already were, rather than a change
+        if self._bitmask is not None:
+            self._fire_transitions(self._bitmask, bitmask)
+        self._bitmask = bitmask
+        self._update_alarm(AlarmDetails(bitmask))
+
+    def _update_alarm(self, alarm: AlarmDetails):
+        raise NotImplementedError()
+
+    def _fire_transitions(self, before: int, after: int):
+        raised, cleared = alarm_transitions(before, after)
+        for event_type, flags in [(EVENT_ALARM_RAISED, raised), (EVENT_ALARM_CLEARED, cleared)]:
+            for flag in flags:
+                _LOGGER.debug(f"{self.entity_id}: {event_type} {flag.name}")
+                self.hass.bus.async_fire(event_type, {
+                    "entity_id": self.entity_id,
+                    "device_id": self.registry_entry.device_id if self.registry_entry else None,
+                    "modbus_address": self._modbus_index,
+                    "alarm": flag.name.lower(),
+                    "bit": flag.bit_length() - 1,
+                })
+
+
+class PowerTagAlarm(AlarmEntity):
     def __init__(self, client: SchneiderModbus, modbus_index: int, tag_device: DeviceInfo, unique_id_version: UniqueIdVersion, serial_number: str):
         super().__init__(client, modbus_index, tag_device, "alarm info", unique_id_version, serial_number)
 
-    async def async_update(self):
-        alarm = await self._client.tag_get_alarm(self._modbus_index)
-        if self._handle_availability(alarm):
-            if alarm.has_alarm != self._attr_is_on:
-                self._attr_is_on = alarm.has_alarm
-                self._attr_extra_state_attributes = {
-                    "Voltage loss": alarm.voltage_loss,
-                    "Current overload when voltage loss": alarm.current_overload_when_voltage_loss,
-                    "Current short-circuit": alarm.current_short_circuit,
-                    "Overload 45%": alarm.current_overload_45_percent,
-                    "Load current loss": alarm.load_current_loss,
-                    "Overvoltage 120%": alarm.overvoltage_120_percent,
-                    "Undervoltage 80%": alarm.undervoltage_80_percent,
-                    "Current 50%": alarm.current_50_percent,
-                    "Current 80%": alarm.current_80_percent
-                }
+    def _update_alarm(self, alarm: AlarmDetails):
+        self._attr_is_on = alarm.has_alarm
+        self._attr_extra_state_attributes = {
+            "Voltage loss": alarm.voltage_loss,
+            "Current overload when voltage loss": alarm.current_overload_when_voltage_loss,
+            "Current short-circuit": alarm.current_short_circuit,
+            "Overload 45%": alarm.current_overload_45_percent,
+            "Load current loss": alarm.load_current_loss,
+            "Overvoltage 120%": alarm.overvoltage_120_percent,
+            "Undervoltage 80%": alarm.undervoltage_80_percent,
+            "Current 50%": alarm.current_50_percent,
+            "Current 80%": alarm.current_80_percent
+        }
 
     @staticmethod
     def supports_feature_set(feature_class: FeatureClass) -> bool:
@@ -128,16 +166,12 @@ class PowerTagAlarm(WirelessDeviceEntity, BinarySensorEntity):
         return type_of_gateway in [TypeOfGateway.SMARTLINK, TypeOfGateway.POWERTAG_LINK, TypeOfGateway.PANEL_SERVER]
 
 
-class AmbientTagAlarm(WirelessDeviceEntity, BinarySensorEntity):
-    _attr_device_class = BinarySensorDeviceClass.PROBLEM
-
+class AmbientTagAlarm(AlarmEntity):
     def __init__(self, client: SchneiderModbus, modbus_index: int, tag_device: DeviceInfo, unique_id_version: UniqueIdVersion, serial_number: str):
         super().__init__(client, modbus_index, tag_device, "battery", unique_id_version, serial_number)
 
-    async def async_update(self):
-        alarm = await self._client.tag_get_alarm(self._modbus_index)
-        if self._handle_availability(alarm):
-            self._attr_is_on = alarm.has_alarm
+    def _update_alarm(self, alarm: AlarmDetails):
+        self._attr_is_on = alarm.has_alarm
 
     @staticmethod
     def supports_feature_set(feature_class: FeatureClass) -> bool:
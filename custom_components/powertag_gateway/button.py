@@ -7,7 +7,12 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import UniqueIdVersion
-from .device_features import FeatureClass
+from .device_features import (
+    FeatureClass,
+    RESETTABLE_ACTIVE_ENERGY,
+    RESETTABLE_REACTIVE_ENERGY,
+    RESETTABLE_APPARENT_ENERGY,
+)
 from .entity_base import WirelessDeviceEntity, async_setup_entities
 from .schneider_modbus import SchneiderModbus, TypeOfGateway
 
@@ -31,7 +36,7 @@ async def async_setup_entry(
     """Set up PowerTag Link Gateway from a config entry."""
     buttons = list_buttons()
 
-    entities = await async_setup_entities(hass, config_entry, buttons)
+    entities = async_setup_entities(hass, config_entry, buttons)
     async_add_entities(entities, update_before_add=False)
 
 
@@ -40,9 +45,6 @@ class PowerTagResetPeakDemand(WirelessDeviceEntity, ButtonEntity):
         super().__init__(client, modbus_index, tag_device, "reset peak demand", unique_id_version, serial_number)
 
     async def async_press(self) -> None:
-        await self.async_reset()
-
-    async def async_reset(self):
         await self._client.tag_reset_peak_demands(self._modbus_index)
 
     @staticmethod
@@ -59,16 +61,11 @@ class PowerTagResetActiveEnergyDelivered(WirelessDeviceEntity, ButtonEntity):
         super().__init__(client, modbus_index, tag_device, "reset active energy delivered", unique_id_version, serial_number)
 
     async def async_press(self) -> None:
-        await self.async_reset()
-
-    async def async_reset(self):
         await self._client.tag_reset_energy_active_delivered_partial(self._modbus_index)
 
     @staticmethod
     def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [FeatureClass.A1, FeatureClass.A2, FeatureClass.P1, FeatureClass.F1,
-                                 FeatureClass.F3, FeatureClass.FL, FeatureClass.M0, FeatureClass.M1,
-                                 FeatureClass.M2, FeatureClass.M3, FeatureClass.R1]
+        return feature_class in RESETTABLE_ACTIVE_ENERGY
 
     @staticmethod
     def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
@@ -80,16 +77,11 @@ class PowerTagResetActiveEnergyReceived(WirelessDeviceEntity, ButtonEntity):
         super().__init__(client, modbus_index, tag_device, "reset active energy received", unique_id_version, serial_number)
 
     async def async_press(self) -> None:
-        await self.async_reset()
-
-    async def async_reset(self):
         await self._client.tag_reset_energy_active_received_partial(self._modbus_index)
 
     @staticmethod
     def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [FeatureClass.A1, FeatureClass.A2, FeatureClass.P1, FeatureClass.F1,
-                                 FeatureClass.F3, FeatureClass.FL, FeatureClass.M0, FeatureClass.M1,
-                                 FeatureClass.M2, FeatureClass.M3, FeatureClass.R1]
+        return feature_class in RESETTABLE_ACTIVE_ENERGY
 
     @staticmethod
     def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
@@ -101,16 +93,11 @@ class PowerTagResetReactiveEnergyDelivered(WirelessDeviceEntity, ButtonEntity):
         super().__init__(client, modbus_index, tag_device, "reset reactive energy delivered", unique_id_version, serial_number)
 
     async def async_press(self) -> None:
-        await self.async_reset()
-
-    async def async_reset(self):
         await self._client.tag_reset_energy_reactive_delivered_partial(self._modbus_index)
 
     @staticmethod
     def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.FL, FeatureClass.M0, FeatureClass.M1, FeatureClass.M2, FeatureClass.M3, FeatureClass.R1
-        ]
+        return feature_class in RESETTABLE_REACTIVE_ENERGY
 
     @staticmethod
     def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
@@ -122,16 +109,11 @@ class PowerTagResetReactiveEnergyReceived(WirelessDeviceEntity, ButtonEntity):
         super().__init__(client, modbus_index, tag_device, "reset reactive energy received", unique_id_version, serial_number)
 
     async def async_press(self) -> None:
-        await self.async_reset()
-
-    async def async_reset(self):
         await self._client.tag_reset_energy_reactive_received_partial(self._modbus_index)
 
     @staticmethod
     def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.FL, FeatureClass.M0, FeatureClass.M1, FeatureClass.M2, FeatureClass.M3, FeatureClass.R1
-        ]
+        return feature_class in RESETTABLE_REACTIVE_ENERGY
 
     @staticmethod
     def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
@@ -143,15 +125,12 @@ class PowerTagResetApparentEnergy(WirelessDeviceEntity, ButtonEntity):
         super().__init__(client, modbus_index, tag_device, "reset apparent energy", unique_id_version, serial_number)
 
     async def async_press(self) -> None:
-        await self.async_reset()
-
-    async def async_reset(self):
         await self._client.tag_reset_energy_apparent_partial(self._modbus_index)
 
     @staticmethod
     def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [FeatureClass.FL, FeatureClass.R1]
+        return feature_class in RESETTABLE_APPARENT_ENERGY
 
     @staticmethod
     def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [TypeOfGateway.POWERTAG_LINK, TypeOfGateway.PANEL_SERVER]
+        return type_of_gateway is TypeOfGateway.PANEL_SERVER
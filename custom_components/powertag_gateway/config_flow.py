@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from urllib.parse import urlparse
@@ -11,9 +12,8 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_DEVICE, \
     CONF_INTERNAL_URL
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
-from pymodbus.exceptions import ConnectionException
 
 from . import UniqueIdVersion
 from .const import (
@@ -23,11 +23,21 @@ from .const import (
     DPWS_PRESENTATION_URL,
     DPWS_FRIENDLY_NAME,
     DPWS_SERIAL_NUMBER,
-    DOMAIN, CONF_TYPE_OF_GATEWAY, CONF_DEVICE_UNIQUE_ID_VERSION
+    DOMAIN, CONF_TYPE_OF_GATEWAY, CONF_DEVICE_UNIQUE_ID_VERSION,
+    CONF_POOL_SIZE, DEFAULT_POOL_SIZE, MAX_POOL_SIZE,
+    CONF_PIPELINE_WINDOW, DEFAULT_PIPELINE_WINDOW, MAX_PIPELINE_WINDOW,
+    CONF_MEASUREMENT_INTERVAL, DEFAULT_MEASUREMENT_INTERVAL,
+    CONF_ENERGY_INTERVAL, DEFAULT_ENERGY_INTERVAL,
+    CONF_DIAGNOSTIC_INTERVAL, DEFAULT_DIAGNOSTIC_INTERVAL,
+    MAX_INTERVAL
 )
 from .schneider_modbus import SchneiderModbus, TypeOfGateway, LinkStatus, \
     PanelHealth
-from .soap_communication import Soapy, dpws_discovery
+from .soap_communication import Soapy, Service, dpws_discovery
+
+# Seconds that discovered gateways get to send their metadata and answer over Modbus, all at the same time
+DISCOVERY_TIMEOUT = 5
+REACHABILITY_TIMEOUT = 3
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -46,10 +56,13 @@ class DiscoveredDevice:
     async def create(cls, content: str, type_of_gateway: TypeOfGateway):
         instance = cls(content, type_of_gateway)
         try:
-            await SchneiderModbus.create(instance.host, instance.type_of_gateway, DEFAULT_MODBUS_PORT, timeout=1)
-            instance.port = DEFAULT_MODBUS_PORT
-        except ConnectionException:
-            instance.port = None
+            serial_number = await asyncio.wait_for(
+                SchneiderModbus.probe(instance.host, instance.type_of_gateway, DEFAULT_MODBUS_PORT),
+                REACHABILITY_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            serial_number = None
+        instance.port = DEFAULT_MODBUS_PORT if serial_number is not None else None
         return instance
 
 
@@ -59,22 +72,26 @@ def find_tag(tag, source):
 
 async def async_discovery(hass: HomeAssistant) -> list[DiscoveredDevice]:
     """Return if there are devices that can be discovered."""
-    services = await dpws_discovery(hass)
+    services = await dpws_discovery()
 
     _LOGGER.info(f"Found {len(services)} candidates...")
     for s in services:
-        _LOGGER.info(s.getTypes())
+        _LOGGER.info(s.types)
 
     discovered_devices = []
 
-    for service in services:
-        soapy = Soapy(service, hass)
-        type_of_gateway = TypeOfGateway.PANEL_SERVER if soapy.is_panel_server() else TypeOfGateway.POWERTAG_LINK
-        result = await soapy.transfer_get()
-        if result.status_code != 200:
-            continue
-
-        discovered_devices.append(await DiscoveredDevice.create(result.text, type_of_gateway))
+    tasks = [asyncio.ensure_future(async_discover_device(hass, service)) for service in services]
+    if tasks:
+        done, pending = await asyncio.wait(tasks, timeout=DISCOVERY_TIMEOUT)
+        for task in pending:
+            task.cancel()
+        if pending:
+            _LOGGER.info(f"{len(pending)} candidates did not answer in time")
+        for task in done:
+            if task.exception() is not None:
+                _LOGGER.warning(f"Could not identify a candidate: {task.exception()}")
+            elif task.result() is not None:
+                discovered_devices.append(task.result())
 
     if discovered_devices:
         _LOGGER.info(f"Found {[s.friendly_name for s in discovered_devices]}")
@@ -84,6 +101,15 @@ async def async_discovery(hass: HomeAssistant) -> list[DiscoveredDevice]:
     return discovered_devices
 
 
+async def async_discover_device(hass: HomeAssistant, service: Service) -> DiscoveredDevice | None:
+    soapy = Soapy(service, hass)
+    type_of_gateway = TypeOfGateway.PANEL_SERVER if soapy.is_panel_server() else TypeOfGateway.POWERTAG_LINK
+    content = await soapy.transfer_get()
+    if content is None:
+        return None
+    return await DiscoveredDevice.create(content, type_of_gateway)
+
+
 class PowerTagFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     """PowerTag config flow."""
 
@@ -169,8 +195,13 @@ class PowerTagFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             self.host = user_input[CONF_HOST]
             self.port = user_input[CONF_PORT]
             self.type_of_gateway = user_input[CONF_TYPE_OF_GATEWAY]
+            type_of_gateway = [t for t in TypeOfGateway if t.value == self.type_of_gateway][0]
             try:
-                return await self.async_step_connect()
+                # Fails fast when nothing answers, rather than after searching for the synthesis table
+                if await SchneiderModbus.probe(self.host, type_of_gateway, self.port) is None:
+                    self.errors["base"] = "connection_error"
+                else:
+                    return await self.async_step_connect()
             except Exception as e:
                 logging.exception(e)
                 self.errors["base"] = "connection_error"
@@ -259,7 +290,47 @@ class PowerTagFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             },
         )
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: config_entries.ConfigEntry) -> config_entries.OptionsFlow:
+        return PowerTagOptionsFlowHandler(config_entry)
+
     @staticmethod
     def construct_unique_id(model_name: str, serial_number: str) -> str:
         """Construct the unique id from the dpws discovery or user_step."""
         return f"{model_name}-{serial_number}"
+
+
+class PowerTagOptionsFlowHandler(config_entries.OptionsFlow):
+    """PowerTag options flow."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        self.entry = config_entry
+
+    async def async_step_init(self, user_input=None) -> FlowResult:
+        """Handle how often values are polled, and how requests are spread over connections to the gateway."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema({
+                vol.Required(
+                    CONF_POOL_SIZE, default=self.entry.options.get(CONF_POOL_SIZE, DEFAULT_POOL_SIZE)
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_POOL_SIZE)),
+                vol.Required(
+                    CONF_PIPELINE_WINDOW,
+                    default=self.entry.options.get(CONF_PIPELINE_WINDOW, DEFAULT_PIPELINE_WINDOW)
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_PIPELINE_WINDOW)),
+                **{
+                    vol.Required(option, default=self.entry.options.get(option, default)): vol.All(
+                        vol.Coerce(int), vol.Range(min=1, max=MAX_INTERVAL)
+                    )
+                    for option, default in [
+                        (CONF_MEASUREMENT_INTERVAL, DEFAULT_MEASUREMENT_INTERVAL),
+                        (CONF_ENERGY_INTERVAL, DEFAULT_ENERGY_INTERVAL),
+                        (CONF_DIAGNOSTIC_INTERVAL, DEFAULT_DIAGNOSTIC_INTERVAL),
+                    ]
+                },
+            })
+        )
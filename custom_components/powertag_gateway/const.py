@@ -3,6 +3,14 @@ GATEWAY_DOMAIN = 'PowerTagGateway'
 TAG_DOMAIN = 'PowerTag'
 
 DEFAULT_MODBUS_PORT = 502
+DEFAULT_POOL_SIZE = 1
+MAX_POOL_SIZE = 8
+DEFAULT_PIPELINE_WINDOW = 1
+MAX_PIPELINE_WINDOW = 16
+DEFAULT_MEASUREMENT_INTERVAL = 30
+DEFAULT_ENERGY_INTERVAL = 60
+DEFAULT_DIAGNOSTIC_INTERVAL = 300
+MAX_INTERVAL = 3600
 
 SCHNEIDER_QNAME = 'http://www.schneider-electric.com'
 SCHNEIDER_QNAME_GATEWAY = 'GatewayServer'
@@ -10,8 +18,21 @@ SCHNEIDER_QNAME_GATEWAY = 'GatewayServer'
 CONF_MANUAL_INPUT = 'Manually configure EnergyTag Link Gateway'
 CONF_TYPE_OF_GATEWAY = 'type_of_gateway'
 CONF_DEVICE_UNIQUE_ID_VERSION = 'device_unique_id_version'
+CONF_POOL_SIZE = 'pool_size'
+CONF_PIPELINE_WINDOW = 'pipeline_window'
+CONF_MEASUREMENT_INTERVAL = 'measurement_interval'
+CONF_ENERGY_INTERVAL = 'energy_interval'
+CONF_DIAGNOSTIC_INTERVAL = 'diagnostic_interval'
 
 CONF_CLIENT = 'client'
+CONF_COORDINATOR = 'coordinator'
+CONF_INVENTORY = 'inventory'
+
+SERVICE_RESET_ENERGY = 'reset_energy'
+ATTR_CONFIG_ENTRY_ID = 'config_entry_id'
+
+EVENT_ALARM_RAISED = f'{DOMAIN}_alarm_raised'
+EVENT_ALARM_CLEARED = f'{DOMAIN}_alarm_cleared'
 
 DPWS_MODEL_NAME = 'ModelName'
 DPWS_PRESENTATION_URL = 'PresentationUrl'
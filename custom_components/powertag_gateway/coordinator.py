@@ -0,0 +1,317 @@
+import asyncio
+import logging
+import math
+import time
+from datetime import timedelta
+from enum import Enum
+
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.core import HomeAssistant, CALLBACK_TYPE, callback
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import (
+    DOMAIN,
+    CONF_MEASUREMENT_INTERVAL,
+    CONF_ENERGY_INTERVAL,
+    CONF_DIAGNOSTIC_INTERVAL,
+    DEFAULT_MEASUREMENT_INTERVAL,
+    DEFAULT_ENERGY_INTERVAL,
+    DEFAULT_DIAGNOSTIC_INTERVAL,
+)
+from .schneider_modbus import SchneiderModbus, GATEWAY_SLAVE_ID
+
+# Seconds before polling a slave that didn't answer again, doubled for every failed attempt up to the maximum
+BACKOFF_MIN = 30
+BACKOFF_MAX = 600
+
+# Relative change in power between two polls, above which the measurements of a tag are polled twice as often
+RAPID_CHANGE = 0.1
+RAPID_CHANGE_MIN = 50
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PollingTier(Enum):
+    """How fast the values of an entity change; each tier is polled at its own interval, configured by this option."""
+    MEASUREMENT = CONF_MEASUREMENT_INTERVAL
+    ENERGY = CONF_ENERGY_INTERVAL
+    DIAGNOSTIC = CONF_DIAGNOSTIC_INTERVAL
+
+
+DEFAULT_INTERVALS = {
+    PollingTier.MEASUREMENT: DEFAULT_MEASUREMENT_INTERVAL,
+    PollingTier.ENERGY: DEFAULT_ENERGY_INTERVAL,
+    PollingTier.DIAGNOSTIC: DEFAULT_DIAGNOSTIC_INTERVAL,
+}
+
+
+def polling_tier(entity: Entity) -> PollingTier:
+    return getattr(entity, "_polling_tier", PollingTier.MEASUREMENT)
+
+
+def written_state(entity: Entity) -> tuple[bool, object, dict | None]:
+    return entity.available, getattr(entity, "native_value", None), entity.extra_state_attributes
+
+
+def is_within_deadband(entity: Entity, written: tuple[bool, object, dict | None] | None) -> bool:
+    """Whether only the value of the entity changed since the (available, value, attributes) that was written, and by
+    less than its deadband."""
+    deadband = getattr(entity, "_deadband", None)
+    if deadband is None or written is None:
+        return False
+    available, value, attributes = written
+    current = getattr(entity, "native_value", None)
+    if available != entity.available or attributes != entity.extra_state_attributes:
+        return False
+    if not isinstance(value, (int, float)) or not isinstance(current, (int, float)):
+        return False
+    return abs(current - value) < deadband
+
+
+def is_rapid_change(before: float | None, after: float | None) -> bool:
+    if before is None or after is None:
+        return False
+    return abs(after - before) > max(abs(before) * RAPID_CHANGE, RAPID_CHANGE_MIN)
+
+
+class SlaveSchedule:
+    """Adapts the polling of a slave: backs off while it doesn't answer, and speeds up while its power swings."""
+
+    def __init__(self):
+        self.failures = 0
+        self.retry_at = 0.0
+        self.rapid = False
+
+    def is_backing_off(self, now: float) -> bool:
+        return self.failures > 0 and now < self.retry_at
+
+    def failed(self, now: float) -> float:
+        """Schedules the next attempt, and returns how many seconds away it is."""
+        self.failures += 1
+        delay = min(BACKOFF_MIN * 2 ** (self.failures - 1), BACKOFF_MAX)
+        self.retry_at = now + delay
+        self.rapid = False
+        return delay
+
+    def recovered(self):
+        self.failures = 0
+        self.retry_at = 0.0
+
+    def as_dict(self, now: float) -> dict:
+        return {
+            "failures": self.failures,
+            "retry_in": max(self.retry_at - now, 0) if self.failures else None,
+            "rapid": self.rapid,
+        }
+
+
+class PowerTagCoordinator(DataUpdateCoordinator[None]):
+    """Polls a gateway in ticks: per slave, a batched snapshot read of the tiers that are due, fanned out to their
+    entities."""
+
+    def __init__(self, hass: HomeAssistant, client: SchneiderModbus, intervals: dict[PollingTier, int] | None = None):
+        self._intervals = {**DEFAULT_INTERVALS, **(intervals or {})}
+        self._rapid_interval = max(self._intervals[PollingTier.MEASUREMENT] // 2, 1)
+        # Tiers that are due at the same tick are read together, so ticks are as far apart as all intervals allow
+        tick = math.gcd(*self._intervals.values(), self._rapid_interval)
+        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=timedelta(seconds=tick))
+        self._client = client
+        self._entities: dict[int, list[Entity]] = {}
+        self._schedules: dict[int, SlaveSchedule] = {}
+        self._next_due: dict[PollingTier | None, float] = {}
+        self._updated: set[Entity] = set()
+        # The raw registers each entity was last updated from, and what was last written to its state
+        self._registers: dict[Entity, tuple] = {}
+        self._written: dict[Entity, tuple[bool, object, dict | None]] = {}
+        self._unchanged = 0
+        self._within_deadband = 0
+        self._ticks = 0
+        self._update_seconds = 0.0
+
+    def async_add_entity(self, slave_id: int, entity: Entity) -> CALLBACK_TYPE:
+        """Registers an entity to be updated from the snapshot of its slave, returns a callback to unregister it."""
+        entities = self._entities.setdefault(slave_id, [])
+        entities.append(entity)
+
+        @callback
+        def write_state() -> None:
+            if entity in self._updated:
+                self._written[entity] = written_state(entity)
+                entity.async_write_ha_state()
+
+        remove_listener = self.async_add_listener(write_state)
+
+        def remove_entity() -> None:
+            remove_listener()
+            entities.remove(entity)
+            self._registers.pop(entity, None)
+            self._written.pop(entity, None)
+            if not entities:
+                self._entities.pop(slave_id, None)
+
+        return remove_entity
+
+    def due_tiers(self) -> tuple[set[PollingTier], bool]:
+        """The tiers to poll at this tick, and whether rapidly changing tags are due for their measurements."""
+        now = time.monotonic()
+        # Ticks don't run exactly on time, so what is due within half a tick is polled now
+        margin = self.update_interval.total_seconds() / 2
+        due = {tier for tier in PollingTier if self.__is_due(tier, self._intervals[tier], now, margin)}
+        rapid = self.__is_due(None, self._rapid_interval, now, margin)
+        return due, rapid
+
+    def __is_due(self, key: PollingTier | None, interval: float, now: float, margin: float) -> bool:
+        if self._next_due.get(key, now) - now > margin:
+            return False
+        self._next_due[key] = now + interval
+        return True
+
+    def diagnostics(self) -> dict:
+        """The polling schedule, of the gateway as a whole and of each slave."""
+        now = time.monotonic()
+        return {
+            "tick": self.update_interval.total_seconds(),
+            "intervals": {tier.name.lower(): interval for tier, interval in self._intervals.items()},
+            "rapid_interval": self._rapid_interval,
+            "next_due_in": {
+                "rapid" if key is None else key.name.lower(): due_at - now for key, due_at in self._next_due.items()
+            },
+            "ticks": self._ticks,
+            "update_seconds": self._update_seconds,
+            "skipped_updates": {"unchanged": self._unchanged, "within_deadband": self._within_deadband},
+            "last_update_success": self.last_update_success,
+            "slaves": {
+                slave_id: {
+                    "entities": {
+                        tier.name.lower(): sum(polling_tier(entity) is tier for entity in entities)
+                        for tier in PollingTier
+                    },
+                    **(self._schedules[slave_id].as_dict(now) if slave_id in self._schedules else {}),
+                }
+                for slave_id, entities in sorted(self._entities.items())
+            },
+        }
+
+    async def _async_update_data(self) -> None:
+        start = time.monotonic()
+        try:
+            await self.__async_update_due()
+        finally:
+            self._ticks += 1
+            self._update_seconds += time.monotonic() - start
+
+    async def __async_update_due(self) -> None:
+        due, rapid = self.due_tiers()
+        self._updated = set()
+        schedules = {slave_id: self._schedules.setdefault(slave_id, SlaveSchedule()) for slave_id in self._entities}
+        # Slaves that didn't answer last time come last, so the others don't have to wait behind their timeouts
+        for failing in [False, True]:
+            await asyncio.gather(*[
+                self.__async_poll_slave(slave_id, list(slave_entities), schedules[slave_id], due, rapid)
+                for slave_id, slave_entities in list(self._entities.items())
+                if (schedules[slave_id].failures > 0) is failing
+            ])
+
+    async def __async_poll_slave(
+        self, slave_id: int, entities: list[Entity], schedule: SlaveSchedule, due: set[PollingTier], rapid: bool
+    ) -> None:
+        if schedule.is_backing_off(time.monotonic()):
+            return
+
+        tiers = set(due)
+        if schedule.rapid and rapid:
+            tiers.add(PollingTier.MEASUREMENT)
+        if schedule.failures:
+            # A single register tells whether the tag is back, instead of timing out on a whole snapshot
+            if slave_id != GATEWAY_SLAVE_ID and not await self._client.tag_responds(slave_id):
+                delay = schedule.failed(time.monotonic())
+                _LOGGER.debug(f"Slave ID {slave_id} still doesn't answer, retrying in {delay} seconds")
+                return
+            # Its entities missed the tiers that were due in the meantime
+            tiers = set(PollingTier)
+
+        entities = [entity for entity in entities if polling_tier(entity) in tiers]
+        if not entities:
+            return
+        powers = {
+            entity: entity.native_value
+            for entity in entities
+            if getattr(entity, "device_class", None) == SensorDeviceClass.POWER
+        }
+
+        answered, updated = await async_update_slave(self._client, slave_id, entities, self._registers)
+        self._unchanged += len(entities) - len(updated)
+        for entity in updated:
+            if is_within_deadband(entity, self._written.get(entity)):
+                self._within_deadband += 1
+            else:
+                self._updated.add(entity)
+
+        if answered is False:
+            delay = schedule.failed(time.monotonic())
+            _LOGGER.info(f"Slave ID {slave_id} doesn't answer, backing off for {delay} seconds")
+            return
+        if schedule.failures:
+            _LOGGER.info(f"Slave ID {slave_id} answers again, resuming its polling")
+            schedule.recovered()
+        if PollingTier.MEASUREMENT in tiers:
+            schedule.rapid = any(is_rapid_change(before, entity.native_value) for entity, before in powers.items())
+
+
+async def async_update_slaves(client: SchneiderModbus, entities: dict[int, list[Entity]]):
+    """Runs a poll cycle for the entities of each slave."""
+    await asyncio.gather(*[
+        async_update_slave(client, slave_id, list(slave_entities))
+        for slave_id, slave_entities in entities.items()
+    ])
+
+
+async def async_update_slave(
+    client: SchneiderModbus, slave_id: int, entities: list[Entity], registers: dict[Entity, tuple] | None = None
+) -> tuple[bool | None, list[Entity]]:
+    """Reads the snapshot of a slave for the tiers of the entities, and updates them from it.
+
+    With registers to remember what each entity was updated from, entities whose registers didn't change since are
+    skipped. Entities that don't read any registers of the snapshot are always updated.
+    Returns whether the slave answered the snapshot, or None when nothing is known to be read yet, and the entities
+    that were updated.
+    """
+    tiers: dict[PollingTier, list[Entity]] = {}
+    for entity in entities:
+        tiers.setdefault(polling_tier(entity), []).append(entity)
+
+    answered = await client.prefetch(slave_id, client.learned_spans(slave_id, tiers))
+    updated = []
+    try:
+        for tier, tier_entities in tiers.items():
+            tier_spans = set()
+            for entity in tier_entities:
+                previous = registers.get(entity) if registers is not None else None
+                if previous is not None:
+                    spans, words = previous
+                    if words is not None and client.prefetched_registers(slave_id, spans) == words:
+                        tier_spans.update(spans)
+                        continue
+
+                with client.record_reads() as spans:
+                    await async_update_entity(entity)
+                tier_spans.update(spans)
+                updated.append(entity)
+                if registers is not None:
+                    # Unavailable entities are retried every time, as their registers may not tell why they failed
+                    words = client.prefetched_registers(slave_id, spans) if spans and entity.available else None
+                    registers[entity] = (frozenset(spans), words)
+            # Registers that weren't in the snapshot yet are included in the next one of their tier
+            client.learn_spans(slave_id, tier_spans, tier)
+    finally:
+        client.discard_prefetched(slave_id)
+    return answered, updated
+
+
+async def async_update_entity(entity: Entity):
+    try:
+        await entity.async_update()  # type: ignore
+    except Exception as e:
+        _LOGGER.exception(f"Could not update {entity.entity_id}: {e}")
+        entity._attr_available = False
@@ -3,6 +3,8 @@ from enum import Enum, auto
 
 from homeassistant.exceptions import IntegrationError
 
+from .register_map import FEATURE_CLASS_TABLES
+
 
 class FeatureClass(Enum):
     A1 = auto()
@@ -23,6 +25,19 @@ class FeatureClass(Enum):
     CO2 = auto()
 
 
+REGISTER_TABLES = {FeatureClass[name]: table for name, table in FEATURE_CLASS_TABLES.items()}
+
+# Tags with partial energy counters that can be reset, per kind of energy
+RESETTABLE_ACTIVE_ENERGY = [
+    FeatureClass.A1, FeatureClass.A2, FeatureClass.P1, FeatureClass.F1, FeatureClass.F3, FeatureClass.FL,
+    FeatureClass.M0, FeatureClass.M1, FeatureClass.M2, FeatureClass.M3, FeatureClass.R1,
+]
+RESETTABLE_REACTIVE_ENERGY = [
+    FeatureClass.FL, FeatureClass.M0, FeatureClass.M1, FeatureClass.M2, FeatureClass.M3, FeatureClass.R1
+]
+RESETTABLE_APPARENT_ENERGY = [FeatureClass.FL, FeatureClass.R1]
+
+
 class UnknownDevice(IntegrationError):
     pass
 
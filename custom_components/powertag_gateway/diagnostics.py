@@ -0,0 +1,32 @@
+"""Diagnostics of a PowerTag gateway, to see where the time of a poll goes."""
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_INTERNAL_URL
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_CLIENT, CONF_COORDINATOR, CONF_INVENTORY, DOMAIN
+from .coordinator import PowerTagCoordinator
+from .inventory import Inventory
+from .schneider_modbus import SchneiderModbus
+
+TO_REDACT = {CONF_HOST, CONF_INTERNAL_URL, "serial_number", "identifiers", "via_device", "configuration_url"}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    data = hass.data[DOMAIN][entry.entry_id]
+    client: SchneiderModbus = data[CONF_CLIENT]
+    coordinator: PowerTagCoordinator = data[CONF_COORDINATOR]
+    inventory: Inventory = data[CONF_INVENTORY]
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "inventory": async_redact_data(inventory.as_dict(), TO_REDACT),
+        "connection": client.diagnostics(),
+        "schedule": coordinator.diagnostics(),
+        "modbus": client.metrics.as_dict(),
+    }
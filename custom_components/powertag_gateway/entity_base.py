@@ -1,102 +1,31 @@
-import asyncio
+import functools
 import inspect
 import logging
+from collections.abc import Callable
+from dataclasses import dataclass
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_INTERNAL_URL
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import Entity, DeviceInfo
-from homeassistant.helpers import device_registry as dr
 
 from . import UniqueIdVersion
-from .const import CONF_CLIENT, DOMAIN, CONF_DEVICE_UNIQUE_ID_VERSION
-from .const import GATEWAY_DOMAIN, TAG_DOMAIN
-from .device_features import (
-    FeatureClass,
-    from_commercial_reference,
-    UnknownDevice,
-    from_wireless_device_type_code,
-)
+from .const import CONF_CLIENT, DOMAIN, CONF_DEVICE_UNIQUE_ID_VERSION, CONF_COORDINATOR, CONF_INVENTORY
+from .const import TAG_DOMAIN
+from .coordinator import PollingTier
+from .device_features import FeatureClass
+from .inventory import Inventory
 from .schneider_modbus import (
     SchneiderModbus,
     Phase,
     LineVoltage,
     PhaseSequence,
     TypeOfGateway,
+    GATEWAY_SLAVE_ID,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def gateway_device_info(
-    client: SchneiderModbus, presentation_url: str
-) -> DeviceInfo:
-    serial = await client.serial_number()
-    name = await client.name()
-    hw_version = await client.hardware_version()
-    firmware_version = await client.firmware_version()
-    manufacturer = await client.manufacturer()
-    product_code = await client.product_code()
-
-    return DeviceInfo(
-        configuration_url=presentation_url,
-        identifiers={(GATEWAY_DOMAIN, serial)},
-        hw_version=hw_version,
-        sw_version=firmware_version,
-        manufacturer=manufacturer,
-        model=product_code,
-        name=name,
-        serial_number=serial,
-    )
-
-
-async def tag_device_info(
-    client: SchneiderModbus,
-    modbus_index: int,
-    presentation_url: str,
-    gateway_identification: tuple[str, str],
-) -> DeviceInfo:
-    is_unreachable = await client.tag_radio_lqi_gateway(modbus_index) is None
-    serial_number = await client.tag_serial_number(modbus_index)
-
-    kwargs = {
-        "configuration_url": presentation_url,
-        "via_device": gateway_identification,
-        "identifiers": {(TAG_DOMAIN, serial_number)},
-        "serial_number": serial_number,
-        "hw_version": await client.tag_hardware_revision(modbus_index),
-        "sw_version": await client.tag_firmware_revision(modbus_index),
-        "manufacturer": await client.tag_vendor_name(modbus_index),
-        "model": await client.tag_product_model(modbus_index),
-        "name": await client.tag_name(modbus_index),
-    }
-    if not is_unreachable:
-        usage = await client.tag_usage(modbus_index)
-        if usage is not None:
-            kwargs["suggested_area"] = usage.name
-
-    if not is_unreachable and logging.DEBUG >= _LOGGER.level:
-        position = await client.tag_position(modbus_index)
-        power_supply_type = await client.tag_power_supply_type(modbus_index)
-        rated_current = await client.tag_rated_current(modbus_index)
-        rated_voltage = await client.tag_rated_voltage(modbus_index)
-        circuit_diagnostic = await client.tag_circuit_diagnostic(modbus_index)
-        circuit = await client.tag_circuit(modbus_index)
-        product_code = await client.tag_product_code(modbus_index)
-        phase_sequence = await client.tag_phase_sequence(modbus_index)
-        family = await client.tag_product_family(modbus_index)
-
-        _LOGGER.debug(
-            f"Found new device: name {kwargs['name']}, circuit {circuit}, rated voltage {rated_voltage}, "
-            f"rated current {rated_current}, position {position}, phase_sequence {phase_sequence}, "
-            f"family {family}, model {kwargs['model']}, product_code {product_code}, "
-            f" power_supply_type {power_supply_type}, circuit_diagnostic {circuit_diagnostic}, "
-            f"S/N {kwargs['serial_number']}"
-        )
-
-    return DeviceInfo(kwargs)  # type: ignore
-
-
 def phase_sequence_to_phases(phase_sequence: PhaseSequence) -> list[Phase]:
     return {
         PhaseSequence.A: [Phase.A],
@@ -134,7 +63,27 @@ def phase_sequence_to_line_voltages(
         )
 
 
-class GatewayEntity(Entity):
+class CoordinatedEntity(Entity):
+    """Entity that is updated by the coordinator of its config entry instead of being polled on its own."""
+
+    _attr_should_poll = False
+    _polling_tier = PollingTier.MEASUREMENT
+    # Smallest change of the value that is worth a state write, or None to write every change
+    _deadband: float | None = None
+    _slave_id: int
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if not hasattr(self, "async_update"):
+            return
+
+        coordinator = self.hass.data[DOMAIN][self.platform.config_entry.entry_id][CONF_COORDINATOR]
+        self.async_on_remove(coordinator.async_add_entity(self._slave_id, self))
+
+
+class GatewayEntity(CoordinatedEntity):
+    _slave_id = GATEWAY_SLAVE_ID
+
     def __init__(
         self, client: SchneiderModbus, tag_device: DeviceInfo, sensor_name: str, serial_number: str
     ):
@@ -153,7 +102,42 @@ class GatewayEntity(Entity):
         return self._attr_available
 
 
-class WirelessDeviceEntity(Entity):
+@dataclass(frozen=True, kw_only=True)
+class WirelessDeviceEntityDescription:
+    """Which wireless devices have an entity and how it is polled, mixed into the entity descriptions of a platform.
+
+    Its name is formatted with the phase or line voltage when the entity is enumerated over those of the device.
+    """
+
+    feature_classes: frozenset[FeatureClass]
+    gateways: frozenset[TypeOfGateway]
+    enumeration: type[Phase] | type[LineVoltage] | None = None
+    firmware_version_fn: Callable[[str], bool] | None = None
+    polling_tier: PollingTier = PollingTier.MEASUREMENT
+    deadband: float | None = None
+
+    def supports_feature_set(self, feature_class: FeatureClass) -> bool:
+        return feature_class in self.feature_classes
+
+    def supports_gateway(self, type_of_gateway: TypeOfGateway) -> bool:
+        return type_of_gateway in self.gateways
+
+    def supports_firmware_version(self, firmware_version: str) -> bool:
+        return self.firmware_version_fn is None or self.firmware_version_fn(firmware_version)
+
+    def create_entity(
+        self,
+        client: SchneiderModbus,
+        modbus_index: int,
+        tag_device: DeviceInfo,
+        feature_class: FeatureClass,
+        enumerated: Phase | LineVoltage | None,
+        unique_id_version: UniqueIdVersion,
+    ) -> Entity:
+        raise NotImplementedError()
+
+
+class WirelessDeviceEntity(CoordinatedEntity):
     def __init__(
         self,
         client: SchneiderModbus,
@@ -165,6 +149,7 @@ class WirelessDeviceEntity(Entity):
     ):
         self._client = client
         self._modbus_index = modbus_index
+        self._slave_id = modbus_index
 
         self._attr_device_info = tag_device
         self._attr_name = f"{tag_device['name']} {entity_name}"
@@ -191,24 +176,41 @@ class WirelessDeviceEntity(Entity):
         return self._attr_available
 
 
+@functools.cache
+def _constructor_parameters(powertag_entity: type[WirelessDeviceEntity]) -> list[tuple[str, type]]:
+    params_raw = inspect.signature(powertag_entity.__init__).parameters
+    return [
+        (name, param.annotation) for name, param in params_raw.items() if name != "self" and name != "kwargs"
+    ]
+
+
 def collect_entities(
     client: SchneiderModbus,
     entities: list[Entity],
     feature_class: FeatureClass,
     modbus_address: int,
-    powertag_entity: type[WirelessDeviceEntity],
+    powertag_entity: type[WirelessDeviceEntity] | WirelessDeviceEntityDescription,
     tag_device: DeviceInfo,
     tag_phase_sequence: PhaseSequence,
     device_unique_id_version: UniqueIdVersion,
 ):
-    params_raw = inspect.signature(powertag_entity.__init__).parameters
-    params = [
-        name for name in params_raw.items() if name[0] != "self" and name[0] != "kwargs"
-    ]
+    if isinstance(powertag_entity, WirelessDeviceEntityDescription):
+        if powertag_entity.enumeration is Phase:
+            enumerated_values = phase_sequence_to_phases(tag_phase_sequence)
+        elif powertag_entity.enumeration is LineVoltage:
+            enumerated_values = phase_sequence_to_line_voltages(tag_phase_sequence, feature_class)
+        else:
+            enumerated_values = [None]
+        for enumerated in enumerated_values:
+            entities.append(powertag_entity.create_entity(
+                client, modbus_address, tag_device, feature_class, enumerated, device_unique_id_version
+            ))
+        return
+
     args = []
     enumerate_param = None
-    for param in params:
-        typey = param[1].annotation
+    for param in _constructor_parameters(powertag_entity):
+        typey = param[1]
         if typey == SchneiderModbus:
             args.append(client)
         elif typey == DeviceInfo:
@@ -247,116 +249,33 @@ def collect_entities(
         entities.append(powertag_entity(*args))
 
 
-async def async_setup_entities(
+def async_setup_entities(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
-    powertag_entities: list[type[WirelessDeviceEntity]],
-):
+    powertag_entities: list[type[WirelessDeviceEntity] | WirelessDeviceEntityDescription],
+) -> list[Entity]:
     data = hass.data[DOMAIN][config_entry.entry_id]
     client = data[CONF_CLIENT]
-    presentation_url = data[CONF_INTERNAL_URL]
+    inventory: Inventory = data[CONF_INVENTORY]
     device_unique_id_version = data[CONF_DEVICE_UNIQUE_ID_VERSION]
 
     entities = []
-    gateway_device = await gateway_device_info(client, presentation_url)
-    device_registry = dr.async_get(hass)
-    device_registry.async_get_or_create(
-        config_entry_id=config_entry.entry_id,
-        identifiers=gateway_device["identifiers"],
-        manufacturer=gateway_device.get("manufacturer"),
-        model=gateway_device.get("model"),
-        name=gateway_device.get("name"),
-        sw_version=gateway_device.get("sw_version"),
-        hw_version=gateway_device.get("hw_version"),
-        configuration_url=gateway_device.get("configuration_url"),
-        serial_number=gateway_device.get("serial_number"),
-    )
-
-    _LOGGER.debug("Starting to scan for devices...")
-    for i in range(1, 100):
-        modbus_address = await client.modbus_address_of_node(i)
-        _LOGGER.debug(f"Found device #{i} at address {modbus_address}")
-
-        if modbus_address is None:
-            if client.type_of_gateway == TypeOfGateway.PANEL_SERVER:
-                # PanelServers can have out of order devices, so make sure to just scan everything
-                continue
-            else:
-                break
-
-        if client.type_of_gateway == TypeOfGateway.SMARTLINK:
-            identifier = await client.tag_product_identifier(modbus_address)
-            if identifier is None:
-                break
-
-            _LOGGER.debug(
-                f"Found device #{modbus_address} to have product wireless device type code {identifier}"
-            )
-
-            try:
-                feature_class = from_wireless_device_type_code(identifier)
-            except UnknownDevice:
-                _LOGGER.error(
-                    f"I don't know what this product identifier is: {identifier}, but we can fix this! :) "
-                    f"Please create a GitHub issue and tell me model of the {modbus_address}th wireless "
-                    f"device."
-                )
-                continue
-
-        else:
-            commercial_reference = await client.tag_product_code(modbus_address)
-
-            _LOGGER.debug(f"Device #{modbus_address} is {commercial_reference}")
-
-            try:
-                feature_class = from_commercial_reference(commercial_reference)
-            except UnknownDevice:
-                _LOGGER.error(
-                    f"Unsupported wireless device: {commercial_reference}, "
-                    f"to request support, please create a GitHub issue for this device."
-                )
-                continue
-
-        if client.type_of_gateway is not TypeOfGateway.SMARTLINK:
-            is_disabled = await client.tag_radio_lqi_gateway(modbus_address) is None
-            if is_disabled:
-                _LOGGER.warning(
-                    f"The device {await client.tag_name(modbus_address)} is not reachable; will ignore this one."
-                )
-                continue
-
-        tag_device = await tag_device_info(
-            client,
-            modbus_address,
-            presentation_url,
-            next(iter(gateway_device["identifiers"])),
-        )
-        device_name = tag_device["name"]
-
-        tag_phase_sequence = await client.tag_phase_sequence(modbus_address)
-        if not tag_phase_sequence:
-            _LOGGER.warning(
-                f"The phase sequence of {device_name} was not defined."
-                f"Skipping adding phase-specific entities..."
-            )
-
+    for tag in inventory.tags:
         for powertag_entity in [
             entity
             for entity in powertag_entities
-            if entity.supports_feature_set(feature_class)
+            if entity.supports_feature_set(tag.feature_class)
             and entity.supports_gateway(client.type_of_gateway)
-            and entity.supports_firmware_version(tag_device["sw_version"])
+            and entity.supports_firmware_version(tag.device_info["sw_version"])
         ]:
             collect_entities(
                 client,
                 entities,
-                feature_class,
-                modbus_address,
+                tag.feature_class,
+                tag.modbus_address,
                 powertag_entity,
-                tag_device,
-                tag_phase_sequence,
+                tag.device_info,
+                tag.phase_sequence,
                 device_unique_id_version,
             )
-
-        _LOGGER.info(f"Done with device at address {modbus_address}: {device_name}")
     return entities
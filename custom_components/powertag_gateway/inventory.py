@@ -0,0 +1,398 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.storage import Store
+from pymodbus.exceptions import ConnectionException
+
+from .const import DOMAIN, GATEWAY_DOMAIN, TAG_DOMAIN
+from .device_features import (
+    FeatureClass,
+    from_commercial_reference,
+    UnknownDevice,
+    from_wireless_device_type_code,
+    REGISTER_TABLES,
+)
+from .register_map import RegisterTable, mapped_ranges
+from .schneider_modbus import SchneiderModbus, PhaseSequence, TypeOfGateway, GATEWAY_SLAVE_ID
+
+# Wireless devices that are identified at the same time during setup
+MAX_CONCURRENT_IDENTIFICATIONS = 8
+
+STORAGE_VERSION = 1
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TagInventory:
+    """Everything needed to create the entities of a wireless device."""
+
+    def __init__(
+        self,
+        modbus_address: int,
+        feature_class: FeatureClass,
+        device_info: DeviceInfo,
+        phase_sequence: PhaseSequence,
+        rf_id: int | None,
+    ):
+        self.modbus_address = modbus_address
+        self.feature_class = feature_class
+        self.device_info = device_info
+        self.phase_sequence = phase_sequence
+        self.rf_id = rf_id
+
+    def as_dict(self) -> dict:
+        return {
+            "modbus_address": self.modbus_address,
+            "feature_class": self.feature_class.name,
+            "device_info": device_info_as_dict(self.device_info),
+            "phase_sequence": self.phase_sequence.name,
+            "rf_id": self.rf_id,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(
+            data["modbus_address"],
+            FeatureClass[data["feature_class"]],
+            device_info_from_dict(data["device_info"]),
+            PhaseSequence[data["phase_sequence"]],
+            data["rf_id"],
+        )
+
+
+class Inventory:
+    """The gateway and its wireless devices, scanned once per config entry and shared by all platforms."""
+
+    def __init__(self, gateway_device: DeviceInfo, tags: list[TagInventory]):
+        self.gateway_device = gateway_device
+        self.tags = tags
+
+    @property
+    def gateway_serial(self) -> str:
+        return self.gateway_device["serial_number"]
+
+    @property
+    def gateway_identification(self) -> tuple[str, str]:
+        return next(iter(self.gateway_device["identifiers"]))
+
+    def as_dict(self) -> dict:
+        return {
+            "gateway_device": device_info_as_dict(self.gateway_device),
+            "tags": [tag.as_dict() for tag in self.tags],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(
+            device_info_from_dict(data["gateway_device"]),
+            [TagInventory.from_dict(tag) for tag in data["tags"]],
+        )
+
+    @classmethod
+    async def create(cls, client: SchneiderModbus, presentation_url: str, known: Inventory | None = None):
+        """Scans the gateway and its wireless devices.
+
+        Tags of a known inventory that are still at the same address with the same RF ID are not identified again.
+        Known tags that are still configured but don't answer are kept, known tags that are no longer configured
+        are dropped. Raises ConnectionException when the configured devices could not be read.
+        """
+        gateway_device = await gateway_device_info(client, presentation_url)
+        gateway_identification = next(iter(gateway_device["identifiers"]))
+        known_tags = {tag.modbus_address: tag for tag in known.tags} if known else {}
+
+        _LOGGER.debug("Starting to scan for devices...")
+        product_identifiers = await scan_modbus_addresses(client)
+        modbus_addresses = list(product_identifiers)
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_IDENTIFICATIONS)
+
+        async def identify(modbus_address: int):
+            async with semaphore:
+                known_tag = known_tags.get(modbus_address)
+                if known_tag is not None and known_tag.rf_id is not None:
+                    rf_id = await client.tag_rf_id(modbus_address)
+                    if rf_id is None or rf_id == known_tag.rf_id:
+                        return known_tag
+                    _LOGGER.info(f"A different device answers at address {modbus_address} now")
+                    return await identify_tag(
+                        client, modbus_address, presentation_url, gateway_identification,
+                        product_identifiers[modbus_address]
+                    )
+                tag = await identify_tag(
+                    client, modbus_address, presentation_url, gateway_identification,
+                    product_identifiers[modbus_address]
+                )
+                return tag if tag is not None else known_tag
+
+        identified = dict(zip(modbus_addresses, await asyncio.gather(*[
+            identify(modbus_address) for modbus_address in modbus_addresses
+        ])))
+
+        # Known tags keep their place, so an unchanged inventory compares equal to the stored one
+        tags = [identified.pop(modbus_address) for modbus_address in known_tags if modbus_address in identified]
+        tags += identified.values()
+        tags = [tag for tag in tags if tag is not None]
+
+        return cls(gateway_device, tags)
+
+
+class InventoryStore:
+    """What was learned about a gateway, persisted across restarts."""
+
+    def __init__(self, hass: HomeAssistant, gateway_serial: str):
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{gateway_serial}")
+        self._data: dict = {}
+
+    async def async_load(self) -> None:
+        self._data = await self._store.async_load() or {}
+
+    @property
+    def inventory(self) -> Inventory | None:
+        data = self._data.get("inventory")
+        if data is None:
+            return None
+        try:
+            return Inventory.from_dict(data)
+        except (KeyError, TypeError, ValueError) as e:
+            _LOGGER.warning(f"Ignoring the stored inventory, as it could not be read: {e}")
+            return None
+
+    async def async_save_inventory(self, inventory: Inventory) -> None:
+        self._data["inventory"] = inventory.as_dict()
+        await self._store.async_save(self._data)
+
+    @property
+    def synthetic_slave_id(self) -> int | None:
+        return self._data.get("synthetic_slave_id")
+
+    async def async_save_synthetic_slave_id(self, slave_id: int | None) -> None:
+        if slave_id is None or slave_id == self.synthetic_slave_id:
+            return
+        self._data["synthetic_slave_id"] = slave_id
+        await self._store.async_save(self._data)
+
+
+def use_register_map(client: SchneiderModbus, inventory: Inventory) -> None:
+    """Tells the client which registers each slave has, according to the register map of its device family."""
+    if client.type_of_gateway is TypeOfGateway.PANEL_SERVER:
+        client.use_mapped_ranges(GATEWAY_SLAVE_ID, mapped_ranges(RegisterTable.PANEL_SERVER))
+    for tag in inventory.tags:
+        table = REGISTER_TABLES.get(tag.feature_class)
+        if table is not None:
+            client.use_mapped_ranges(tag.modbus_address, mapped_ranges(table))
+
+
+def device_info_as_dict(device_info: DeviceInfo) -> dict:
+    data = dict(device_info)
+    data["identifiers"] = [list(identifier) for identifier in device_info["identifiers"]]
+    if "via_device" in device_info:
+        data["via_device"] = list(device_info["via_device"])
+    return data
+
+
+def device_info_from_dict(data: dict) -> DeviceInfo:
+    data = dict(data)
+    data["identifiers"] = {tuple(identifier) for identifier in data["identifiers"]}
+    if "via_device" in data:
+        data["via_device"] = tuple(data["via_device"])
+    return DeviceInfo(data)  # type: ignore
+
+
+async def gateway_device_info(
+    client: SchneiderModbus, presentation_url: str
+) -> DeviceInfo:
+    serial = await client.serial_number()
+    name = await client.name()
+    hw_version = await client.hardware_version()
+    firmware_version = await client.firmware_version()
+    manufacturer = await client.manufacturer()
+    product_code = await client.product_code()
+
+    return DeviceInfo(
+        configuration_url=presentation_url,
+        identifiers={(GATEWAY_DOMAIN, serial)},
+        hw_version=hw_version,
+        sw_version=firmware_version,
+        manufacturer=manufacturer,
+        model=product_code,
+        name=name,
+        serial_number=serial,
+    )
+
+
+async def tag_device_info(
+    client: SchneiderModbus,
+    modbus_index: int,
+    presentation_url: str,
+    gateway_identification: tuple[str, str],
+) -> DeviceInfo:
+    is_unreachable = await client.tag_radio_lqi_gateway(modbus_index) is None
+    serial_number = await client.tag_serial_number(modbus_index)
+
+    kwargs = {
+        "configuration_url": presentation_url,
+        "via_device": gateway_identification,
+        "identifiers": {(TAG_DOMAIN, serial_number)},
+        "serial_number": serial_number,
+        "hw_version": await client.tag_hardware_revision(modbus_index),
+        "sw_version": await client.tag_firmware_revision(modbus_index),
+        "manufacturer": await client.tag_vendor_name(modbus_index),
+        "model": await client.tag_product_model(modbus_index),
+        "name": await client.tag_name(modbus_index),
+    }
+    if not is_unreachable:
+        usage = await client.tag_usage(modbus_index)
+        if usage is not None:
+            kwargs["suggested_area"] = usage.name
+
+    if not is_unreachable and logging.DEBUG >= _LOGGER.level:
+        position = await client.tag_position(modbus_index)
+        power_supply_type = await client.tag_power_supply_type(modbus_index)
+        rated_current = await client.tag_rated_current(modbus_index)
+        rated_voltage = await client.tag_rated_voltage(modbus_index)
+        circuit_diagnostic = await client.tag_circuit_diagnostic(modbus_index)
+        circuit = await client.tag_circuit(modbus_index)
+        product_code = await client.tag_product_code(modbus_index)
+        phase_sequence = await client.tag_phase_sequence(modbus_index)
+        family = await client.tag_product_family(modbus_index)
+
+        _LOGGER.debug(
+            f"Found new device: name {kwargs['name']}, circuit {circuit}, rated voltage {rated_voltage}, "
+            f"rated current {rated_current}, position {position}, phase_sequence {phase_sequence}, "
+            f"family {family}, model {kwargs['model']}, product_code {product_code}, "
+            f" power_supply_type {power_supply_type}, circuit_diagnostic {circuit_diagnostic}, "
+            f"S/N {kwargs['serial_number']}"
+        )
+
+    return DeviceInfo(kwargs)  # type: ignore
+
+
+async def scan_modbus_addresses(client: SchneiderModbus) -> dict[int, int | None]:
+    """Modbus addresses of all configured wireless devices in node order, with their product identifier on Smartlink."""
+    if client.type_of_gateway == TypeOfGateway.SMARTLINK:
+        return await scan_smartlink_product_identifiers(client)
+
+    modbus_addresses = {}
+    for i, modbus_address in enumerate(await client.modbus_addresses_of_nodes(), start=1):
+        _LOGGER.debug(f"Found device #{i} at address {modbus_address}")
+
+        if modbus_address is None:
+            if client.type_of_gateway == TypeOfGateway.PANEL_SERVER:
+                # PanelServers can have out of order devices, so make sure to just scan everything
+                continue
+            else:
+                break
+
+        modbus_addresses[modbus_address] = None
+    return modbus_addresses
+
+
+async def scan_smartlink_product_identifiers(client: SchneiderModbus) -> dict[int, int | None]:
+    """Product identifiers of the Smartlink wireless devices by Modbus address.
+
+    Smartlink addresses are fixed, the first one the gateway reports without a device marks the end. The identifiers
+    are read a few addresses at a time, so the end is found without waiting on each address in turn. Addresses the
+    gateway doesn't answer for are scanned without an identifier, as they may have a silent device. Raises
+    ConnectionException when it answers for none of them, rather than taking that for the end.
+    """
+    modbus_addresses = await client.modbus_addresses_of_nodes()
+    product_identifiers = {}
+    for start in range(0, len(modbus_addresses), MAX_CONCURRENT_IDENTIFICATIONS):
+        wave = modbus_addresses[start:start + MAX_CONCURRENT_IDENTIFICATIONS]
+        identifiers = await asyncio.gather(*[
+            client.tag_product_identifier_of_node(modbus_address) for modbus_address in wave
+        ], return_exceptions=True)
+        for identifier in identifiers:
+            if isinstance(identifier, BaseException) and not isinstance(identifier, ConnectionException):
+                raise identifier
+        if all(isinstance(identifier, ConnectionException) for identifier in identifiers):
+            raise identifiers[0]
+
+        for modbus_address, identifier in zip(wave, identifiers):
+            if identifier is None:
+                return product_identifiers
+            if isinstance(identifier, ConnectionException):
+                _LOGGER.debug(f"No answer for address {modbus_address}, scanning it in case its device is silent")
+                identifier = None
+            else:
+                _LOGGER.debug(f"Found device at address {modbus_address}")
+            product_identifiers[modbus_address] = identifier
+    return product_identifiers
+
+
+async def identify_tag(
+    client: SchneiderModbus,
+    modbus_address: int,
+    presentation_url: str,
+    gateway_identification: tuple[str, str],
+    identifier: int | None = None,
+) -> TagInventory | None:
+    """Reads what's needed to create entities for a wireless device, or None if it should be ignored.
+
+    On Smartlink, the product identifier is only read if it isn't passed along from the scan.
+    """
+    if client.type_of_gateway == TypeOfGateway.SMARTLINK:
+        if identifier is None:
+            identifier = await client.tag_product_identifier(modbus_address)
+        if identifier is None:
+            return None
+
+        _LOGGER.debug(
+            f"Found device #{modbus_address} to have product wireless device type code {identifier}"
+        )
+
+        try:
+            feature_class = from_wireless_device_type_code(identifier)
+        except UnknownDevice:
+            _LOGGER.error(
+                f"I don't know what this product identifier is: {identifier}, but we can fix this! :) "
+                f"Please create a GitHub issue and tell me model of the {modbus_address}th wireless "
+                f"device."
+            )
+            return None
+
+    else:
+        commercial_reference = await client.tag_product_code(modbus_address)
+
+        _LOGGER.debug(f"Device #{modbus_address} is {commercial_reference}")
+
+        try:
+            feature_class = from_commercial_reference(commercial_reference)
+        except UnknownDevice:
+            _LOGGER.error(
+                f"Unsupported wireless device: {commercial_reference}, "
+                f"to request support, please create a GitHub issue for this device."
+            )
+            return None
+
+    if client.type_of_gateway is not TypeOfGateway.SMARTLINK:
+        is_disabled = await client.tag_radio_lqi_gateway(modbus_address) is None
+        if is_disabled:
+            _LOGGER.warning(
+                f"The device {await client.tag_name(modbus_address)} is not reachable; will ignore this one."
+            )
+            return None
+
+    tag_device = await tag_device_info(
+        client,
+        modbus_address,
+        presentation_url,
+        gateway_identification,
+    )
+    device_name = tag_device["name"]
+
+    tag_phase_sequence = await client.tag_phase_sequence(modbus_address)
+    if not tag_phase_sequence:
+        _LOGGER.warning(
+            f"The phase sequence of {device_name} was not defined."
+            f"Skipping adding phase-specific entities..."
+        )
+
+    rf_id = await client.tag_rf_id(modbus_address)
+
+    _LOGGER.info(f"Done with device at address {modbus_address}: {device_name}")
+    return TagInventory(modbus_address, feature_class, tag_device, tag_phase_sequence, rf_id)
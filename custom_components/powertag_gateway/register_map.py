@@ -0,0 +1,2119 @@
+"""Modbus registers of the gateways and their wireless devices, per device family.
+
+Generated by tools/generate_register_map.py from doc/DOCA0241EN-06.xlsx, do not edit.
+"""
+
+import enum
+import functools
+
+
+class RegisterTable(enum.Enum):
+    PANEL_SERVER = "Panel Server"
+    POWERTAG_63 = "PTE63-PoTag QO"
+    POWERTAG_250_630 = "PTEnergy250_630-PoTag Efram"
+    POWERTAG_ROPE = "PTE Rope-PoTag  Rope"
+    TH110 = "TH110"
+    CL110 = "CL110"
+    CO2 = "CO2 sensors"
+    TEMPERATURE_TRH = "Temperature sensors TRH"
+    HEATTAG = "PowerLogic HeatTag"
+    ACTI9_ACTIVE = "Acti9 Active"
+    WIRELESS_INDICATION_AUXILIARY = "Wireless indication auxiliary"
+    PARTIAL_DISCHARGE_BOX = "Partial Discharge Box"
+    POWERTAG_C_2DI = "PowerTagC2DI"
+    POWERTAG_C_IO = "PowerTagCIO"
+
+
+# Names of TypeOfGateway
+GATEWAYS = ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')
+
+
+class Register:
+    """A register: its 0-based address, size in registers, data type and unit.
+
+    The slave is where it's read from: TAG for the wireless device, GATEWAY for the gateway at slave 255, or
+    SYNTHESIS_TABLE for the synthesis table of the PowerTag Link. The gateways are the ones known to have it at this
+    address, and the feature classes those of the wireless devices whose register table documents it.
+    """
+
+    __slots__ = (
+        "address", "count", "type", "unit", "writable", "section", "description", "slave", "gateways",
+        "feature_classes",
+    )
+
+    def __init__(
+        self,
+        address: int,
+        count: int,
+        type: str,
+        unit: str | None,
+        writable: bool,
+        section: str,
+        description: str,
+        slave: str,
+        gateways: tuple[str, ...] = ("PANEL_SERVER",),
+        feature_classes: tuple[str, ...] = (),
+    ):
+        self.address = address
+        self.count = count
+        self.type = type
+        self.unit = unit
+        self.writable = writable
+        self.section = section
+        self.description = description
+        self.slave = slave
+        self.gateways = frozenset(gateways)
+        self.feature_classes = frozenset(feature_classes)
+
+    def __repr__(self):
+        return f"Register(0x{self.address:04X}, {self.count}, {self.type}, {self.description!r})"
+
+
+class Value:
+    """A value the integration reads, by the register that holds it on each gateway that has it."""
+
+    __slots__ = ("name", "registers", "feature_classes")
+
+    def __init__(self, name: str, feature_classes: tuple[str, ...], **registers: Register):
+        self.name = name
+        self.registers = registers
+        self.feature_classes = frozenset(feature_classes)
+
+    @property
+    def description(self) -> str:
+        return next(iter(self.registers.values())).description
+
+    def __repr__(self):
+        return f"Value({self.name}, {self.registers!r})"
+
+
+def _table(slave: str, feature_classes: tuple[str, ...], *registers: tuple) -> dict[int, Register]:
+    return {
+        register[0]: Register(*register[:7], slave, *register[7:], feature_classes=feature_classes)
+        for register in registers
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def mapped_ranges(table: RegisterTable) -> tuple[tuple[int, int], ...]:
+    """The (start, end) ranges of consecutive documented registers, which the gateway allows to be read at once."""
+    ranges: list[list[int]] = []
+    for address, register in sorted(REGISTERS[table].items()):
+        end = address + register.count
+        if ranges and address <= ranges[-1][1]:
+            ranges[-1][1] = max(ranges[-1][1], end)
+        else:
+            ranges.append([address, end])
+    return tuple((start, end) for start, end in ranges)
+
+
+def register(table: RegisterTable, address: int) -> Register | None:
+    return REGISTERS[table].get(address)
+
+
+REGISTERS: dict[RegisterTable, dict[int, Register]] = {
+    RegisterTable.PANEL_SERVER: _table('GATEWAY', (),
+        (0x000A, 16, 'ASCII', None, False, 'Identification', 'Product range'),
+        (0x001A, 16, 'ASCII', None, False, 'Identification', 'Product family'),
+        (0x002A, 17, 'ASCII', None, False, 'Identification', 'Vendor URL'),
+        (0x003C, 16, 'ASCII', None, False, 'Identification', 'Commercial Reference - Example "PAS600L"'),
+        (0x0050, 6, 'ASCII', None, False, 'Identification', 'EcoStruxure Panel Server hardware version on 11 ASCII characters, valid for firmware version 001.008.007 and later.', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x0064, 6, 'ASCII', None, False, 'Identification', 'Serial number on 12 ASCII characters; 11 alphanumeric digits maximum [SN] or [S/N]: PP YY WW [D[nnnn]]', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0073, 4, 'DATETIME', None, True, 'Date and Time', 'Indicates the year, month, day, hour, minute and millisecond on EcoStruxure Panel Server.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0078, 6, 'ASCII', None, False, 'Identification', 'EcoStruxure Panel Server firmware version on 11 ASCII characters, valid for firmware version 001.008.007 and later.', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x007E, 16, 'ASCII', None, False, 'Identification', 'Product capability'),
+        (0x008E, 16, 'ASCII', None, False, 'Identification', 'Additionnal product capability'),
+        (0x009E, 1, 'UINT16', None, False, 'Health State', 'Health state of EcoStruxure Panel Server'),
+        (0x009F, 16, 'ASCII', None, False, 'Identification', 'Manufacturer Name - "Schneider Electric"'),
+        (0x01F4, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 1'),
+        (0x01F8, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 1'),
+        (0x01F9, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 2'),
+        (0x01FD, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 2'),
+        (0x01FE, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 3'),
+        (0x0202, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 3'),
+        (0x0203, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 4'),
+        (0x0207, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 4'),
+        (0x0208, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 5'),
+        (0x020C, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 5'),
+        (0x020D, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 6'),
+        (0x0211, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 6'),
+        (0x0212, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 7'),
+        (0x0216, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 7'),
+        (0x0217, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 8'),
+        (0x021B, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 8'),
+        (0x021C, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 9'),
+        (0x0220, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 9'),
+        (0x0221, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 10'),
+        (0x0225, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 10'),
+        (0x0226, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 11'),
+        (0x022A, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 11'),
+        (0x022B, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 12'),
+        (0x022F, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 12'),
+        (0x0230, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 13'),
+        (0x0234, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 13'),
+        (0x0235, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 14'),
+        (0x0239, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 14'),
+        (0x023A, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 15'),
+        (0x023E, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 15'),
+        (0x023F, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 16'),
+        (0x0243, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 16'),
+        (0x0244, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 17'),
+        (0x0248, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 17'),
+        (0x0249, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 18'),
+        (0x024D, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 18'),
+        (0x024E, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 19'),
+        (0x0252, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 19'),
+        (0x0253, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 20'),
+        (0x0257, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 20'),
+        (0x0258, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 21'),
+        (0x025C, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 21'),
+        (0x025D, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 22'),
+        (0x0261, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 22'),
+        (0x0262, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 23'),
+        (0x0266, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 23'),
+        (0x0267, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 24'),
+        (0x026B, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 24'),
+        (0x026C, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 25'),
+        (0x0270, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 25'),
+        (0x0271, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 26'),
+        (0x0275, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 26'),
+        (0x0276, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 27'),
+        (0x027A, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 27'),
+        (0x027B, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 28'),
+        (0x027F, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 28'),
+        (0x0280, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 29'),
+        (0x0284, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 29'),
+        (0x0285, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 30'),
+        (0x0289, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 30'),
+        (0x028A, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 31'),
+        (0x028E, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 31'),
+        (0x028F, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 32'),
+        (0x0293, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 32'),
+        (0x0294, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 33'),
+        (0x0298, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 33'),
+        (0x0299, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 34'),
+        (0x029D, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 34'),
+        (0x029E, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 35'),
+        (0x02A2, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 35'),
+        (0x02A3, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 36'),
+        (0x02A7, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 36'),
+        (0x02A8, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 37'),
+        (0x02AC, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 37'),
+        (0x02AD, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 38'),
+        (0x02B1, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 38'),
+        (0x02B2, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 39'),
+        (0x02B6, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 39'),
+        (0x02B7, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 40'),
+        (0x02BB, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 40'),
+        (0x02BC, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 41'),
+        (0x02C0, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 41'),
+        (0x02C1, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 42'),
+        (0x02C5, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 42'),
+        (0x02C6, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 43'),
+        (0x02CA, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 43'),
+        (0x02CB, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 44'),
+        (0x02CF, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 44'),
+        (0x02D0, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 45'),
+        (0x02D4, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 45'),
+        (0x02D5, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 46'),
+        (0x02D9, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 46'),
+        (0x02DA, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 47'),
+        (0x02DE, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 47'),
+        (0x02DF, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 48'),
+        (0x02E3, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 48'),
+        (0x02E4, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 49'),
+        (0x02E8, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 49'),
+        (0x02E9, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 50'),
+        (0x02ED, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 50'),
+        (0x02EE, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 51'),
+        (0x02F2, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 51'),
+        (0x02F3, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 52'),
+        (0x02F7, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 52'),
+        (0x02F8, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 53'),
+        (0x02FC, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 53'),
+        (0x02FD, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 54'),
+        (0x0301, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 54'),
+        (0x0302, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 55'),
+        (0x0306, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 55'),
+        (0x0307, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 56'),
+        (0x030B, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 56'),
+        (0x030C, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 57'),
+        (0x0310, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 57'),
+        (0x0311, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 58'),
+        (0x0315, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 58'),
+        (0x0316, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 59'),
+        (0x031A, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 59'),
+        (0x031B, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 60'),
+        (0x031F, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 60'),
+        (0x0320, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 61'),
+        (0x0324, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 61'),
+        (0x0325, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 62'),
+        (0x0329, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 62'),
+        (0x032A, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 63'),
+        (0x032E, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 63'),
+        (0x032F, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 64'),
+        (0x0333, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 64'),
+        (0x0334, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 65'),
+        (0x0338, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 65'),
+        (0x0339, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 66'),
+        (0x033D, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 66'),
+        (0x033E, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 67'),
+        (0x0342, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 67'),
+        (0x0343, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 68'),
+        (0x0347, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 68'),
+        (0x0348, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 69'),
+        (0x034C, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 69'),
+        (0x034D, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 70'),
+        (0x0351, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 70'),
+        (0x0352, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 71'),
+        (0x0356, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 71'),
+        (0x0357, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 72'),
+        (0x035B, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 72'),
+        (0x035C, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 73'),
+        (0x0360, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 73'),
+        (0x0361, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 74'),
+        (0x0365, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 74'),
+        (0x0366, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 75'),
+        (0x036A, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 75'),
+        (0x036B, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 76'),
+        (0x036F, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 76'),
+        (0x0370, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 77'),
+        (0x0374, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 77'),
+        (0x0375, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 78'),
+        (0x0379, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 78'),
+        (0x037A, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 79'),
+        (0x037E, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 79'),
+        (0x037F, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 80'),
+        (0x0383, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 80'),
+        (0x0384, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 81'),
+        (0x0388, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 81'),
+        (0x0389, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 82'),
+        (0x038D, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 82'),
+        (0x038E, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 83'),
+        (0x0392, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 83'),
+        (0x0393, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 84'),
+        (0x0397, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 84'),
+        (0x0398, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 85'),
+        (0x039C, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 85'),
+        (0x039D, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 86'),
+        (0x03A1, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 86'),
+        (0x03A2, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 87'),
+        (0x03A6, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 87'),
+        (0x03A7, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 88'),
+        (0x03AB, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 88'),
+        (0x03AC, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 89'),
+        (0x03B0, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 89'),
+        (0x03B1, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 90'),
+        (0x03B5, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 90'),
+        (0x03B6, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 91'),
+        (0x03BA, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 91'),
+        (0x03BB, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 92'),
+        (0x03BF, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 92'),
+        (0x03C0, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 93'),
+        (0x03C4, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 93'),
+        (0x03C5, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 94'),
+        (0x03C9, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 94'),
+        (0x03CA, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 95'),
+        (0x03CE, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 95'),
+        (0x03CF, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 96'),
+        (0x03D3, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 96'),
+        (0x03D4, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 97'),
+        (0x03D8, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 97'),
+        (0x03D9, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 98'),
+        (0x03DD, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 98'),
+        (0x03DE, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 99'),
+        (0x03E2, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 99'),
+        (0x03E3, 4, 'UINT64', None, False, 'List of wireless devices', 'RFID of wireless device 100'),
+        (0x03E7, 1, 'UINT16', None, False, 'List of wireless devices', 'Virtual address of wireless device 100'),
+        (0x03E8, 1, 'UINT16', None, False, 'Local Digital Inputs', 'DI1 validity.'),
+        (0x03E9, 1, 'UINT16', None, False, 'Local Digital Inputs', 'DI2 validity.'),
+        (0x03EA, 1, 'UINT16', None, False, 'Local Digital Inputs', 'DI1 input mode'),
+        (0x03EB, 1, 'UINT16', None, False, 'Local Digital Inputs', 'DI2 input mode'),
+        (0x03EC, 20, 'ASCII', None, False, 'Local Digital Inputs', 'User application name of the device connected on DI1'),
+        (0x0400, 20, 'ASCII', None, False, 'Local Digital Inputs', 'User application name of the device connected on DI2'),
+        (0x0414, 3, 'ASCII', None, False, 'Local Digital Inputs', 'Electrical label of the device connected on DI1'),
+        (0x0417, 3, 'ASCII', None, False, 'Local Digital Inputs', 'Electrical label of the device connected on DI2'),
+        (0x041A, 1, 'UINT16', None, False, 'Local Digital Inputs', 'Usage of the device connected to DI1:'),
+        (0x041B, 1, 'UINT16', None, False, 'Local Digital Inputs', 'Usage of the device connected to DI2:'),
+        (0x041C, 1, 'UINT16', None, False, 'Local Digital Inputs', 'Logical status of the Digital Input DI1 (takes into account the configured polarity)'),
+        (0x041D, 1, 'UINT16', None, False, 'Local Digital Inputs', 'Logical status of the Digital Input DI2 (takes into account the configured polarity)'),
+        (0x041E, 2, 'UINT32', None, False, 'Local Digital Inputs', 'Non resettable DI1 operating time'),
+        (0x0420, 2, 'UINT32', None, False, 'Local Digital Inputs', 'Non resettable DI2 operating time'),
+        (0x0422, 2, 'UINT32', None, True, 'Local Digital Inputs', 'Resettable DI1 operating time'),
+        (0x0424, 2, 'UINT32', None, True, 'Local Digital Inputs', 'Resettable DI2 operating time'),
+        (0x0426, 4, 'DATETIME', None, False, 'Local Digital Inputs', 'DI1 last reset operating time date'),
+        (0x042A, 4, 'DATETIME', None, False, 'Local Digital Inputs', 'DI2 last reset operating time date'),
+        (0x042E, 2, 'UINT32', None, False, 'Local Digital Inputs', 'Non resettable DI1 operation counter'),
+        (0x0430, 2, 'UINT32', None, False, 'Local Digital Inputs', 'Non resettable DI2 operation counter'),
+        (0x0432, 2, 'UINT32', None, True, 'Local Digital Inputs', 'Resettable DI1 operation counter'),
+        (0x0434, 2, 'UINT32', None, True, 'Local Digital Inputs', 'Resettable DI2 operation counter'),
+        (0x0436, 4, 'DATETIME', None, False, 'Local Digital Inputs', 'DI1 last reset operation counter date'),
+        (0x043A, 4, 'DATETIME', None, False, 'Local Digital Inputs', 'DI2 last reset operation counter date'),
+        (0x043E, 2, 'FLOAT32', None, False, 'Local Digital Inputs', 'Pulse weight of device connected on DI1 if DI1 mode is set to Pulse'),
+        (0x0440, 2, 'FLOAT32', None, False, 'Local Digital Inputs', 'Pulse weight of device connected on DI2 if DI2 mode is set to Pulse'),
+        (0x0442, 4, 'INT64', None, False, 'Local Digital Inputs', 'Offset applied on DI1 is DI1 mode if set to Pulse'),
+        (0x0446, 4, 'INT64', None, False, 'Local Digital Inputs', 'Offset applied on DI2 is DI2 mode if set to Pulse'),
+        (0x044A, 4, 'INT64', None, False, 'Local Digital Inputs', 'Non-resettable pulse counter on DI1 if DI1 mode is set to Pulse'),
+        (0x044E, 4, 'INT64', None, False, 'Local Digital Inputs', 'Non-resettable pulse counter on DI2 if DI2 mode is set to Pulse'),
+        (0x0452, 4, 'INT64', None, True, 'Local Digital Inputs', 'Resettable DI1 pulse count'),
+        (0x0456, 4, 'INT64', None, True, 'Local Digital Inputs', 'Resettable DI2 pulse count'),
+        (0x045A, 4, 'DATETIME', None, False, 'Local Digital Inputs', 'Date of last reset pulse counter for DI1'),
+        (0x045E, 4, 'DATETIME', None, False, 'Local Digital Inputs', 'Date of last reset pulse counter for DI2'),
+        (0x0462, 4, 'INT64', None, False, 'Local Digital Inputs', 'Metering accumulated value on DI1 if DI1 mode is set to Pulse'),
+        (0x0466, 4, 'INT64', None, False, 'Local Digital Inputs', 'Metering accumulated value on DI2 if DI2 mode is set to Pulse'),
+        (0x0494, 2, 'FLOAT32', None, False, 'Local Digital Inputs', 'Measured flow unit on DI1 if DI1 mode is set to Pulse'),
+        (0x0496, 2, 'FLOAT32', None, False, 'Local Digital Inputs', 'Measured flow unit on DI2 if DI2 mode is set to Pulse'),
+        (0x04C2, 1, 'UINT16', None, False, 'Local Digital Inputs', 'Commodity of device connected to DI1'),
+        (0x04C3, 1, 'UINT16', None, False, 'Local Digital Inputs', 'Commodity of device connected to DI2'),
+        (0x04C4, 1, 'UINT16', None, False, 'Local Digital Inputs', 'Features assigned to digital input'),
+        (0x04C5, 1, 'UINT16', None, False, 'Local Digital Inputs', 'Features assigned to digital input'),
+        (0x04C6, 1, 'UINT16', None, False, 'Local Digital Inputs', 'Digital input DI1 electrical status. Indicates the electrical status of the input, regardless of the assignment reference & polarity'),
+        (0x04C7, 1, 'UINT16', None, False, 'Local Digital Inputs', 'Digital input DI2 electrical status. Indicates the electrical status of the input, regardless of the assignment reference & polarity'),
+        (0x04C8, 1, 'UINT16', None, False, 'Local Digital Inputs', 'Polarity of the Digital Input DI1'),
+        (0x04C9, 1, 'UINT16', None, False, 'Local Digital Inputs', 'Polarity of the Digital Input DI2'),
+        (0x04CA, 10, 'ASCII', None, False, 'Local Digital Inputs', "Text giving the context of use of the Digital Input DI1 when DI1 is defined as 'Custom'"),
+        (0x04D4, 10, 'ASCII', None, False, 'Local Digital Inputs', "Text giving the context of use of the Digital Input DI2 when DI2 is defined as 'Custom'"),
+        (0x04DE, 10, 'ASCII', None, False, 'Local Digital Inputs', "Text defining the inactive value of the Digital Input DI1 when DI1 is defined as 'Custom'"),
+        (0x04E8, 10, 'ASCII', None, False, 'Local Digital Inputs', "Text defining the inactive value of the Digital Input DI2 when DI2 is defined as 'Custom'"),
+        (0x04F2, 10, 'ASCII', None, False, 'Local Digital Inputs', "Text defining the active value of the Digital Input DI1 when DI1 is defined as 'Custom'"),
+        (0x04FC, 10, 'ASCII', None, False, 'Local Digital Inputs', "Text defining the active value of the Digital Input DI2 when DI2 is defined as 'Custom'"),
+        (0x0506, 1, 'UINT16', None, False, 'Local Digital Inputs', 'Feature assigned to digital input'),
+        (0x0507, 1, 'UINT16', None, False, 'Local Digital Inputs', 'Feature assigned to digital input'),
+        (0x0508, 20, 'ASCII', None, False, 'Local Digital Inputs', 'Custom Metering accumulated name for DI1. Only applicable if DI mode is "Pulse"'),
+        (0x051C, 20, 'ASCII', None, False, 'Local Digital Inputs', 'Custom Metering accumulated name for DI2 Only applicable if DI mode is "Pulse"'),
+        (0x0530, 20, 'ASCII', None, False, 'Local Digital Inputs', 'Metering accumulated custom unit for DI1. Unit defined at Commissioning time. Used only if unit is custom. Only applicable if DI mode is "Pulse"'),
+        (0x0544, 20, 'ASCII', None, False, 'Local Digital Inputs', 'Metering accumulated custom unit for DI2. Unit defined at Commissioning time. Used only if unit is custom. Only applicable if DI mode is "Pulse"'),
+        (0x0558, 20, 'ASCII', None, False, 'Local Digital Inputs', 'Custom Flow name for DI1. Only applicable if DI mode is "Pulse"'),
+        (0x056C, 20, 'ASCII', None, False, 'Local Digital Inputs', 'Custom Flow name for DI2. Only applicable if DI mode is "Pulse"'),
+        (0x0580, 20, 'ASCII', None, False, 'Local Digital Inputs', 'Measured Flow custom unit for DI1. Unit defined at Commissioning time. Used only if unit is custom. Only applicable if DI mode is "Pulse"'),
+        (0x0594, 20, 'ASCII', None, False, 'Local Digital Inputs', 'Measured Flow custom unit for DI2. Unit defined at Commissioning time. Used only if unit is custom. Only applicable if DI mode is "Pulse"'),
+        (0x1605, 32, 'ASCII', None, False, 'Identification', 'EcoStruxure Panel Server user application name'),
+        (0xF002, 1, 'UINT16', None, False, 'Identification', 'EcoStruxure Panel Server product identifier'),
+        (0xF003, 16, 'ASCII', None, False, 'Identification', 'EcoStruxure Panel Server product model'),
+    ),
+    RegisterTable.POWERTAG_63: _table('TAG', ('A1', 'A2', 'P1', 'F1', 'F2', 'F3'),
+        (0x0BB7, 2, 'FLOAT32', 'A', False, 'Current Metering Data', 'RMS current on phase A', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BB9, 2, 'FLOAT32', 'A', False, 'Current Metering Data', 'RMS current on phase B', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BBB, 2, 'FLOAT32', 'A', False, 'Current Metering Data', 'RMS current on phase C', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BCB, 2, 'FLOAT32', 'V', False, 'Voltage Metering Data', 'RMS phase-to-phase voltage A-B', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BCD, 2, 'FLOAT32', 'V', False, 'Voltage Metering Data', 'RMS phase-to-phase voltage B-C', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BCF, 2, 'FLOAT32', 'V', False, 'Voltage Metering Data', 'RMS phase-to-phase voltage C-A', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BD3, 2, 'FLOAT32', 'V', False, 'Voltage Metering Data', 'RMS phase-to-neutral voltage A-N', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BD5, 2, 'FLOAT32', 'V', False, 'Voltage Metering Data', 'RMS phase-to-neutral voltage B-N', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BD7, 2, 'FLOAT32', 'V', False, 'Voltage Metering Data', 'RMS phase-to-neutral voltage C-N', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BED, 2, 'FLOAT32', 'W', False, 'Power Metering Data', 'Active power on phase A', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BEF, 2, 'FLOAT32', 'W', False, 'Power Metering Data', 'Active power on phase B', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BF1, 2, 'FLOAT32', 'W', False, 'Power Metering Data', 'Active power on phase C', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BF3, 2, 'FLOAT32', 'W', False, 'Power Metering Data', 'Total active power', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C03, 2, 'FLOAT32', 'VA', False, 'Power Metering Data', 'Total apparent power (arithmetic)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C0B, 2, 'FLOAT32', None, False, 'Power Factor Metering Data', 'Total power factor', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C3B, 2, 'FLOAT32', '°C', False, 'Device Temperature Metering Data', 'Device internal temperature', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C83, 4, 'INT64', 'Wh', False, 'Energy Data - Legacy Zone', 'Total active energy delivered + received (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CB7, 4, 'INT64', 'Wh', False, 'Energy Data - Legacy Zone', 'Partial active energy delivered + received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CBB, 4, 'INT64', 'Wh', True, 'Energy Data - Legacy Zone', 'Set partial active energy counter. The value returns to zero by Panel Server.'),
+        (0x0CBF, 4, 'INT64', 'Wh', False, 'Energy Data - Legacy Zone', 'Partial active energy delivered (resettable)'),
+        (0x0CC3, 4, 'INT64', 'Wh', True, 'Energy Data - Legacy Zone', 'Set partial active energy delivered counter. The value returns to zero by Panel Server.'),
+        (0x0CC7, 4, 'INT64', 'Wh', False, 'Energy Data - Legacy Zone', 'Partial active energy received (resettable)', ('PANEL_SERVER', 'SMARTLINK')),
+        (0x0CCB, 4, 'INT64', 'Wh', True, 'Energy Data - Legacy Zone', 'Set partial active energy received counter. The value returns to zero by Panel Server.'),
+        (0x0CE1, 2, 'BITMAP', None, False, 'Load Monitoring - Alarm', 'Validity of the alarm bitmap (0 = Invalid / 1 = Valid) – refer to register 3300', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CE3, 2, 'BITMAP', None, False, 'Load Monitoring - Alarm', 'Alarm bitmap status (0 = Inactive / 1 = Active)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CE5, 2, 'FLOAT32', 'A', False, 'Load Monitoring - Alarm', 'Last RMS current measured on phase B when voltage loss occurred', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CE7, 2, 'FLOAT32', 'A', False, 'Load Monitoring - Alarm', 'Last RMS current measured on phase A when voltage loss occurred', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CE9, 2, 'FLOAT32', 'A', False, 'Load Monitoring - Alarm', 'Last RMS current measured on phase C when voltage loss occurred', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CED, 2, 'FLOAT32', 'W', False, 'Load Monitoring - Alarm', 'Active power threshold for load operating time counter.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1390, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy delivered (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x1394, 4, 'INT64', 'Wh', False, 'Energy Data – New Zone', 'Active energy delivered count positively (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x1398, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x139C, 4, 'INT64', 'Wh', False, 'Energy Data – New Zone', 'Active energy received count negatively (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x13B8, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy on phase A delivered (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x13BC, 4, 'INT64', 'Wh', False, 'Energy Data – New Zone', 'Active energy on phase A delivered (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x13C0, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy on phase A received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x13C4, 4, 'INT64', 'Wh', False, 'Energy Data – New Zone', 'Active energy on phase A received (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x13E0, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy on phase B delivered (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x13E4, 4, 'INT64', 'Wh', False, 'Energy Data – New Zone', 'Active energy on phase B delivered (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x13E8, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy on phase B received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x13EC, 4, 'INT64', 'Wh', False, 'Energy Data – New Zone', 'Active energy on phase B received (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1408, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy on phase C delivered (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x140C, 4, 'INT64', 'Wh', False, 'Energy Data – New Zone', 'Active energy on phase C delivered (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1410, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy on phase C received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1414, 4, 'INT64', 'Wh', False, 'Energy Data – New Zone', 'Active energy on phase C received (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7724, 1, 'UINT16', None, False, 'Identification', 'Product ID of the Panel Server'),
+        (0x7725, 16, 'ASCII', None, False, 'Identification', 'Commercial reference of the Panel Server'),
+        (0x7735, 6, 'ASCII', None, False, 'Identification', 'Firmware version of the Panel Server'),
+        (0x773B, 10, 'ASCII', None, False, 'Identification', 'Serial number of the Panel Server'),
+        (0x7745, 8, 'ASCII', None, False, 'Identification', 'Product model of the Panel Server'),
+        (0x7918, 10, 'ASCII', None, False, 'Configuration', 'Device name of the wireless device. The user can enter maximum 20 characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7922, 3, 'ASCII', None, False, 'Configuration', 'Label of the wireless device. The user can enter maximum five characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7925, 1, 'UINT16', None, False, 'Configuration', 'Indicates the usage of the wireless device with:', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7926, 1, 'UINT16', None, False, 'Configuration', 'Phase sequence with:', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7927, 1, 'UINT16', None, False, 'Configuration', 'Mounting position', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7929, 1, 'UINT16', 'A', False, 'Configuration', 'Rated current of the protective device to the wireless device', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x792B, 2, 'FLOAT32', 'V', False, 'Configuration', 'Rated voltage:', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x792D, 1, 'UINT16', None, False, 'Configuration', 'Indicates the commodity of the wireless device'),
+        (0x792F, 1, 'UINT16', None, False, 'Configuration', 'Power supply type', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x7931, 1, 'UINT16', None, False, 'Device Identification', 'Virtual Modbus server address', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7932, 4, 'UINT64', None, False, 'Device Identification', 'Wireless device radio frequency identifier (RF-Id)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7937, 1, 'UINT16', None, False, 'Device Identification', 'Wireless product identifier', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7944, 16, 'ASCII', None, False, 'Device Identification', 'Vendor name', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7954, 16, 'ASCII', None, False, 'Device Identification', 'Commercial reference', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x7964, 6, 'ASCII', None, False, 'Device Identification', 'Firmware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x796A, 6, 'ASCII', None, False, 'Device Identification', 'Hardware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7970, 10, 'ASCII', None, False, 'Device Identification', 'Serial number', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x797A, 8, 'ASCII', None, False, 'Device Identification', 'Product range', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7982, 8, 'ASCII', None, False, 'Device Identification', 'Product model', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x798A, 8, 'ASCII', None, False, 'Device Identification', 'Product family', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x79A8, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Validity of the RF communication between PowerTag system and Panel Server status.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79A9, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Communication status between Panel Server and wireless devices.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79AA, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'Packet Error Rate (PER) of the device, received by Panel Server'),
+        (0x79AC, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'RSSI of the device, received by Panel Server'),
+        (0x79AE, 1, 'UINT16', None, False, 'Diagnostic Data', 'Link Quality Indicator (LQI) of the device, received by Panel Server'),
+        (0x79AF, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER of gateway, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B1, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'Radio Signal Strength Indicator (RSSI) calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B3, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B4, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER – Maximum value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B6, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'RSSI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B8, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+    ),
+    RegisterTable.POWERTAG_250_630: _table('TAG', ('M0', 'M1', 'M2', 'M3'),
+        (0x0BB7, 2, 'FLOAT32', 'A', False, 'Current Metering Data', 'RMS current on phase A', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BB9, 2, 'FLOAT32', 'A', False, 'Current Metering Data', 'RMS current on phase B', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BBB, 2, 'FLOAT32', 'A', False, 'Current Metering Data', 'RMS current on phase C', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BCB, 2, 'FLOAT32', 'V', False, 'Voltage Metering Data', 'RMS phase-to-phase voltage A-B', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BCD, 2, 'FLOAT32', 'V', False, 'Voltage Metering Data', 'RMS phase-to-phase voltage B-C', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BCF, 2, 'FLOAT32', 'V', False, 'Voltage Metering Data', 'RMS phase-to-phase voltage C-A', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BD3, 2, 'FLOAT32', 'V', False, 'Voltage Metering Data', 'RMS phase-to-neutral voltage A-N', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BD5, 2, 'FLOAT32', 'V', False, 'Voltage Metering Data', 'RMS phase-to-neutral voltage B-N', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BD7, 2, 'FLOAT32', 'V', False, 'Voltage Metering Data', 'RMS phase-to-neutral voltage C-N', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BED, 2, 'FLOAT32', 'W', False, 'Power Metering Data', 'Active power on phase A', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BEF, 2, 'FLOAT32', 'W', False, 'Power Metering Data', 'Active power on phase B', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BF1, 2, 'FLOAT32', 'W', False, 'Power Metering Data', 'Active power on phase C', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BF3, 2, 'FLOAT32', 'W', False, 'Power Metering Data', 'Total active power', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BFB, 2, 'FLOAT32', 'VAR', False, 'Power Metering Data', 'Total reactive power', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C03, 2, 'FLOAT32', 'VA', False, 'Power Metering Data', 'Total apparent power (arithmetic)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C0B, 2, 'FLOAT32', None, False, 'Power Factor Metering Data', 'Total power factor', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C25, 2, 'FLOAT32', 'Hz', False, 'Frequency Metering Data', 'AC frequency', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C3B, 2, 'FLOAT32', '°C', False, 'Device Temperature Metering Data', 'Device internal temperature', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C83, 4, 'INT64', 'Wh', False, 'Energy Data - Legacy Zone', 'Total active energy delivered + received (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C87, 4, 'INT64', 'Wh', False, 'Energy Data - Legacy Zone', 'Total active energy delivered count positively (not resettable)', ('PANEL_SERVER', 'SMARTLINK')),
+        (0x0C8B, 4, 'INT64', 'Wh', False, 'Energy Data - Legacy Zone', 'Total active energy received (not resettable)', ('PANEL_SERVER', 'SMARTLINK')),
+        (0x0C8F, 4, 'INT64', 'Wh', False, 'Energy Data - Legacy Zone', 'Active energy on phase A delivered – received (not resettable)'),
+        (0x0C93, 4, 'INT64', 'Wh', False, 'Energy Data - Legacy Zone', 'Active energy on phase B delivered – received (not resettable)'),
+        (0x0C97, 4, 'INT64', 'Wh', False, 'Energy Data - Legacy Zone', 'Active energy on phase C delivered – received (not resettable)'),
+        (0x0CB7, 4, 'INT64', 'Wh', False, 'Energy Data - Legacy Zone', 'Partial active energy delivered + received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CBB, 4, 'INT64', 'Wh', True, 'Energy Data - Legacy Zone', 'Set partial active energy counter. The value returns to zero by Panel Server.'),
+        (0x0CBF, 4, 'INT64', 'Wh', False, 'Energy Data - Legacy Zone', 'Partial active energy delivered (resettable)'),
+        (0x0CC3, 4, 'INT64', 'Wh', True, 'Energy Data - Legacy Zone', 'Set partial active energy delivered counter. The value returns to zero by Panel Server.'),
+        (0x0CC7, 4, 'INT64', 'Wh', False, 'Energy Data - Legacy Zone', 'Partial active energy received (resettable)', ('PANEL_SERVER', 'SMARTLINK')),
+        (0x0CCB, 4, 'INT64', 'Wh', True, 'Energy Data - Legacy Zone', 'Set partial active energy received counter. The value returns to zero by Panel Server.'),
+        (0x0CCF, 4, 'INT64', 'VARh', False, 'Energy Data - Legacy Zone', 'Partial reactive energy delivered (resettable)', ('PANEL_SERVER', 'SMARTLINK')),
+        (0x0CD3, 4, 'INT64', 'VARh', True, 'Energy Data - Legacy Zone', 'Set partial reactive energy delivered counter. The value returns to zero by Panel Server.'),
+        (0x0CD7, 4, 'INT64', 'VARh', False, 'Energy Data - Legacy Zone', 'Partial reactive energy received (resettable)', ('PANEL_SERVER', 'SMARTLINK')),
+        (0x0CDB, 4, 'INT64', 'VARh', True, 'Energy Data - Legacy Zone', 'Set partial reactive energy received counter. The value returns to zero by Panel Server.'),
+        (0x0CE1, 2, 'BITMAP', None, False, 'Load Monitoring - Alarm', 'Validity of the alarm bitmap (0 = Invalid / 1 = Valid) – refer to register 3300', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CE3, 2, 'BITMAP', None, False, 'Load Monitoring - Alarm', 'Alarm bitmap status (0 = Inactive / 1 = Active)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CE5, 2, 'FLOAT32', 'A', False, 'Load Monitoring - Alarm', 'Last RMS current measured on phase B when voltage loss occurred', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CE7, 2, 'FLOAT32', 'A', False, 'Load Monitoring - Alarm', 'Last RMS current measured on phase A when voltage loss occurred', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CE9, 2, 'FLOAT32', 'A', False, 'Load Monitoring - Alarm', 'Last RMS current measured on phase C when voltage loss occurred', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CED, 2, 'FLOAT32', 'W', False, 'Load Monitoring - Alarm', 'Active power threshold for load operating time counter.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1390, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy delivered (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x1398, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x1438, 4, 'INT64', 'VARh', True, 'Energy Data – New Zone', 'Reactive energy delivered (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x1448, 4, 'INT64', 'VARh', True, 'Energy Data – New Zone', 'Reactive energy received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x7724, 1, 'UINT16', None, False, 'Identification', 'Product ID of the Panel Server'),
+        (0x7725, 16, 'ASCII', None, False, 'Identification', 'Commercial reference of the Panel Server'),
+        (0x7735, 6, 'ASCII', None, False, 'Identification', 'Firmware version of the Panel Server'),
+        (0x773B, 10, 'ASCII', None, False, 'Identification', 'Serial number of the Panel Server'),
+        (0x7745, 8, 'ASCII', None, False, 'Identification', 'Product model of the Panel Server'),
+        (0x7918, 10, 'ASCII', None, False, 'Configuration', 'Device name of the wireless device. The user can enter maximum 20 characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7922, 3, 'ASCII', None, False, 'Configuration', 'Label of the wireless device. The user can enter maximum five characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7925, 1, 'UINT16', None, False, 'Configuration', 'Indicates the usage of the wireless device with:', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7926, 1, 'UINT16', None, False, 'Configuration', 'Phase sequence with:', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7927, 1, 'UINT16', None, False, 'Configuration', 'Mounting position', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7929, 1, 'UINT16', 'A', False, 'Configuration', 'Rated current of the protective device to the wireless device', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x792A, 1, 'UINT16', None, False, 'Configuration', 'Electrical network system type', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x792B, 2, 'FLOAT32', 'V', False, 'Configuration', 'Rated voltage:', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x792D, 1, 'UINT16', None, False, 'Configuration', 'Indicates the commodity of the wireless device'),
+        (0x792F, 1, 'UINT16', None, False, 'Configuration', 'Power supply type', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x7931, 1, 'UINT16', None, False, 'Device Identification', 'Virtual Modbus server address', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7932, 4, 'UINT64', None, False, 'Device Identification', 'Wireless device radio frequency identifier (RF-Id)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7937, 1, 'UINT16', None, False, 'Device Identification', 'Wireless product identifier', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7944, 16, 'ASCII', None, False, 'Device Identification', 'Vendor name', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7954, 16, 'ASCII', None, False, 'Device Identification', 'Commercial reference', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x7964, 6, 'ASCII', None, False, 'Device Identification', 'Firmware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x796A, 6, 'ASCII', None, False, 'Device Identification', 'Hardware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7970, 10, 'ASCII', None, False, 'Device Identification', 'Serial number', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x797A, 8, 'ASCII', None, False, 'Device Identification', 'Product range', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7982, 8, 'ASCII', None, False, 'Device Identification', 'Product model', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x798A, 8, 'ASCII', None, False, 'Device Identification', 'Product family', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x79A8, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Validity of the RF communication between PowerTag system and Panel Server status.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79A9, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Communication status between Panel Server and wireless devices.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79AA, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'Packet Error Rate (PER) of the device, received by Panel Server'),
+        (0x79AC, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'RSSI of the device, received by Panel Server'),
+        (0x79AE, 1, 'UINT16', None, False, 'Diagnostic Data', 'Link Quality Indicator (LQI) of the device, received by Panel Server'),
+        (0x79AF, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER of gateway, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B1, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'Radio Signal Strength Indicator (RSSI) calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B3, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B4, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER – Maximum value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B6, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'RSSI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B8, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+    ),
+    RegisterTable.POWERTAG_ROPE: _table('TAG', ('FL', 'R1'),
+        (0x0BB7, 2, 'FLOAT32', 'A', False, 'Current Metering Data', 'RMS current on phase A', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BB9, 2, 'FLOAT32', 'A', False, 'Current Metering Data', 'RMS current on phase B', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BBB, 2, 'FLOAT32', 'A', False, 'Current Metering Data', 'RMS current on phase C', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BBD, 2, 'FLOAT32', 'A', False, 'Current Metering Data', 'RMS current on Neutral', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BCB, 2, 'FLOAT32', 'V', False, 'Voltage Metering Data', 'RMS phase-to-phase voltage A-B', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BCD, 2, 'FLOAT32', 'V', False, 'Voltage Metering Data', 'RMS phase-to-phase voltage B-C', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BCF, 2, 'FLOAT32', 'V', False, 'Voltage Metering Data', 'RMS phase-to-phase voltage C-A', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BD3, 2, 'FLOAT32', 'V', False, 'Voltage Metering Data', 'RMS phase-to-neutral voltage A-N', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BD5, 2, 'FLOAT32', 'V', False, 'Voltage Metering Data', 'RMS phase-to-neutral voltage B-N', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BD7, 2, 'FLOAT32', 'V', False, 'Voltage Metering Data', 'RMS phase-to-neutral voltage C-N', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BED, 2, 'FLOAT32', 'W', False, 'Power Metering Data', 'Active power on phase A', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BEF, 2, 'FLOAT32', 'W', False, 'Power Metering Data', 'Active power on phase B', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BF1, 2, 'FLOAT32', 'W', False, 'Power Metering Data', 'Active power on phase C', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BF3, 2, 'FLOAT32', 'W', False, 'Power Metering Data', 'Total active power', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BF5, 2, 'FLOAT32', 'VAR', False, 'Power Metering Data', 'Reactive power on phase A', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BF7, 2, 'FLOAT32', 'VAR', False, 'Power Metering Data', 'Reactive power on phase B', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BF9, 2, 'FLOAT32', 'VAR', False, 'Power Metering Data', 'Reactive power on phase C', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BFB, 2, 'FLOAT32', 'VAR', False, 'Power Metering Data', 'Total reactive power', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BFD, 2, 'FLOAT32', 'VA', False, 'Power Metering Data', 'Apparent power on phase A', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BFF, 2, 'FLOAT32', 'VA', False, 'Power Metering Data', 'Apparent power on phase B', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C01, 2, 'FLOAT32', 'VA', False, 'Power Metering Data', 'Apparent power on phase C', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C03, 2, 'FLOAT32', 'VA', False, 'Power Metering Data', 'Total apparent power (arithmetic)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C05, 2, 'FLOAT32', None, False, 'Power Factor Metering Data', 'Power factor on phase A', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C07, 2, 'FLOAT32', None, False, 'Power Factor Metering Data', 'Power factor on phase B', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C09, 2, 'FLOAT32', None, False, 'Power Factor Metering Data', 'Power factor on phase C', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C0B, 2, 'FLOAT32', None, False, 'Power Factor Metering Data', 'Total power factor', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C0D, 1, 'UINT16', None, False, 'Power Factor Metering Data', 'Power factor sign convention', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C25, 2, 'FLOAT32', 'Hz', False, 'Frequency Metering Data', 'AC frequency', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C3B, 2, 'FLOAT32', '°C', False, 'Device Temperature Metering Data', 'Device internal temperature', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C83, 4, 'INT64', 'Wh', False, 'Energy Data - Legacy Zone', 'Total active energy delivered + received (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C87, 4, 'INT64', 'Wh', False, 'Energy Data - Legacy Zone', 'Total active energy delivered count positively (not resettable)', ('PANEL_SERVER', 'SMARTLINK')),
+        (0x0C8B, 4, 'INT64', 'Wh', False, 'Energy Data - Legacy Zone', 'Total active energy received (not resettable)', ('PANEL_SERVER', 'SMARTLINK')),
+        (0x0CB7, 4, 'INT64', 'Wh', False, 'Energy Data - Legacy Zone', 'Partial active energy delivered + received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CBB, 4, 'INT64', 'Wh', True, 'Energy Data - Legacy Zone', 'Set partial active energy counter. The value returns to zero by Panel Server.'),
+        (0x0CBF, 4, 'INT64', 'Wh', False, 'Energy Data - Legacy Zone', 'Partial active energy delivered (resettable)'),
+        (0x0CC3, 4, 'INT64', 'Wh', True, 'Energy Data - Legacy Zone', 'Set partial active energy delivered counter. The value returns to zero by Panel Server.'),
+        (0x0CC7, 4, 'INT64', 'Wh', False, 'Energy Data - Legacy Zone', 'Partial active energy received (resettable)', ('PANEL_SERVER', 'SMARTLINK')),
+        (0x0CCB, 4, 'INT64', 'Wh', True, 'Energy Data - Legacy Zone', 'Set partial active energy received counter. The value returns to zero by Panel Server.'),
+        (0x0CCF, 4, 'INT64', 'VARh', False, 'Energy Data - Legacy Zone', 'Partial reactive energy delivered (resettable)', ('PANEL_SERVER', 'SMARTLINK')),
+        (0x0CD3, 4, 'INT64', 'VARh', True, 'Energy Data - Legacy Zone', 'Set partial reactive energy delivered counter. The value returns to zero by Panel Server.'),
+        (0x0CD7, 4, 'INT64', 'VARh', False, 'Energy Data - Legacy Zone', 'Partial reactive energy received (resettable)', ('PANEL_SERVER', 'SMARTLINK')),
+        (0x0CDB, 4, 'INT64', 'VARh', True, 'Energy Data - Legacy Zone', 'Set partial reactive energy received counter. The value returns to zero by Panel Server.'),
+        (0x0CE1, 2, 'BITMAP', None, False, 'Load Monitoring - Alarm', 'Validity of the alarm bitmap (0 = Invalid / 1 = Valid) – refer to register 3300', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CE3, 2, 'BITMAP', None, False, 'Load Monitoring - Alarm', 'Alarm bitmap status (0 = Inactive / 1 = Active)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CE5, 2, 'FLOAT32', 'A', False, 'Load Monitoring - Alarm', 'Last RMS current measured on phase B when voltage loss occurred', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CE7, 2, 'FLOAT32', 'A', False, 'Load Monitoring - Alarm', 'Last RMS current measured on phase A when voltage loss occurred', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CE9, 2, 'FLOAT32', 'A', False, 'Load Monitoring - Alarm', 'Last RMS current measured on phase C when voltage loss occurred', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CED, 2, 'FLOAT32', 'W', False, 'Load Monitoring - Alarm', 'Active power threshold for load operating time counter.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1390, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy delivered (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x1394, 4, 'INT64', 'Wh', False, 'Energy Data – New Zone', 'Active energy delivered count positively (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x1398, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x139C, 4, 'INT64', 'Wh', False, 'Energy Data – New Zone', 'Active energy received count negatively (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x13B8, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy on phase A delivered (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x13BC, 4, 'INT64', 'Wh', False, 'Energy Data – New Zone', 'Active energy on phase A delivered (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x13C0, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy on phase A received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x13C4, 4, 'INT64', 'Wh', False, 'Energy Data – New Zone', 'Active energy on phase A received (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x13E0, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy on phase B delivered (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x13E4, 4, 'INT64', 'Wh', False, 'Energy Data – New Zone', 'Active energy on phase B delivered (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x13E8, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy on phase B received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x13EC, 4, 'INT64', 'Wh', False, 'Energy Data – New Zone', 'Active energy on phase B received (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1408, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy on phase C delivered (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x140C, 4, 'INT64', 'Wh', False, 'Energy Data – New Zone', 'Active energy on phase C delivered (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1410, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy on phase C received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1414, 4, 'INT64', 'Wh', False, 'Energy Data – New Zone', 'Active energy on phase C received (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1438, 4, 'INT64', 'VARh', True, 'Energy Data – New Zone', 'Reactive energy delivered (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x143C, 4, 'INT64', 'VARh', False, 'Energy Data – New Zone', 'Reactive energy delivered count positively (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1448, 4, 'INT64', 'VARh', True, 'Energy Data – New Zone', 'Reactive energy received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x144C, 4, 'INT64', 'VARh', False, 'Energy Data – New Zone', 'Reactive energy received count negatively (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1470, 4, 'INT64', 'VARh', True, 'Energy Data – New Zone', 'Reactive energy on phase A delivered (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1474, 4, 'INT64', 'VARh', False, 'Energy Data – New Zone', 'Reactive energy on phase A delivered (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1478, 4, 'INT64', 'VARh', True, 'Energy Data – New Zone', 'Reactive energy on phase A received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x147C, 4, 'INT64', 'VARh', False, 'Energy Data – New Zone', 'Reactive energy on phase A received (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1498, 4, 'INT64', 'VARh', True, 'Energy Data – New Zone', 'Reactive energy on phase B delivered (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x149C, 4, 'INT64', 'VARh', False, 'Energy Data – New Zone', 'Reactive energy on phase B delivered (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x14A0, 4, 'INT64', 'VARh', True, 'Energy Data – New Zone', 'Reactive energy on phase B received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x14A4, 4, 'INT64', 'VARh', False, 'Energy Data – New Zone', 'Reactive energy on phase B received (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x14C0, 4, 'INT64', 'VARh', True, 'Energy Data – New Zone', 'Reactive energy on phase C delivered (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x14C4, 4, 'INT64', 'VARh', False, 'Energy Data – New Zone', 'Reactive energy on phase C delivered (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x14C8, 4, 'INT64', 'VARh', True, 'Energy Data – New Zone', 'Reactive energy on phase C received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x14CC, 4, 'INT64', 'VARh', False, 'Energy Data – New Zone', 'Reactive energy on phase C received (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x14F4, 4, 'INT64', 'VAh', True, 'Energy Data – New Zone', 'Apparent energy delivered + received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x14F8, 4, 'INT64', 'VAh', False, 'Energy Data – New Zone', 'Apparent energy delivered + received (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x150C, 4, 'INT64', 'VAh', True, 'Energy Data – New Zone', 'Apparent energy on phase A (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1510, 4, 'INT64', 'VAh', False, 'Energy Data – New Zone', 'Apparent energy on phase A (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1534, 4, 'INT64', 'VAh', True, 'Energy Data – New Zone', 'Apparent energy on phase B (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1538, 4, 'INT64', 'VAh', False, 'Energy Data – New Zone', 'Apparent energy on phase B (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x155C, 4, 'INT64', 'VAh', True, 'Energy Data – New Zone', 'Apparent energy on phase C (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1560, 4, 'INT64', 'VAh', False, 'Energy Data – New Zone', 'Apparent energy on phase C (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7724, 1, 'UINT16', None, False, 'Identification', 'Product ID of the Panel Server'),
+        (0x7725, 16, 'ASCII', None, False, 'Identification', 'Commercial reference of the Panel Server'),
+        (0x7735, 6, 'ASCII', None, False, 'Identification', 'Firmware version of the Panel Server'),
+        (0x773B, 10, 'ASCII', None, False, 'Identification', 'Serial number of the Panel Server'),
+        (0x7745, 8, 'ASCII', None, False, 'Identification', 'Product model of the Panel Server'),
+        (0x7918, 10, 'ASCII', None, False, 'Configuration', 'Device name of the wireless device. The user can enter maximum 20 characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7922, 3, 'ASCII', None, False, 'Configuration', 'Label of the wireless device. The user can enter maximum five characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7925, 1, 'UINT16', None, False, 'Configuration', 'Indicates the usage of the wireless device with:', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7926, 1, 'UINT16', None, False, 'Configuration', 'Phase sequence with:', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7927, 1, 'UINT16', None, False, 'Configuration', 'Mounting position', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7929, 1, 'UINT16', 'A', False, 'Configuration', 'Rated current of the protective device to the wireless device', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x792A, 1, 'UINT16', None, False, 'Configuration', 'Electrical network system type', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x792B, 2, 'FLOAT32', 'V', False, 'Configuration', 'Rated voltage:', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x792D, 1, 'UINT16', None, False, 'Configuration', 'Indicates the commodity of the wireless device'),
+        (0x792F, 1, 'UINT16', None, False, 'Configuration', 'Power supply type', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x7931, 1, 'UINT16', None, False, 'Device Identification', 'Virtual Modbus server address', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7932, 4, 'UINT64', None, False, 'Device Identification', 'Wireless device radio frequency identifier (RF-Id)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7937, 1, 'UINT16', None, False, 'Device Identification', 'Wireless product identifier', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7944, 16, 'ASCII', None, False, 'Device Identification', 'Vendor name', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7954, 16, 'ASCII', None, False, 'Device Identification', 'Commercial reference', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x7964, 6, 'ASCII', None, False, 'Device Identification', 'Firmware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x796A, 6, 'ASCII', None, False, 'Device Identification', 'Hardware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7970, 10, 'ASCII', None, False, 'Device Identification', 'Serial number', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x797A, 8, 'ASCII', None, False, 'Device Identification', 'Product range', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7982, 8, 'ASCII', None, False, 'Device Identification', 'Product model', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x798A, 8, 'ASCII', None, False, 'Device Identification', 'Product family', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x79A8, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Validity of the RF communication between PowerTag system and Panel Server status.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79A9, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Communication status between Panel Server and wireless devices.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79AA, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'Packet Error Rate (PER) of the device, received by Panel Server'),
+        (0x79AC, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'RSSI of the device, received by Panel Server'),
+        (0x79AE, 1, 'UINT16', None, False, 'Diagnostic Data', 'Link Quality Indicator (LQI) of the device, received by Panel Server'),
+        (0x79AF, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER of gateway, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B1, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'Radio Signal Strength Indicator (RSSI) calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B3, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B4, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER – Maximum value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B6, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'RSSI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B8, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+    ),
+    RegisterTable.TH110: _table('TAG', ('TEMP0',),
+        (0x0FA0, 2, 'FLOAT32', '°C', False, 'Ambient Data', 'Temperature value', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FA2, 2, 'FLOAT32', '°C', False, 'Ambient Data', 'Maximum value that the device is able to read (maximum measurable temperature).', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FA4, 2, 'FLOAT32', '°C', False, 'Ambient Data', 'Minimum value that the device is able to read (minimum measurable temperature).', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7724, 1, 'UINT16', None, False, 'Identification', 'Product ID of the Panel Server'),
+        (0x7725, 16, 'ASCII', None, False, 'Identification', 'Commercial reference of the Panel Server'),
+        (0x7735, 6, 'ASCII', None, False, 'Identification', 'Firmware version of the Panel Server'),
+        (0x773B, 10, 'ASCII', None, False, 'Identification', 'Serial number of the Panel Server'),
+        (0x7745, 8, 'ASCII', None, False, 'Identification', 'Product model of the Panel Server'),
+        (0x7918, 10, 'ASCII', None, False, 'Configuration', 'Device name of the wireless device. The user can enter maximum 20 characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7922, 3, 'ASCII', None, False, 'Configuration', 'Label of the wireless device. The user can enter maximum five characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x792D, 1, 'UINT16', None, False, 'Configuration', 'Indicates the commodity of the wireless device'),
+        (0x7931, 1, 'UINT16', None, False, 'Device Identification', 'Virtual Modbus server address', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7932, 4, 'UINT64', None, False, 'Device Identification', 'Wireless device radio frequency identifier (RF-Id)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7937, 1, 'UINT16', None, False, 'Device Identification', 'Wireless product identifier', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7944, 16, 'ASCII', None, False, 'Device Identification', 'Vendor name', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7954, 16, 'ASCII', None, False, 'Device Identification', 'Commercial reference', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x7964, 6, 'ASCII', None, False, 'Device Identification', 'Firmware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x796A, 6, 'ASCII', None, False, 'Device Identification', 'Hardware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7970, 10, 'ASCII', None, False, 'Device Identification', 'Serial number', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x797A, 8, 'ASCII', None, False, 'Device Identification', 'Product range', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7982, 8, 'ASCII', None, False, 'Device Identification', 'Product model', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x798A, 8, 'ASCII', None, False, 'Device Identification', 'Product family', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x79A8, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Validity of the RF communication between PowerTag system and Panel Server status.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79A9, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Communication status between Panel Server and wireless devices.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79AF, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER of gateway, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B1, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'Radio Signal Strength Indicator (RSSI) calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B3, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B4, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER – Maximum value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B6, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'RSSI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B8, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+    ),
+    RegisterTable.CL110: _table('TAG', (),
+        (0x0CE1, 2, 'BITMAP', None, False, 'Load Monitoring - Alarm', 'Validity of the alarm bitmap (0 = Invalid / 1 = Valid) – refer to register 3300', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CE3, 2, 'BITMAP', None, False, 'Load Monitoring - Alarm', 'Alarm bitmap status (0 = Inactive / 1 = Active)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CF3, 2, 'FLOAT32', 'V', False, 'Diagnostic Data', 'Battery voltage', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FA0, 2, 'FLOAT32', '°C', False, 'Ambient Data', 'Temperature value', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FA2, 2, 'FLOAT32', '°C', False, 'Ambient Data', 'Maximum value that the device is able to read (maximum measurable temperature).', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FA4, 2, 'FLOAT32', '°C', False, 'Ambient Data', 'Minimum value that the device is able to read (minimum measurable temperature).', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FA6, 2, 'FLOAT32', None, False, 'Ambient Data', 'Relative humidity value', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FA8, 2, 'FLOAT32', None, False, 'Ambient Data', 'Maximum value that the device is able to read (maximum measurable humidity).', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FAA, 2, 'FLOAT32', None, False, 'Ambient Data', 'Minimum value that the device is able to read (minimum measurable humidity).', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7724, 1, 'UINT16', None, False, 'Identification', 'Product ID of the Panel Server'),
+        (0x7725, 16, 'ASCII', None, False, 'Identification', 'Commercial reference of the Panel Server'),
+        (0x7735, 6, 'ASCII', None, False, 'Identification', 'Firmware version of the Panel Server'),
+        (0x773B, 10, 'ASCII', None, False, 'Identification', 'Serial number of the Panel Server'),
+        (0x7745, 8, 'ASCII', None, False, 'Identification', 'Product model of the Panel Server'),
+        (0x7918, 10, 'ASCII', None, False, 'Configuration', 'Device name of the wireless device. The user can enter maximum 20 characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7922, 3, 'ASCII', None, False, 'Configuration', 'Label of the wireless device. The user can enter maximum five characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x792D, 1, 'UINT16', None, False, 'Configuration', 'Indicates the commodity of the wireless device'),
+        (0x7931, 1, 'UINT16', None, False, 'Device Identification', 'Virtual Modbus server address', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7932, 4, 'UINT64', None, False, 'Device Identification', 'Wireless device radio frequency identifier (RF-Id)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7937, 1, 'UINT16', None, False, 'Device Identification', 'Wireless product identifier', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7944, 16, 'ASCII', None, False, 'Device Identification', 'Vendor name', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7954, 16, 'ASCII', None, False, 'Device Identification', 'Commercial reference', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x7964, 6, 'ASCII', None, False, 'Device Identification', 'Firmware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x796A, 6, 'ASCII', None, False, 'Device Identification', 'Hardware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7970, 10, 'ASCII', None, False, 'Device Identification', 'Serial number', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x797A, 8, 'ASCII', None, False, 'Device Identification', 'Product range', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7982, 8, 'ASCII', None, False, 'Device Identification', 'Product model', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x798A, 8, 'ASCII', None, False, 'Device Identification', 'Product family', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x79A8, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Validity of the RF communication between PowerTag system and Panel Server status.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79A9, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Communication status between Panel Server and wireless devices.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79AF, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER of gateway, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B1, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'Radio Signal Strength Indicator (RSSI) calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B3, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B4, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER – Maximum value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B6, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'RSSI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B8, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+    ),
+    RegisterTable.CO2: _table('TAG', ('CO2',),
+        (0x0CE1, 2, 'BITMAP', None, False, 'Load Monitoring - Alarm', 'Validity of the alarm bitmap (0 = Invalid / 1 = Valid) – refer to register 3300', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CE3, 2, 'BITMAP', None, False, 'Load Monitoring - Alarm', 'Alarm bitmap status (0 = Inactive / 1 = Active)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CF3, 2, 'FLOAT32', 'V', False, 'Diagnostic Data', 'Battery voltage', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FA0, 2, 'FLOAT32', '°C', False, 'Ambient Data', 'Temperature value', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FA2, 2, 'FLOAT32', '°C', False, 'Ambient Data', 'Maximum value that the device is able to read (maximum measurable temperature).', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FA4, 2, 'FLOAT32', '°C', False, 'Ambient Data', 'Minimum value that the device is able to read (minimum measurable temperature).', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FA6, 2, 'FLOAT32', None, False, 'Ambient Data', 'Relative humidity value', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FA8, 2, 'FLOAT32', None, False, 'Ambient Data', 'Maximum value that the device is able to read (maximum measurable humidity).', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FAA, 2, 'FLOAT32', None, False, 'Ambient Data', 'Minimum value that the device is able to read (minimum measurable humidity).', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FAE, 2, 'FLOAT32', None, False, 'Ambient Data', 'CO2 (Example:5000 ppm represented as 0,005)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7724, 1, 'UINT16', None, False, 'Identification', 'Product ID of the Panel Server'),
+        (0x7725, 16, 'ASCII', None, False, 'Identification', 'Commercial reference of the Panel Server'),
+        (0x7735, 6, 'ASCII', None, False, 'Identification', 'Firmware version of the Panel Server'),
+        (0x773B, 10, 'ASCII', None, False, 'Identification', 'Serial number of the Panel Server'),
+        (0x7745, 8, 'ASCII', None, False, 'Identification', 'Product model of the Panel Server'),
+        (0x7918, 10, 'ASCII', None, False, 'Configuration', 'Device name of the wireless device. The user can enter maximum 20 characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7922, 3, 'ASCII', None, False, 'Configuration', 'Label of the wireless device. The user can enter maximum five characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x792D, 1, 'UINT16', None, False, 'Configuration', 'Indicates the commodity of the wireless device'),
+        (0x7931, 1, 'UINT16', None, False, 'Device Identification', 'Virtual Modbus server address', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7932, 4, 'UINT64', None, False, 'Device Identification', 'Wireless device radio frequency identifier (RF-Id)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7937, 1, 'UINT16', None, False, 'Device Identification', 'Wireless product identifier', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7944, 16, 'ASCII', None, False, 'Device Identification', 'Vendor name', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7954, 16, 'ASCII', None, False, 'Device Identification', 'Commercial reference', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x7964, 6, 'ASCII', None, False, 'Device Identification', 'Firmware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x796A, 6, 'ASCII', None, False, 'Device Identification', 'Hardware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7970, 10, 'ASCII', None, False, 'Device Identification', 'Serial number', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x797A, 8, 'ASCII', None, False, 'Device Identification', 'Product range', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7982, 8, 'ASCII', None, False, 'Device Identification', 'Product model', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x798A, 8, 'ASCII', None, False, 'Device Identification', 'Product family', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x79A8, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Validity of the RF communication between PowerTag system and Panel Server status.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79A9, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Communication status between Panel Server and wireless devices.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79AF, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER of gateway, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B1, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'Radio Signal Strength Indicator (RSSI) calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B3, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B4, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER – Maximum value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B6, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'RSSI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B8, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+    ),
+    RegisterTable.TEMPERATURE_TRH: _table('TAG', ('TEMP1',),
+        (0x0CE1, 2, 'BITMAP', None, False, 'Load Monitoring - Alarm', 'Validity of the alarm bitmap (0 = Invalid / 1 = Valid) – refer to register 3300', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CE3, 2, 'BITMAP', None, False, 'Load Monitoring - Alarm', 'Alarm bitmap status (0 = Inactive / 1 = Active)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CF3, 2, 'FLOAT32', 'V', False, 'Diagnostic Data', 'Battery voltage', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FA0, 2, 'FLOAT32', '°C', False, 'Ambient Data', 'Temperature value', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FA2, 2, 'FLOAT32', '°C', False, 'Ambient Data', 'Maximum value that the device is able to read (maximum measurable temperature).', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FA4, 2, 'FLOAT32', '°C', False, 'Ambient Data', 'Minimum value that the device is able to read (minimum measurable temperature).', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FA6, 2, 'FLOAT32', None, False, 'Ambient Data', 'Relative humidity value', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FA8, 2, 'FLOAT32', None, False, 'Ambient Data', 'Maximum value that the device is able to read (maximum measurable humidity).', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FAA, 2, 'FLOAT32', None, False, 'Ambient Data', 'Minimum value that the device is able to read (minimum measurable humidity).', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7724, 1, 'UINT16', None, False, 'Identification', 'Product ID of the Panel Server'),
+        (0x7725, 16, 'ASCII', None, False, 'Identification', 'Commercial reference of the Panel Server'),
+        (0x7735, 6, 'ASCII', None, False, 'Identification', 'Firmware version of the Panel Server'),
+        (0x773B, 10, 'ASCII', None, False, 'Identification', 'Serial number of the Panel Server'),
+        (0x7745, 8, 'ASCII', None, False, 'Identification', 'Product model of the Panel Server'),
+        (0x7918, 10, 'ASCII', None, False, 'Configuration', 'Device name of the wireless device. The user can enter maximum 20 characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7922, 3, 'ASCII', None, False, 'Configuration', 'Label of the wireless device. The user can enter maximum five characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x792D, 1, 'UINT16', None, False, 'Configuration', 'Indicates the commodity of the wireless device'),
+        (0x7931, 1, 'UINT16', None, False, 'Device Identification', 'Virtual Modbus server address', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7932, 4, 'UINT64', None, False, 'Device Identification', 'Wireless device radio frequency identifier (RF-Id)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7937, 1, 'UINT16', None, False, 'Device Identification', 'Wireless product identifier', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7944, 16, 'ASCII', None, False, 'Device Identification', 'Vendor name', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7954, 16, 'ASCII', None, False, 'Device Identification', 'Commercial reference', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x7964, 6, 'ASCII', None, False, 'Device Identification', 'Firmware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x796A, 6, 'ASCII', None, False, 'Device Identification', 'Hardware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7970, 10, 'ASCII', None, False, 'Device Identification', 'Serial number', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x797A, 8, 'ASCII', None, False, 'Device Identification', 'Product range', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7982, 8, 'ASCII', None, False, 'Device Identification', 'Product model', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x798A, 8, 'ASCII', None, False, 'Device Identification', 'Product family', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x79A8, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Validity of the RF communication between PowerTag system and Panel Server status.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79A9, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Communication status between Panel Server and wireless devices.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79AF, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER of gateway, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B1, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'Radio Signal Strength Indicator (RSSI) calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B3, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B4, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER – Maximum value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B6, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'RSSI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B8, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+    ),
+    RegisterTable.HEATTAG: _table('TAG', (),
+        (0x0C3B, 2, 'FLOAT32', '°C', False, 'Device Temperature Metering Data', 'Device internal temperature', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CE1, 2, 'BITMAP', None, False, 'Load Monitoring - Alarm', 'Validity of the alarm bitmap (0 = Invalid / 1 = Valid) – refer to register 3300', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CE3, 2, 'BITMAP', None, False, 'Load Monitoring - Alarm', 'Alarm bitmap status (0 = Inactive / 1 = Active)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CF9, 1, 'BITMAP', None, False, 'HeatTag Sensor', 'HeatTag alarm type'),
+        (0x0CFA, 1, 'BITMAP', None, False, 'HeatTag Sensor', 'HeatTag alarm level'),
+        (0x0FA0, 2, 'FLOAT32', '°C', False, 'Ambient Data', 'Temperature value', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FA2, 2, 'FLOAT32', '°C', False, 'Ambient Data', 'Maximum value that the device is able to read (maximum measurable temperature).', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FA4, 2, 'FLOAT32', '°C', False, 'Ambient Data', 'Minimum value that the device is able to read (minimum measurable temperature).', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FA6, 2, 'FLOAT32', None, False, 'Ambient Data', 'Relative humidity value', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FA8, 2, 'FLOAT32', None, False, 'Ambient Data', 'Maximum value that the device is able to read (maximum measurable humidity).', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FAA, 2, 'FLOAT32', None, False, 'Ambient Data', 'Minimum value that the device is able to read (minimum measurable humidity).', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0FAC, 2, 'FLOAT32', None, False, 'Ambient Data', 'Air quality index'),
+        (0x7724, 1, 'UINT16', None, False, 'Identification', 'Product ID of the Panel Server'),
+        (0x7725, 16, 'ASCII', None, False, 'Identification', 'Commercial reference of the Panel Server'),
+        (0x7735, 6, 'ASCII', None, False, 'Identification', 'Firmware version of the Panel Server'),
+        (0x773B, 10, 'ASCII', None, False, 'Identification', 'Serial number of the Panel Server'),
+        (0x7745, 8, 'ASCII', None, False, 'Identification', 'Product model of the Panel Server'),
+        (0x7918, 10, 'ASCII', None, False, 'Configuration', 'Device name of the wireless device. The user can enter maximum 20 characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7922, 3, 'ASCII', None, False, 'Configuration', 'Label of the wireless device. The user can enter maximum five characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x792D, 1, 'UINT16', None, False, 'Configuration', 'Indicates the commodity of the wireless device'),
+        (0x7931, 1, 'UINT16', None, False, 'Device Identification', 'Virtual Modbus server address', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7932, 4, 'UINT64', None, False, 'Device Identification', 'Wireless device radio frequency identifier (RF-Id)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7937, 1, 'UINT16', None, False, 'Device Identification', 'Wireless product identifier', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7944, 16, 'ASCII', None, False, 'Device Identification', 'Vendor name', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7954, 16, 'ASCII', None, False, 'Device Identification', 'Commercial reference', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x7964, 6, 'ASCII', None, False, 'Device Identification', 'Firmware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x796A, 6, 'ASCII', None, False, 'Device Identification', 'Hardware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7970, 10, 'ASCII', None, False, 'Device Identification', 'Serial number', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x797A, 8, 'ASCII', None, False, 'Device Identification', 'Product range', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7982, 8, 'ASCII', None, False, 'Device Identification', 'Product model', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x798A, 8, 'ASCII', None, False, 'Device Identification', 'Product family', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x79A8, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Validity of the RF communication between PowerTag system and Panel Server status.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79A9, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Communication status between Panel Server and wireless devices.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79AC, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'RSSI of the device, received by Panel Server'),
+        (0x79AE, 1, 'UINT16', None, False, 'Diagnostic Data', 'Link Quality Indicator (LQI) of the device, received by Panel Server'),
+        (0x79AF, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER of gateway, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B1, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'Radio Signal Strength Indicator (RSSI) calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B3, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B4, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER – Maximum value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B6, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'RSSI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B8, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79C7, 1, 'UINT16', None, False, 'HeatTag Sensor', 'Operation mode'),
+    ),
+    RegisterTable.ACTI9_ACTIVE: _table('TAG', ('C',),
+        (0x0BB7, 2, 'FLOAT32', 'A', False, 'Current Metering Data', 'RMS current on phase A', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BB9, 2, 'FLOAT32', 'A', False, 'Current Metering Data', 'RMS current on phase B', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BBB, 2, 'FLOAT32', 'A', False, 'Current Metering Data', 'RMS current on phase C', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BD3, 2, 'FLOAT32', 'V', False, 'Voltage Metering Data', 'RMS phase-to-neutral voltage A-N', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BD5, 2, 'FLOAT32', 'V', False, 'Voltage Metering Data', 'RMS phase-to-neutral voltage B-N', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BD7, 2, 'FLOAT32', 'V', False, 'Voltage Metering Data', 'RMS phase-to-neutral voltage C-N', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BED, 2, 'FLOAT32', 'W', False, 'Power Metering Data', 'Active power on phase A', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BEF, 2, 'FLOAT32', 'W', False, 'Power Metering Data', 'Active power on phase B', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BF1, 2, 'FLOAT32', 'W', False, 'Power Metering Data', 'Active power on phase C', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BF3, 2, 'FLOAT32', 'W', False, 'Power Metering Data', 'Total active power', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0BFB, 2, 'FLOAT32', 'VAR', False, 'Power Metering Data', 'Total reactive power', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C03, 2, 'FLOAT32', 'VA', False, 'Power Metering Data', 'Total apparent power (arithmetic)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C0B, 2, 'FLOAT32', None, False, 'Power Factor Metering Data', 'Total power factor', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C0D, 1, 'UINT16', None, False, 'Power Factor Metering Data', 'Power factor sign convention', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C3B, 2, 'FLOAT32', '°C', False, 'Device Temperature Metering Data', 'Device internal temperature', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0C83, 4, 'INT64', 'Wh', False, 'Energy Data - Legacy Zone', 'Total active energy delivered + received (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CB7, 4, 'INT64', 'Wh', False, 'Energy Data - Legacy Zone', 'Partial active energy delivered + received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CBB, 4, 'INT64', 'Wh', True, 'Energy Data - Legacy Zone', 'Set partial active energy counter. The value returns to zero by Panel Server.'),
+        (0x0CBF, 4, 'INT64', 'Wh', False, 'Energy Data - Legacy Zone', 'Partial active energy delivered (resettable)'),
+        (0x0CC3, 4, 'INT64', 'Wh', True, 'Energy Data - Legacy Zone', 'Set partial active energy delivered counter. The value returns to zero by Panel Server.'),
+        (0x0CC7, 4, 'INT64', 'Wh', False, 'Energy Data - Legacy Zone', 'Partial active energy received (resettable)', ('PANEL_SERVER', 'SMARTLINK')),
+        (0x0CCB, 4, 'INT64', 'Wh', True, 'Energy Data - Legacy Zone', 'Set partial active energy received counter. The value returns to zero by Panel Server.'),
+        (0x0CCF, 4, 'INT64', 'VARh', False, 'Energy Data - Legacy Zone', 'Partial reactive energy delivered (resettable)', ('PANEL_SERVER', 'SMARTLINK')),
+        (0x0CD3, 4, 'INT64', 'VARh', True, 'Energy Data - Legacy Zone', 'Set partial reactive energy delivered counter. The value returns to zero by Panel Server.'),
+        (0x0CD7, 4, 'INT64', 'VARh', False, 'Energy Data - Legacy Zone', 'Partial reactive energy received (resettable)', ('PANEL_SERVER', 'SMARTLINK')),
+        (0x0CDB, 4, 'INT64', 'VARh', True, 'Energy Data - Legacy Zone', 'Set partial reactive energy received counter. The value returns to zero by Panel Server.'),
+        (0x0CE1, 2, 'BITMAP', None, False, 'Load Monitoring - Alarm', 'Validity of the alarm bitmap (0 = Invalid / 1 = Valid) – refer to register 3300', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CE3, 2, 'BITMAP', None, False, 'Load Monitoring - Alarm', 'Alarm bitmap status (0 = Inactive / 1 = Active)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CE5, 2, 'FLOAT32', 'A', False, 'Load Monitoring - Alarm', 'Last RMS current measured on phase B when voltage loss occurred', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CE7, 2, 'FLOAT32', 'A', False, 'Load Monitoring - Alarm', 'Last RMS current measured on phase A when voltage loss occurred', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CE9, 2, 'FLOAT32', 'A', False, 'Load Monitoring - Alarm', 'Last RMS current measured on phase C when voltage loss occurred', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CF5, 1, 'BITMAP', None, False, 'Load Monitoring - Alarm', 'Validity of the alarm bitmap (0 = Invalid / 1 = Valid) – refer to register 3319'),
+        (0x0CF6, 1, 'BITMAP', None, False, 'Load Monitoring - Alarm', 'Alarm bitmap status (0 = Inactive / 1 = Active)'),
+        (0x0CF7, 1, 'BITMAP', None, False, 'Load Monitoring - Alarm', 'Validity of the pre-alarm bitmap (0 = Invalid / 1 = Valid) – refer to register 3321'),
+        (0x0CF8, 1, 'BITMAP', None, False, 'Load Monitoring - Alarm', 'Pre-alarm bitmap status (0 = Inactive / 1 = Active)'),
+        (0x0D25, 2, 'FLOAT32', None, False, 'Protection Against Ground Faults', 'Ground fault level'),
+        (0x0D27, 2, 'FLOAT32', None, False, 'Protection Against Ground Faults', 'Pre-alarm on overload tripping threshold'),
+        (0x0D29, 2, 'FLOAT32', None, False, 'Protection Against Ground Faults', 'Pre-alarm on overvoltage tripping threshold'),
+        (0x0D2B, 2, 'FLOAT32', None, False, 'Protection Against Ground Faults', 'Pre-alarm on earthleakage current tripping threshold'),
+        (0x1390, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy delivered (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x1394, 4, 'INT64', 'Wh', False, 'Energy Data – New Zone', 'Active energy delivered count positively (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x1398, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x139C, 4, 'INT64', 'Wh', False, 'Energy Data – New Zone', 'Active energy received count negatively (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x13B8, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy on phase A delivered (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x13BC, 4, 'INT64', 'Wh', False, 'Energy Data – New Zone', 'Active energy on phase A delivered (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x13C0, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy on phase A received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x13C4, 4, 'INT64', 'Wh', False, 'Energy Data – New Zone', 'Active energy on phase A received (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x13E0, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy on phase B delivered (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x13E4, 4, 'INT64', 'Wh', False, 'Energy Data – New Zone', 'Active energy on phase B delivered (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x13E8, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy on phase B received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x13EC, 4, 'INT64', 'Wh', False, 'Energy Data – New Zone', 'Active energy on phase B received (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1408, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy on phase C delivered (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x140C, 4, 'INT64', 'Wh', False, 'Energy Data – New Zone', 'Active energy on phase C delivered (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1410, 4, 'INT64', 'Wh', True, 'Energy Data – New Zone', 'Active energy on phase C received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1414, 4, 'INT64', 'Wh', False, 'Energy Data – New Zone', 'Active energy on phase C received (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1438, 4, 'INT64', 'VARh', True, 'Energy Data – New Zone', 'Reactive energy delivered (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x143C, 4, 'INT64', 'VARh', False, 'Energy Data – New Zone', 'Reactive energy delivered count positively (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1448, 4, 'INT64', 'VARh', True, 'Energy Data – New Zone', 'Reactive energy received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x144C, 4, 'INT64', 'VARh', False, 'Energy Data – New Zone', 'Reactive energy received count negatively (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1470, 4, 'INT64', 'VARh', True, 'Energy Data – New Zone', 'Reactive energy on phase A delivered (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1474, 4, 'INT64', 'VARh', False, 'Energy Data – New Zone', 'Reactive energy on phase A delivered (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1478, 4, 'INT64', 'VARh', True, 'Energy Data – New Zone', 'Reactive energy on phase A received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x147C, 4, 'INT64', 'VARh', False, 'Energy Data – New Zone', 'Reactive energy on phase A received (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1498, 4, 'INT64', 'VARh', True, 'Energy Data – New Zone', 'Reactive energy on phase B delivered (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x149C, 4, 'INT64', 'VARh', False, 'Energy Data – New Zone', 'Reactive energy on phase B delivered (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x14A0, 4, 'INT64', 'VARh', True, 'Energy Data – New Zone', 'Reactive energy on phase B received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x14A4, 4, 'INT64', 'VARh', False, 'Energy Data – New Zone', 'Reactive energy on phase B received (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x14C0, 4, 'INT64', 'VARh', True, 'Energy Data – New Zone', 'Reactive energy on phase C delivered (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x14C4, 4, 'INT64', 'VARh', False, 'Energy Data – New Zone', 'Reactive energy on phase C delivered (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x14C8, 4, 'INT64', 'VARh', True, 'Energy Data – New Zone', 'Reactive energy on phase C received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x14CC, 4, 'INT64', 'VARh', False, 'Energy Data – New Zone', 'Reactive energy on phase C received (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x14F4, 4, 'INT64', 'VAh', True, 'Energy Data – New Zone', 'Apparent energy delivered + received (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x14F8, 4, 'INT64', 'VAh', False, 'Energy Data – New Zone', 'Apparent energy delivered + received (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x150C, 4, 'INT64', 'VAh', True, 'Energy Data – New Zone', 'Apparent energy on phase A (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1510, 4, 'INT64', 'VAh', False, 'Energy Data – New Zone', 'Apparent energy on phase A (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1534, 4, 'INT64', 'VAh', True, 'Energy Data – New Zone', 'Apparent energy on phase B (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1538, 4, 'INT64', 'VAh', False, 'Energy Data – New Zone', 'Apparent energy on phase B (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x155C, 4, 'INT64', 'VAh', True, 'Energy Data – New Zone', 'Apparent energy on phase C (resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x1560, 4, 'INT64', 'VAh', False, 'Energy Data – New Zone', 'Apparent energy on phase C (not resettable)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7724, 1, 'UINT16', None, False, 'Identification', 'Product ID of the Panel Server'),
+        (0x7725, 16, 'ASCII', None, False, 'Identification', 'Commercial reference of the Panel Server'),
+        (0x7735, 6, 'ASCII', None, False, 'Identification', 'Firmware version of the Panel Server'),
+        (0x773B, 10, 'ASCII', None, False, 'Identification', 'Serial number of the Panel Server'),
+        (0x7745, 8, 'ASCII', None, False, 'Identification', 'Product model of the Panel Server'),
+        (0x7918, 10, 'ASCII', None, False, 'Configuration', 'Device name of the wireless device. The user can enter maximum 20 characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7922, 3, 'ASCII', None, False, 'Configuration', 'Label of the wireless device. The user can enter maximum five characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7925, 1, 'UINT16', None, False, 'Configuration', 'Indicates the usage of the wireless device with:', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7926, 1, 'UINT16', None, False, 'Configuration', 'Phase sequence with:', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7929, 1, 'UINT16', 'A', False, 'Configuration', 'Rated current of the protective device to the wireless device', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x792B, 2, 'FLOAT32', 'V', False, 'Configuration', 'Rated voltage:', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x792D, 1, 'UINT16', None, False, 'Configuration', 'Indicates the commodity of the wireless device'),
+        (0x792F, 1, 'UINT16', None, False, 'Configuration', 'Power supply type', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x7931, 1, 'UINT16', None, False, 'Device Identification', 'Virtual Modbus server address', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7932, 4, 'UINT64', None, False, 'Device Identification', 'Wireless device radio frequency identifier (RF-Id)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7937, 1, 'UINT16', None, False, 'Device Identification', 'Wireless product identifier', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7944, 16, 'ASCII', None, False, 'Device Identification', 'Vendor name', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7954, 16, 'ASCII', None, False, 'Device Identification', 'Commercial reference', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x7964, 6, 'ASCII', None, False, 'Device Identification', 'Firmware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x796A, 6, 'ASCII', None, False, 'Device Identification', 'Hardware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7970, 10, 'ASCII', None, False, 'Device Identification', 'Serial number', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x797A, 8, 'ASCII', None, False, 'Device Identification', 'Product range', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7982, 8, 'ASCII', None, False, 'Device Identification', 'Product model', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x798A, 8, 'ASCII', None, False, 'Device Identification', 'Product family', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x79A8, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Validity of the RF communication between PowerTag system and Panel Server status.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79A9, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Communication status between Panel Server and wireless devices.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79AA, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'Packet Error Rate (PER) of the device, received by Panel Server'),
+        (0x79AC, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'RSSI of the device, received by Panel Server'),
+        (0x79AE, 1, 'UINT16', None, False, 'Diagnostic Data', 'Link Quality Indicator (LQI) of the device, received by Panel Server'),
+        (0x79AF, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER of gateway, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B1, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'Radio Signal Strength Indicator (RSSI) calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B3, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B4, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER – Maximum value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B6, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'RSSI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B8, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x80E8, 1, 'UINT16', None, False, 'Circuit breaker', 'Circuit breaker position'),
+    ),
+    RegisterTable.WIRELESS_INDICATION_AUXILIARY: _table('TAG', (),
+        (0x0C3B, 2, 'FLOAT32', '°C', False, 'Device Temperature Metering Data', 'Device internal temperature', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CE1, 2, 'BITMAP', None, False, 'Load Monitoring - Alarm', 'Validity of the alarm bitmap (0 = Invalid / 1 = Valid) – refer to register 3300', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x0CE3, 2, 'BITMAP', None, False, 'Load Monitoring - Alarm', 'Alarm bitmap status (0 = Inactive / 1 = Active)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7724, 1, 'UINT16', None, False, 'Identification', 'Product ID of the Panel Server'),
+        (0x7725, 16, 'ASCII', None, False, 'Identification', 'Commercial reference of the Panel Server'),
+        (0x7735, 6, 'ASCII', None, False, 'Identification', 'Firmware version of the Panel Server'),
+        (0x773B, 10, 'ASCII', None, False, 'Identification', 'Serial number of the Panel Server'),
+        (0x7745, 8, 'ASCII', None, False, 'Identification', 'Product model of the Panel Server'),
+        (0x7918, 10, 'ASCII', None, False, 'Configuration', 'Device name of the wireless device. The user can enter maximum 20 characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7922, 3, 'ASCII', None, False, 'Configuration', 'Label of the wireless device. The user can enter maximum five characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7925, 1, 'UINT16', None, False, 'Configuration', 'Indicates the usage of the wireless device with:', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7931, 1, 'UINT16', None, False, 'Device Identification', 'Virtual Modbus server address', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7932, 4, 'UINT64', None, False, 'Device Identification', 'Wireless device radio frequency identifier (RF-Id)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7937, 1, 'UINT16', None, False, 'Device Identification', 'Wireless product identifier', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7944, 16, 'ASCII', None, False, 'Device Identification', 'Vendor name', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7954, 16, 'ASCII', None, False, 'Device Identification', 'Commercial reference', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x7964, 6, 'ASCII', None, False, 'Device Identification', 'Firmware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x796A, 6, 'ASCII', None, False, 'Device Identification', 'Hardware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7970, 10, 'ASCII', None, False, 'Device Identification', 'Serial number', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x797A, 8, 'ASCII', None, False, 'Device Identification', 'Product range', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7982, 8, 'ASCII', None, False, 'Device Identification', 'Product model', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x798A, 8, 'ASCII', None, False, 'Device Identification', 'Product family', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x79A8, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Validity of the RF communication between PowerTag system and Panel Server status.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79A9, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Communication status between Panel Server and wireless devices.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79AA, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'Packet Error Rate (PER) of the device, received by Panel Server'),
+        (0x79AC, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'RSSI of the device, received by Panel Server'),
+        (0x79AE, 1, 'UINT16', None, False, 'Diagnostic Data', 'Link Quality Indicator (LQI) of the device, received by Panel Server'),
+        (0x79AF, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER of gateway, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B1, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'Radio Signal Strength Indicator (RSSI) calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B3, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B4, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER – Maximum value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B6, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'RSSI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B8, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x80E8, 1, 'UINT16', None, False, 'Circuit breaker', 'Circuit breaker position'),
+        (0x80E9, 1, 'UINT16', None, False, 'Circuit breaker', 'Circuit breaker trip indicator'),
+        (0x80EA, 1, 'UINT16', None, False, 'Circuit breaker', 'Circuit breaker trip electrical fault indicator'),
+        (0x84E7, 3, 'ASCII', None, False, 'Modbus Registers of Wireless Indication Auxiliaries for ComPacT NSX and ComPacT NSXm Circuit Breakers', 'Digital Input 1 circuit identifier'),
+        (0x84EC, 1, 'UINT16', None, False, 'Modbus Registers of Wireless Indication Auxiliaries for ComPacT NSX and ComPacT NSXm Circuit Breakers', 'Features assigned to digital input'),
+        (0x84F8, 1, 'UINT16', None, False, 'Modbus Registers of Wireless Indication Auxiliaries for ComPacT NSX and ComPacT NSXm Circuit Breakers', 'Digital Input 1 electrical status. Indicates the electrical status of the input, regardless of the assignment reference & polarity'),
+        (0x8510, 1, 'UINT16', None, False, 'Digital input', 'Logical status of the Digital Input 1 (takes into account the configured polarity)'),
+    ),
+    RegisterTable.PARTIAL_DISCHARGE_BOX: _table('TAG', (),
+        (0x7724, 1, 'UINT16', None, False, 'Identification', 'Product ID of the Panel Server'),
+        (0x7725, 16, 'ASCII', None, False, 'Identification', 'Commercial reference of the Panel Server'),
+        (0x7735, 6, 'ASCII', None, False, 'Identification', 'Firmware version of the Panel Server'),
+        (0x773B, 10, 'ASCII', None, False, 'Identification', 'Serial number of the Panel Server'),
+        (0x7745, 8, 'ASCII', None, False, 'Identification', 'Product model of the Panel Server'),
+        (0x7918, 10, 'ASCII', None, False, 'Configuration', 'Device name of the wireless device. The user can enter maximum 20 characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7922, 3, 'ASCII', None, False, 'Configuration', 'Label of the wireless device. The user can enter maximum five characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7931, 1, 'UINT16', None, False, 'Device Identification', 'Virtual Modbus server address', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7932, 4, 'UINT64', None, False, 'Device Identification', 'Wireless device radio frequency identifier (RF-Id)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7937, 1, 'UINT16', None, False, 'Device Identification', 'Wireless product identifier', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7944, 16, 'ASCII', None, False, 'Device Identification', 'Vendor name', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7954, 16, 'ASCII', None, False, 'Device Identification', 'Commercial reference', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x7964, 6, 'ASCII', None, False, 'Device Identification', 'Firmware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x796A, 6, 'ASCII', None, False, 'Device Identification', 'Hardware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7970, 10, 'ASCII', None, False, 'Device Identification', 'Serial number', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x797A, 8, 'ASCII', None, False, 'Device Identification', 'Product range', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7982, 8, 'ASCII', None, False, 'Device Identification', 'Product model', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x798A, 8, 'ASCII', None, False, 'Device Identification', 'Product family', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x79A8, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Validity of the RF communication between PowerTag system and Panel Server status.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79A9, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Communication status between Panel Server and wireless devices.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79AC, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'RSSI of the device, received by Panel Server'),
+        (0x79AE, 1, 'UINT16', None, False, 'Diagnostic Data', 'Link Quality Indicator (LQI) of the device, received by Panel Server'),
+        (0x79AF, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER of gateway, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B1, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'Radio Signal Strength Indicator (RSSI) calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B3, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B4, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER – Maximum value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B6, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'RSSI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B8, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+    ),
+    RegisterTable.POWERTAG_C_2DI: _table('TAG', (),
+        (0x7724, 1, 'UINT16', None, False, 'Identification', 'Product ID of the Panel Server'),
+        (0x7725, 16, 'ASCII', None, False, 'Identification', 'Commercial reference of the Panel Server'),
+        (0x7735, 6, 'ASCII', None, False, 'Identification', 'Firmware version of the Panel Server'),
+        (0x773B, 10, 'ASCII', None, False, 'Identification', 'Serial number of the Panel Server'),
+        (0x7745, 8, 'ASCII', None, False, 'Identification', 'Product model of the Panel Server'),
+        (0x7918, 10, 'ASCII', None, False, 'Configuration', 'Device name of the wireless device. The user can enter maximum 20 characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7922, 3, 'ASCII', None, False, 'Configuration', 'Label of the wireless device. The user can enter maximum five characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7931, 1, 'UINT16', None, False, 'Device Identification', 'Virtual Modbus server address', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7932, 4, 'UINT64', None, False, 'Device Identification', 'Wireless device radio frequency identifier (RF-Id)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7937, 1, 'UINT16', None, False, 'Device Identification', 'Wireless product identifier', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7944, 16, 'ASCII', None, False, 'Device Identification', 'Vendor name', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7954, 16, 'ASCII', None, False, 'Device Identification', 'Commercial reference', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x7964, 6, 'ASCII', None, False, 'Device Identification', 'Firmware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x796A, 6, 'ASCII', None, False, 'Device Identification', 'Hardware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7970, 10, 'ASCII', None, False, 'Device Identification', 'Serial number', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x797A, 8, 'ASCII', None, False, 'Device Identification', 'Product range', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7982, 8, 'ASCII', None, False, 'Device Identification', 'Product model', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x798A, 8, 'ASCII', None, False, 'Device Identification', 'Product family', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x79A8, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Validity of the RF communication between PowerTag system and Panel Server status.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79A9, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Communication status between Panel Server and wireless devices.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79AA, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'Packet Error Rate (PER) of the device, received by Panel Server'),
+        (0x79AC, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'RSSI of the device, received by Panel Server'),
+        (0x79AE, 1, 'UINT16', None, False, 'Diagnostic Data', 'Link Quality Indicator (LQI) of the device, received by Panel Server'),
+        (0x79AF, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER of gateway, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B1, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'Radio Signal Strength Indicator (RSSI) calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B3, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B4, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER – Maximum value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B6, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'RSSI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B8, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x84D0, 10, 'ASCII', None, False, 'Modbus Registers of Wireless Indication Auxiliaries for ComPacT NSX and ComPacT NSXm Circuit Breakers', 'Digital Input 1 name'),
+        (0x84E7, 3, 'ASCII', None, False, 'Modbus Registers of Wireless Indication Auxiliaries for ComPacT NSX and ComPacT NSXm Circuit Breakers', 'Digital Input 1 circuit identifier'),
+        (0x84EA, 1, 'UINT16', None, False, 'Modbus Registers of Wireless Indication Auxiliaries for ComPacT NSX and ComPacT NSXm Circuit Breakers', 'Indicates the usage of the wireless device with:'),
+        (0x84EC, 1, 'UINT16', None, False, 'Modbus Registers of Wireless Indication Auxiliaries for ComPacT NSX and ComPacT NSXm Circuit Breakers', 'Features assigned to digital input'),
+        (0x84ED, 1, 'UINT16', None, False, 'Modbus Registers of Wireless Indication Auxiliaries for ComPacT NSX and ComPacT NSXm Circuit Breakers', 'Polarity of the Digital Input 1'),
+        (0x84F8, 1, 'UINT16', None, False, 'Modbus Registers of Wireless Indication Auxiliaries for ComPacT NSX and ComPacT NSXm Circuit Breakers', 'Digital Input 1 electrical status. Indicates the electrical status of the input, regardless of the assignment reference & polarity'),
+        (0x84FE, 1, 'UINT16', None, False, 'Digital input', 'Indicates the breaker position - Only available if input assigned to OF (case = 2)'),
+        (0x8508, 1, 'UINT16', None, False, 'Digital input', 'Indicates the status of the trip'),
+        (0x8510, 1, 'UINT16', None, False, 'Digital input', 'Logical status of the Digital Input 1 (takes into account the configured polarity)'),
+        (0x8534, 10, 'ASCII', None, False, 'Digital input', 'Digital Input 2 name'),
+        (0x854B, 3, 'ASCII', None, False, 'Digital input', 'Digital Input 2 circuit identifier'),
+        (0x854E, 1, 'UINT16', None, False, 'Digital input', 'Indicates the usage of the wireless device with:'),
+        (0x8550, 1, 'UINT16', None, False, 'Digital input', 'Features assigned to digital input'),
+        (0x8551, 1, 'UINT16', None, False, 'Digital input', 'Polarity of the Digital Input 2'),
+        (0x855C, 1, 'UINT16', None, False, 'Digital input', 'Digital Input 2 electrical status. Indicates the electrical status of the input, regardless of the assignment reference & polarity'),
+        (0x8562, 1, 'UINT16', None, False, 'Digital input', 'Indicates the breaker position - Only available if input assigned to OF (case = 2)'),
+        (0x856C, 1, 'UINT16', None, False, 'Digital input', 'Indicates the status of the trip'),
+        (0x8574, 1, 'UINT16', None, False, 'Digital input', 'Logical status of the Digital Input 2 (takes into account the configured polarity)'),
+        (0x8598, 10, 'ASCII', None, False, 'Digital input', "Text giving the context of use of the Digital Input 1 when Digital Input 1 is defined as 'Custom'"),
+        (0x85A2, 10, 'ASCII', None, False, 'Digital input', "Text defining the inactive value of the Digital Input 1 when the Digital Input 1 is defined as 'Custom'"),
+        (0x85AC, 10, 'ASCII', None, False, 'Digital input', "Text defining the active value of the Digital Input 1 when the Digital Input 1 is defined as 'Custom'"),
+        (0x8660, 10, 'ASCII', None, False, 'Digital input', "Text giving the context of use of the Digital Input 2 when Digital Input 2 is defined as 'Custom'"),
+        (0x866A, 10, 'ASCII', None, False, 'Digital input', "Text defining the inactive value of the Digital Input 2 when the Digital Input 2 is defined as 'Custom'"),
+        (0x8674, 10, 'ASCII', None, False, 'Digital input', "Text defining the active value of the Digital Input 2 when the Digital Input 2 is defined as 'Custom'"),
+    ),
+    RegisterTable.POWERTAG_C_IO: _table('TAG', (),
+        (0x7724, 1, 'UINT16', None, False, 'Identification', 'Product ID of the Panel Server'),
+        (0x7725, 16, 'ASCII', None, False, 'Identification', 'Commercial reference of the Panel Server'),
+        (0x7735, 6, 'ASCII', None, False, 'Identification', 'Firmware version of the Panel Server'),
+        (0x773B, 10, 'ASCII', None, False, 'Identification', 'Serial number of the Panel Server'),
+        (0x7745, 8, 'ASCII', None, False, 'Identification', 'Product model of the Panel Server'),
+        (0x7918, 10, 'ASCII', None, False, 'Configuration', 'Device name of the wireless device. The user can enter maximum 20 characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7922, 3, 'ASCII', None, False, 'Configuration', 'Label of the wireless device. The user can enter maximum five characters.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7931, 1, 'UINT16', None, False, 'Device Identification', 'Virtual Modbus server address', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7932, 4, 'UINT64', None, False, 'Device Identification', 'Wireless device radio frequency identifier (RF-Id)', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7937, 1, 'UINT16', None, False, 'Device Identification', 'Wireless product identifier', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7944, 16, 'ASCII', None, False, 'Device Identification', 'Vendor name', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7954, 16, 'ASCII', None, False, 'Device Identification', 'Commercial reference', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x7964, 6, 'ASCII', None, False, 'Device Identification', 'Firmware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x796A, 6, 'ASCII', None, False, 'Device Identification', 'Hardware revision', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7970, 10, 'ASCII', None, False, 'Device Identification', 'Serial number', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x797A, 8, 'ASCII', None, False, 'Device Identification', 'Product range', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x7982, 8, 'ASCII', None, False, 'Device Identification', 'Product model', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x798A, 8, 'ASCII', None, False, 'Device Identification', 'Product family', ('PANEL_SERVER', 'POWERTAG_LINK')),
+        (0x79A8, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Validity of the RF communication between PowerTag system and Panel Server status.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79A9, 1, 'BITMAP', None, False, 'Diagnostic Data', 'Communication status between Panel Server and wireless devices.', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79AA, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'Packet Error Rate (PER) of the device, received by Panel Server'),
+        (0x79AC, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'RSSI of the device, received by Panel Server'),
+        (0x79AE, 1, 'UINT16', None, False, 'Diagnostic Data', 'Link Quality Indicator (LQI) of the device, received by Panel Server'),
+        (0x79AF, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER of gateway, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B1, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'Radio Signal Strength Indicator (RSSI) calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B3, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI, calculated inside the Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B4, 2, 'FLOAT32', None, False, 'Diagnostic Data', 'PER – Maximum value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B6, 2, 'FLOAT32', 'dBm', False, 'Diagnostic Data', 'RSSI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x79B8, 1, 'UINT16', None, False, 'Diagnostic Data', 'LQI – Minimal value between device and Panel Server', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        (0x84D0, 10, 'ASCII', None, False, 'Modbus Registers of Wireless Indication Auxiliaries for ComPacT NSX and ComPacT NSXm Circuit Breakers', 'Digital Input 1 name'),
+        (0x84E7, 3, 'ASCII', None, False, 'Modbus Registers of Wireless Indication Auxiliaries for ComPacT NSX and ComPacT NSXm Circuit Breakers', 'Digital Input 1 circuit identifier'),
+        (0x84EA, 1, 'UINT16', None, False, 'Modbus Registers of Wireless Indication Auxiliaries for ComPacT NSX and ComPacT NSXm Circuit Breakers', 'Indicates the usage of the wireless device with:'),
+        (0x84EC, 1, 'UINT16', None, False, 'Modbus Registers of Wireless Indication Auxiliaries for ComPacT NSX and ComPacT NSXm Circuit Breakers', 'Features assigned to digital input'),
+        (0x84ED, 1, 'UINT16', None, False, 'Modbus Registers of Wireless Indication Auxiliaries for ComPacT NSX and ComPacT NSXm Circuit Breakers', 'Polarity of the Digital Input 1'),
+        (0x84F8, 1, 'UINT16', None, False, 'Modbus Registers of Wireless Indication Auxiliaries for ComPacT NSX and ComPacT NSXm Circuit Breakers', 'Digital Input 1 electrical status. Indicates the electrical status of the input, regardless of the assignment reference & polarity'),
+        (0x84FE, 1, 'UINT16', None, False, 'Digital input', 'Indicates the breaker position - Only available if input assigned to OF (case = 2)'),
+        (0x8508, 1, 'UINT16', None, False, 'Digital input', 'Indicates the status of the trip'),
+        (0x8510, 1, 'UINT16', None, False, 'Digital input', 'Logical status of the Digital Input 1 (takes into account the configured polarity)'),
+        (0x8598, 10, 'ASCII', None, False, 'Digital input', "Text giving the context of use of the Digital Input 1 when Digital Input 1 is defined as 'Custom'"),
+        (0x85A2, 10, 'ASCII', None, False, 'Digital input', "Text defining the inactive value of the Digital Input 1 when the Digital Input 1 is defined as 'Custom'"),
+        (0x85AC, 10, 'ASCII', None, False, 'Digital input', "Text defining the active value of the Digital Input 1 when the Digital Input 1 is defined as 'Custom'"),
+        (0x9088, 10, 'ASCII', None, False, 'Digital output', 'Name given by the user to the Digital Output. Can be used for the name of the asset controled by the DO, or to specify the user define connected product and/or the user defined output assignment.'),
+        (0x909F, 3, 'ASCII', None, False, 'Digital output', 'Name of the circuit on witch the Output is wired. Max 5 Char. May be left empty if not applicable.'),
+        (0x90A2, 1, 'UINT16', None, False, 'Digital output', 'Indicates the usage of the wireless device with:'),
+        (0x90A4, 1, 'UINT16', None, False, 'Digital output', 'ENUM'),
+        (0x90A7, 1, 'UINT16', None, False, 'Digital output', 'ENUM'),
+        (0x90A9, 1, 'UINT16', None, False, 'Digital output', 'ENUM'),
+        (0x90AC, 1, 'UINT16', None, False, 'Digital output', 'Features assigned to output:'),
+        (0x90BA, 1, 'UINT16', None, True, 'Digital output', 'ENUM'),
+        (0x90BB, 1, 'UINT16', None, False, 'Digital output', 'Reflect the last command sent to the output - Only significant if Output is configured to Contactor (see Output behavior). Otherwise is set to invalid value'),
+        (0x90EC, 10, 'ASCII', None, False, 'Digital output', "Text giving the context of use of the Digital Input 1 when Digital Output 1 is defined as 'Custom'"),
+        (0x90F6, 10, 'ASCII', None, False, 'Digital output', "Text defining the inactive value of the Digital Input 1 when the Digital Output 1 is defined as 'Custom'"),
+        (0x9100, 10, 'ASCII', None, False, 'Digital output', "Text defining the active value of the Digital Input 1 when the Digital Output 1 is defined as 'Custom'"),
+    ),
+}
+
+# Values the integration reads, by the name of their accessor
+VALUES: dict[str, Value] = {
+    'hardware_version': Value(
+        'hardware_version', (),
+        PANEL_SERVER=REGISTERS[RegisterTable.PANEL_SERVER][0x0050],
+        POWERTAG_LINK=REGISTERS[RegisterTable.PANEL_SERVER][0x0050],
+        SMARTLINK=Register(0x006A, 3, 'ASCII', None, False, 'Identification', 'Hardware version', 'GATEWAY', ('SMARTLINK',)),
+    ),
+    'serial_number': Value(
+        'serial_number', (),
+        PANEL_SERVER=REGISTERS[RegisterTable.PANEL_SERVER][0x0064],
+        POWERTAG_LINK=REGISTERS[RegisterTable.PANEL_SERVER][0x0064],
+        SMARTLINK=REGISTERS[RegisterTable.PANEL_SERVER][0x0064],
+    ),
+    'firmware_version': Value(
+        'firmware_version', (),
+        PANEL_SERVER=REGISTERS[RegisterTable.PANEL_SERVER][0x0078],
+        POWERTAG_LINK=REGISTERS[RegisterTable.PANEL_SERVER][0x0078],
+        SMARTLINK=Register(0x006D, 3, 'ASCII', None, False, 'Identification', 'Firmware version', 'GATEWAY', ('SMARTLINK',)),
+    ),
+    'status': Value(
+        'status', (),
+        POWERTAG_LINK=Register(0x0070, 1, 'UINT16', None, False, 'Status', 'Gateway status and diagnostic register', 'GATEWAY', ('POWERTAG_LINK', 'SMARTLINK')),
+        SMARTLINK=Register(0x0070, 1, 'UINT16', None, False, 'Status', 'Gateway status and diagnostic register', 'GATEWAY', ('POWERTAG_LINK', 'SMARTLINK')),
+    ),
+    'health': Value(
+        'health', (),
+        PANEL_SERVER=REGISTERS[RegisterTable.PANEL_SERVER][0x009E],
+    ),
+    'date_time': Value(
+        'date_time', (),
+        PANEL_SERVER=REGISTERS[RegisterTable.PANEL_SERVER][0x0073],
+        POWERTAG_LINK=REGISTERS[RegisterTable.PANEL_SERVER][0x0073],
+        SMARTLINK=REGISTERS[RegisterTable.PANEL_SERVER][0x0073],
+    ),
+    'product_id': Value(
+        'product_id', (),
+        PANEL_SERVER=REGISTERS[RegisterTable.PANEL_SERVER][0xF002],
+        POWERTAG_LINK=Register(0x0001, 1, 'UINT16', None, False, 'Identification', 'Product ID', 'SYNTHESIS_TABLE', ('POWERTAG_LINK',)),
+    ),
+    'manufacturer': Value(
+        'manufacturer', (),
+        PANEL_SERVER=REGISTERS[RegisterTable.PANEL_SERVER][0x009F],
+        POWERTAG_LINK=Register(0x0002, 16, 'ASCII', None, False, 'Identification', 'Manufacturer name', 'SYNTHESIS_TABLE', ('POWERTAG_LINK',)),
+    ),
+    'product_code': Value(
+        'product_code', (),
+        PANEL_SERVER=REGISTERS[RegisterTable.PANEL_SERVER][0x003C],
+        POWERTAG_LINK=Register(0x0012, 16, 'ASCII', None, False, 'Identification', 'Commercial reference', 'SYNTHESIS_TABLE', ('POWERTAG_LINK',)),
+    ),
+    'product_range': Value(
+        'product_range', (),
+        PANEL_SERVER=REGISTERS[RegisterTable.PANEL_SERVER][0x000A],
+        POWERTAG_LINK=Register(0x0022, 8, 'ASCII', None, False, 'Identification', 'Product range', 'SYNTHESIS_TABLE', ('POWERTAG_LINK',)),
+    ),
+    'product_model': Value(
+        'product_model', (),
+        PANEL_SERVER=REGISTERS[RegisterTable.PANEL_SERVER][0xF003],
+        POWERTAG_LINK=Register(0x002A, 8, 'ASCII', None, False, 'Identification', 'Product model', 'SYNTHESIS_TABLE', ('POWERTAG_LINK',)),
+    ),
+    'name': Value(
+        'name', (),
+        PANEL_SERVER=REGISTERS[RegisterTable.PANEL_SERVER][0x1605],
+        POWERTAG_LINK=Register(0x0032, 10, 'ASCII', None, False, 'Identification', 'Asset name', 'SYNTHESIS_TABLE', ('POWERTAG_LINK',)),
+    ),
+    'product_vendor_url': Value(
+        'product_vendor_url', (),
+        PANEL_SERVER=REGISTERS[RegisterTable.PANEL_SERVER][0x002A],
+        POWERTAG_LINK=Register(0x003C, 17, 'ASCII', None, False, 'Identification', 'Vendor URL', 'SYNTHESIS_TABLE', ('POWERTAG_LINK',)),
+    ),
+    'tag_current_a': Value(
+        'tag_current_a', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x0BB7],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BB7],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BB7],
+    ),
+    'tag_current_b': Value(
+        'tag_current_b', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x0BB9],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BB9],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BB9],
+    ),
+    'tag_current_c': Value(
+        'tag_current_c', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x0BBB],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BBB],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BBB],
+    ),
+    'tag_current_neutral': Value(
+        'tag_current_neutral', ('FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0BBD],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0BBD],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0BBD],
+    ),
+    'tag_voltage_a_b': Value(
+        'tag_voltage_a_b', ('A1', 'A2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x0BCB],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BCB],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BCB],
+    ),
+    'tag_voltage_b_c': Value(
+        'tag_voltage_b_c', ('A1', 'A2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x0BCD],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BCD],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BCD],
+    ),
+    'tag_voltage_c_a': Value(
+        'tag_voltage_c_a', ('A1', 'A2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x0BCF],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BCF],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BCF],
+    ),
+    'tag_voltage_a_n': Value(
+        'tag_voltage_a_n', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x0BD3],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BD3],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BD3],
+    ),
+    'tag_voltage_b_n': Value(
+        'tag_voltage_b_n', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x0BD5],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BD5],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BD5],
+    ),
+    'tag_voltage_c_n': Value(
+        'tag_voltage_c_n', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x0BD7],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BD7],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BD7],
+    ),
+    'tag_power_active_a': Value(
+        'tag_power_active_a', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x0BED],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BED],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BED],
+    ),
+    'tag_power_active_b': Value(
+        'tag_power_active_b', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x0BEF],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BEF],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BEF],
+    ),
+    'tag_power_active_c': Value(
+        'tag_power_active_c', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x0BF1],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BF1],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BF1],
+    ),
+    'tag_power_active_total': Value(
+        'tag_power_active_total', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x0BF3],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BF3],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x0BF3],
+    ),
+    'tag_power_reactive_a': Value(
+        'tag_power_reactive_a', ('FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0BF5],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0BF5],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0BF5],
+    ),
+    'tag_power_reactive_b': Value(
+        'tag_power_reactive_b', ('FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0BF7],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0BF7],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0BF7],
+    ),
+    'tag_power_reactive_c': Value(
+        'tag_power_reactive_c', ('FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0BF9],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0BF9],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0BF9],
+    ),
+    'tag_power_reactive_total': Value(
+        'tag_power_reactive_total', ('C', 'FL', 'M0', 'M1', 'M2', 'M3', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_250_630][0x0BFB],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_250_630][0x0BFB],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_250_630][0x0BFB],
+    ),
+    'tag_power_apparent_a': Value(
+        'tag_power_apparent_a', ('FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0BFD],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0BFD],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0BFD],
+    ),
+    'tag_power_apparent_b': Value(
+        'tag_power_apparent_b', ('FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0BFF],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0BFF],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0BFF],
+    ),
+    'tag_power_apparent_c': Value(
+        'tag_power_apparent_c', ('FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0C01],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0C01],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0C01],
+    ),
+    'tag_power_apparent_total': Value(
+        'tag_power_apparent_total', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x0C03],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x0C03],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x0C03],
+    ),
+    'tag_power_factor_a': Value(
+        'tag_power_factor_a', ('FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0C05],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0C05],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0C05],
+    ),
+    'tag_power_factor_b': Value(
+        'tag_power_factor_b', ('FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0C07],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0C07],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0C07],
+    ),
+    'tag_power_factor_c': Value(
+        'tag_power_factor_c', ('FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0C09],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0C09],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0C09],
+    ),
+    'tag_power_factor_total': Value(
+        'tag_power_factor_total', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x0C0B],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x0C0B],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x0C0B],
+    ),
+    'tag_power_factor_sign_convention': Value(
+        'tag_power_factor_sign_convention', ('C', 'FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0C0D],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0C0D],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x0C0D],
+    ),
+    'tag_ac_frequency': Value(
+        'tag_ac_frequency', ('FL', 'M0', 'M1', 'M2', 'M3', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_250_630][0x0C25],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_250_630][0x0C25],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_250_630][0x0C25],
+    ),
+    'tag_device_temperature': Value(
+        'tag_device_temperature', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x0C3B],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x0C3B],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x0C3B],
+    ),
+    'tag_energy_active_delivered_plus_received_total': Value(
+        'tag_energy_active_delivered_plus_received_total', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x0C83],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x0C83],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x0C83],
+    ),
+    'tag_energy_active_delivered_plus_received_partial': Value(
+        'tag_energy_active_delivered_plus_received_partial', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x0CB7],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x0CB7],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x0CB7],
+    ),
+    'tag_energy_active_delivered_partial': Value(
+        'tag_energy_active_delivered_partial', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x1390],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x1390],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_250_630][0x0C87],
+    ),
+    'tag_energy_active_delivered_total': Value(
+        'tag_energy_active_delivered_total', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x1394],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x1394],
+        SMARTLINK=Register(0x0000, 4, 'INT64', 'Wh', False, 'Energy', 'Total active energy delivered (not resettable)', 'TAG', ('SMARTLINK',)),
+    ),
+    'tag_energy_active_received_partial': Value(
+        'tag_energy_active_received_partial', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x1398],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x1398],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x0CC7],
+    ),
+    'tag_energy_active_received_total': Value(
+        'tag_energy_active_received_total', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x139C],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x139C],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_250_630][0x0C8B],
+    ),
+    'tag_energy_active_delivered_partial_phase_a': Value(
+        'tag_energy_active_delivered_partial_phase_a', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x13B8],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x13B8],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x13B8],
+    ),
+    'tag_energy_active_delivered_partial_phase_b': Value(
+        'tag_energy_active_delivered_partial_phase_b', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x13E0],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x13E0],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x13E0],
+    ),
+    'tag_energy_active_delivered_partial_phase_c': Value(
+        'tag_energy_active_delivered_partial_phase_c', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x1408],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x1408],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x1408],
+    ),
+    'tag_energy_active_delivered_total_phase_a': Value(
+        'tag_energy_active_delivered_total_phase_a', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x13BC],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x13BC],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x13BC],
+    ),
+    'tag_energy_active_delivered_total_phase_b': Value(
+        'tag_energy_active_delivered_total_phase_b', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x13E4],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x13E4],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x13E4],
+    ),
+    'tag_energy_active_delivered_total_phase_c': Value(
+        'tag_energy_active_delivered_total_phase_c', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x140C],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x140C],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x140C],
+    ),
+    'tag_energy_active_received_partial_phase_a': Value(
+        'tag_energy_active_received_partial_phase_a', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x13C0],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x13C0],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x13C0],
+    ),
+    'tag_energy_active_received_partial_phase_b': Value(
+        'tag_energy_active_received_partial_phase_b', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x13E8],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x13E8],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x13E8],
+    ),
+    'tag_energy_active_received_partial_phase_c': Value(
+        'tag_energy_active_received_partial_phase_c', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x1410],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x1410],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x1410],
+    ),
+    'tag_energy_active_received_total_phase_a': Value(
+        'tag_energy_active_received_total_phase_a', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x13C4],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x13C4],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x13C4],
+    ),
+    'tag_energy_active_received_total_phase_b': Value(
+        'tag_energy_active_received_total_phase_b', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x13EC],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x13EC],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x13EC],
+    ),
+    'tag_energy_active_received_total_phase_c': Value(
+        'tag_energy_active_received_total_phase_c', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x1414],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x1414],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x1414],
+    ),
+    'tag_energy_reactive_delivered_partial': Value(
+        'tag_energy_reactive_delivered_partial', ('C', 'FL', 'M0', 'M1', 'M2', 'M3', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_250_630][0x1438],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_250_630][0x1438],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_250_630][0x0CCF],
+    ),
+    'tag_energy_reactive_delivered_total': Value(
+        'tag_energy_reactive_delivered_total', ('C', 'FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x143C],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x143C],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x143C],
+    ),
+    'tag_energy_reactive_received_partial': Value(
+        'tag_energy_reactive_received_partial', ('C', 'FL', 'M0', 'M1', 'M2', 'M3', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_250_630][0x1448],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_250_630][0x1448],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_250_630][0x0CD7],
+    ),
+    'tag_energy_reactive_received_total': Value(
+        'tag_energy_reactive_received_total', ('C', 'FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x144C],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x144C],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x144C],
+    ),
+    'tag_energy_reactive_delivered_partial_phase_a': Value(
+        'tag_energy_reactive_delivered_partial_phase_a', ('C', 'FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x1470],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x1470],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x1470],
+    ),
+    'tag_energy_reactive_delivered_partial_phase_b': Value(
+        'tag_energy_reactive_delivered_partial_phase_b', ('C', 'FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x1498],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x1498],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x1498],
+    ),
+    'tag_energy_reactive_delivered_partial_phase_c': Value(
+        'tag_energy_reactive_delivered_partial_phase_c', ('C', 'FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x14C0],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x14C0],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x14C0],
+    ),
+    'tag_energy_reactive_delivered_total_phase_a': Value(
+        'tag_energy_reactive_delivered_total_phase_a', ('C', 'FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x1474],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x1474],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x1474],
+    ),
+    'tag_energy_reactive_delivered_total_phase_b': Value(
+        'tag_energy_reactive_delivered_total_phase_b', ('C', 'FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x149C],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x149C],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x149C],
+    ),
+    'tag_energy_reactive_delivered_total_phase_c': Value(
+        'tag_energy_reactive_delivered_total_phase_c', ('C', 'FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x14C4],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x14C4],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x14C4],
+    ),
+    'tag_energy_reactive_received_partial_phase_a': Value(
+        'tag_energy_reactive_received_partial_phase_a', ('C', 'FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x1478],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x1478],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x1478],
+    ),
+    'tag_energy_reactive_received_partial_phase_b': Value(
+        'tag_energy_reactive_received_partial_phase_b', ('C', 'FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x14A0],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x14A0],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x14A0],
+    ),
+    'tag_energy_reactive_received_partial_phase_c': Value(
+        'tag_energy_reactive_received_partial_phase_c', ('C', 'FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x14C8],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x14C8],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x14C8],
+    ),
+    'tag_energy_reactive_received_total_phase_a': Value(
+        'tag_energy_reactive_received_total_phase_a', ('C', 'FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x147C],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x147C],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x147C],
+    ),
+    'tag_energy_reactive_received_total_phase_b': Value(
+        'tag_energy_reactive_received_total_phase_b', ('C', 'FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x14A4],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x14A4],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x14A4],
+    ),
+    'tag_energy_reactive_received_total_phase_c': Value(
+        'tag_energy_reactive_received_total_phase_c', ('C', 'FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x14CC],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x14CC],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x14CC],
+    ),
+    'tag_energy_apparent_partial': Value(
+        'tag_energy_apparent_partial', ('C', 'FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x14F4],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x14F4],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x14F4],
+    ),
+    'tag_energy_apparent_total': Value(
+        'tag_energy_apparent_total', ('C', 'FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x14F8],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x14F8],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x14F8],
+    ),
+    'tag_energy_apparent_partial_phase_a': Value(
+        'tag_energy_apparent_partial_phase_a', ('C', 'FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x150C],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x150C],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x150C],
+    ),
+    'tag_energy_apparent_partial_phase_b': Value(
+        'tag_energy_apparent_partial_phase_b', ('C', 'FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x1534],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x1534],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x1534],
+    ),
+    'tag_energy_apparent_partial_phase_c': Value(
+        'tag_energy_apparent_partial_phase_c', ('C', 'FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x155C],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x155C],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x155C],
+    ),
+    'tag_energy_apparent_total_phase_a': Value(
+        'tag_energy_apparent_total_phase_a', ('C', 'FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x1510],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x1510],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x1510],
+    ),
+    'tag_energy_apparent_total_phase_b': Value(
+        'tag_energy_apparent_total_phase_b', ('C', 'FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x1538],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x1538],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x1538],
+    ),
+    'tag_energy_apparent_total_phase_c': Value(
+        'tag_energy_apparent_total_phase_c', ('C', 'FL', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_ROPE][0x1560],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x1560],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_ROPE][0x1560],
+    ),
+    'tag_power_active_demand_total': Value(
+        'tag_power_active_demand_total', (),
+        PANEL_SERVER=Register(0x0EB5, 2, 'FLOAT32', 'W', False, 'Power Demand Data', 'Demand total active power', 'TAG', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        POWERTAG_LINK=Register(0x0EB5, 2, 'FLOAT32', 'W', False, 'Power Demand Data', 'Demand total active power', 'TAG', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        SMARTLINK=Register(0x0EB5, 2, 'FLOAT32', 'W', False, 'Power Demand Data', 'Demand total active power', 'TAG', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+    ),
+    'tag_power_active_power_demand_total_maximum': Value(
+        'tag_power_active_power_demand_total_maximum', (),
+        PANEL_SERVER=Register(0x0EB9, 2, 'FLOAT32', 'W', False, 'Power Demand Data', 'Maximum demand total active power', 'TAG', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        POWERTAG_LINK=Register(0x0EB9, 2, 'FLOAT32', 'W', False, 'Power Demand Data', 'Maximum demand total active power', 'TAG', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        SMARTLINK=Register(0x0EB9, 2, 'FLOAT32', 'W', False, 'Power Demand Data', 'Maximum demand total active power', 'TAG', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+    ),
+    'tag_power_active_demand_total_maximum_timestamp': Value(
+        'tag_power_active_demand_total_maximum_timestamp', (),
+        PANEL_SERVER=Register(0x0EBB, 4, 'DATETIME', None, False, 'Power Demand Data', 'Date and time of the maximum demand total active power', 'TAG', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        POWERTAG_LINK=Register(0x0EBB, 4, 'DATETIME', None, False, 'Power Demand Data', 'Date and time of the maximum demand total active power', 'TAG', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        SMARTLINK=Register(0x0EBB, 4, 'DATETIME', None, False, 'Power Demand Data', 'Date and time of the maximum demand total active power', 'TAG', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+    ),
+    'tag_alarm_validity': Value(
+        'tag_alarm_validity', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x0CE1],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x0CE1],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x0CE1],
+    ),
+    'tag_alarm_bitmask': Value(
+        'tag_alarm_bitmask', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x0CE3],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x0CE3],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x0CE3],
+    ),
+    'tag_current_at_voltage_loss_a': Value(
+        'tag_current_at_voltage_loss_a', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x0CE7],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x0CE7],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x0CE7],
+    ),
+    'tag_current_at_voltage_loss_b': Value(
+        'tag_current_at_voltage_loss_b', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x0CE5],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x0CE5],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x0CE5],
+    ),
+    'tag_current_at_voltage_loss_c': Value(
+        'tag_current_at_voltage_loss_c', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x0CE9],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x0CE9],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x0CE9],
+    ),
+    'tag_load_operating_time': Value(
+        'tag_load_operating_time', (),
+        PANEL_SERVER=Register(0x0CEB, 2, 'UINT32', 's', False, 'Load Operating Time', 'Load operating time counter.', 'TAG', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        POWERTAG_LINK=Register(0x0CEB, 2, 'UINT32', 's', False, 'Load Operating Time', 'Load operating time counter.', 'TAG', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        SMARTLINK=Register(0x0CEB, 2, 'UINT32', 's', False, 'Load Operating Time', 'Load operating time counter.', 'TAG', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+    ),
+    'tag_load_operating_time_active_power_threshold': Value(
+        'tag_load_operating_time_active_power_threshold', ('A1', 'A2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x0CED],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x0CED],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x0CED],
+    ),
+    'tag_load_operating_time_start': Value(
+        'tag_load_operating_time_start', (),
+        PANEL_SERVER=Register(0x0CEF, 4, 'DATETIME', None, False, 'Load Operating Time', 'Date and time stamp of last Set or reset of Load operating time counter.', 'TAG', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        POWERTAG_LINK=Register(0x0CEF, 4, 'DATETIME', None, False, 'Load Operating Time', 'Date and time stamp of last Set or reset of Load operating time counter.', 'TAG', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        SMARTLINK=Register(0x0CEF, 4, 'DATETIME', None, False, 'Load Operating Time', 'Date and time stamp of last Set or reset of Load operating time counter.', 'TAG', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+    ),
+    'tag_name': Value(
+        'tag_name', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x7918],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x7918],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x7918],
+    ),
+    'tag_circuit': Value(
+        'tag_circuit', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x7922],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x7922],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x7922],
+    ),
+    'tag_usage': Value(
+        'tag_usage', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x7925],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x7925],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x7925],
+    ),
+    'tag_phase_sequence': Value(
+        'tag_phase_sequence', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x7926],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x7926],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x7926],
+    ),
+    'tag_position': Value(
+        'tag_position', ('A1', 'A2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x7927],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x7927],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x7927],
+    ),
+    'tag_circuit_diagnostic': Value(
+        'tag_circuit_diagnostic', (),
+        PANEL_SERVER=Register(0x7928, 1, 'UINT16', None, False, 'Configuration', 'Circuit diagnostics', 'TAG', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        POWERTAG_LINK=Register(0x7928, 1, 'UINT16', None, False, 'Configuration', 'Circuit diagnostics', 'TAG', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+        SMARTLINK=Register(0x7928, 1, 'UINT16', None, False, 'Configuration', 'Circuit diagnostics', 'TAG', ('PANEL_SERVER', 'POWERTAG_LINK', 'SMARTLINK')),
+    ),
+    'tag_rated_current': Value(
+        'tag_rated_current', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x7929],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x7929],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x7929],
+    ),
+    'tag_electrical_network_system_type': Value(
+        'tag_electrical_network_system_type', ('FL', 'M0', 'M1', 'M2', 'M3', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_250_630][0x792A],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_250_630][0x792A],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_250_630][0x792A],
+    ),
+    'tag_rated_voltage': Value(
+        'tag_rated_voltage', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x792B],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x792B],
+    ),
+    'tag_power_supply_type': Value(
+        'tag_power_supply_type', ('A1', 'A2', 'C', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x792F],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x792F],
+    ),
+    'tag_product_identifier': Value(
+        'tag_product_identifier', (),
+        SMARTLINK=Register(0x7930, 1, 'UINT16', None, False, 'Device identification', 'Wireless device code type', 'TAG', ('SMARTLINK',)),
+    ),
+    'tag_slave_address': Value(
+        'tag_slave_address', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x7931],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x7931],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x7931],
+    ),
+    'tag_rf_id': Value(
+        'tag_rf_id', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x7932],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x7932],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x7932],
+    ),
+    'tag_wireless_product_identifier': Value(
+        'tag_wireless_product_identifier', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x7937],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x7937],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x7937],
+    ),
+    'tag_vendor_name': Value(
+        'tag_vendor_name', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x7944],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x7944],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x7944],
+    ),
+    'tag_product_code': Value(
+        'tag_product_code', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x7954],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x7954],
+    ),
+    'tag_firmware_revision': Value(
+        'tag_firmware_revision', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x7964],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x7964],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x7964],
+    ),
+    'tag_hardware_revision': Value(
+        'tag_hardware_revision', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x796A],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x796A],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x796A],
+    ),
+    'tag_serial_number': Value(
+        'tag_serial_number', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x7970],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x7970],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x7970],
+    ),
+    'tag_product_range': Value(
+        'tag_product_range', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x797A],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x797A],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x797A],
+    ),
+    'tag_product_model': Value(
+        'tag_product_model', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x7982],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x7982],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x7982],
+    ),
+    'tag_product_family': Value(
+        'tag_product_family', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x798A],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x798A],
+    ),
+    'tag_radio_communication_valid': Value(
+        'tag_radio_communication_valid', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x79A8],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x79A8],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x79A8],
+    ),
+    'tag_wireless_communication_valid': Value(
+        'tag_wireless_communication_valid', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x79A9],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x79A9],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x79A9],
+    ),
+    'tag_radio_per_tag': Value(
+        'tag_radio_per_tag', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x79B4],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x79B4],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x79B4],
+    ),
+    'tag_radio_rssi_inside_tag': Value(
+        'tag_radio_rssi_inside_tag', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x79B6],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x79B6],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x79B6],
+    ),
+    'tag_radio_lqi_tag': Value(
+        'tag_radio_lqi_tag', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x79B8],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x79B8],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x79B8],
+    ),
+    'tag_radio_per_gateway': Value(
+        'tag_radio_per_gateway', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x79AF],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x79AF],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x79AF],
+    ),
+    'tag_radio_rssi_inside_gateway': Value(
+        'tag_radio_rssi_inside_gateway', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x79B1],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x79B1],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x79B1],
+    ),
+    'tag_radio_lqi_gateway': Value(
+        'tag_radio_lqi_gateway', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x79B3],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x79B3],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x79B3],
+    ),
+    'tag_radio_per_maximum': Value(
+        'tag_radio_per_maximum', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x79B4],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x79B4],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x79B4],
+    ),
+    'tag_radio_rssi_minimum': Value(
+        'tag_radio_rssi_minimum', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x79B6],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x79B6],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x79B6],
+    ),
+    'tag_radio_lqi_minimum': Value(
+        'tag_radio_lqi_minimum', ('A1', 'A2', 'C', 'CO2', 'F1', 'F2', 'F3', 'FL', 'M0', 'M1', 'M2', 'M3', 'P1', 'R1', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.POWERTAG_63][0x79B8],
+        POWERTAG_LINK=REGISTERS[RegisterTable.POWERTAG_63][0x79B8],
+        SMARTLINK=REGISTERS[RegisterTable.POWERTAG_63][0x79B8],
+    ),
+    'env_battery_voltage': Value(
+        'env_battery_voltage', ('CO2', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.CL110][0x0CF3],
+        POWERTAG_LINK=REGISTERS[RegisterTable.CL110][0x0CF3],
+        SMARTLINK=REGISTERS[RegisterTable.CL110][0x0CF3],
+    ),
+    'env_temperature': Value(
+        'env_temperature', ('CO2', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.TH110][0x0FA0],
+        POWERTAG_LINK=REGISTERS[RegisterTable.TH110][0x0FA0],
+        SMARTLINK=REGISTERS[RegisterTable.TH110][0x0FA0],
+    ),
+    'env_temperature_maximum': Value(
+        'env_temperature_maximum', ('CO2', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.TH110][0x0FA2],
+        POWERTAG_LINK=REGISTERS[RegisterTable.TH110][0x0FA2],
+        SMARTLINK=REGISTERS[RegisterTable.TH110][0x0FA2],
+    ),
+    'env_temperature_minimum': Value(
+        'env_temperature_minimum', ('CO2', 'TEMP0', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.TH110][0x0FA4],
+        POWERTAG_LINK=REGISTERS[RegisterTable.TH110][0x0FA4],
+        SMARTLINK=REGISTERS[RegisterTable.TH110][0x0FA4],
+    ),
+    'env_humidity': Value(
+        'env_humidity', ('CO2', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.CL110][0x0FA6],
+        POWERTAG_LINK=REGISTERS[RegisterTable.CL110][0x0FA6],
+        SMARTLINK=REGISTERS[RegisterTable.CL110][0x0FA6],
+    ),
+    'env_humidity_maximum': Value(
+        'env_humidity_maximum', ('CO2', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.CL110][0x0FA8],
+        POWERTAG_LINK=REGISTERS[RegisterTable.CL110][0x0FA8],
+        SMARTLINK=REGISTERS[RegisterTable.CL110][0x0FA8],
+    ),
+    'env_humidity_minimum': Value(
+        'env_humidity_minimum', ('CO2', 'TEMP1'),
+        PANEL_SERVER=REGISTERS[RegisterTable.CL110][0x0FAA],
+        POWERTAG_LINK=REGISTERS[RegisterTable.CL110][0x0FAA],
+        SMARTLINK=REGISTERS[RegisterTable.CL110][0x0FAA],
+    ),
+    'env_co2': Value(
+        'env_co2', ('CO2',),
+        PANEL_SERVER=REGISTERS[RegisterTable.CO2][0x0FAE],
+        POWERTAG_LINK=REGISTERS[RegisterTable.CO2][0x0FAE],
+        SMARTLINK=REGISTERS[RegisterTable.CO2][0x0FAE],
+    ),
+}
+
+# Register table of each feature class
+FEATURE_CLASS_TABLES: dict[str, RegisterTable] = {
+    'A1': RegisterTable.POWERTAG_63,
+    'A2': RegisterTable.POWERTAG_63,
+    'P1': RegisterTable.POWERTAG_63,
+    'F1': RegisterTable.POWERTAG_63,
+    'F2': RegisterTable.POWERTAG_63,
+    'F3': RegisterTable.POWERTAG_63,
+    'M0': RegisterTable.POWERTAG_250_630,
+    'M1': RegisterTable.POWERTAG_250_630,
+    'M2': RegisterTable.POWERTAG_250_630,
+    'M3': RegisterTable.POWERTAG_250_630,
+    'FL': RegisterTable.POWERTAG_ROPE,
+    'R1': RegisterTable.POWERTAG_ROPE,
+    'C': RegisterTable.ACTI9_ACTIVE,
+    'TEMP0': RegisterTable.TH110,
+    'TEMP1': RegisterTable.TEMPERATURE_TRH,
+    'CO2': RegisterTable.CO2,
+}
+
+COMMERCIAL_REFERENCES: dict[str, RegisterTable] = {
+    'PAS400': RegisterTable.PANEL_SERVER,
+    'PAS600': RegisterTable.PANEL_SERVER,
+    'PAS600L': RegisterTable.PANEL_SERVER,
+    'PAS600T': RegisterTable.PANEL_SERVER,
+    'PAS800': RegisterTable.PANEL_SERVER,
+    'PAS800L': RegisterTable.PANEL_SERVER,
+    'A9MEM1520': RegisterTable.POWERTAG_63,
+    'A9MEM1521': RegisterTable.POWERTAG_63,
+    'A9MEM1522': RegisterTable.POWERTAG_63,
+    'A9MEM1540': RegisterTable.POWERTAG_63,
+    'A9MEM1541': RegisterTable.POWERTAG_63,
+    'A9MEM1542': RegisterTable.POWERTAG_63,
+    'A9MEM1543': RegisterTable.POWERTAG_63,
+    'A9MEM1560': RegisterTable.POWERTAG_63,
+    'A9MEM1561': RegisterTable.POWERTAG_63,
+    'A9MEM1562': RegisterTable.POWERTAG_63,
+    'A9MEM1563': RegisterTable.POWERTAG_63,
+    'A9MEM1564': RegisterTable.POWERTAG_63,
+    'A9MEM1570': RegisterTable.POWERTAG_63,
+    'A9MEM1571': RegisterTable.POWERTAG_63,
+    'A9MEM1572': RegisterTable.POWERTAG_63,
+    'A9MEM1573': RegisterTable.POWERTAG_63,
+    'A9MEM1574': RegisterTable.POWERTAG_63,
+    'PLTQO301P': RegisterTable.POWERTAG_63,
+    'PLTQO601P': RegisterTable.POWERTAG_63,
+    'PLTQO303P': RegisterTable.POWERTAG_63,
+    'PLTQO603P': RegisterTable.POWERTAG_63,
+    'PLTQO302P': RegisterTable.POWERTAG_63,
+    'PLTQO602P': RegisterTable.POWERTAG_63,
+    'LV434020': RegisterTable.POWERTAG_250_630,
+    'LV434022': RegisterTable.POWERTAG_250_630,
+    'LV434021': RegisterTable.POWERTAG_250_630,
+    'LV434023': RegisterTable.POWERTAG_250_630,
+    'PLTE601P': RegisterTable.POWERTAG_63,
+    'PLTE602P': RegisterTable.POWERTAG_63,
+    'PLTE603P': RegisterTable.POWERTAG_63,
+    'A9MEM1580': RegisterTable.POWERTAG_ROPE,
+    'A9MEM1590': RegisterTable.POWERTAG_ROPE,
+    'A9MEM1591': RegisterTable.POWERTAG_ROPE,
+    'A9MEM1592': RegisterTable.POWERTAG_ROPE,
+    'A9MEM1593': RegisterTable.POWERTAG_ROPE,
+    'PLTR1203P': RegisterTable.POWERTAG_ROPE,
+    'PLTR6003P': RegisterTable.POWERTAG_ROPE,
+    'PLTR10003P': RegisterTable.POWERTAG_ROPE,
+    'PLTR20003P': RegisterTable.POWERTAG_ROPE,
+    'EMS59440': RegisterTable.TH110,
+    'EMS59443': RegisterTable.CL110,
+    'SED-CO2-G-5045': RegisterTable.CO2,
+    'SED-TRH-G-5045': RegisterTable.TEMPERATURE_TRH,
+    'ZBRTT1': RegisterTable.TEMPERATURE_TRH,
+    'ESST010B0400': RegisterTable.TEMPERATURE_TRH,
+    'A9XST114': RegisterTable.TEMPERATURE_TRH,
+    'SMT10020': RegisterTable.HEATTAG,
+    'A9TAA2625': RegisterTable.ACTI9_ACTIVE,
+    'A9TAA1625': RegisterTable.ACTI9_ACTIVE,
+    'A9TAA2640': RegisterTable.ACTI9_ACTIVE,
+    'A9TAA1640': RegisterTable.ACTI9_ACTIVE,
+    'A9TAA2225': RegisterTable.ACTI9_ACTIVE,
+    'A9TAA1225': RegisterTable.ACTI9_ACTIVE,
+    'A9TAA2240': RegisterTable.ACTI9_ACTIVE,
+    'A9TAA1240': RegisterTable.ACTI9_ACTIVE,
+    'A9TAB2625': RegisterTable.ACTI9_ACTIVE,
+    'A9TAB1625': RegisterTable.ACTI9_ACTIVE,
+    'A9TAB2640': RegisterTable.ACTI9_ACTIVE,
+    'A9TAB1640': RegisterTable.ACTI9_ACTIVE,
+    'A9TAB2225': RegisterTable.ACTI9_ACTIVE,
+    'A9TAB1225': RegisterTable.ACTI9_ACTIVE,
+    'A9TAB2240': RegisterTable.ACTI9_ACTIVE,
+    'A9TAB1240': RegisterTable.ACTI9_ACTIVE,
+    'A9TDEC610': RegisterTable.ACTI9_ACTIVE,
+    'A9TDEC613': RegisterTable.ACTI9_ACTIVE,
+    'A9TDEC616': RegisterTable.ACTI9_ACTIVE,
+    'A9TDFC606': RegisterTable.ACTI9_ACTIVE,
+    'A9TDFC610': RegisterTable.ACTI9_ACTIVE,
+    'A9TDFC613': RegisterTable.ACTI9_ACTIVE,
+    'A9TDFC616': RegisterTable.ACTI9_ACTIVE,
+    'A9TDFC625': RegisterTable.ACTI9_ACTIVE,
+    'A9TDFC632': RegisterTable.ACTI9_ACTIVE,
+    'A9TDFC640': RegisterTable.ACTI9_ACTIVE,
+    'A9TDFD606': RegisterTable.ACTI9_ACTIVE,
+    'A9TDFD610': RegisterTable.ACTI9_ACTIVE,
+    'A9TDFD616': RegisterTable.ACTI9_ACTIVE,
+    'A9TDFD620': RegisterTable.ACTI9_ACTIVE,
+    'A9TDFD625': RegisterTable.ACTI9_ACTIVE,
+    'A9TDFD632': RegisterTable.ACTI9_ACTIVE,
+    'A9TPDD610': RegisterTable.ACTI9_ACTIVE,
+    'A9TPDD613': RegisterTable.ACTI9_ACTIVE,
+    'A9TPDD616': RegisterTable.ACTI9_ACTIVE,
+    'A9TPED610': RegisterTable.ACTI9_ACTIVE,
+    'A9TPED613': RegisterTable.ACTI9_ACTIVE,
+    'A9TPED616': RegisterTable.ACTI9_ACTIVE,
+    'A9TPED625': RegisterTable.ACTI9_ACTIVE,
+    'A9TPED632': RegisterTable.ACTI9_ACTIVE,
+    'A9TPED640': RegisterTable.ACTI9_ACTIVE,
+    'A9TYAE625': RegisterTable.ACTI9_ACTIVE,
+    'A9TYAE640': RegisterTable.ACTI9_ACTIVE,
+    'A9TYAE225': RegisterTable.ACTI9_ACTIVE,
+    'A9TYAE240': RegisterTable.ACTI9_ACTIVE,
+    'A9TYBE625': RegisterTable.ACTI9_ACTIVE,
+    'A9TYBE640': RegisterTable.ACTI9_ACTIVE,
+    'A9TYBE225': RegisterTable.ACTI9_ACTIVE,
+    'A9TYBE240': RegisterTable.ACTI9_ACTIVE,
+    'A9Y6E625': RegisterTable.ACTI9_ACTIVE,
+    'A9Y6E640': RegisterTable.ACTI9_ACTIVE,
+    'A9Y8E625': RegisterTable.ACTI9_ACTIVE,
+    'A9Y8E640': RegisterTable.ACTI9_ACTIVE,
+    'A9V6E225': RegisterTable.ACTI9_ACTIVE,
+    'A9V6E240': RegisterTable.ACTI9_ACTIVE,
+    'A9V8E225': RegisterTable.ACTI9_ACTIVE,
+    'A9V8E240': RegisterTable.ACTI9_ACTIVE,
+    'LV429453': RegisterTable.WIRELESS_INDICATION_AUXILIARY,
+    'LV429454': RegisterTable.WIRELESS_INDICATION_AUXILIARY,
+    'PD100X001': RegisterTable.PARTIAL_DISCHARGE_BOX,
+    'A9XMC2D3': RegisterTable.POWERTAG_C_2DI,
+    'A9XMC1D3': RegisterTable.POWERTAG_C_IO,
+}
@@ -1,20 +1,650 @@
 import asyncio
+import bisect
+import contextvars
 import enum
+import functools
 import logging
 import math
+import struct
+import time
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
 
-from pymodbus.client import ModbusTcpClient, AsyncModbusTcpClient  # type: ignore
-from pymodbus.constants import DeviceInformation  # type: ignore
-from pymodbus.pdu import ExceptionResponse  # type: ignore
 from pymodbus.client.mixin import ModbusClientMixin  # type: ignore
-from pymodbus.exceptions import ModbusIOException  # type: ignore
+from pymodbus.exceptions import ConnectionException, ModbusIOException  # type: ignore
+
+from .register_map import VALUES, Register
 
 GATEWAY_SLAVE_ID = 255
+# Smartlink wireless devices are at fixed addresses, starting from this one
+FIRST_SMARTLINK_TAG_ADDRESS = 150
 SYNTHESIS_TABLE_SLAVE_ID_START = 247
+# Connections opened besides the regular ones while searching for the synthesis table, as each slave ID that
+# doesn't answer holds up a connection until it times out
+PROBE_CONNECTIONS = 4
+
+# Modbus caps a single Read Holding Registers request at 125 registers
+MAX_REGISTERS_PER_READ = 125
+# Unused registers we're willing to read in between two wanted spans to save a round trip
+MAX_READ_GAP = 16
+# How long a prefetched buffer stays valid after it was read
+BUFFER_MAX_AGE = 2.0
+# Requests kept in flight on a single connection when pipelining
+PIPELINE_WINDOW = 4
+# Consecutive failed requests to a slave after which further requests fail instantly
+CIRCUIT_BREAKER_THRESHOLD = 3
+# Seconds before a single trial request is let through to a slave that failed instantly since
+CIRCUIT_BREAKER_RESET = 20.0
+# Lower bound of the timeouts derived from the measured round trip times
+MIN_TIMEOUT = 0.2
+# Upper bounds in seconds of the latency histogram buckets, the last bucket holds everything slower
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+# Most recent requests kept for the diagnostics
+TRANSACTION_LOG_SIZE = 200
+READ_HOLDING_REGISTERS = 0x03
+WRITE_MULTIPLE_REGISTERS = 0x10
+# Modbus exceptions of a gateway that can't reach the wireless device behind it
+GATEWAY_PATH_UNAVAILABLE = 0x0A
+GATEWAY_TARGET_FAILED_TO_RESPOND = 0x0B
 
 _LOGGER = logging.getLogger(__name__)
 
+_UNDECODED = object()
+
+_recorded_spans: contextvars.ContextVar[set[tuple[int, int]] | None] = contextvars.ContextVar(
+    "recorded_spans", default=None
+)
+
+
+def plan_reads(
+    spans: Iterable[tuple[int, int]],
+    max_gap: int = MAX_READ_GAP,
+    mapped_ranges: Iterable[tuple[int, int]] | None = None,
+) -> list[tuple[int, int]]:
+    """Coalesces (address, count) spans into the fewest contiguous reads within the Modbus limit.
+
+    Spans are never split over two reads, and two spans only share a read when at most max_gap unused registers
+    lie in between them. Given the (start, end) ranges of registers the slave is known to have, those unused
+    registers must lie within them too, as gateways refuse reads that touch registers they don't have.
+    """
+    spans = sorted(set(spans))
+    known = None
+    if mapped_ranges is not None:
+        # The spans themselves are evidently there, even when the documentation doesn't mention them
+        known = merge_ranges(list(mapped_ranges) + [(address, address + count) for address, count in spans])
+
+    blocks: list[list[int]] = []
+    for address, count in spans:
+        end = address + count
+        if blocks:
+            block = blocks[-1]
+            merged_end = max(block[1], end)
+            if (
+                address <= block[1] + max_gap
+                and merged_end - block[0] <= MAX_REGISTERS_PER_READ
+                and (known is None or address <= block[1] or ranges_cover(known, block[1], address))
+            ):
+                block[1] = merged_end
+                continue
+        blocks.append([address, end])
+    return [(start, end - start) for start, end in blocks]
+
+
+def merge_ranges(ranges: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Merges overlapping and adjacent (start, end) ranges, sorted by start."""
+    merged: list[list[int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+def ranges_cover(ranges: list[tuple[int, int]], start: int, end: int) -> bool:
+    """Whether the registers from start up to end lie within a single one of the merged ranges."""
+    index = bisect.bisect_right(ranges, (start, math.inf)) - 1
+    return index >= 0 and ranges[index][0] <= start and end <= ranges[index][1]
+
+
+def plan_writes(writes: dict[int, list[int]]) -> list[tuple[int, list[int]]]:
+    """Joins writes to adjacent registers into single (address, registers) blocks, sorted by address.
+
+    Writes that are merely near each other are kept apart, as a block would overwrite the registers in between.
+    """
+    blocks: list[tuple[int, list[int]]] = []
+    for address, registers in sorted(writes.items()):
+        if blocks and blocks[-1][0] + len(blocks[-1][1]) == address:
+            blocks[-1][1].extend(registers)
+        else:
+            blocks.append((address, list(registers)))
+    return blocks
+
+
+class ValueType(enum.Enum):
+    """Big-endian layout of a value in registers, along with the raw value that marks it as invalid."""
+    UINT16 = ("H", 0xFFFF)
+    UINT32 = ("I", 0x8000_0000)
+    UINT64 = ("Q", 0x8000_0000_0000_0000)
+    FLOAT32 = ("f", None)
+
+    def __init__(self, code: str, invalid: int | None):
+        self.code = code
+        self.invalid = invalid
+        self.struct = struct.Struct(f">{code}")
+        self.count = self.struct.size // 2
+
+    def clean(self, raw: int | float) -> int | float | None:
+        """Masks the invalid marker, which is NaN for floats, and rounds floats to their significant digits."""
+        if self is ValueType.FLOAT32:
+            return round_to_significant_digits(raw, 7) if raw == raw else None
+        return raw if raw != self.invalid else None
+
+    def decode(self, registers: list[int]) -> int | float | None:
+        return self.clean(self.struct.unpack(struct.pack(f">{self.count}H", *registers))[0])
+
+    @classmethod
+    def of(cls, register: Register) -> "ValueType":
+        """The type a numeric register of the register map is decoded as.
+
+        Bitmaps are read as unsigned integers of their size. Energy counters never go negative, so INT64 registers are
+        read unsigned, with the same invalid marker.
+        """
+        if register.type == "BITMAP":
+            return cls.UINT16 if register.count == 1 else cls.UINT32
+        if register.type == "INT64":
+            return cls.UINT64
+        return cls[register.type]
+
+
+def round_to_significant_digits(number: float, significant_digits: int):
+    if number == 0:
+        return 0  # Early return to handle 0 explicitly
+
+    # Formatting rounds correctly to the significant digits, without the log10 to find the magnitude first
+    return float(f"{number:.{significant_digits}g}")
+
+
+@functools.lru_cache(maxsize=1024)
+def _layout_struct(layout: tuple[tuple[int, str], ...]) -> struct.Struct:
+    """Single struct unpacking values at the given (register offset, code) positions, skipping what's in between."""
+    fmt = ">"
+    position = 0
+    for offset, code in layout:
+        if offset > position:
+            fmt += f"{(offset - position) * 2}x"
+        fmt += code
+        position = offset + struct.calcsize(f">{code}") // 2
+    return struct.Struct(fmt)
+
+
+class RegisterBuffer:
+    """Registers of a single slave that were read in bulk, so values can be decoded without further requests."""
+
+    __slots__ = ("slave_id", "expires", "_blocks", "_failed", "_value_types", "_values")
+
+    def __init__(self, slave_id: int, max_age: float = BUFFER_MAX_AGE):
+        self.slave_id = slave_id
+        self.expires = time.monotonic() + max_age
+        self._blocks: list[tuple[int, list[int]]] = []
+        self._failed: list[tuple[int, int]] = []
+        # Decoded values by address, as each address is decoded as a single type
+        self._value_types: dict[int, ValueType] = {}
+        self._values: dict[int, int | float | None] = {}
+
+    def add(self, address: int, registers: list[int]):
+        self._blocks.append((address, registers))
+
+    def add_failed(self, address: int, count: int):
+        """Marks a span that could not be read, so it's reported as unavailable rather than re-read."""
+        self._failed.append((address, count))
+
+    def is_fresh(self) -> bool:
+        return time.monotonic() <= self.expires
+
+    @property
+    def answered(self) -> bool:
+        """Whether the slave answered any of the reads."""
+        return bool(self._blocks)
+
+    def covers(self, address: int, count: int) -> bool:
+        end = address + count
+        return any(
+            start <= address and end <= start + length
+            for start, length in [(a, len(r)) for a, r in self._blocks] + self._failed
+        )
+
+    def registers(self, address: int, count: int) -> list[int] | None:
+        end = address + count
+        for start, registers in self._blocks:
+            if start <= address and end <= start + len(registers):
+                return registers[address - start:end - start]
+        return None
+
+    def decode(self, value_types: dict[int, ValueType]) -> int:
+        """Decodes all values of a known type in one pass, with a single struct per block.
+
+        Afterwards, those values are available through value() without any further decoding.
+        Returns the number of decoded values.
+        """
+        self._value_types = dict(value_types)
+        addresses = sorted(value_types)
+        for start, registers in self._blocks:
+            end = start + len(registers)
+            layout = []
+            decoded = []
+            position = start
+            for address in addresses:
+                value_type = value_types[address]
+                if address < position or address + value_type.count > end:
+                    continue
+                layout.append((address - start, value_type.code))
+                decoded.append((address, value_type))
+                position = address + value_type.count
+            if not layout:
+                continue
+
+            data = struct.pack(f">{len(registers)}H", *registers)
+            raw_values = _layout_struct(tuple(layout)).unpack_from(data)
+            for (address, value_type), raw in zip(decoded, raw_values):
+                self._values[address] = value_type.clean(raw)
+        return len(self._values)
+
+    def value(self, address: int, value_type: ValueType):
+        """The decoded value, or _UNDECODED when it wasn't part of decode()."""
+        if self._value_types.get(address) is not value_type:
+            return _UNDECODED
+        return self._values.get(address, _UNDECODED)
+
+
+class CircuitBreaker:
+    """Fails requests to a slave instantly once it failed repeatedly, and lets a trial request through now and then.
+
+    Closed while the slave answers; open after CIRCUIT_BREAKER_THRESHOLD consecutive failures; half open once
+    CIRCUIT_BREAKER_RESET seconds passed, when a single request decides whether it closes or opens again.
+    """
+
+    __slots__ = ("threshold", "reset_timeout", "failures", "opened_at")
+
+    def __init__(self, threshold: int = CIRCUIT_BREAKER_THRESHOLD, reset_timeout: float = CIRCUIT_BREAKER_RESET):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        if time.monotonic() - self.opened_at < self.reset_timeout:
+            return False
+        # The trial request restarts the timer, so requests made meanwhile keep failing instantly
+        self.opened_at = time.monotonic()
+        return True
+
+    def succeeded(self):
+        self.failures = 0
+        self.opened_at = None
+
+    def failed(self) -> bool:
+        """Counts a failure, and returns whether it opened the circuit."""
+        self.failures += 1
+        if self.failures < self.threshold:
+            return False
+        opened = self.opened_at is None
+        self.opened_at = time.monotonic()
+        return opened
+
+    def as_dict(self) -> dict:
+        return {
+            "failures": self.failures,
+            "open_for": None if self.opened_at is None else time.monotonic() - self.opened_at,
+        }
+
+
+class RoundTripEstimator:
+    """Derives a timeout from measured round trip times, like the retransmission timeout of TCP (RFC 6298)."""
+
+    __slots__ = ("min_timeout", "max_timeout", "smoothed", "variation", "timeout")
+
+    def __init__(self, max_timeout: float, min_timeout: float = MIN_TIMEOUT):
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.smoothed: float | None = None
+        self.variation = 0.0
+        self.timeout = max_timeout
+
+    def add(self, round_trip: float):
+        if self.smoothed is None:
+            self.smoothed = round_trip
+            self.variation = round_trip / 2
+        else:
+            self.variation = 0.75 * self.variation + 0.25 * abs(self.smoothed - round_trip)
+            self.smoothed = 0.875 * self.smoothed + 0.125 * round_trip
+        self.timeout = min(max(self.smoothed + 4 * self.variation, self.min_timeout), self.max_timeout)
+
+    def timed_out(self):
+        # The link may have gotten slower rather than the request lost, so wait longer next time
+        self.timeout = min(self.timeout * 2, self.max_timeout)
+
+    def derive(self) -> "RoundTripEstimator":
+        """A new estimator that starts out with the current timeout, until it measures round trips of its own."""
+        estimator = RoundTripEstimator(self.max_timeout, self.min_timeout)
+        estimator.timeout = self.timeout
+        return estimator
+
+    def as_dict(self) -> dict:
+        return {"smoothed": self.smoothed, "variation": self.variation, "timeout": self.timeout}
+
+
+class RequestOutcome(enum.Enum):
+    OK = "ok"
+    EXCEPTION = "exception"  # The gateway answered with a Modbus exception
+    TIMEOUT = "timeout"
+    IO_ERROR = "io_error"
+    REJECTED = "rejected"  # Failed instantly by the circuit breaker
+
+
+def transferred_bytes(function_code: int, count: int, outcome: RequestOutcome) -> int:
+    """Size on the wire of the Modbus TCP frames of a request and its response."""
+    if outcome is RequestOutcome.REJECTED:
+        return 0
+    read = function_code == READ_HOLDING_REGISTERS
+    size = 12 if read else 13 + 2 * count
+    if outcome is RequestOutcome.OK:
+        size += 9 + 2 * count if read else 12
+    elif outcome is RequestOutcome.EXCEPTION:
+        size += 9
+    return size
+
+
+class RequestStats:
+    """Number, outcome, size and latency of a group of Modbus requests."""
+
+    __slots__ = ("outcomes", "bytes", "latency_total", "latency_max", "histogram")
+
+    def __init__(self):
+        self.outcomes = {outcome: 0 for outcome in RequestOutcome}
+        self.bytes = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    @property
+    def requests(self) -> int:
+        return sum(self.outcomes.values())
+
+    @property
+    def errors(self) -> int:
+        return self.requests - self.outcomes[RequestOutcome.OK]
+
+    @property
+    def latency_mean(self) -> float | None:
+        timed = sum(self.histogram)
+        return self.latency_total / timed if timed else None
+
+    def record(self, outcome: RequestOutcome, size: int, latency: float | None):
+        self.outcomes[outcome] += 1
+        self.bytes += size
+        if latency is not None:
+            self.latency_total += latency
+            self.latency_max = max(self.latency_max, latency)
+            self.histogram[bisect.bisect_left(LATENCY_BUCKETS, latency)] += 1
+
+    def latency_histogram(self) -> dict[str, int]:
+        labels = [f"<={bound}s" for bound in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]}s"]
+        return dict(zip(labels, self.histogram))
+
+    def as_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            **{outcome.value: count for outcome, count in self.outcomes.items()},
+            "bytes": self.bytes,
+            "latency_mean": self.latency_mean,
+            "latency_max": self.latency_max,
+            "latency_histogram": self.latency_histogram(),
+        }
+
+
+class ModbusMetrics:
+    """Statistics of the Modbus requests to a gateway, in total, per slave and per register block."""
+
+    def __init__(self):
+        self.total = RequestStats()
+        self.slaves: dict[int, RequestStats] = {}
+        self.blocks: dict[tuple[int, int, int, int], RequestStats] = {}
+        self.transactions: deque[tuple] = deque(maxlen=TRANSACTION_LOG_SIZE)
+        self.decode_seconds = 0.0
+        self.decoded_values = 0
+
+    def record(
+        self, slave_id: int, function_code: int, address: int, count: int, outcome: RequestOutcome,
+        latency: float | None = None
+    ):
+        size = transferred_bytes(function_code, count, outcome)
+        self.total.record(outcome, size, latency)
+        self.slaves.setdefault(slave_id, RequestStats()).record(outcome, size, latency)
+        self.blocks.setdefault((slave_id, function_code, address, count), RequestStats()).record(outcome, size, latency)
+        self.transactions.append((time.time(), slave_id, function_code, address, count, outcome, latency))
+
+    def record_decode(self, seconds: float, values: int):
+        self.decode_seconds += seconds
+        self.decoded_values += values
+
+    def slowest_slaves(self, limit: int = 5) -> list[tuple[int, float]]:
+        """The slave IDs with the highest mean latency, with that latency."""
+        latencies = [(slave_id, stats.latency_mean) for slave_id, stats in self.slaves.items()]
+        return sorted([entry for entry in latencies if entry[1] is not None], key=lambda entry: -entry[1])[:limit]
+
+    def as_dict(self) -> dict:
+        return {
+            "total": self.total.as_dict(),
+            "slaves": {slave_id: stats.as_dict() for slave_id, stats in sorted(self.slaves.items())},
+            "blocks": [
+                {"slave_id": slave_id, "function_code": function_code, "address": address, "count": count,
+                 **stats.as_dict()}
+                for (slave_id, function_code, address, count), stats in sorted(self.blocks.items())
+            ],
+            "decode_seconds": self.decode_seconds,
+            "decoded_values": self.decoded_values,
+            "recent_transactions": [
+                {
+                    "time": datetime.fromtimestamp(timestamp).isoformat(), "slave_id": slave_id,
+                    "function_code": function_code, "address": address, "count": count, "outcome": outcome.value,
+                    "latency": latency,
+                }
+                for timestamp, slave_id, function_code, address, count, outcome, latency in self.transactions
+            ],
+        }
+
+
+class ModbusResponse:
+    """Response of a PipelinedModbusClient, shaped like the pymodbus responses the helpers expect."""
+
+    __slots__ = ("function_code", "registers", "exception_code", "round_trip")
+
+    def __init__(self, function_code: int, registers: list[int] | None = None, exception_code: int | None = None):
+        self.function_code = function_code
+        self.registers = registers or []
+        self.exception_code = exception_code
+        # Seconds from sending the request until its response, without the time it waited for the window
+        self.round_trip: float | None = None
+
+    def isError(self) -> bool:
+        return self.function_code & 0x80 != 0
+
+
+class PipelinedModbusClient:
+    """Modbus TCP client that keeps up to `window` requests in flight, matching responses by transaction ID.
+
+    Gateways that don't support this tend to drop requests that arrive while they're busy, or close the connection.
+    A request that times out while later ones were answered is retried on its own. Only when that retry is answered,
+    or when the connection closes with several requests in flight, the client falls back to strict request/response
+    for as long as it lives; other timeouts are the slave's own. A window of 1 is strict request/response throughout.
+    """
+
+    def __init__(self, host: str, port: int = 502, timeout: float = 5, window: int = PIPELINE_WINDOW):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.window = window
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._receiver: asyncio.Task | None = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._slots = asyncio.Condition()
+        self._next_transaction_id = 0
+        # Requests are numbered in the order they're sent, to tell whether a later one was answered first
+        self._sent = 0
+        self._sequences: dict[int, int] = {}
+        self._last_answered = 0
+        self._retrying = 0
+
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def connect(self) -> bool:
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), self.timeout
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            _LOGGER.debug(f"Could not connect to {self.host}:{self.port}: {e}")
+            return False
+        self._receiver = asyncio.ensure_future(self.__receive(self._reader))
+        return True
+
+    def close(self):
+        if self._receiver is not None:
+            self._receiver.cancel()
+            self._receiver = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self.__fail_pending(ConnectionException("Connection closed"))
+
+    async def read_holding_registers(
+        self, address: int, count: int = 1, device_id: int = 1, timeout: float | None = None
+    ) -> ModbusResponse:
+        pdu, round_trip = await self.__execute(
+            device_id, struct.pack(">BHH", READ_HOLDING_REGISTERS, address, count), timeout
+        )
+        if pdu[0] & 0x80:
+            response = ModbusResponse(pdu[0], exception_code=pdu[1])
+        else:
+            response = ModbusResponse(pdu[0], list(struct.unpack(f">{pdu[1] // 2}H", pdu[2:2 + pdu[1]])))
+        response.round_trip = round_trip
+        return response
+
+    async def write_registers(
+        self, address: int, values: list[int], device_id: int = 1, timeout: float | None = None
+    ) -> ModbusResponse:
+        pdu, round_trip = await self.__execute(
+            device_id,
+            struct.pack(f">BHHB{len(values)}H", WRITE_MULTIPLE_REGISTERS, address, len(values), len(values) * 2, *values),
+            timeout,
+        )
+        response = ModbusResponse(pdu[0], exception_code=pdu[1] if pdu[0] & 0x80 else None)
+        response.round_trip = round_trip
+        return response
+
+    async def __execute(self, device_id: int, request: bytes, timeout: float | None = None) -> tuple[bytes, float]:
+        deadline = None
+        alone = False
+        while True:
+            async with self._slots:
+                if alone:
+                    # New requests are held off until the ones in flight are done, then the retry goes on its own
+                    self._retrying += 1
+                    try:
+                        await asyncio.wait_for(
+                            self._slots.wait_for(lambda: not self._pending), deadline - time.monotonic()
+                        )
+                    finally:
+                        self._retrying -= 1
+                        self._slots.notify_all()
+                else:
+                    await self._slots.wait_for(lambda: not self._retrying and len(self._pending) < self.window)
+                if not self.connected:
+                    raise ConnectionException(f"Not connected to {self.host}:{self.port}")
+                # Time spent waiting for a slot doesn't count, the gateway hasn't seen the request yet
+                if deadline is None:
+                    deadline = time.monotonic() + (timeout or self.timeout)
+
+                self._next_transaction_id = self._next_transaction_id % 0xFFFF + 1
+                transaction_id = self._next_transaction_id
+                self._sent += 1
+                sequence = self._sent
+                response = asyncio.get_running_loop().create_future()
+                self._pending[transaction_id] = response
+                self._sequences[transaction_id] = sequence
+                self._writer.write(struct.pack(">HHHB", transaction_id, 0, len(request) + 1, device_id) + request)
+                sent = time.monotonic()
+
+            try:
+                if self.window > 1 and not alone:
+                    # A pipelined attempt first gets half the time, so a retry on its own still fits in the timeout
+                    try:
+                        pdu = await asyncio.wait_for(asyncio.shield(response), (deadline - time.monotonic()) / 2)
+                        return pdu, time.monotonic() - sent
+                    except asyncio.TimeoutError:
+                        if self._last_answered > sequence:
+                            # Requests sent after it were answered, so either the gateway dropped this one or the
+                            # slave doesn't answer, which a retry on its own tells apart
+                            alone = True
+                            continue
+
+                pdu = await asyncio.wait_for(response, deadline - time.monotonic())
+                if alone:
+                    self.__fall_back(f"slave ID {device_id} only answered a request on its own")
+                return pdu, time.monotonic() - sent
+            finally:
+                self._pending.pop(transaction_id, None)
+                self._sequences.pop(transaction_id, None)
+                async with self._slots:
+                    self._slots.notify_all()
+
+    async def __receive(self, reader: asyncio.StreamReader):
+        try:
+            while True:
+                transaction_id, _, length, _ = struct.unpack(">HHHB", await reader.readexactly(7))
+                pdu = await reader.readexactly(length - 1)
+                response = self._pending.get(transaction_id)
+                if response is None and transaction_id == 0 and len(self._pending) == 1:
+                    # Some gateways don't echo the transaction ID, which is unambiguous when only one is in flight
+                    response = next(iter(self._pending.values()))
+                if response is None:
+                    # Most likely the answer to a request that already timed out
+                    _LOGGER.debug(f"Discarding response with unknown transaction ID {transaction_id}")
+                elif not response.done():
+                    response.set_result(pdu)
+                    self._last_answered = max(self._last_answered, self._sequences.get(transaction_id, 0))
+        except (asyncio.IncompleteReadError, ConnectionError) as e:
+            if len(self._pending) > 1 and self.window > 1:
+                self.__fall_back("the gateway closed the connection")
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            self.__fail_pending(ConnectionException(f"Connection to {self.host}:{self.port} lost: {e}"))
+
+    def __fall_back(self, reason: str):
+        _LOGGER.warning(
+            f"{self.host}:{self.port} does not seem to support pipelined requests ({reason}),"
+            f" falling back to one request at a time"
+        )
+        self.window = 1
+
+    def __fail_pending(self, exception: Exception):
+        for response in self._pending.values():
+            if not response.done():
+                response.set_exception(exception)
+
 
 class Phase(enum.Enum):
     A = 0
@@ -50,30 +680,67 @@ class PanelHealth(enum.Enum):
     OUT_OF_ORDER = 2
 
 
+class AlarmFlags(enum.IntFlag):
+    """Alarms of a device, as the bits of its alarm bitmask."""
+    VOLTAGE_LOSS = 1 << 0
+    CURRENT_OVERLOAD_WHEN_VOLTAGE_LOSS = 1 << 1
+    CURRENT_SHORT_CIRCUIT = 1 << 2
+    CURRENT_OVERLOAD_45_PERCENT = 1 << 3
+    LOAD_CURRENT_LOSS = 1 << 4
+    OVERVOLTAGE_120_PERCENT = 1 << 5
+    UNDERVOLTAGE_80_PERCENT = 1 << 6
+    BATTERY_ALMOST_LOW = 1 << 7
+    HEAT = 1 << 8
+    BATTERY_LOW = 1 << 9
+    PREVENTIVE_MAINTENANCE = 1 << 10
+    DEVICE_REPLACEMENT = 1 << 11
+    CURRENT_50_PERCENT = 1 << 12
+    CURRENT_80_PERCENT = 1 << 13
+
+
+ALL_ALARMS = AlarmFlags(sum(AlarmFlags))
+
+
+def _alarm(flag: AlarmFlags) -> property:
+    return property(lambda self: flag in self.flags)
+
+
 class AlarmDetails:
+    __slots__ = ("bitmask", "flags")
+
     def __init__(self, bitmask: int):
         self.bitmask = bitmask
-        self.has_alarm = bitmask & (0b1 << 14) - 1 != 0
-
-        self.voltage_loss = 0b1 & bitmask != 0
-        self.current_overload_when_voltage_loss = 0b1 << 1 & bitmask != 0
-        self.current_short_circuit = 0b1 << 2 & bitmask != 0
-        self.current_overload_45_percent = 0b1 << 3 & bitmask != 0
-        self.load_current_loss = 0b1 << 4 & bitmask != 0
-        self.overvoltage_120_percent = 0b1 << 5 & bitmask != 0
-        self.undervoltage_80_percent = 0b1 << 6 & bitmask != 0
-        self.battery_almost_low = 0b1 << 7 & bitmask != 0
-        self.heat = 0b1 << 8 & bitmask != 0
-        self.battery_low = 0b1 << 9 & bitmask != 0
-        self.preventive_maintenance = 0b1 << 10 & bitmask != 0
-        self.device_replacement = 0b1 << 11 & bitmask != 0
-        self.current_50_percent = 0b1 << 12 & bitmask != 0
-        self.current_80_percent = 0b1 << 13 & bitmask != 0
+        self.flags = AlarmFlags(bitmask) & ALL_ALARMS
+
+    @property
+    def has_alarm(self) -> bool:
+        return bool(self.flags)
+
+    voltage_loss = _alarm(AlarmFlags.VOLTAGE_LOSS)
+    current_overload_when_voltage_loss = _alarm(AlarmFlags.CURRENT_OVERLOAD_WHEN_VOLTAGE_LOSS)
+    current_short_circuit = _alarm(AlarmFlags.CURRENT_SHORT_CIRCUIT)
+    current_overload_45_percent = _alarm(AlarmFlags.CURRENT_OVERLOAD_45_PERCENT)
+    load_current_loss = _alarm(AlarmFlags.LOAD_CURRENT_LOSS)
+    overvoltage_120_percent = _alarm(AlarmFlags.OVERVOLTAGE_120_PERCENT)
+    undervoltage_80_percent = _alarm(AlarmFlags.UNDERVOLTAGE_80_PERCENT)
+    battery_almost_low = _alarm(AlarmFlags.BATTERY_ALMOST_LOW)
+    heat = _alarm(AlarmFlags.HEAT)
+    battery_low = _alarm(AlarmFlags.BATTERY_LOW)
+    preventive_maintenance = _alarm(AlarmFlags.PREVENTIVE_MAINTENANCE)
+    device_replacement = _alarm(AlarmFlags.DEVICE_REPLACEMENT)
+    current_50_percent = _alarm(AlarmFlags.CURRENT_50_PERCENT)
+    current_80_percent = _alarm(AlarmFlags.CURRENT_80_PERCENT)
 
     def __str__(self):
         return bin(self.bitmask)
 
 
+def alarm_transitions(before: int, after: int) -> tuple[AlarmFlags, AlarmFlags]:
+    """The alarms that were raised and the ones that were cleared from one bitmask to the other."""
+    changed = AlarmFlags(before ^ after) & ALL_ALARMS
+    return changed & AlarmFlags(after), changed & AlarmFlags(before)
+
+
 class DeviceUsage(enum.Enum):
     main_incomer = 1
     sub_head_of_group = 2
@@ -190,58 +857,191 @@ class TypeOfGateway(enum.Enum):
     SMARTLINK = "Smartlink SI D"
 
 
+def _value_accessor(name: str, convert: Callable | None = None):
+    """An accessor of a value of a wireless device in the register map, converted when it could be read."""
+
+    async def accessor(self: "SchneiderModbus", tag_index: int):
+        value = await self.read_value(name, tag_index)
+        return convert(value) if convert is not None and value is not None else value
+
+    accessor.__name__ = accessor.__qualname__ = name
+    accessor.__doc__ = VALUES[name].description
+    return accessor
+
+
+def _enumerated_value_accessor(name: str):
+    """An accessor of a value of a wireless device in the register map that exists per member of an enumeration.
+
+    The value of a member, like Phase.A or LineVoltage.A_N, is named after it: tag_current_a, tag_voltage_a_n.
+    """
+
+    async def accessor(self: "SchneiderModbus", tag_index: int, member: enum.Enum):
+        return await self.read_value(f"{name}_{member.name.lower()}", tag_index)
+
+    accessor.__name__ = accessor.__qualname__ = name
+    accessor.__doc__ = next(value.description for value in VALUES.values() if value.name.startswith(f"{name}_"))
+    return accessor
+
+
+def _gateway_value_accessor(name: str, convert: Callable | None = None, missing=None):
+    """An accessor of a value of the gateway itself in the register map; missing on gateways that don't have it."""
+
+    async def accessor(self: "SchneiderModbus"):
+        if self.type_of_gateway.name not in VALUES[name].registers:
+            return missing
+        value = await self.read_value(name)
+        return convert(value) if convert is not None and value is not None else value
+
+    accessor.__name__ = accessor.__qualname__ = name
+    accessor.__doc__ = VALUES[name].description
+    return accessor
+
+
 class SchneiderModbus:
-    def __init__(self, host, type_of_gateway: TypeOfGateway, port=502, timeout=5):
-        _LOGGER.info(f"Connecting Modbus TCP to {host}:{port}")
-        self.client = AsyncModbusTcpClient(host=host, port=port, timeout=timeout)
+    def __init__(self, host, type_of_gateway: TypeOfGateway, port=502, timeout=5, pool_size=1, pipeline_window=1):
+        _LOGGER.info(
+            f"Connecting Modbus TCP to {host}:{port} with {pool_size} connection(s)"
+            f" of {pipeline_window} request(s) in flight"
+        )
+        self.host = host
+        self.port = port
+        # Each slave always uses the same connection, so its requests stay in order
+        self.clients = [PipelinedModbusClient(host, port, timeout, pipeline_window) for _ in range(pool_size)]
+        self.client = self.clients[0]
         self.type_of_gateway = type_of_gateway
         self.synthetic_slave_id = None
+        self._buffers: dict[int, RegisterBuffer] = {}
+        self._prefetches: dict[int, asyncio.Task] = {}
+        self._learned_spans: dict[int, dict[Hashable, set[tuple[int, int]]]] = {}
+        self._value_types: dict[int, dict[int, ValueType]] = {}
+        self._mapped_ranges: dict[int, tuple[tuple[int, int], ...]] = {}
+        self._connect_locks: dict[PipelinedModbusClient, asyncio.Lock] = {}
+        self._breakers: dict[int, CircuitBreaker] = {}
+        # Each slave's timeout starts out at the gateway's, which only learns from answered requests, so slaves that
+        # don't answer only lengthen their own timeout
+        self._gateway_round_trip = RoundTripEstimator(timeout)
+        self._round_trips: dict[int, RoundTripEstimator] = {}
+        self._timeout = timeout
+        self.metrics = ModbusMetrics()
 
     @classmethod
-    async def create(cls, host, type_of_gateway: TypeOfGateway, port=502, timeout=5):
-        instance = cls(host, type_of_gateway, port, timeout)
-        if type_of_gateway is TypeOfGateway.POWERTAG_LINK:
-            instance.synthetic_slave_id = await instance.find_synthetic_table_slave_id()
+    async def create(cls, host, type_of_gateway: TypeOfGateway, port=502, timeout=5, pool_size=1, pipeline_window=1):
+        instance = cls(host, type_of_gateway, port, timeout, pool_size, pipeline_window)
+        await instance.locate_synthetic_table()
         return instance
 
-    async def find_synthetic_table_slave_id(self):
-        for slave_id in range(SYNTHESIS_TABLE_SLAVE_ID_START, 1, -1):
-            _LOGGER.debug(f"Searching for synthesis table at slave ID {slave_id}")
-            result = await self.__read_int_16(0x0001, slave_id)
-            if result is not None:
-                _LOGGER.debug(f"Found synthesis table at slave ID {slave_id}")
-                return slave_id
+    @classmethod
+    async def probe(cls, host, type_of_gateway: TypeOfGateway, port=502, timeout=1) -> str | None:
+        """Connects, reads the serial number of the gateway and disconnects again.
+
+        Unlike create, it doesn't search for the synthesis table, so it costs a single request.
+        Returns the serial number, or None when the gateway didn't answer.
+        """
+        instance = cls(host, type_of_gateway, port, timeout)
+        try:
+            return await instance.serial_number()
+        except ConnectionException as e:
+            _LOGGER.debug(f"Could not reach {host}:{port}: {e}")
+            return None
+        finally:
+            instance.close()
+
+    async def locate_synthetic_table(self, known_slave_id: int | None = None):
+        """Finds the slave ID of the synthesis table, which only the PowerTag Link has."""
+        if self.type_of_gateway is TypeOfGateway.POWERTAG_LINK:
+            self.synthetic_slave_id = await self.find_synthetic_table_slave_id(known_slave_id)
+
+    async def find_synthetic_table_slave_id(self, known_slave_id: int | None = None) -> int:
+        if known_slave_id is not None:
+            _LOGGER.debug(f"Trying the known synthesis table slave ID {known_slave_id}")
+            if await self.__read_int_16(0x0001, known_slave_id) is not None:
+                return known_slave_id
+
+        candidates = iter(range(SYNTHESIS_TABLE_SLAVE_ID_START, 1, -1))
+        found = asyncio.get_running_loop().create_future()
+
+        async def probe_candidates(client: PipelinedModbusClient):
+            for slave_id in candidates:
+                _LOGGER.debug(f"Searching for synthesis table at slave ID {slave_id}")
+                registers, _ = await self.__async_read_registers(0x0001, 1, slave_id, client)
+                if registers is not None:
+                    if not found.done():
+                        found.set_result(slave_id)
+                    return
+
+        # Gateways that refuse more connections are probed over the ones they accepted
+        extra_clients = [
+            PipelinedModbusClient(self.host, self.port, self._timeout, 1) for _ in range(PROBE_CONNECTIONS)
+        ]
+        connected = await asyncio.gather(*[client.connect() for client in extra_clients])
+        probe_clients = self.clients + [client for client, ok in zip(extra_clients, connected) if ok]
+
+        probes = [
+            asyncio.ensure_future(probe_candidates(client))
+            for client in probe_clients for _ in range(client.window)
+        ]
+        all_probed = asyncio.gather(*probes)
+        try:
+            await asyncio.wait([found, all_probed], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            all_probed.cancel()
+            await asyncio.gather(all_probed, return_exceptions=True)
+            for client in extra_clients:
+                client.close()
+                self._connect_locks.pop(client, None)
+
+        if found.done():
+            _LOGGER.debug(f"Found synthesis table at slave ID {found.result()}")
+            return found.result()
+        # Raises the connection error of the probes, if any
+        await all_probed
 
         _LOGGER.warning(
             f"Could not find synthesis table, proceeding with the default of {SYNTHESIS_TABLE_SLAVE_ID_START}, though expect problems later."
         )
         return SYNTHESIS_TABLE_SLAVE_ID_START
 
-    async def hardware_version(self) -> str | None:
-        """Gateway Hardware version
-        valid for firmware version 001.008.007 and later.
-        """
-        if self.type_of_gateway == TypeOfGateway.SMARTLINK:
-            return await self.__read_string(0x006A, 3, GATEWAY_SLAVE_ID)
-        else:
-            return await self.__read_string(0x0050, 6, GATEWAY_SLAVE_ID)
-
-    async def serial_number(self) -> str | None:
-        """[S/N]: PP YY WW [D [nnnn]]
-        • PP: Plant
-        • YY: Year in decimal notation [05...99]
-        • WW: Week in decimal notation [1...53]
-        • D: Day of the week in decimal notation [1...7]
-        • nnnn: Sequence of numbers [0001...10.00-0–1]
+    # Register map
+
+    async def read_value(self, name: str, tag_index: int | None = None):
+        """Reads a value of the register map, decoded by the type of its register on this gateway.
+
+        Values of wireless devices are read from the slave tag_index. None when this gateway doesn't have the value,
+        or when it could not be read.
         """
-        return await self.__read_string(0x0064, 6, GATEWAY_SLAVE_ID)
+        register = VALUES[name].registers.get(self.type_of_gateway.name)
+        if register is None:
+            return None
+        return await self.read_register(register, tag_index)
+
+    async def read_register(self, register: Register, tag_index: int | None = None):
+        """Reads a register of the register map from the slave it lives on, decoded by its type."""
+        slave_id = self.__slave_of(register, tag_index)
+        if register.type == "ASCII":
+            return await self.__read_string(register.address, register.count, slave_id)
+        if register.type == "DATETIME":
+            return await self.__read_date_time(register.address, slave_id)
+        return await self.__async_read_value(register.address, ValueType.of(register), slave_id)
+
+    def __slave_of(self, register: Register, tag_index: int | None) -> int:
+        if register.slave == "TAG":
+            return tag_index
+        if register.slave == "SYNTHESIS_TABLE":
+            return self.synthetic_slave_id
+        return GATEWAY_SLAVE_ID
 
-    async def firmware_version(self) -> str | None:
-        """valid for firmware version 001.008.007 and later."""
-        if self.type_of_gateway == TypeOfGateway.SMARTLINK:
-            return await self.__read_string(0x006D, 3, GATEWAY_SLAVE_ID)
-        else:
-            return await self.__read_string(0x0078, 6, GATEWAY_SLAVE_ID)
+    # Identification and Status Register
+
+    hardware_version = _gateway_value_accessor("hardware_version")
+    serial_number = _gateway_value_accessor("serial_number")
+    firmware_version = _gateway_value_accessor("firmware_version")
+    product_id = _gateway_value_accessor("product_id")
+    manufacturer = _gateway_value_accessor("manufacturer", missing="Schneider Electric")
+    product_code = _gateway_value_accessor("product_code", missing="A9XMWA20")
+    product_range = _gateway_value_accessor("product_range", missing="Unknown")
+    product_model = _gateway_value_accessor("product_model", missing="Smartlink SI D")
+    name = _gateway_value_accessor("name", missing="Unknown")
+    product_vendor_url = _gateway_value_accessor("product_vendor_url", missing="Unknown")
 
     # Status
 
@@ -251,7 +1051,7 @@ class SchneiderModbus:
             TypeOfGateway.POWERTAG_LINK,
             TypeOfGateway.SMARTLINK,
         ]
-        bitmap = await self.__read_int_16(0x0070, GATEWAY_SLAVE_ID)
+        bitmap = await self.read_value("status")
         try:
             return LinkStatus(bitmap) if bitmap is not None else None
         except Exception as e:
@@ -260,642 +1060,253 @@ class SchneiderModbus:
             )
             return LinkStatus.GENERAL_FAILURE
 
-    async def health(self) -> PanelHealth | None:
-        """PowerTag Link gateway status and diagnostic register"""
-        assert self.type_of_gateway == TypeOfGateway.PANEL_SERVER
-        code = await self.__read_int_16(0x009E, GATEWAY_SLAVE_ID)
-        return PanelHealth(code) if code is not None else None
+    health = _gateway_value_accessor("health", PanelHealth)
 
     # Date and Time
 
-    async def date_time(self) -> datetime | None:
-        """Indicates the year, month, day, hour, minute and millisecond on the PowerTag Link gateway."""
-        return await self.__read_date_time(0x0073, GATEWAY_SLAVE_ID)
-
-    # Current Metering Data
-
-    async def tag_current(self, tag_index: int, phase: Phase) -> float | None:
-        """RMS current on phase"""
-        return await self.__read_float_32(0xBB7 + phase.value, tag_index)
-
-    async def tag_current_neutral(self, tag_index: int) -> float | None:
-        """RMS current on Neutral"""
-        return await self.__read_float_32(0xBBD, tag_index)
-
-    # Voltage Metering Data
-
-    async def tag_voltage(
-        self, tag_index: int, line_voltage: LineVoltage
-    ) -> float | None:
-        """RMS phase-to-phase voltage"""
-        return await self.__read_float_32(0xBCB + line_voltage.value, tag_index)
-
-    # Power Metering Data
-
-    async def tag_power_active(self, tag_index: int, phase: Phase) -> float | None:
-        """Active power on phase"""
-        return await self.__read_float_32(0xBED + phase.value, tag_index)
-
-    async def tag_power_active_total(self, tag_index: int) -> float | None:
-        """Total active power"""
-        return await self.__read_float_32(0xBF3, tag_index)
-
-    async def tag_power_reactive(self, tag_index: int, phase: Phase) -> float | None:
-        """Reactive power on phase"""
-        return await self.__read_float_32(0xBF5 + phase.value, tag_index)
-
-    async def tag_power_reactive_total(self, tag_index: int) -> float | None:
-        """Total reactive power"""
-        return await self.__read_float_32(0xBFB, tag_index)
-
-    async def tag_power_apparent(self, tag_index: int, phase: Phase) -> float | None:
-        """Apparent power on phase"""
-        return await self.__read_float_32(0xBFD + phase.value, tag_index)
-
-    async def tag_power_apparent_total(self, tag_index: int) -> float | None:
-        """Total apparent power (arithmetric)"""
-        return await self.__read_float_32(0xC03, tag_index)
-
-    # Power Factor Metering Data
-
-    async def tag_power_factor(self, tag_index: int, phase: Phase) -> float | None:
-        """Power factor on phase"""
-        return await self.__read_float_32(0xC05 + phase.value, tag_index)
-
-    async def tag_power_factor_total(self, tag_index: int) -> float | None:
-        """Total power factor"""
-        return await self.__read_float_32(0xC0B, tag_index)
-
-    async def tag_power_factor_sign_convention(
-        self, tag_index: int
-    ) -> PowerFactorSignConvention | None:
-        """Power factor sign convention"""
-        power_factor_sign = await self.__read_int_16(0xC0D, tag_index)
-        return PowerFactorSignConvention(power_factor_sign) if power_factor_sign is not None else None
-
-    # Frequency Metering Data
-
-    async def tag_ac_frequency(self, tag_index: int) -> float | None:
-        """AC frequency"""
-        return await self.__read_float_32(0xC25, tag_index)
-
-    # Device Temperature Metering Data
-
-    async def tag_device_temperature(self, tag_index: int) -> float | None:
-        """Device internal temperature"""
-        return await self.__read_float_32(0xC3B, tag_index)
+    date_time = _gateway_value_accessor("date_time")
+
+    # Metering Data
+
+    tag_current = _enumerated_value_accessor("tag_current")
+    tag_current_neutral = _value_accessor("tag_current_neutral")
+    tag_voltage = _enumerated_value_accessor("tag_voltage")
+    tag_power_active = _enumerated_value_accessor("tag_power_active")
+    tag_power_active_total = _value_accessor("tag_power_active_total")
+    tag_power_reactive = _enumerated_value_accessor("tag_power_reactive")
+    tag_power_reactive_total = _value_accessor("tag_power_reactive_total")
+    tag_power_apparent = _enumerated_value_accessor("tag_power_apparent")
+    tag_power_apparent_total = _value_accessor("tag_power_apparent_total")
+    tag_power_factor = _enumerated_value_accessor("tag_power_factor")
+    tag_power_factor_total = _value_accessor("tag_power_factor_total")
+    tag_power_factor_sign_convention = _value_accessor("tag_power_factor_sign_convention", PowerFactorSignConvention)
+    tag_ac_frequency = _value_accessor("tag_ac_frequency")
+    tag_device_temperature = _value_accessor("tag_device_temperature")
 
     # Energy Data – Legacy Zone
 
-    async def tag_energy_active_delivered_plus_received_total(
-        self, tag_index: int
-    ) -> int | None:
-        """Total active energy delivered + received (not resettable)"""
-        return await self.__read_int_64(0xC83, tag_index)
-
-    async def tag_energy_active_delivered_plus_received_partial(
-        self, tag_index: int
-    ) -> int | None:
-        """Partial active energy delivered + received (resettable)"""
-        return await self.__read_int_64(0xCB7, tag_index)
+    tag_energy_active_delivered_plus_received_total = _value_accessor("tag_energy_active_delivered_plus_received_total")
+    tag_energy_active_delivered_plus_received_partial = _value_accessor(
+        "tag_energy_active_delivered_plus_received_partial"
+    )
 
     # Energy Data – New Zone
 
     async def tag_reset_energy_active_delivered_partial(self, tag_index: int):
         """Set partial active energy delivered counter. The value returns to zero by PowerTag Link gateway"""
         if self.type_of_gateway == TypeOfGateway.PANEL_SERVER:
-            await self.__write_int_64(0x1390, tag_index, 0)  # All
-            await self.__write_int_64(0x13B8, tag_index, 0)  # Phase A
-            await self.__write_int_64(0x13E0, tag_index, 0)  # Phase B
-            await self.__write_int_64(0x1408, tag_index, 0)  # Phase C
+            # All, phase A, B and C
+            await self.__reset_counters([0x1390, 0x13B8, 0x13E0, 0x1408], tag_index)
         else:
             await self.__write_int_64(0xCC3, tag_index, 0)
 
     async def tag_reset_energy_active_received_partial(self, tag_index: int):
         """Set partial active energy received counter. The value returns to zero by PowerTag Link gateway."""
         if self.type_of_gateway == TypeOfGateway.PANEL_SERVER:
-            await self.__write_int_64(0x1398, tag_index, 0)  # All
-            await self.__write_int_64(0x13C0, tag_index, 0)  # Phase A
-            await self.__write_int_64(0x13E8, tag_index, 0)  # Phase B
-            await self.__write_int_64(0x1410, tag_index, 0)  # Phase C
+            # All, phase A, B and C
+            await self.__reset_counters([0x1398, 0x13C0, 0x13E8, 0x1410], tag_index)
         else:
             await self.__write_int_64(0xCCB, tag_index, 0)
 
     async def tag_reset_energy_reactive_delivered_partial(self, tag_index: int):
         """Set partial reactive energy delivered counter. The value returns to zero by PowerTag Link gateway."""
         if self.type_of_gateway == TypeOfGateway.PANEL_SERVER:
-            await self.__write_int_64(0x1438, tag_index, 0)  # All
-            await self.__write_int_64(0x1470, tag_index, 0)  # Phase A
-            await self.__write_int_64(0x1498, tag_index, 0)  # Phase B
-            await self.__write_int_64(0x14C0, tag_index, 0)  # Phase C
+            # All, phase A, B and C
+            await self.__reset_counters([0x1438, 0x1470, 0x1498, 0x14C0], tag_index)
         else:
             await self.__write_int_64(0xCD3, tag_index, 0)
 
     async def tag_reset_energy_reactive_received_partial(self, tag_index: int):
         """Set partial reactive energy received counter. The value returns to zero by PowerTag Link gateway."""
         if self.type_of_gateway == TypeOfGateway.PANEL_SERVER:
-            await self.__write_int_64(0x1448, tag_index, 0)  # All
-            await self.__write_int_64(0x1478, tag_index, 0)  # Phase A
-            await self.__write_int_64(0x14A0, tag_index, 0)  # Phase B
-            await self.__write_int_64(0x14C8, tag_index, 0)  # Phase C
+            # All, phase A, B and C
+            await self.__reset_counters([0x1448, 0x1478, 0x14A0, 0x14C8], tag_index)
         else:
             await self.__write_int_64(0xCDB, tag_index, 0)
 
     async def tag_reset_energy_apparent_partial(self, tag_index: int):
         """Set partial apparent energy counter. The value returns to zero by PowerTag Link gateway."""
         assert self.type_of_gateway == TypeOfGateway.PANEL_SERVER
-        await self.__write_int_64(0x14F4, tag_index, 0)  # All
-        await self.__write_int_64(0x150C, tag_index, 0)  # Phase A
-        await self.__write_int_64(0x1534, tag_index, 0)  # Phase B
-        await self.__write_int_64(0x155C, tag_index, 0)  # Phase C
-
-    async def tag_energy_active_delivered_partial(self, tag_index: int) -> int | None:
-        """Active energy delivered (resettable)"""
-        if self.type_of_gateway == TypeOfGateway.SMARTLINK:
-            return await self.__read_int_64(0x0C87, tag_index)
-        else:
-            return await self.__read_int_64(0x1390, tag_index)
-
-    async def tag_energy_active_delivered_total(self, tag_index: int) -> int | None:
-        """Active energy delivered count positively (not resettable)"""
-        if self.type_of_gateway == TypeOfGateway.SMARTLINK:
-            return await self.__read_int_64(0x0, tag_index)
-        else:
-            return await self.__read_int_64(0x1394, tag_index)
-
-    async def tag_energy_active_received_partial(self, tag_index: int) -> int | None:
-        """Active energy received (resettable)"""
-        if self.type_of_gateway == TypeOfGateway.SMARTLINK:
-            return await self.__read_int_64(0x0CC7, tag_index)
-        else:
-            return await self.__read_int_64(0x1398, tag_index)
-
-    async def tag_energy_active_received_total(self, tag_index: int) -> int | None:
-        """Active energy received count negatively (not resettable)"""
-        if self.type_of_gateway == TypeOfGateway.SMARTLINK:
-            return await self.__read_int_64(0x0C8B, tag_index)
-        else:
-            return await self.__read_int_64(0x139C, tag_index)
-
-    async def tag_energy_active_delivered_partial_phase(
-        self, tag_index: int, phase: Phase
-    ) -> int | None:
-        """Active energy on phase delivered (resettable)"""
-        return await self.__read_int_64(0x13B8 + phase.value * 0x14, tag_index)
-
-    async def tag_energy_active_delivered_total_phase(
-        self, tag_index: int, phase: Phase
-    ) -> int | None:
-        """Active energy on phase delivered (not resettable)"""
-        return await self.__read_int_64(0x13BC + phase.value * 0x14, tag_index)
-
-    async def tag_energy_active_received_partial_phase(
-        self, tag_index: int, phase: Phase
-    ) -> int | None:
-        """Active energy on phase received (resettable)"""
-        return await self.__read_int_64(0x13C0 + phase.value * 0x14, tag_index)
-
-    async def tag_energy_active_received_total_phase(
-        self, tag_index: int, phase: Phase
-    ) -> int | None:
-        """Active energy on phase received (not resettable)"""
-        return await self.__read_int_64(0x13C4 + phase.value * 0x14, tag_index)
-
-    async def tag_energy_reactive_delivered_partial(self, tag_index: int) -> int | None:
-        """Reactive energy delivered (resettable)"""
-        if self.type_of_gateway == TypeOfGateway.SMARTLINK:
-            return await self.__read_int_64(0x0CCF, tag_index)
-        else:
-            return await self.__read_int_64(0x1438, tag_index)
-
-    async def tag_energy_reactive_delivered_total(self, tag_index: int) -> int | None:
-        """Reactive energy delivered count positively (not resettable)"""
-        return await self.__read_int_64(0x143C, tag_index)
-
-    async def tag_energy_reactive_received_partial(self, tag_index: int) -> int | None:
-        """Reactive energy received (resettable)"""
-        if self.type_of_gateway == TypeOfGateway.SMARTLINK:
-            return await self.__read_int_64(0x0CD7, tag_index)
-        else:
-            return await self.__read_int_64(0x1488, tag_index)
-
-    async def tag_energy_reactive_received_total(self, tag_index: int) -> int | None:
-        """Reactive energy received count negatively (not resettable)"""
-        return await self.__read_int_64(0x144C, tag_index)
-
-    async def tag_energy_reactive_delivered_partial_phase(
-        self, tag_index: int, phase: Phase
-    ) -> int | None:
-        """Reactive energy on phase delivered (resettable)"""
-        return await self.__read_int_64(0x1470 + phase.value * 0x14, tag_index)
-
-    async def tag_energy_reactive_delivered_total_phase(
-        self, tag_index: int, phase: Phase
-    ) -> int | None:
-        """Reactive energy on phase delivered (not resettable)"""
-        return await self.__read_int_64(0x1474 + phase.value * 0x14, tag_index)
-
-    async def tag_energy_reactive_received_partial_phase(
-        self, tag_index: int, phase: Phase
-    ) -> int | None:
-        """Reactive energy on phase received (resettable)"""
-        return await self.__read_int_64(0x1478 + phase.value * 0x14, tag_index)
-
-    async def tag_energy_reactive_received_total_phase(
-        self, tag_index: int, phase: Phase
-    ) -> int | None:
-        """Reactive energy on phase received (not resettable)"""
-        return await self.__read_int_64(0x147C + phase.value * 0x14, tag_index)
-
-    async def tag_energy_apparent_partial(self, tag_index: int) -> int | None:
-        """Apparent energy delivered + received (resettable)"""
-        return await self.__read_int_64(0x14F4, tag_index)
-
-    async def tag_energy_apparent_total(self, tag_index: int) -> int | None:
-        """Apparent energy delivered + received (not resettable)"""
-        return await self.__read_int_64(0x14F8, tag_index)
-
-    async def tag_energy_apparent_partial_phase(
-        self, tag_index: int, phase: Phase
-    ) -> int | None:
-        """Apparent energy on phase (resettable)"""
-        return await self.__read_int_64(0x150C + phase.value * 0x14, tag_index)
-
-    async def tag_energy_apparent_total_phase(
-        self, tag_index: int, phase: Phase
-    ) -> int | None:
-        """Apparent energy on phase A (not resettable)"""
-        return await self.__read_int_64(0x1510 + phase.value * 0x14, tag_index)
+        # All, phase A, B and C
+        await self.__reset_counters([0x14F4, 0x150C, 0x1534, 0x155C], tag_index)
+
+    tag_energy_active_delivered_partial = _value_accessor("tag_energy_active_delivered_partial")
+    tag_energy_active_delivered_total = _value_accessor("tag_energy_active_delivered_total")
+    tag_energy_active_received_partial = _value_accessor("tag_energy_active_received_partial")
+    tag_energy_active_received_total = _value_accessor("tag_energy_active_received_total")
+    tag_energy_active_delivered_partial_phase = _enumerated_value_accessor("tag_energy_active_delivered_partial_phase")
+    tag_energy_active_delivered_total_phase = _enumerated_value_accessor("tag_energy_active_delivered_total_phase")
+    tag_energy_active_received_partial_phase = _enumerated_value_accessor("tag_energy_active_received_partial_phase")
+    tag_energy_active_received_total_phase = _enumerated_value_accessor("tag_energy_active_received_total_phase")
+    tag_energy_reactive_delivered_partial = _value_accessor("tag_energy_reactive_delivered_partial")
+    tag_energy_reactive_delivered_total = _value_accessor("tag_energy_reactive_delivered_total")
+    tag_energy_reactive_received_partial = _value_accessor("tag_energy_reactive_received_partial")
+    tag_energy_reactive_received_total = _value_accessor("tag_energy_reactive_received_total")
+    tag_energy_reactive_delivered_partial_phase = _enumerated_value_accessor(
+        "tag_energy_reactive_delivered_partial_phase"
+    )
+    tag_energy_reactive_delivered_total_phase = _enumerated_value_accessor("tag_energy_reactive_delivered_total_phase")
+    tag_energy_reactive_received_partial_phase = _enumerated_value_accessor(
+        "tag_energy_reactive_received_partial_phase"
+    )
+    tag_energy_reactive_received_total_phase = _enumerated_value_accessor("tag_energy_reactive_received_total_phase")
+    tag_energy_apparent_partial = _value_accessor("tag_energy_apparent_partial")
+    tag_energy_apparent_total = _value_accessor("tag_energy_apparent_total")
+    tag_energy_apparent_partial_phase = _enumerated_value_accessor("tag_energy_apparent_partial_phase")
+    tag_energy_apparent_total_phase = _enumerated_value_accessor("tag_energy_apparent_total_phase")
 
     # Power Demand Data
 
-    async def tag_power_active_demand_total(self, tag_index: int) -> float | None:
-        """Demand total active power"""
-        return await self.__read_float_32(0x0EB5, tag_index)
-
-    async def tag_power_active_power_demand_total_maximum(
-        self, tag_index: int
-    ) -> float | None:
-        """Maximum Demand total active power"""
-        return await self.__read_float_32(0x0EB9, tag_index)
-
-    async def tag_power_active_demand_total_maximum_timestamp(
-        self, tag_index: int
-    ) -> datetime | None:
-        """Maximum Demand total active power"""
-        return await self.__read_date_time(0x0EBB, tag_index)
+    tag_power_active_demand_total = _value_accessor("tag_power_active_demand_total")
+    tag_power_active_power_demand_total_maximum = _value_accessor("tag_power_active_power_demand_total_maximum")
+    tag_power_active_demand_total_maximum_timestamp = _value_accessor("tag_power_active_demand_total_maximum_timestamp")
 
     # Alarm
 
     async def tag_is_alarm_valid(self, tag_index: int) -> AlarmDetails | bool | None:
         """Validity of the alarm bitmap"""
+        alarm_valid = await self.read_value("tag_alarm_validity", tag_index)
+        if alarm_valid is None:
+            return None
         if self.type_of_gateway is TypeOfGateway.PANEL_SERVER:
-            alarm_valid = await self.__read_int_32(0xCE1, tag_index)
-            return AlarmDetails(alarm_valid) if alarm_valid is not None else None
-        else:
-            alarm_valid = await self.__read_int_32(0xCE1, tag_index)
-            if alarm_valid is None:
-                return None
-            return (alarm_valid & 0b1) != 0
+            return AlarmDetails(alarm_valid)
+        return (alarm_valid & 0b1) != 0
 
     async def tag_get_alarm(self, tag_index: int) -> AlarmDetails | None:
         """Alarms"""
-        alarm = await self.__read_int_32(0xCE3, tag_index)
+        alarm = await self.tag_alarm_bitmask(tag_index)
         return AlarmDetails(alarm) if alarm is not None else None
 
-    async def tag_current_at_voltage_loss(
-        self, tag_index: int, phase: Phase
-    ) -> float | None:
-        """RMS current on phase at voltage loss (last RMS current measured when voltage loss occurred)"""
-        return await self.__read_float_32(0xCE5 + phase.value, tag_index)
+    tag_alarm_bitmask = _value_accessor("tag_alarm_bitmask")
+    tag_current_at_voltage_loss = _enumerated_value_accessor("tag_current_at_voltage_loss")
 
     # Load Operating Time
 
-    async def tag_load_operating_time(self, tag_index: int) -> int | None:
-        """Load operating time counter."""
-        return await self.__read_int_32(0xCEB, tag_index)
-
-    async def tag_load_operating_time_active_power_threshold(
-        self, tag_index: int
-    ) -> float | None:
-        """Active power threshold for Load operating time counter. Counter starts above the threshold value."""
-        return await self.__read_float_32(0xCED, tag_index)
-
-    async def tag_load_operating_time_start(self, tag_index: int) -> datetime | None:
-        """Date and time stamp of last Set or reset of Load operating time counter."""
-        return await self.__read_date_time(0xCEF, tag_index)
+    tag_load_operating_time = _value_accessor("tag_load_operating_time")
+    tag_load_operating_time_active_power_threshold = _value_accessor("tag_load_operating_time_active_power_threshold")
+    tag_load_operating_time_start = _value_accessor("tag_load_operating_time_start")
 
     # Configuration Registers
 
-    async def tag_name(self, tag_index: int) -> str | None:
-        """User application name of the wireless device. The user can enter maximum 20 characters."""
-        return await self.__read_string(0x7918, 10, tag_index)
-
-    async def tag_circuit(self, tag_index: int) -> str | None:
-        """Circuit identifier of the wireless device. The user can enter maximum five characters."""
-        return await self.__read_string(0x7922, 3, tag_index)
-
-    async def tag_usage(self, tag_index: int) -> DeviceUsage | None:
-        """Indicates the usage of the wireless device."""
-        usage = await self.__read_int_16(0x7925, tag_index)
-        return DeviceUsage(usage) if usage is not None else None
+    tag_name = _value_accessor("tag_name")
+    tag_circuit = _value_accessor("tag_circuit")
+    tag_usage = _value_accessor("tag_usage", DeviceUsage)
 
     async def tag_phase_sequence(self, tag_index: int) -> PhaseSequence | None:
         """Phase sequence."""
-        sequence = await self.__read_int_16(0x7926, tag_index)
+        sequence = await self.read_value("tag_phase_sequence", tag_index)
         _LOGGER.debug(f"Raw phase sequence register 0x7926 for slave {tag_index}: {sequence}")
         return PhaseSequence(sequence) if sequence is not None else PhaseSequence.INVALID
 
-    async def tag_position(self, tag_index: int) -> Position | None:
-        """Mounting position"""
-        position = await self.__read_int_16(0x7927, tag_index)
-        return Position(position) if position is not None else None
-
-    async def tag_circuit_diagnostic(self, tag_index: int) -> Position | None:
-        """Circuit diagnostics"""
-        position = await self.__read_int_16(0x7928, tag_index)
-        return Position(position) if position is not None else None
-
-    async def tag_rated_current(self, tag_index: int) -> int | None:
-        """Rated current of the protective device to the wireless device"""
-        return await self.__read_int_16(0x7929, tag_index)
+    tag_position = _value_accessor("tag_position", Position)
+    tag_circuit_diagnostic = _value_accessor("tag_circuit_diagnostic", Position)
+    tag_rated_current = _value_accessor("tag_rated_current")
 
     async def tag_electrical_network_system_type(
         self, tag_index: int
     ) -> ElectricalNetworkSystemType | None:
-        code = await self.__read_int_16(0x792A, tag_index)
+        code = await self.read_value("tag_electrical_network_system_type", tag_index)
         if code is None:
             return None
         system_type = [e for e in ElectricalNetworkSystemType if e.value[0] == code]
         return system_type[0] if system_type else None
 
-    async def tag_rated_voltage(self, tag_index: int) -> float | None:
-        """Rated voltage"""
-        if self.type_of_gateway == TypeOfGateway.SMARTLINK:
-            return None
-        return await self.__read_float_32(0x792B, tag_index)
+    tag_rated_voltage = _value_accessor("tag_rated_voltage")
 
     async def tag_reset_peak_demands(self, tag_index: int):
         """Reset All Peak Demands"""
         await self.__write_int_16(0x792E, tag_index, 1)
 
-    async def tag_power_supply_type(self, tag_index: int) -> Position | None:
-        """Power supply type"""
-        if self.type_of_gateway == TypeOfGateway.SMARTLINK:
-            return Position.INVALID
-        position = await self.__read_int_16(0x792F, tag_index)
-        return Position(position) if position is not None else None
+    tag_power_supply_type = _value_accessor("tag_power_supply_type", Position)
 
     # Device identification
 
-    async def tag_device_identification(self, tag_index: int):
-        return self.__identify(tag_index)
+    tag_product_identifier = _value_accessor("tag_product_identifier")
 
-    async def tag_product_identifier(self, tag_index: int) -> int | None:
-        """Wireless device code type"""
-        if self.type_of_gateway == TypeOfGateway.SMARTLINK:
-            try:
-                return await self.__read_int_16(0x7930, tag_index)
+    async def tag_product_identifier_of_node(self, tag_index: int) -> int | None:
+        """Smartlink: wireless device code type at a fixed address, or None when there's no device there.
 
-            except ConnectionError as e:
-                _LOGGER.warning(
-                    f"Could not read product type of device on slave ID {tag_index}: {str(e)}. "
-                    f"Might be because there's device, or an actual error. Either way we're stopping the search.",
-                    exc_info=True,
-                )
-                return None
-
-        raise NotImplementedError()
+        Raises ConnectionException when the gateway doesn't answer, as that doesn't tell whether there is one.
+        """
+        register = VALUES["tag_product_identifier"].registers[self.type_of_gateway.name]
+        registers, answered = await self.__async_read_registers(register.address, register.count, tag_index)
+        if not answered:
+            raise ConnectionException(f"The gateway didn't answer for the wireless device at address {tag_index}")
+        return ValueType.of(register).decode(registers) if registers is not None else None
 
     async def tag_product_type(self, tag_index: int) -> ProductType | None:
         """Wireless device code type"""
         if self.type_of_gateway == TypeOfGateway.SMARTLINK:
-            try:
-                identifier = self.__read_int_16(0x7930, tag_index)
-                if not identifier:
-                    _LOGGER.error(
-                        "The powertag returned an error while requesting its product type"
-                    )
-                    return None
-
-                product_type = [p for p in ProductType if p.value[0] == identifier]
-                if not product_type:
-                    _LOGGER.warning(f"Unknown product type: {identifier}")
-                    return None
-
-            except ConnectionError as e:
-                _LOGGER.warning(
-                    f"Could not read product type of device on slave ID {tag_index}: {str(e)}. "
-                    f"Might be because there's device, or an actual error. Either way we're stopping the search.",
-                    exc_info=True,
+            identifier = await self.tag_product_identifier(tag_index)
+            if not identifier:
+                _LOGGER.error(
+                    "The powertag returned an error while requesting its product type"
                 )
                 return None
+
+            product_type = [p for p in ProductType if p.value[0] == identifier]
         else:
-            identifier = self.__read_int_16(0x7937, tag_index)
+            identifier = await self.read_value("tag_wireless_product_identifier", tag_index)
             product_type = [p for p in ProductType if p.value[1] == identifier]
-            if not product_type:
-                _LOGGER.warning(f"Unknown product type: {identifier}")
-                return None
-
-        return product_type[0] if product_type else None
-
-    async def tag_slave_address(self, tag_index: int) -> int | None:
-        """Virtual Modbus server address"""
-        return await self.__read_int_16(0x7931, tag_index)
-
-    async def tag_rf_id(self, tag_index: int) -> int | None:
-        """Wireless device Radio Frequency Identifier"""
-        return await self.__read_int_64(0x7932, tag_index)
-
-    async def tag_vendor_name(self, tag_index: int) -> str | None:
-        """Vendor name"""
-        return await self.__read_string(0x7944, 16, tag_index)
-
-    async def tag_product_code(self, tag_index: int) -> str | None:
-        """Wireless device commercial reference"""
-        if self.type_of_gateway is TypeOfGateway.SMARTLINK:
-            return None
-        return await self.__read_string(0x7954, 16, tag_index)
 
-    async def tag_firmware_revision(self, tag_index: int) -> str | None:
-        """Firmware revision"""
-        return await self.__read_string(0x7964, 6, tag_index)
-
-    async def tag_hardware_revision(self, tag_index: int) -> str | None:
-        """Hardware revision"""
-        return await self.__read_string(0x796A, 6, tag_index)
-
-    async def tag_serial_number(self, tag_index: int) -> str | None:
-        """Serial number"""
-        return await self.__read_string(0x7970, 10, tag_index)
-
-    async def tag_product_range(self, tag_index: int) -> str | None:
-        """Product range"""
-        return await self.__read_string(0x797A, 8, tag_index)
-
-    async def tag_product_model(self, tag_index: int) -> str | None:
-        """Product model"""
-        return await self.__read_string(0x7982, 8, tag_index)
-
-    async def tag_product_family(self, tag_index: int) -> str | None:
-        """Product family"""
-        if self.type_of_gateway is TypeOfGateway.SMARTLINK:
+        if not product_type:
+            _LOGGER.warning(f"Unknown product type: {identifier}")
             return None
-        return await self.__read_string(0x798A, 8, tag_index)
+        return product_type[0]
+
+    tag_slave_address = _value_accessor("tag_slave_address")
+    tag_rf_id = _value_accessor("tag_rf_id")
+    tag_vendor_name = _value_accessor("tag_vendor_name")
+    tag_product_code = _value_accessor("tag_product_code")
+    tag_firmware_revision = _value_accessor("tag_firmware_revision")
+    tag_hardware_revision = _value_accessor("tag_hardware_revision")
+    tag_serial_number = _value_accessor("tag_serial_number")
+    tag_product_range = _value_accessor("tag_product_range")
+    tag_product_model = _value_accessor("tag_product_model")
+    tag_product_family = _value_accessor("tag_product_family")
 
     # Diagnostic Data Registers
 
     async def tag_radio_communication_valid(self, tag_index: int) -> bool:
         """Validity of the RF communication between PowerTag system and PowerTag Link gateway status."""
-        return await self.__read_int_16(0x79A8, tag_index) != 0
+        return await self.read_value("tag_radio_communication_valid", tag_index) != 0
 
     async def tag_wireless_communication_valid(self, tag_index: int) -> bool:
         """Communication status between PowerTag Link gateway and wireless devices."""
-        return await self.__read_int_16(0x79A9, tag_index) != 0
-
-    async def tag_radio_per_tag(self, tag_index: int) -> float | None:
-        """Packet Error Rate (PER) of the device, received by PowerTag Link gateway"""
-        return await self.__read_float_32(0x79B4, tag_index)
-
-    async def tag_radio_rssi_inside_tag(self, tag_index: int) -> float | None:
-        """RSSI of the device, received by PowerTag Link gateway"""
-        return await self.__read_float_32(0x79B6, tag_index)
-
-    async def tag_radio_lqi_tag(self, tag_index: int) -> int | None:
-        """Link Quality Indicator (LQI) of the device, received by PowerTag Link gateway"""
-        return await self.__read_int_16(0x79B8, tag_index)
-
-    async def tag_radio_per_gateway(self, tag_index: int) -> float | None:
-        """PER of gateway, calculated inside the PowerTag Link gateway"""
-        return await self.__read_float_32(0x79AF, tag_index)
-
-    async def tag_radio_rssi_inside_gateway(self, tag_index: int) -> float | None:
-        """Radio Signal Strength Indicator (RSSI) of gateway, calculated inside the PowerTag Link gateway"""
-        return await self.__read_float_32(0x79B1, tag_index)
-
-    async def tag_radio_lqi_gateway(self, tag_index: int) -> float | None:
-        """LQI of gateway, calculated insider the PowerTag Link gateway"""
-        return await self.__read_int_16(0x79B3, tag_index)
-
-    async def tag_radio_per_maximum(self, tag_index: int) -> float | None:
-        """PER–Maximum value between device and gateway"""
-        return await self.__read_float_32(0x79B4, tag_index)
-
-    async def tag_radio_rssi_minimum(self, tag_index: int) -> float | None:
-        """RSSI–Minimal value between device and gateway"""
-        return await self.__read_float_32(0x79B6, tag_index)
-
-    async def tag_radio_lqi_minimum(self, tag_index: int) -> float | None:
-        """LQI–Minimal value between device and gateway"""
-        return await self.__read_int_16(0x79B8, tag_index)
+        return await self.read_value("tag_wireless_communication_valid", tag_index) != 0
+
+    async def tag_responds(self, tag_index: int) -> bool:
+        """Whether the gateway answers for the device, with a single read of its wireless communication status."""
+        register = VALUES["tag_wireless_communication_valid"].registers[self.type_of_gateway.name]
+        registers, _ = await self.__async_read_registers(register.address, register.count, tag_index)
+        return registers is not None
+
+    tag_radio_per_tag = _value_accessor("tag_radio_per_tag")
+    tag_radio_rssi_inside_tag = _value_accessor("tag_radio_rssi_inside_tag")
+    tag_radio_lqi_tag = _value_accessor("tag_radio_lqi_tag")
+    tag_radio_per_gateway = _value_accessor("tag_radio_per_gateway")
+    tag_radio_rssi_inside_gateway = _value_accessor("tag_radio_rssi_inside_gateway")
+    tag_radio_lqi_gateway = _value_accessor("tag_radio_lqi_gateway")
+    tag_radio_per_maximum = _value_accessor("tag_radio_per_maximum")
+    tag_radio_rssi_minimum = _value_accessor("tag_radio_rssi_minimum")
+    tag_radio_lqi_minimum = _value_accessor("tag_radio_lqi_minimum")
 
     # Environmental sensors
-    async def env_battery_voltage(self, tag_index: int) -> float | None:
-        """Battery voltage"""
-        return await self.__read_float_32(0x0CF3, tag_index)
-
-    async def env_temperature(self, tag_index: int) -> float | None:
-        """Temperature value"""
-        return await self.__read_float_32(0x0FA0, tag_index)
-
-    async def env_temperature_maximum(self, tag_index: int) -> float | None:
-        """Maximum value that the device is able to read (maximum measurable temperature)."""
-        return await self.__read_float_32(0x0FA2, tag_index)
-
-    async def env_temperature_minimum(self, tag_index: int) -> float | None:
-        """Minimum value that the device is able to read (minimum measurable temperature)."""
-        return await self.__read_float_32(0x0FA4, tag_index)
 
-    async def env_humidity(self, tag_index: int) -> float | None:
-        """ "Relative humidity value Example: 50% represented as 0.50"""
-        return await self.__read_float_32(0x0FA6, tag_index)
-
-    async def env_humidity_maximum(self, tag_index: int) -> float | None:
-        """Maximum value that the device is able to read (maximum measurable humidity)."""
-        return await self.__read_float_32(0x0FA8, tag_index)
-
-    async def env_humidity_minimum(self, tag_index: int) -> float | None:
-        """Minimum value that the device is able to read (minimum measurable humidity)."""
-        return await self.__read_float_32(0x0FAA, tag_index)
-
-    async def env_co2(self, tag_index: int) -> float | None:
-        """CO2 (Example:5000 ppm represented as 0,005)"""
-        return await self.__read_float_32(0x0FAE, tag_index)
-
-    # Identification and Status Register
-
-    async def product_id(self) -> int | None:
-        """Product ID of the synthesis table"""
-        if self.type_of_gateway is TypeOfGateway.POWERTAG_LINK:
-            return await self.__read_int_16(0x0001, self.synthetic_slave_id)
-        elif self.type_of_gateway is TypeOfGateway.PANEL_SERVER:
-            return await self.__read_int_16(0xF002, GATEWAY_SLAVE_ID)
-        else:
-            return None
-
-    async def manufacturer(self) -> str | None:
-        """Product ID of the synthesis table"""
-        if self.type_of_gateway is TypeOfGateway.POWERTAG_LINK:
-            return await self.__read_string(0x0002, 16, self.synthetic_slave_id)
-        elif self.type_of_gateway is TypeOfGateway.PANEL_SERVER:
-            return await self.__read_string(0x009F, 16, GATEWAY_SLAVE_ID)
-        elif self.type_of_gateway is TypeOfGateway.SMARTLINK:
-            return "Schneider Electric"
-        else:
-            return None
-
-    async def product_code(self) -> str | None:
-        """Commercial reference of the gateway"""
-        if self.type_of_gateway is TypeOfGateway.POWERTAG_LINK:
-            return await self.__read_string(0x0012, 16, self.synthetic_slave_id)
-        elif self.type_of_gateway is TypeOfGateway.PANEL_SERVER:
-            return await self.__read_string(0x003C, 16, GATEWAY_SLAVE_ID)
-        elif self.type_of_gateway is TypeOfGateway.SMARTLINK:
-            return "A9XMWA20"
-        else:
-            return None
-
-    async def product_range(self) -> str | None:
-        """Product range of the gateway"""
-        if self.type_of_gateway is TypeOfGateway.POWERTAG_LINK:
-            return await self.__read_string(0x0022, 8, self.synthetic_slave_id)
-        elif self.type_of_gateway is TypeOfGateway.PANEL_SERVER:
-            return await self.__read_string(0x000A, 16, GATEWAY_SLAVE_ID)
-        else:
-            return "Unknown"
-
-    async def product_model(self) -> str | None:
-        """Product model"""
-        if self.type_of_gateway is TypeOfGateway.POWERTAG_LINK:
-            return await self.__read_string(0x002A, 8, self.synthetic_slave_id)
-        elif self.type_of_gateway is TypeOfGateway.PANEL_SERVER:
-            return await self.__read_string(0xF003, 16, GATEWAY_SLAVE_ID)
-        else:
-            return "Smartlink SI D"
-
-    async def name(self) -> str | None:
-        """Asset name"""
-        if self.type_of_gateway is TypeOfGateway.POWERTAG_LINK:
-            return await self.__read_string(0x0032, 10, self.synthetic_slave_id)
-        elif self.type_of_gateway is TypeOfGateway.PANEL_SERVER:
-            return await self.__read_string(0x1605, 32, GATEWAY_SLAVE_ID)
-        else:
-            return "Unknown"
-
-    async def product_vendor_url(self) -> str | None:
-        """Vendor URL"""
-        if self.type_of_gateway is TypeOfGateway.POWERTAG_LINK:
-            return await self.__read_string(0x003C, 17, self.synthetic_slave_id)
-        elif self.type_of_gateway is TypeOfGateway.PANEL_SERVER:
-            return await self.__read_string(0x002A, 17, GATEWAY_SLAVE_ID)
-        else:
-            return "Unknown"
+    env_battery_voltage = _value_accessor("env_battery_voltage")
+    env_temperature = _value_accessor("env_temperature")
+    env_temperature_maximum = _value_accessor("env_temperature_maximum")
+    env_temperature_minimum = _value_accessor("env_temperature_minimum")
+    env_humidity = _value_accessor("env_humidity")
+    env_humidity_maximum = _value_accessor("env_humidity_maximum")
+    env_humidity_minimum = _value_accessor("env_humidity_minimum")
+    env_co2 = _value_accessor("env_co2")
 
     # Wireless Configured Devices – 100 Devices
 
     async def modbus_address_of_node(self, node_index: int) -> int | None:
         if self.type_of_gateway is TypeOfGateway.SMARTLINK:
-            return 150 + node_index - 1
+            return FIRST_SMARTLINK_TAG_ADDRESS + node_index - 1
         elif self.type_of_gateway is TypeOfGateway.POWERTAG_LINK:
             return await self.__read_int_16(
                 0x012C + node_index - 1, self.synthetic_slave_id
@@ -905,169 +1316,385 @@ class SchneiderModbus:
                 0x01F8 + (node_index - 1) * 5, GATEWAY_SLAVE_ID
             )
 
-    # Helper functions
+    async def modbus_addresses_of_nodes(self, node_count: int = 99) -> list[int | None]:
+        """Modbus addresses of nodes 1 up to node_count, reading the node table in bulk.
 
-    @staticmethod
-    def round_to_significant_digits(number: float, significant_digits: int):
-        if number == 0:
-            return 0  # Early return to handle 0 explicitly
+        Raises ConnectionException when the node table could not be read.
+        """
+        if self.type_of_gateway is TypeOfGateway.SMARTLINK:
+            # Smartlink addresses are fixed, there's no node table to read
+            return [FIRST_SMARTLINK_TAG_ADDRESS + i - 1 for i in range(1, node_count + 1)]
+        elif self.type_of_gateway is TypeOfGateway.POWERTAG_LINK:
+            slave_id = self.synthetic_slave_id
+            spans = [(0x012C + i - 1, 1) for i in range(1, node_count + 1)]
+        else:
+            slave_id = GATEWAY_SLAVE_ID
+            spans = [(0x01F8 + (i - 1) * 5, 1) for i in range(1, node_count + 1)]
+
+        await self.prefetch(slave_id, spans)
+        try:
+            # An unreadable node table must not pass for one without devices
+            registers = self.prefetched_registers(slave_id, spans)
+            if registers is None or None in registers:
+                raise ConnectionException(f"Could not read the node table from slave ID {slave_id}")
+            return [await self.modbus_address_of_node(i) for i in range(1, node_count + 1)]
+        finally:
+            self.discard_prefetched(slave_id)
+
+    # Batched reads
+
+    async def read_buffer(
+        self, slave_id: int, spans: Iterable[tuple[int, int]], max_age: float = BUFFER_MAX_AGE
+    ) -> RegisterBuffer:
+        """Reads all (address, count) spans of a slave in as few requests as possible."""
+        spans = set(spans)
+        buffer = RegisterBuffer(slave_id, max_age)
+        answered = True
+        for address, count in plan_reads(spans, MAX_READ_GAP, self._mapped_ranges.get(slave_id)):
+            # A slave that timed out won't answer the rest of the snapshot either, so don't wait for it again
+            if answered:
+                registers, answered = await self.__async_read_registers(address, count, slave_id)
+                if registers is not None:
+                    buffer.add(address, registers)
+                    continue
+
+            members = sorted(
+                span for span in spans if address <= span[0] and span[0] + span[1] <= address + count
+            )
+            if not answered or len(members) == 1:
+                for member in members:
+                    buffer.add_failed(*member)
+                continue
+
+            # The gateway refuses reads that touch unmapped registers, so fall back to the individual spans
+            _LOGGER.debug(
+                f"Slave ID {slave_id} refused block read of {count} registers at {address}, reading separately"
+            )
+            for member_address, member_count in members:
+                registers, _ = await self.__async_read_registers(member_address, member_count, slave_id)
+                if registers is None:
+                    buffer.add_failed(member_address, member_count)
+                else:
+                    buffer.add(member_address, registers)
+
+        start = time.perf_counter()
+        decoded = buffer.decode(self._value_types.get(slave_id, {}))
+        self.metrics.record_decode(time.perf_counter() - start, decoded)
+        buffer.expires = time.monotonic() + max_age
+        return buffer
+
+    def use_mapped_ranges(self, slave_id: int, mapped_ranges: Iterable[tuple[int, int]]) -> None:
+        """Tells which (start, end) register ranges a slave has, so batched reads don't bridge over missing ones."""
+        self._mapped_ranges[slave_id] = tuple(mapped_ranges)
+
+    def learn_spans(self, slave_id: int, spans: Iterable[tuple[int, int]], group: Hashable = None) -> None:
+        """Remembers spans that are read for a group of a slave's values every poll, so prefetch can batch them."""
+        self._learned_spans.setdefault(slave_id, {}).setdefault(group, set()).update(spans)
+
+    def learned_spans(self, slave_id: int, groups: Iterable[Hashable] | None = None) -> set[tuple[int, int]]:
+        """The spans learned for the given groups of a slave, or for all of them."""
+        learned = self._learned_spans.get(slave_id, {})
+        if groups is not None:
+            learned = {group: learned[group] for group in groups if group in learned}
+        return set().union(*learned.values())
+
+    async def prefetch(
+        self, slave_id: int, spans: Iterable[tuple[int, int]] | None = None, max_age: float = BUFFER_MAX_AGE
+    ) -> bool | None:
+        """Reads the spans of a slave in bulk; subsequent reads within them are served from memory.
+
+        Without explicit spans, the ones learned for this slave are used.
+        Concurrent callers for the same slave share a single batched read.
+        Returns whether the slave answered any of the reads, or None when there was nothing to read.
+        """
+        spans = self.learned_spans(slave_id) if spans is None else set(spans)
+        if not spans:
+            return None
+        buffer = self._buffers.get(slave_id)
+        if buffer is not None and buffer.is_fresh() and all(buffer.covers(*span) for span in spans):
+            return buffer.answered
+
+        task = self._prefetches.get(slave_id)
+        if task is None:
+            task = asyncio.ensure_future(self.read_buffer(slave_id, spans, max_age))
+            self._prefetches[slave_id] = task
+            try:
+                buffer = self._buffers[slave_id] = await task
+            finally:
+                self._prefetches.pop(slave_id, None)
+        else:
+            buffer = await task
+        return buffer.answered
 
-        # Calculate the number of digits in the integer part
-        integer_digits = int(math.floor(math.log10(abs(number)))) + 1
+    def discard_prefetched(self, slave_id: int) -> None:
+        self._buffers.pop(slave_id, None)
 
-        # Calculate how many digits should be in the fractional part
-        fractional_digits = significant_digits - integer_digits
+    def prefetched_registers(self, slave_id: int, spans: Iterable[tuple[int, int]]) -> tuple | None:
+        """The raw registers of the spans in the prefetched snapshot, to tell whether they changed since the last one.
 
-        # Round the number to the calculated number of fractional digits
-        return round(number, fractional_digits)
+        None when a span isn't part of a fresh snapshot; spans that could not be read are None themselves.
+        """
+        buffer = self._buffers.get(slave_id)
+        spans = sorted(spans)
+        if buffer is None or not buffer.is_fresh() or not all(buffer.covers(*span) for span in spans):
+            return None
+        registers = [buffer.registers(*span) for span in spans]
+        return tuple(None if r is None else tuple(r) for r in registers)
 
-    def __write(self, address: int, registers: list[int], slave_id: int):
-        self.client.write_registers(address, registers, device_id=slave_id)
+    @staticmethod
+    @contextmanager
+    def record_reads() -> Iterator[set[tuple[int, int]]]:
+        """Collects the (address, count) spans read within this context, e.g. to prefetch them next time."""
+        spans: set[tuple[int, int]] = set()
+        token = _recorded_spans.set(spans)
+        try:
+            yield spans
+        finally:
+            _recorded_spans.reset(token)
+
+    # Helper functions
+
+    @staticmethod
+    def round_to_significant_digits(number: float, significant_digits: int):
+        return round_to_significant_digits(number, significant_digits)
+
+    def close(self):
+        for client in self.clients:
+            client.close()
+
+    def diagnostics(self) -> dict:
+        """The state of the connections, and what was learned about each slave."""
+        slave_ids = sorted(set(self._breakers) | set(self._round_trips) | set(self._learned_spans))
+        return {
+            "type_of_gateway": self.type_of_gateway.value,
+            "synthetic_slave_id": self.synthetic_slave_id,
+            "connections": [
+                {"connected": client.connected, "pipeline_window": client.window}
+                for client in self.clients
+            ],
+            "max_timeout": self._timeout,
+            "round_trip": self._gateway_round_trip.as_dict(),
+            "slaves": {
+                slave_id: {
+                    "circuit_breaker": self._breakers[slave_id].as_dict() if slave_id in self._breakers else None,
+                    "round_trip": self._round_trips[slave_id].as_dict() if slave_id in self._round_trips else None,
+                    "learned_spans": len(self.learned_spans(slave_id)),
+                    "mapped_ranges": len(self._mapped_ranges.get(slave_id, ())),
+                }
+                for slave_id in slave_ids
+            },
+        }
+
+    def __client_for(self, slave_id: int) -> PipelinedModbusClient:
+        return self.clients[slave_id % len(self.clients)]
+
+    async def __connect(self, client: PipelinedModbusClient):
+        # Concurrent requests would otherwise each open their own connection
+        async with self._connect_locks.setdefault(client, asyncio.Lock()):
+            if not client.connected:
+                await client.connect()
+
+    async def __async_read_value(self, address: int, value_type: ValueType, slave_id: int) -> int | float | None:
+        # Remembered, so the next snapshot of this slave decodes the value along with the others
+        self._value_types.setdefault(slave_id, {})[address] = value_type
+
+        buffer = self._buffers.get(slave_id)
+        if buffer is not None and buffer.is_fresh():
+            value = buffer.value(address, value_type)
+            if value is not _UNDECODED:
+                recorded_spans = _recorded_spans.get()
+                if recorded_spans is not None:
+                    recorded_spans.add((address, value_type.count))
+                return value
+
+        registers = await self.__async_read(address, value_type.count, slave_id)
+        if registers is None:
+            return None
+        start = time.perf_counter()
+        value = value_type.decode(registers)
+        self.metrics.record_decode(time.perf_counter() - start, 1)
+        return value
 
     async def __async_read(
         self, address: int, count: int, slave_id: int
     ) -> list[int] | None:
+        recorded_spans = _recorded_spans.get()
+        if recorded_spans is not None:
+            recorded_spans.add((address, count))
+
+        buffer = self._buffers.get(slave_id)
+        if buffer is not None:
+            if not buffer.is_fresh():
+                del self._buffers[slave_id]
+            elif buffer.covers(address, count):
+                return buffer.registers(address, count)
+
+        registers, _ = await self.__async_read_registers(address, count, slave_id)
+        return registers
+
+    async def __async_read_registers(
+        self, address: int, count: int, slave_id: int, client: PipelinedModbusClient | None = None
+    ) -> tuple[list[int] | None, bool]:
+        """Returns the registers, and whether the gateway answered at all."""
+        breaker = self._breakers.setdefault(slave_id, CircuitBreaker())
+        client = client or self.__client_for(slave_id)
         try:
-            if not self.client.connected:
-                await self.client.connect()
-
-            result = await asyncio.wait_for(
-                self.client.read_holding_registers(
-                    address=address, count=count, device_id=slave_id
-                ),
-                timeout=5.0,
+            if not client.connected:
+                await self.__connect(client)
+
+            result = await self.__transact(
+                client, breaker, slave_id, READ_HOLDING_REGISTERS, address, count,
+                functools.partial(client.read_holding_registers, address=address, count=count),
             )
+            if result is None:
+                return None, False
             if result.isError():
                 _LOGGER.debug(f"Modbus error reading {address} from slave ID {slave_id}")
-                return None
-            return result.registers
+                self.__settle(slave_id, breaker, result)
+                return None, True
+            breaker.succeeded()
+            return result.registers, True
 
         except asyncio.TimeoutError:
             _LOGGER.debug(f"Timeout when fetching address {address} from slave ID {slave_id}")
-            return None
+            self.__trip(slave_id, breaker)
+            return None, False
         except ModbusIOException as e:
             _LOGGER.error(f"Error when fetching {address} from slave ID {slave_id}: {e}")
+            self.__trip(slave_id, breaker)
+            return None, False
+
+    async def __transact(
+        self, client: PipelinedModbusClient, breaker: CircuitBreaker, slave_id: int,
+        function_code: int, address: int, count: int, request
+    ):
+        """Sends a request with the timeout of the slave, which adapts to how long it takes to answer.
+
+        The timeout starts once the request is sent, not while it waits behind others on the connection.
+        Returns None without sending it when the circuit breaker of the slave is open.
+        """
+        if not breaker.allow():
+            _LOGGER.debug(f"Not sending to address {address} of slave ID {slave_id}, as it doesn't answer")
+            self.metrics.record(slave_id, function_code, address, count, RequestOutcome.REJECTED)
             return None
 
+        estimator = self._round_trips.get(slave_id)
+        if estimator is None:
+            estimator = self._round_trips[slave_id] = self._gateway_round_trip.derive()
+        start = time.monotonic()
+        try:
+            result = await request(device_id=slave_id, timeout=estimator.timeout)
+        except asyncio.TimeoutError:
+            estimator.timed_out()
+            self.metrics.record(
+                slave_id, function_code, address, count, RequestOutcome.TIMEOUT, time.monotonic() - start
+            )
+            raise
+        except (ModbusIOException, ConnectionException):
+            self.metrics.record(slave_id, function_code, address, count, RequestOutcome.IO_ERROR)
+            raise
+        round_trip = result.round_trip
+
+        outcome = RequestOutcome.EXCEPTION if result.isError() else RequestOutcome.OK
+        self.metrics.record(slave_id, function_code, address, count, outcome, round_trip)
+        self._gateway_round_trip.add(round_trip)
+        estimator.add(round_trip)
+        return result
+
+    def __settle(self, slave_id: int, breaker: CircuitBreaker, result):
+        # Other errors come from the device itself, which shows it's there
+        if getattr(result, "exception_code", None) in [GATEWAY_PATH_UNAVAILABLE, GATEWAY_TARGET_FAILED_TO_RESPOND]:
+            self.__trip(slave_id, breaker)
+        else:
+            breaker.succeeded()
+
+    @staticmethod
+    def __trip(slave_id: int, breaker: CircuitBreaker):
+        if breaker.failed():
+            _LOGGER.info(
+                f"Slave ID {slave_id} failed {breaker.failures} times in a row,"
+                f" failing its requests instantly for {breaker.reset_timeout} seconds"
+            )
+
     async def __async_write(
         self, address: int, registers: list[int], slave_id: int
     ) -> None:
+        breaker = self._breakers.setdefault(slave_id, CircuitBreaker())
+        client = self.__client_for(slave_id)
         try:
-            if not self.client.connected:
-                await self.client.connect()
+            if not client.connected:
+                await self.__connect(client)
 
-            result = await asyncio.wait_for(
-                self.client.write_registers(address, registers, device_id=slave_id),
-                timeout=5.0,
+            result = await self.__transact(
+                client, breaker, slave_id, WRITE_MULTIPLE_REGISTERS, address, len(registers),
+                functools.partial(client.write_registers, address=address, values=registers),
             )
+            if result is None:
+                return None
             if result.isError():
                 _LOGGER.debug(f"Modbus error writing {address} to slave ID {slave_id}")
+                self.__settle(slave_id, breaker, result)
                 return None
+            breaker.succeeded()
         except asyncio.TimeoutError:
             _LOGGER.debug(
                 f"Timeout when writing to address {address} to slave ID {slave_id}"
             )
+            self.__trip(slave_id, breaker)
+            return None
+        except (ModbusIOException, ConnectionException) as e:
+            _LOGGER.error(f"Error when writing to address {address} to slave ID {slave_id}: {e}")
+            self.__trip(slave_id, breaker)
             return None
 
-    async def __identify(self, _: int):
-        # data = self.client.read_device_information(read_code=DeviceInformation.REGULAR, device_id=0xFF)
-        for i in range(0xFF):
-            try:
-                response = self.client.read_device_information(
-                    read_code=DeviceInformation.REGULAR, device_id=i
-                )
-                print(f"Yes {i}: {response}")
-            except ExceptionResponse as e:
-                print(f"Not {i}: {e}")
-        # return self.client.read_device_information(read_code=DeviceInformation.REGULAR, device_id=slave_id)
+    async def __async_write_many(self, writes: dict[int, list[int]], slave_id: int) -> None:
+        """Writes (address, registers) in as few requests as possible, without waiting for one another."""
+        await asyncio.gather(*[
+            self.__async_write(address, registers, slave_id) for address, registers in plan_writes(writes)
+        ])
 
     async def __read_string(self, address: int, count: int, slave_id: int) -> str | None:
         registers = await self.__async_read(address, count, slave_id)
-        return self.client.convert_from_registers(registers, ModbusClientMixin.DATATYPE.STRING)
+        if registers is None:
+            return None
+        return ModbusClientMixin.convert_from_registers(registers, ModbusClientMixin.DATATYPE.STRING)
 
     async def __write_string(self, address: int, slave_id: int, string: str):
-        registers = self.client.convert_to_registers(
+        registers = ModbusClientMixin.convert_to_registers(
             string.ljust(20, "\x00"), ModbusClientMixin.DATATYPE.STRING
         )
         await self.__async_write(address, registers, slave_id)
 
-    async def __read_float_32(self, address: int, slave_id: int) -> float | None:
-        registers = await self.__async_read(address, 2, slave_id)
-        if registers is None:
-            return None
-        result = self.client.convert_from_registers(
-            registers, ModbusClientMixin.DATATYPE.FLOAT32
-        )
-        return (
-            self.round_to_significant_digits(result, 7)
-            if not math.isnan(result)
-            else None
-        )
-
     async def __read_int_16(self, address: int, slave_id: int) -> int | None:
-        registers = await self.__async_read(address, 1, slave_id)
-        if registers is None:
-            return None
-        result = self.client.convert_from_registers(
-            registers, ModbusClientMixin.DATATYPE.UINT16
-        )
-        return result if result != 0xFFFF else None
+        return await self.__async_read_value(address, ValueType.UINT16, slave_id)
 
     async def __write_int_16(self, address: int, slave_id: int, value: int):
-        registers = self.client.convert_to_registers(
+        registers = ModbusClientMixin.convert_to_registers(
             value, ModbusClientMixin.DATATYPE.UINT16
         )
         await self.__async_write(address, registers, slave_id)
 
-    async def __read_int_32(self, address: int, slave_id: int) -> int | None:
-        registers = await self.__async_read(address, 2, slave_id)
-        if registers is None:
-            return None
-        result = self.client.convert_from_registers(
-            registers, ModbusClientMixin.DATATYPE.UINT32
-        )
-        return result if result != 0x8000_0000 else None
-
-    async def __read_int_64(self, address: int, slave_id: int) -> int | None:
-        registers = await self.__async_read(address, 4, slave_id)
-        if registers is None:
-            return None
-        result = self.client.convert_from_registers(
-            registers, ModbusClientMixin.DATATYPE.UINT64
-        )
-        return result if result != 0x8000_0000_0000_0000 else None
-
     async def __write_int_64(self, address: int, slave_id: int, value: int):
-        registers = self.client.convert_to_registers(
+        registers = ModbusClientMixin.convert_to_registers(
             value, ModbusClientMixin.DATATYPE.UINT64
         )
         await self.__async_write(address, registers, slave_id)
 
+    async def __reset_counters(self, addresses: list[int], slave_id: int):
+        zero = ModbusClientMixin.convert_to_registers(0, ModbusClientMixin.DATATYPE.UINT64)
+        await self.__async_write_many({address: zero for address in addresses}, slave_id)
+
     async def __read_date_time(self, address: int, slave_id) -> datetime | None:
         registers = await self.__async_read(address, 4, slave_id)
         if registers is None:
             return None
 
-        year_raw = self.client.convert_from_registers(
-            registers[0:1], ModbusClientMixin.DATATYPE.UINT16
-        )
+        year_raw, day_month, minute_hour, second_millisecond = registers
         year = (year_raw & 0b0111_1111) + 2000
-
-        day_month = self.client.convert_from_registers(
-            registers[1:2], ModbusClientMixin.DATATYPE.UINT16
-        )
         day = day_month & 0b0001_1111
         month = (day_month >> 8) & 0b0000_1111
-
-        minute_hour = self.client.convert_from_registers(
-            registers[2:3], ModbusClientMixin.DATATYPE.UINT16
-        )
         minute = minute_hour & 0b0011_1111
         hour = (minute_hour >> 8) & 0b0001_1111
-
-        second_millisecond = self.client.convert_from_registers(
-            registers[3:4], ModbusClientMixin.DATATYPE.UINT16
-        )
         second = math.floor(second_millisecond / 1000)
         millisecond = second_millisecond - second * 1000
 
@@ -1080,12 +1707,3 @@ class SchneiderModbus:
             return None
 
         return datetime(year, month, day, hour, minute, second, millisecond)
-
-# client = SchneiderModbus("192.168.1.114", TypeOfGateway.PANEL_SERVER)
-# print(client.modbus_address_of_node(99))
-# print(client.serial_number())
-# print(client.tag_serial_number(100))
-# print(client.date_time())
-
-
-# print(bytes.decode(bytes([128]), encoding='utf-8'))
\ No newline at end of file
@@ -1,31 +1,39 @@
 """Platform for Schneider Energy."""
 
 import logging
+import re
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorStateClass,
+    SensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_INTERNAL_URL
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import EntityCategory, DeviceInfo
+from homeassistant.helpers.entity import Entity, EntityCategory, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
 from homeassistant.util import dt as dt_util
 
 from . import CONF_CLIENT, DOMAIN, UniqueIdVersion
+from .const import CONF_INVENTORY
+from .coordinator import PollingTier
 from .device_features import FeatureClass
 from .entity_base import (
     GatewayEntity,
     WirelessDeviceEntity,
+    WirelessDeviceEntityDescription,
     async_setup_entities,
-    gateway_device_info,
 )
 from .schneider_modbus import (
     SchneiderModbus,
     Phase,
     LineVoltage,
     PowerFactorSignConvention,
+    RequestOutcome,
     TypeOfGateway,
 )
 
@@ -34,55 +42,8 @@ PLATFORMS: list[str] = ["sensor"]
 _LOGGER = logging.getLogger(__name__)
 
 
-def list_sensors() -> list[type[WirelessDeviceEntity]]:
-    return [
-        PowerTagTotalActiveEnergy,
-        PowerTagReactivePower,
-        PowerTagReactivePowerPerPhase,
-        PowerTagApparentPower,
-        PowerTagApparentPowerPerPhase,
-        PowerTagPowerFactor,
-        PowerTagPowerFactorPerPhase,
-        PowerTagPartialActiveEnergyDelivered,
-        PowerTagTotalActiveEnergyDelivered,
-        PowerTagPartialActiveEnergyDeliveredPerPhase,
-        PowerTagTotalActiveEnergyDeliveredPerPhase,
-        PowerTagPartialActiveEnergyReceived,
-        PowerTagTotalActiveEnergyReceived,
-        PowerTagPartialActiveEnergyReceivedPerPhase,
-        PowerTagTotalActiveEnergyReceivedPerPhase,
-        PowerTagPartialActiveEnergyDeliveredAndReceived,
-        PowerTagPartialReactiveEnergyDelivered,
-        PowerTagTotalReactiveEnergyDelivered,
-        PowerTagPartialReactiveEnergyDeliveredPerPhase,
-        PowerTagTotalReactiveEnergyDeliveredPerPhase,
-        PowerTagPartialReactiveEnergyReceived,
-        PowerTagTotalReactiveEnergyReceived,
-        PowerTagPartialReactiveEnergyReceivedPerPhase,
-        PowerTagTotalReactiveEnergyReceivedPerPhase,
-        PowerTagPartialApparentEnergy,
-        PowerTagTotalApparentEnergy,
-        PowerTagPartialApparentEnergyPerPhase,
-        PowerTagTotalApparentEnergyPerPhase,
-        PowerTagCurrent,
-        PowerTagCurrentNeutral,
-        PowerTagVoltage,
-        PowerTagFrequency,
-        PowerTagTemperature,
-        PowerTagActivePower,
-        PowerTagActivePowerPerPhase,
-        PowerTagDemandActivePower,
-        EnvTagBatteryVoltage,
-        EnvTagTemperature,
-        EnvTagHumidity,
-        EnvTagCO2,
-        DeviceRssiTag,
-        DeviceRssiGateway,
-        DeviceLqiTag,
-        DeviceLqiGateway,
-        DevicePerTag,
-        DevicePerGateway,
-    ]
+def list_sensors() -> list["PowerTagSensorEntityDescription"]:
+    return list(SENSORS)
 
 
 async def async_setup_entry(
@@ -92,17 +53,19 @@ async def async_setup_entry(
 ) -> None:
     """Set up PowerTag Link Gateway from a config entry."""
     sensors = list_sensors()
-    entities = await async_setup_entities(hass, config_entry, sensors)
+    entities = async_setup_entities(hass, config_entry, sensors)
 
     data = hass.data[DOMAIN][config_entry.entry_id]
-    presentation_url = data[CONF_INTERNAL_URL]
     client = data[CONF_CLIENT]
-    gateway_device = await gateway_device_info(client, presentation_url)
-    gateway_serial = await client.serial_number()
+    inventory = data[CONF_INVENTORY]
 
     entities.extend(
         [
-            GatewayTime(client, gateway_device, gateway_serial),
+            GatewayTime(client, inventory.gateway_device, inventory.gateway_serial),
+            GatewayModbusRequests(client, inventory.gateway_device, inventory.gateway_serial),
+            GatewayModbusErrors(client, inventory.gateway_device, inventory.gateway_serial),
+            GatewayModbusLatency(client, inventory.gateway_device, inventory.gateway_serial),
+            GatewayModbusDataTransferred(client, inventory.gateway_device, inventory.gateway_serial),
         ]
     )
 
@@ -110,6 +73,7 @@ async def async_setup_entry(
 
 
 class GatewayTime(GatewayEntity, SensorEntity):
+    _polling_tier = PollingTier.DIAGNOSTIC
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_device_class = SensorDeviceClass.TIMESTAMP
 
@@ -132,2329 +96,801 @@ class GatewayTime(GatewayEntity, SensorEntity):
         ]
 
 
-class PowerTagTotalActiveEnergy(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.ENERGY
-    _attr_native_unit_of_measurement = "Wh"
-    _attr_state_class = SensorStateClass.TOTAL
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            "total active energy",
-            unique_id_version,
-            serial_number,
-        )
-
-    async def async_update(self):
-        value = await self._client.tag_energy_active_delivered_plus_received_total(
-            self._modbus_index
-        )
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.A1,
-            FeatureClass.A2,
-            FeatureClass.P1,
-            FeatureClass.F1,
-            FeatureClass.F2,
-            FeatureClass.F3,
-            FeatureClass.FL,
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-            FeatureClass.C,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.SMARTLINK,
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagReactivePower(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.REACTIVE_POWER
-    _attr_native_unit_of_measurement = "var"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            "reactive power",
-            unique_id_version,
-            serial_number,
-        )
-
-    async def async_update(self):
-        value = await self._client.tag_power_reactive_total(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.FL,
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-            FeatureClass.C,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.SMARTLINK,
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagReactivePowerPerPhase(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.REACTIVE_POWER
-    _attr_native_unit_of_measurement = "var"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        phase: Phase,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            f"reactive power phase {phase}",
-            unique_id_version,
-            serial_number,
-        )
-        self.__phase = phase
-
-    async def async_update(self):
-        value = await self._client.tag_power_reactive(self._modbus_index, self.__phase)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [FeatureClass.FL, FeatureClass.R1]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.SMARTLINK,
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagApparentPower(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.APPARENT_POWER
-    _attr_native_unit_of_measurement = "VA"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            "apparent power",
-            unique_id_version,
-            serial_number,
-        )
-
-    async def async_update(self):
-        value = await self._client.tag_power_apparent_total(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.A1,
-            FeatureClass.A2,
-            FeatureClass.P1,
-            FeatureClass.F1,
-            FeatureClass.F2,
-            FeatureClass.F3,
-            FeatureClass.FL,
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-            FeatureClass.C,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.SMARTLINK,
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagApparentPowerPerPhase(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.APPARENT_POWER
-    _attr_native_unit_of_measurement = "VA"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        phase: Phase,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            f"apparent power phase {phase}",
-            unique_id_version,
-            serial_number,
-        )
-        self.__phase = phase
-
-    async def async_update(self):
-        value = await self._client.tag_power_apparent(self._modbus_index, self.__phase)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [FeatureClass.FL, FeatureClass.R1]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.SMARTLINK,
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagPowerFactor(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.POWER_FACTOR
-    _attr_native_unit_of_measurement = "%"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        feature_class: FeatureClass,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            "power factor",
-            unique_id_version,
-            serial_number,
-        )
-        self._feature_class = feature_class
-        self._attr_extra_state_attributes = {}
-
-    async def async_added_to_hass(self) -> None:
-        await super().async_added_to_hass()
-
-        if self._feature_class == FeatureClass.R1:
-            convention = await self._client.tag_power_factor_sign_convention(
-                self._modbus_index
-            )
-            if convention != PowerFactorSignConvention.INVALID:
-                self._attr_extra_state_attributes = {
-                    "Power factor sign convention": convention
-                }
-
-    async def async_update(self):
-        power_factor = await self._client.tag_power_factor_total(self._modbus_index)
-        if self._handle_availability(power_factor):
-            self._attr_native_value = power_factor * 100
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.A1,
-            FeatureClass.A2,
-            FeatureClass.P1,
-            FeatureClass.F1,
-            FeatureClass.F2,
-            FeatureClass.F3,
-            FeatureClass.FL,
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-            FeatureClass.C,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.SMARTLINK,
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagPowerFactorPerPhase(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.POWER_FACTOR
-    _attr_native_unit_of_measurement = "%"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        phase: Phase,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            f"power factor phase {phase}",
-            unique_id_version,
-            serial_number,
-        )
-        self.__phase = phase
-        self._attr_extra_state_attributes = {}
-
-    async def async_added_to_hass(self) -> None:
-        await super().async_added_to_hass()
-
-        convention = await self._client.tag_power_factor_sign_convention(
-            self._modbus_index
-        )
-        if convention != PowerFactorSignConvention.INVALID:
-            self._attr_extra_state_attributes = {
-                "Power factor sign convention": convention
-            }
-
-    async def async_update(self):
-        power_factor = await self._client.tag_power_factor(
-            self._modbus_index, self.__phase
-        )
-        if self._handle_availability(power_factor):
-            self._attr_native_value = power_factor * 100
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [FeatureClass.FL, FeatureClass.R1]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.SMARTLINK,
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagPartialActiveEnergyDelivered(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.ENERGY
-    _attr_native_unit_of_measurement = "Wh"
-    _attr_state_class = SensorStateClass.TOTAL_INCREASING
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            "partial active energy delivered",
-            unique_id_version,
-            serial_number,
-        )
-
-    async def async_update(self):
-        value = await self._client.tag_energy_active_delivered_partial(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.A1,
-            FeatureClass.A2,
-            FeatureClass.P1,
-            FeatureClass.F1,
-            FeatureClass.F2,
-            FeatureClass.F3,
-            FeatureClass.FL,
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagTotalActiveEnergyDelivered(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.ENERGY
-    _attr_native_unit_of_measurement = "Wh"
-    _attr_state_class = SensorStateClass.TOTAL
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            "total active energy delivered",
-            unique_id_version,
-            serial_number,
-        )
-
-    async def async_update(self):
-        value = await self._client.tag_energy_active_delivered_total(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.A1,
-            FeatureClass.A2,
-            FeatureClass.P1,
-            FeatureClass.F1,
-            FeatureClass.F2,
-            FeatureClass.F3,
-            FeatureClass.FL,
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagPartialActiveEnergyDeliveredPerPhase(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.ENERGY
-    _attr_native_unit_of_measurement = "Wh"
-    _attr_state_class = SensorStateClass.TOTAL_INCREASING
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        phase: Phase,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            f"partial active energy delivered phase {phase}",
-            unique_id_version,
-            serial_number,
-        )
-        self.__phase = phase
-
-    async def async_update(self):
-        value = await self._client.tag_energy_active_delivered_partial_phase(self._modbus_index, self.__phase)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            # Assumption, documentation actually doesn't list these.
-            FeatureClass.A1,
-            FeatureClass.F1,
-            FeatureClass.F3,
-            FeatureClass.FL,
-            # Assumption, documentation actually doesn't list these.
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagTotalActiveEnergyDeliveredPerPhase(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.ENERGY
-    _attr_native_unit_of_measurement = "Wh"
-    _attr_state_class = SensorStateClass.TOTAL
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        phase: Phase,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            f"total active energy delivered phase {phase}",
-            unique_id_version,
-            serial_number,
-        )
-        self.__phase = phase
-
-    async def async_update(self):
-        value = await self._client.tag_energy_active_delivered_total_phase(self._modbus_index, self.__phase)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            # Assumption, documentation actually doesn't list these.
-            FeatureClass.A1,
-            FeatureClass.F1,
-            FeatureClass.F3,
-            FeatureClass.FL,
-            # Assumption, documentation actually doesn't list these.
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagPartialActiveEnergyReceived(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.ENERGY
-    _attr_native_unit_of_measurement = "Wh"
-    _attr_state_class = SensorStateClass.TOTAL_INCREASING
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            "partial active energy received",
-            unique_id_version,
-            serial_number,
-        )
-
-    async def async_update(self):
-        value = await self._client.tag_energy_active_received_partial(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.A1,
-            FeatureClass.A2,
-            FeatureClass.P1,
-            FeatureClass.F1,
-            FeatureClass.F2,
-            FeatureClass.F3,
-            FeatureClass.FL,
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagTotalActiveEnergyReceived(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.ENERGY
-    _attr_native_unit_of_measurement = "Wh"
-    _attr_state_class = SensorStateClass.TOTAL
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            "total active energy received",
-            unique_id_version,
-            serial_number,
-        )
-
-    async def async_update(self):
-        value = await self._client.tag_energy_active_received_total(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.A1,
-            FeatureClass.A2,
-            FeatureClass.P1,
-            FeatureClass.F1,
-            FeatureClass.F2,
-            FeatureClass.F3,
-            FeatureClass.FL,
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagPartialActiveEnergyReceivedPerPhase(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.ENERGY
-    _attr_native_unit_of_measurement = "Wh"
-    _attr_state_class = SensorStateClass.TOTAL_INCREASING
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        phase: Phase,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            f"partial active energy received phase {phase}",
-            unique_id_version,
-            serial_number,
-        )
-        self.__phase = phase
-
-    async def async_update(self):
-        value = await self._client.tag_energy_active_received_partial_phase(self._modbus_index, self.__phase)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            # Assumption, documentation actually doesn't list these.
-            FeatureClass.A1,
-            FeatureClass.F1,
-            FeatureClass.F3,
-            FeatureClass.FL,
-            # Assumption, documentation actually doesn't list these.
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagTotalActiveEnergyReceivedPerPhase(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.ENERGY
-    _attr_native_unit_of_measurement = "Wh"
-    _attr_state_class = SensorStateClass.TOTAL
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        phase: Phase,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            f"total active energy received phase {phase}",
-            unique_id_version,
-            serial_number,
-        )
-        self.__phase = phase
-
-    async def async_update(self):
-        value = await self._client.tag_energy_active_received_total_phase(self._modbus_index, self.__phase)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            # Assumption, documentation actually doesn't list these.
-            FeatureClass.A1,
-            FeatureClass.F1,
-            FeatureClass.F3,
-            FeatureClass.FL,
-            # Assumption, documentation actually doesn't list these.
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagPartialActiveEnergyDeliveredAndReceived(
-    WirelessDeviceEntity, SensorEntity
-):
-    _attr_device_class = SensorDeviceClass.ENERGY
-    _attr_native_unit_of_measurement = "Wh"
-    _attr_state_class = SensorStateClass.TOTAL
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            "partial energy delivered and received",
-            unique_id_version,
-            serial_number,
-        )
-
-    async def async_update(self):
-        value = await self._client.tag_energy_active_delivered_plus_received_partial(self._modbus_index)
-
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-        last_reset = await self._client.tag_load_operating_time_start(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_last_reset = last_reset
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.A1,
-            FeatureClass.A2,
-            FeatureClass.P1,
-            FeatureClass.F1,
-            FeatureClass.F2,
-            FeatureClass.F3,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.SMARTLINK,
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagPartialReactiveEnergyDelivered(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.REACTIVE_ENERGY
-    _attr_native_unit_of_measurement = "VARh"
-    _attr_state_class = SensorStateClass.TOTAL_INCREASING
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            "partial reactive energy delivered",
-            unique_id_version,
-            serial_number,
-        )
-
-    async def async_update(self):
-        value = await self._client.tag_energy_reactive_delivered_partial(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.FL,
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.SMARTLINK,
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagTotalReactiveEnergyDelivered(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.REACTIVE_ENERGY
-    _attr_native_unit_of_measurement = "VARh"
-    _attr_state_class = SensorStateClass.TOTAL
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            "total reactive energy delivered",
-            unique_id_version,
-            serial_number,
-        )
-
-    async def async_update(self):
-        value = await self._client.tag_energy_reactive_delivered_total(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [FeatureClass.FL, FeatureClass.R1]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagPartialReactiveEnergyDeliveredPerPhase(
-    WirelessDeviceEntity, SensorEntity
-):
-    _attr_device_class = SensorDeviceClass.REACTIVE_ENERGY
-    _attr_native_unit_of_measurement = "VARh"
-    _attr_state_class = SensorStateClass.TOTAL_INCREASING
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        phase: Phase,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            f"partial reactive energy delivered phase {phase}",
-            unique_id_version,
-            serial_number,
-        )
-        self.__phase = phase
-
-    async def async_update(self):
-        value = await self._client.tag_energy_reactive_delivered_partial_phase(self._modbus_index, self.__phase)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.FL,
-            # Assumption, documentation actually doesn't list these.
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagTotalReactiveEnergyDeliveredPerPhase(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.REACTIVE_ENERGY
-    _attr_native_unit_of_measurement = "VARh"
-    _attr_state_class = SensorStateClass.TOTAL
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        phase: Phase,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            f"total reactive energy delivered phase {phase}",
-            unique_id_version,
-            serial_number,
-        )
-        self.__phase = phase
-
-    async def async_update(self):
-        value = await self._client.tag_energy_reactive_delivered_total_phase(self._modbus_index, self.__phase)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.FL,
-            # Assumption, documentation actually doesn't list these.
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagPartialReactiveEnergyReceived(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.REACTIVE_ENERGY
-    _attr_native_unit_of_measurement = "VARh"
-    _attr_state_class = SensorStateClass.TOTAL_INCREASING
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            "partial reactive energy received",
-            unique_id_version,
-            serial_number,
-        )
-
-    async def async_update(self):
-        value = await self._client.tag_energy_reactive_received_partial(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.FL,
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.SMARTLINK,
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagTotalReactiveEnergyReceived(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.REACTIVE_ENERGY
-    _attr_native_unit_of_measurement = "VARh"
-    _attr_state_class = SensorStateClass.TOTAL
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            "total reactive energy received",
-            unique_id_version,
-            serial_number,
-        )
-
-    async def async_update(self):
-        value = await self._client.tag_energy_reactive_received_total(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.FL,
-            # Documentation implies only the resettable variant would exist, not this one. Wtf?
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagPartialReactiveEnergyReceivedPerPhase(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.REACTIVE_ENERGY
-    _attr_native_unit_of_measurement = "VARh"
-    _attr_state_class = SensorStateClass.TOTAL_INCREASING
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        phase: Phase,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            f"partial reactive energy received phase {phase}",
-            unique_id_version,
-            serial_number,
-        )
-        self.__phase = phase
-
-    async def async_update(self):
-        value = await self._client.tag_energy_reactive_received_partial_phase(self._modbus_index, self.__phase)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.FL,
-            # Assumption, documentation actually doesn't list these.
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagTotalReactiveEnergyReceivedPerPhase(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.REACTIVE_ENERGY
-    _attr_native_unit_of_measurement = "VARh"
-    _attr_state_class = SensorStateClass.TOTAL
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        phase: Phase,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            f"total reactive energy received phase {phase}",
-            unique_id_version,
-            serial_number,
-        )
-        self.__phase = phase
-
-    async def async_update(self):
-        value = await self._client.tag_energy_reactive_received_total_phase(self._modbus_index, self.__phase)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.FL,
-            # Assumption, documentation actually doesn't list these.
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagPartialApparentEnergy(WirelessDeviceEntity, SensorEntity):
-    # TODO APPARENT_ENERGY maybe?
-    _attr_device_class = SensorDeviceClass.ENERGY
-    _attr_native_unit_of_measurement = "VAh"
-    _attr_state_class = SensorStateClass.TOTAL_INCREASING
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            "partial apparent energy",
-            unique_id_version,
-            serial_number,
-        )
-
-    async def async_update(self):
-        value = await self._client.tag_energy_apparent_partial(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [FeatureClass.FL, FeatureClass.R1]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.SMARTLINK,
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagTotalApparentEnergy(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.ENERGY
-    _attr_native_unit_of_measurement = "VAh"
-    _attr_state_class = SensorStateClass.TOTAL
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            "total apparent energy",
-            unique_id_version,
-            serial_number,
-        )
-
-    async def async_update(self):
-        value = await self._client.tag_energy_apparent_total(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [FeatureClass.FL, FeatureClass.R1]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.SMARTLINK,
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagPartialApparentEnergyPerPhase(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.ENERGY
-    _attr_native_unit_of_measurement = "VAh"
-    _attr_state_class = SensorStateClass.TOTAL_INCREASING
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        phase: Phase,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            f"partial apparent energy phase {phase}",
-            unique_id_version,
-            serial_number,
-        )
-        self.__phase = phase
-
-    async def async_update(self):
-        value = await self._client.tag_energy_apparent_partial_phase(self._modbus_index, self.__phase)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [FeatureClass.FL, FeatureClass.R1]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagTotalApparentEnergyPerPhase(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.ENERGY
-    _attr_native_unit_of_measurement = "VAh"
-    _attr_state_class = SensorStateClass.TOTAL
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        phase: Phase,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            f"total apparent energy phase {phase}",
-            unique_id_version,
-            serial_number,
-        )
-        self.__phase = phase
-
-    async def async_update(self):
-        value = await self._client.tag_energy_apparent_total_phase(self._modbus_index, self.__phase)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [FeatureClass.FL, FeatureClass.R1]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagCurrent(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.CURRENT
-    _attr_native_unit_of_measurement = "A"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        phase: Phase,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            f"current {phase.name}",
-            unique_id_version,
-            serial_number,
-        )
-        self.__phase = phase
-        self._attr_extra_state_attributes = {}
-
-    async def async_added_to_hass(self) -> None:
-        await super().async_added_to_hass()
-
-        self._attr_extra_state_attributes = {
-            "Rated current": await self._client.tag_rated_current(self._modbus_index)
-        }
-
-    async def async_update(self):
-        value = await self._client.tag_current(self._modbus_index, self.__phase)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.A1,
-            FeatureClass.A2,
-            FeatureClass.P1,
-            FeatureClass.F1,
-            FeatureClass.F2,
-            FeatureClass.F3,
-            FeatureClass.FL,
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-            FeatureClass.C,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.SMARTLINK,
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagCurrentNeutral(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.CURRENT
-    _attr_native_unit_of_measurement = "A"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            f"current neutral",
-            unique_id_version,
-            serial_number,
-        )
-
-        self._attr_extra_state_attributes = {}
-
-    async def async_added_to_hass(self) -> None:
-        await super().async_added_to_hass()
-
-        self._attr_extra_state_attributes = {
-            "Rated current": await self._client.tag_rated_current(self._modbus_index)
-        }
-
-    async def async_update(self):
-        value = await self._client.tag_current_neutral(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [FeatureClass.FL, FeatureClass.R1]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.SMARTLINK,
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagVoltage(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.VOLTAGE
-    _attr_native_unit_of_measurement = "V"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        line: LineVoltage,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            f"voltage {line.name}",
-            unique_id_version,
-            serial_number,
-        )
-        self.__line = line
-        self._attr_extra_state_attributes = {}
-
-    async def async_added_to_hass(self) -> None:
-        await super().async_added_to_hass()
-
-        rated_voltage = await self._client.tag_rated_voltage(self._modbus_index)
-
-        if rated_voltage:
-            self._attr_extra_state_attributes = {"Rated voltage": rated_voltage}
-
-    async def async_update(self):
-        value = await self._client.tag_voltage(self._modbus_index, self.__line)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.A1,
-            FeatureClass.A2,
-            FeatureClass.P1,
-            FeatureClass.F1,
-            FeatureClass.F2,
-            FeatureClass.F3,
-            FeatureClass.FL,
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-            FeatureClass.C,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.SMARTLINK,
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagFrequency(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.FREQUENCY
-    _attr_native_unit_of_measurement = "Hz"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            f"frequency",
-            unique_id_version,
-            serial_number,
-        )
-
-    async def async_update(self):
-        value = await self._client.tag_ac_frequency(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.FL,
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.SMARTLINK,
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagTemperature(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_native_unit_of_measurement = "°C"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            f"temperature",
-            unique_id_version,
-            serial_number,
-        )
-
-    async def async_update(self):
-        value = await self._client.tag_device_temperature(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        """
-        The documentation says that A1, A2, P1, F1, F2 and F3 do not support internal temperature.
-        However, they do seem to report temperature values, so let's use them. Let's not tell Schneider about this. ;)
-        """
-        return feature_class in [
-            FeatureClass.A1,
-            FeatureClass.A2,
-            FeatureClass.P1,
-            FeatureClass.F1,
-            FeatureClass.F2,
-            FeatureClass.F3,
-            FeatureClass.FL,
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-            FeatureClass.C,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.SMARTLINK,
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-    @staticmethod
-    def supports_firmware_version(firmware_version: str) -> bool:
-        import re
-
-        major_version = re.sub(r"[^0-9.]", "", firmware_version).split(".")[0]
-        return int(major_version) >= 4
-
-
-class PowerTagActivePower(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.POWER
-    _attr_native_unit_of_measurement = "W"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            "active power",
-            unique_id_version,
-            serial_number,
-        )
-
-    async def async_update(self):
-        value = await self._client.tag_power_active_total(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.A1,
-            FeatureClass.A2,
-            FeatureClass.P1,
-            FeatureClass.F1,
-            FeatureClass.F2,
-            FeatureClass.F3,
-            FeatureClass.FL,
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-            FeatureClass.C,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.SMARTLINK,
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
-
-class PowerTagActivePowerPerPhase(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.POWER
-    _attr_native_unit_of_measurement = "W"
-    _attr_state_class = SensorStateClass.MEASUREMENT
+class GatewayModbusRequests(GatewayEntity, SensorEntity):
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
 
     def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        phase: Phase,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
+        self, client: SchneiderModbus, tag_device: DeviceInfo, serial_number: str
     ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            f"active power phase {phase}",
-            unique_id_version,
-            serial_number,
-        )
-        self.__phase = phase
+        super().__init__(client, tag_device, "Modbus requests", serial_number)
 
     async def async_update(self):
-        value = await self._client.tag_power_active(self._modbus_index, self.__phase)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.A1,
-            FeatureClass.P1,
-            FeatureClass.F1,
-            FeatureClass.F3,
-            FeatureClass.FL,
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-            FeatureClass.C,
-        ]
+        self._attr_native_value = self._client.metrics.total.requests
 
     @staticmethod
     def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.SMARTLINK,
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
+        return True
 
 
-class PowerTagDemandActivePower(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.POWER
-    _attr_native_unit_of_measurement = "W"
-    _attr_state_class = SensorStateClass.MEASUREMENT
+class GatewayModbusErrors(GatewayEntity, SensorEntity):
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
 
     def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
+        self, client: SchneiderModbus, tag_device: DeviceInfo, serial_number: str
     ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            "demand active power",
-            unique_id_version,
-            serial_number,
-        )
+        super().__init__(client, tag_device, "Modbus errors", serial_number)
 
     async def async_update(self):
-        value = await self._client.tag_power_active_demand_total(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
+        stats = self._client.metrics.total
+        self._attr_native_value = stats.errors
         self._attr_extra_state_attributes = {
-            "Maximum demand active power (W)": await self._client.tag_power_active_power_demand_total_maximum(
-                self._modbus_index
-            ),
-            "Maximum demand active power timestamp": await self._client.tag_power_active_demand_total_maximum_timestamp(
-                self._modbus_index
-            ),
+            "Timeouts": stats.outcomes[RequestOutcome.TIMEOUT],
+            "Modbus exceptions": stats.outcomes[RequestOutcome.EXCEPTION],
+            "I/O errors": stats.outcomes[RequestOutcome.IO_ERROR],
+            "Rejected while not answering": stats.outcomes[RequestOutcome.REJECTED],
         }
 
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [FeatureClass.C]
-
     @staticmethod
     def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.SMARTLINK,
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
+        return True
+
 
+class GatewayModbusLatency(GatewayEntity, SensorEntity):
+    """Mean time the gateway took to answer since the previous update."""
 
-class EnvTagBatteryVoltage(WirelessDeviceEntity, SensorEntity):
     _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_device_class = SensorDeviceClass.VOLTAGE
-    _attr_native_unit_of_measurement = "V"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = "ms"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
     def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
+        self, client: SchneiderModbus, tag_device: DeviceInfo, serial_number: str
     ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            "battery voltage",
-            unique_id_version,
-            serial_number,
-        )
+        super().__init__(client, tag_device, "Modbus latency", serial_number)
+        self.__latency_total = 0.0
+        self.__timed = 0
 
     async def async_update(self):
-        value = await self._client.env_battery_voltage(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [FeatureClass.TEMP1, FeatureClass.CO2]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [TypeOfGateway.PANEL_SERVER]
-
-
-class EnvTagTemperature(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_native_unit_of_measurement = "°C"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            "temperature",
-            unique_id_version,
-            serial_number,
-        )
-        self._attr_extra_state_attributes = {}
+        metrics = self._client.metrics
+        timed = sum(metrics.total.histogram)
+        if timed > self.__timed:
+            mean = (metrics.total.latency_total - self.__latency_total) / (timed - self.__timed)
+            self._attr_native_value = round(mean * 1000, 1)
+        self.__latency_total = metrics.total.latency_total
+        self.__timed = timed
 
-    async def async_added_to_hass(self) -> None:
-        await super().async_added_to_hass()
         self._attr_extra_state_attributes = {
-            "Minimum measurable temperature (°C)": await self._client.env_temperature_minimum(
-                self._modbus_index
-            ),
-            "Maximum measurable temperature (°C)": await self._client.env_temperature_maximum(
-                self._modbus_index
-            ),
+            "Maximum": round(metrics.total.latency_max * 1000, 1),
+            "Histogram": metrics.total.latency_histogram(),
+            "Slowest slaves": {
+                slave_id: round(latency * 1000, 1) for slave_id, latency in metrics.slowest_slaves()
+            },
         }
 
-    async def async_update(self):
-        value = await self._client.env_temperature(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.TEMP0,
-            FeatureClass.TEMP1,
-            FeatureClass.CO2,
-        ]
-
     @staticmethod
     def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [TypeOfGateway.PANEL_SERVER]
+        return True
 
 
-class EnvTagHumidity(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.HUMIDITY
-    _attr_native_unit_of_measurement = "%"
-    _attr_state_class = SensorStateClass.MEASUREMENT
+class GatewayModbusDataTransferred(GatewayEntity, SensorEntity):
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DATA_SIZE
+    _attr_native_unit_of_measurement = "B"
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
 
     def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
+        self, client: SchneiderModbus, tag_device: DeviceInfo, serial_number: str
     ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            "humidity",
-            unique_id_version,
-            serial_number,
-        )
-        self._client = client
-        self._modbus_index = modbus_index
-        self._attr_extra_state_attributes = {}
-
-    async def async_added_to_hass(self) -> None:
-        await super().async_added_to_hass()
-        self._attr_extra_state_attributes = {
-            "Minimum measurable humidity (%)": (
-                await self._client.env_humidity_minimum(self._modbus_index) or 0
-            )
-            * 100,
-            "Maximum measurable humidity (%)": (
-                await self._client.env_humidity_maximum(self._modbus_index) or 0
-            )
-            * 100,
-        }
-        self.async_write_ha_state()
+        super().__init__(client, tag_device, "Modbus data transferred", serial_number)
 
     async def async_update(self):
-        value = await self._client.env_humidity(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value * 100
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [FeatureClass.TEMP1, FeatureClass.CO2]
+        self._attr_native_value = self._client.metrics.total.bytes
 
     @staticmethod
     def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [TypeOfGateway.PANEL_SERVER]
+        return True
 
 
-class EnvTagCO2(WirelessDeviceEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.CO2
-    _attr_native_unit_of_measurement = "ppm"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client, modbus_index, tag_device, "CO2", unique_id_version, serial_number
-        )
+# Feature classes that have the same sensors, by the devices that they are
+POWERTAGS = frozenset([
+    FeatureClass.A1,
+    FeatureClass.A2,
+    FeatureClass.P1,
+    FeatureClass.F1,
+    FeatureClass.F2,
+    FeatureClass.F3,
+    FeatureClass.FL,
+    FeatureClass.M0,
+    FeatureClass.M1,
+    FeatureClass.M2,
+    FeatureClass.M3,
+    FeatureClass.R1,
+    FeatureClass.C,
+])
+POWERTAGS_WITHOUT_C = POWERTAGS - {FeatureClass.C}
+POWERTAGS_63 = frozenset([
+    FeatureClass.A1, FeatureClass.A2, FeatureClass.P1, FeatureClass.F1, FeatureClass.F2, FeatureClass.F3
+])
+POWERTAGS_ROPE = frozenset([FeatureClass.FL, FeatureClass.R1])
+POWERTAGS_ROPE_250_630 = POWERTAGS_ROPE | {FeatureClass.M0, FeatureClass.M1, FeatureClass.M2, FeatureClass.M3}
+POWERTAGS_ENERGY_PER_PHASE = POWERTAGS_ROPE_250_630 | {FeatureClass.A1, FeatureClass.F1, FeatureClass.F3}
+POWERTAGS_POWER_PER_PHASE = POWERTAGS - {FeatureClass.A2, FeatureClass.F2}
+ENVIRONMENT_SENSORS = frozenset([FeatureClass.TEMP0, FeatureClass.TEMP1, FeatureClass.CO2])
+HUMIDITY_SENSORS = frozenset([FeatureClass.TEMP1, FeatureClass.CO2])
+WIRELESS_DEVICES = POWERTAGS | ENVIRONMENT_SENSORS
 
-    async def async_update(self):
-        value = await self._client.env_co2(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value * 1000
+ALL_GATEWAYS = frozenset(TypeOfGateway)
+LINK_GATEWAYS = frozenset([TypeOfGateway.POWERTAG_LINK, TypeOfGateway.PANEL_SERVER])
+PANEL_SERVER = frozenset([TypeOfGateway.PANEL_SERVER])
 
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [FeatureClass.CO2]
 
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [TypeOfGateway.PANEL_SERVER]
+def major_version(firmware_version: str) -> int:
+    return int(re.sub("[^0-9.]", "", firmware_version).split(".")[0])
 
 
-class DeviceRssiTag(WirelessDeviceEntity, SensorEntity):
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_device_class = SensorDeviceClass.SIGNAL_STRENGTH
-    _attr_native_unit_of_measurement = "dBm"
-    _attr_state_class = SensorStateClass.MEASUREMENT
+async def power_factor_sign_convention(client: SchneiderModbus, modbus_index: int, feature_class: FeatureClass) -> dict:
+    convention = await client.tag_power_factor_sign_convention(modbus_index)
+    if convention == PowerFactorSignConvention.INVALID:
+        return {}
+    return {"Power factor sign convention": convention}
 
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            "RSSI in tag",
-            unique_id_version,
-            serial_number,
-        )
 
-    async def async_update(self):
-        value = await self._client.tag_radio_rssi_inside_tag(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value
+async def total_power_factor_sign_convention(
+    client: SchneiderModbus, modbus_index: int, feature_class: FeatureClass
+) -> dict:
+    if feature_class != FeatureClass.R1:
+        return {}
+    return await power_factor_sign_convention(client, modbus_index, feature_class)
 
-        self._attr_extra_state_attributes = {
-            "Minimum": await self._client.tag_radio_rssi_minimum(self._modbus_index)
-        }
 
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.A1,
-            FeatureClass.A2,
-            FeatureClass.P1,
-            FeatureClass.F1,
-            FeatureClass.F2,
-            FeatureClass.F3,
-            FeatureClass.FL,
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-            FeatureClass.C,
-            FeatureClass.TEMP0,
-            FeatureClass.TEMP1,
-            FeatureClass.CO2,
-        ]
+async def rated_current(client: SchneiderModbus, modbus_index: int, feature_class: FeatureClass) -> dict:
+    return {"Rated current": await client.tag_rated_current(modbus_index)}
 
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
 
+async def rated_voltage(client: SchneiderModbus, modbus_index: int, feature_class: FeatureClass) -> dict:
+    voltage = await client.tag_rated_voltage(modbus_index)
+    return {"Rated voltage": voltage} if voltage else {}
 
-class DeviceRssiGateway(WirelessDeviceEntity, SensorEntity):
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_device_class = SensorDeviceClass.SIGNAL_STRENGTH
-    _attr_native_unit_of_measurement = "dBm"
-    _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            "RSSI in gateway",
-            unique_id_version,
-            serial_number,
-        )
+async def temperature_range(client: SchneiderModbus, modbus_index: int, feature_class: FeatureClass) -> dict:
+    return {
+        "Minimum measurable temperature (°C)": await client.env_temperature_minimum(modbus_index),
+        "Maximum measurable temperature (°C)": await client.env_temperature_maximum(modbus_index),
+    }
 
-    async def async_update(self):
-        value = await self._client.tag_radio_rssi_inside_gateway(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value
 
-        self._attr_extra_state_attributes = {
-            "Minimum": await self._client.tag_radio_rssi_minimum(self._modbus_index)
-        }
+async def humidity_range(client: SchneiderModbus, modbus_index: int, feature_class: FeatureClass) -> dict:
+    return {
+        "Minimum measurable humidity (%)": (await client.env_humidity_minimum(modbus_index) or 0) * 100,
+        "Maximum measurable humidity (%)": (await client.env_humidity_maximum(modbus_index) or 0) * 100,
+    }
 
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.A1,
-            FeatureClass.A2,
-            FeatureClass.P1,
-            FeatureClass.F1,
-            FeatureClass.F2,
-            FeatureClass.F3,
-            FeatureClass.FL,
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-            FeatureClass.C,
-            FeatureClass.TEMP0,
-            FeatureClass.TEMP1,
-            FeatureClass.CO2,
-        ]
 
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
+async def demand_maximum(client: SchneiderModbus, modbus_index: int) -> dict:
+    return {
+        "Maximum demand active power (W)": await client.tag_power_active_power_demand_total_maximum(modbus_index),
+        "Maximum demand active power timestamp": await client.tag_power_active_demand_total_maximum_timestamp(
+            modbus_index
+        ),
+    }
 
 
-class DeviceLqiTag(WirelessDeviceEntity, SensorEntity):
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_state_class = SensorStateClass.MEASUREMENT
+async def rssi_minimum(client: SchneiderModbus, modbus_index: int) -> dict:
+    return {"Minimum": await client.tag_radio_rssi_minimum(modbus_index)}
 
-    def __init__(
-        self,
-        client: SchneiderModbus,
-        modbus_index: int,
-        tag_device: DeviceInfo,
-        unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            "LQI in tag",
-            unique_id_version,
-            serial_number,
-        )
 
-    async def async_update(self):
-        value = await self._client.tag_radio_lqi_tag(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value
+async def lqi_minimum(client: SchneiderModbus, modbus_index: int) -> dict:
+    return {"Minimum": await client.tag_radio_lqi_minimum(modbus_index)}
 
-        self._attr_extra_state_attributes = {
-            "Minimum": await self._client.tag_radio_lqi_minimum(self._modbus_index)
-        }
 
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.A1,
-            FeatureClass.A2,
-            FeatureClass.P1,
-            FeatureClass.F1,
-            FeatureClass.F2,
-            FeatureClass.F3,
-            FeatureClass.FL,
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-            FeatureClass.C,
-            FeatureClass.TEMP0,
-            FeatureClass.TEMP1,
-            FeatureClass.CO2,
-        ]
+async def per_maximum(client: SchneiderModbus, modbus_index: int) -> dict:
+    return {"Maximum": await client.tag_radio_per_maximum(modbus_index)}
 
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
 
+@dataclass(frozen=True, kw_only=True)
+class PowerTagSensorEntityDescription(SensorEntityDescription, WirelessDeviceEntityDescription):
+    """A sensor of wireless devices: the client method that reads its value, called with the modbus index of the
+    device and the phase or line voltage it is enumerated over, and the attributes that go with it."""
 
-class DeviceLqiGateway(WirelessDeviceEntity, SensorEntity):
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_state_class = SensorStateClass.MEASUREMENT
+    value_fn: Callable[..., Awaitable[Any]]
+    # Factor from the value as it is read to the unit of the sensor
+    scale: float | None = None
+    # Attributes that are read once, when the entity is added, and ones that are read on every update
+    fixed_attributes_fn: Callable[[SchneiderModbus, int, FeatureClass], Awaitable[dict]] | None = None
+    attributes_fn: Callable[[SchneiderModbus, int], Awaitable[dict]] | None = None
+    last_reset_fn: Callable[[SchneiderModbus, int], Awaitable[datetime | None]] | None = None
 
-    def __init__(
+    def create_entity(
         self,
         client: SchneiderModbus,
         modbus_index: int,
         tag_device: DeviceInfo,
+        feature_class: FeatureClass,
+        enumerated: Phase | LineVoltage | None,
         unique_id_version: UniqueIdVersion,
-        serial_number: str,
-    ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            "LQI in gateway",
-            unique_id_version,
-            serial_number,
-        )
-
-    async def async_update(self):
-        value = await self._client.tag_radio_lqi_gateway(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-        self._attr_extra_state_attributes = {
-            "Minimum": await self._client.tag_radio_lqi_minimum(self._modbus_index)
-        }
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.A1,
-            FeatureClass.A2,
-            FeatureClass.P1,
-            FeatureClass.F1,
-            FeatureClass.F2,
-            FeatureClass.F3,
-            FeatureClass.FL,
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-            FeatureClass.C,
-            FeatureClass.TEMP0,
-            FeatureClass.TEMP1,
-            FeatureClass.CO2,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
+    ) -> Entity:
+        return PowerTagSensor(client, modbus_index, tag_device, self, feature_class, enumerated, unique_id_version)
 
 
-class DevicePerTag(WirelessDeviceEntity, SensorEntity):
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_state_class = SensorStateClass.MEASUREMENT
+class PowerTagSensor(WirelessDeviceEntity, SensorEntity):
+    entity_description: PowerTagSensorEntityDescription
 
     def __init__(
         self,
         client: SchneiderModbus,
         modbus_index: int,
         tag_device: DeviceInfo,
+        description: PowerTagSensorEntityDescription,
+        feature_class: FeatureClass,
+        enumerated: Phase | LineVoltage | None,
         unique_id_version: UniqueIdVersion,
-        serial_number: str,
     ):
-        super().__init__(
-            client,
-            modbus_index,
-            tag_device,
-            "packet error rate in tag",
-            unique_id_version,
-            serial_number,
-        )
-
-    async def async_update(self):
-        value = await self._client.tag_radio_per_tag(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-
-        self._attr_extra_state_attributes = {
-            "Maximum": await self._client.tag_radio_per_maximum(self._modbus_index)
-        }
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [
-            FeatureClass.A1,
-            FeatureClass.A2,
-            FeatureClass.P1,
-            FeatureClass.F1,
-            FeatureClass.F2,
-            FeatureClass.F3,
-            FeatureClass.FL,
-            FeatureClass.M0,
-            FeatureClass.M1,
-            FeatureClass.M2,
-            FeatureClass.M3,
-            FeatureClass.R1,
-            FeatureClass.C,
-            FeatureClass.TEMP0,
-            FeatureClass.TEMP1,
-            FeatureClass.CO2,
-        ]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [
-            TypeOfGateway.POWERTAG_LINK,
-            TypeOfGateway.PANEL_SERVER,
-        ]
-
+        name = description.name if enumerated is None else description.name.format(enumerated.name)
+        super().__init__(client, modbus_index, tag_device, name, unique_id_version, tag_device["serial_number"])
+        self.entity_description = description
+        self._polling_tier = description.polling_tier
+        self._deadband = description.deadband
+        self.__feature_class = feature_class
+        self.__value_args = (modbus_index,) if enumerated is None else (modbus_index, enumerated)
+        if description.fixed_attributes_fn:
+            self._attr_extra_state_attributes = {}
 
-class DevicePerGateway(WirelessDeviceEntity, SensorEntity):
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_state_class = SensorStateClass.MEASUREMENT
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
 
-    def __init__(self, client: SchneiderModbus, modbus_index: int, tag_device: DeviceInfo, unique_id_version: UniqueIdVersion, serial_number: str):
-        super().__init__(client, modbus_index, tag_device, "packet error rate in gateway", unique_id_version, serial_number)
+        fixed_attributes_fn = self.entity_description.fixed_attributes_fn
+        if fixed_attributes_fn:
+            self._attr_extra_state_attributes = await fixed_attributes_fn(
+                self._client, self._modbus_index, self.__feature_class
+            )
 
     async def async_update(self):
-        value = await self._client.tag_radio_per_gateway(self._modbus_index)
-        if self._handle_availability(value):
-            self._attr_native_value = value
-        self._attr_extra_state_attributes = {
-            "Maximum": await self._client.tag_radio_per_maximum(self._modbus_index)
-        }
-
-    @staticmethod
-    def supports_feature_set(feature_class: FeatureClass) -> bool:
-        return feature_class in [FeatureClass.A1, FeatureClass.A2, FeatureClass.P1, FeatureClass.F1, FeatureClass.F2,
-                                 FeatureClass.F3, FeatureClass.FL, FeatureClass.M0, FeatureClass.M1, FeatureClass.M2,
-                                 FeatureClass.M3, FeatureClass.R1, FeatureClass.C,
-                                 FeatureClass.TEMP0, FeatureClass.TEMP1, FeatureClass.CO2]
-
-    @staticmethod
-    def supports_gateway(type_of_gateway: TypeOfGateway) -> bool:
-        return type_of_gateway in [TypeOfGateway.POWERTAG_LINK, TypeOfGateway.PANEL_SERVER]
+        description = self.entity_description
+        value = await description.value_fn(self._client, *self.__value_args)
+        if self._handle_availability(value):
+            self._attr_native_value = value if description.scale is None else value * description.scale
+            if description.last_reset_fn:
+                self._attr_last_reset = await description.last_reset_fn(self._client, self._modbus_index)
+        if description.attributes_fn:
+            self._attr_extra_state_attributes = await description.attributes_fn(self._client, self._modbus_index)
+
+
+SENSORS = (
+    PowerTagSensorEntityDescription(
+        key="total_active_energy",
+        name="total active energy",
+        value_fn=SchneiderModbus.tag_energy_active_delivered_plus_received_total,
+        polling_tier=PollingTier.ENERGY,
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement="Wh",
+        state_class=SensorStateClass.TOTAL,
+        feature_classes=POWERTAGS,
+        gateways=ALL_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="reactive_power",
+        name="reactive power",
+        value_fn=SchneiderModbus.tag_power_reactive_total,
+        deadband=0.5,
+        device_class=SensorDeviceClass.REACTIVE_POWER,
+        native_unit_of_measurement="var",
+        state_class=SensorStateClass.MEASUREMENT,
+        feature_classes=POWERTAGS_ROPE_250_630 | {FeatureClass.C},
+        gateways=ALL_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="reactive_power_phase",
+        name="reactive power phase {}",
+        enumeration=Phase,
+        value_fn=SchneiderModbus.tag_power_reactive,
+        deadband=0.5,
+        device_class=SensorDeviceClass.REACTIVE_POWER,
+        native_unit_of_measurement="var",
+        state_class=SensorStateClass.MEASUREMENT,
+        feature_classes=POWERTAGS_ROPE,
+        gateways=ALL_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="apparent_power",
+        name="apparent power",
+        value_fn=SchneiderModbus.tag_power_apparent_total,
+        deadband=0.5,
+        device_class=SensorDeviceClass.APPARENT_POWER,
+        native_unit_of_measurement="VA",
+        state_class=SensorStateClass.MEASUREMENT,
+        feature_classes=POWERTAGS,
+        gateways=ALL_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="apparent_power_phase",
+        name="apparent power phase {}",
+        enumeration=Phase,
+        value_fn=SchneiderModbus.tag_power_apparent,
+        deadband=0.5,
+        device_class=SensorDeviceClass.APPARENT_POWER,
+        native_unit_of_measurement="VA",
+        state_class=SensorStateClass.MEASUREMENT,
+        feature_classes=POWERTAGS_ROPE,
+        gateways=ALL_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="power_factor",
+        name="power factor",
+        value_fn=SchneiderModbus.tag_power_factor_total,
+        scale=100,
+        fixed_attributes_fn=total_power_factor_sign_convention,
+        device_class=SensorDeviceClass.POWER_FACTOR,
+        native_unit_of_measurement="%",
+        state_class=SensorStateClass.MEASUREMENT,
+        feature_classes=POWERTAGS,
+        gateways=ALL_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="power_factor_phase",
+        name="power factor phase {}",
+        enumeration=Phase,
+        value_fn=SchneiderModbus.tag_power_factor,
+        scale=100,
+        fixed_attributes_fn=power_factor_sign_convention,
+        device_class=SensorDeviceClass.POWER_FACTOR,
+        native_unit_of_measurement="%",
+        state_class=SensorStateClass.MEASUREMENT,
+        feature_classes=POWERTAGS_ROPE,
+        gateways=ALL_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="partial_active_energy_delivered",
+        name="partial active energy delivered",
+        value_fn=SchneiderModbus.tag_energy_active_delivered_partial,
+        polling_tier=PollingTier.ENERGY,
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement="Wh",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        feature_classes=POWERTAGS_WITHOUT_C,
+        gateways=LINK_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="total_active_energy_delivered",
+        name="total active energy delivered",
+        value_fn=SchneiderModbus.tag_energy_active_delivered_total,
+        polling_tier=PollingTier.ENERGY,
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement="Wh",
+        state_class=SensorStateClass.TOTAL,
+        feature_classes=POWERTAGS_WITHOUT_C,
+        gateways=LINK_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="partial_active_energy_delivered_phase",
+        name="partial active energy delivered phase {}",
+        enumeration=Phase,
+        value_fn=SchneiderModbus.tag_energy_active_delivered_partial_phase,
+        polling_tier=PollingTier.ENERGY,
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement="Wh",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        feature_classes=POWERTAGS_ENERGY_PER_PHASE,
+        gateways=LINK_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="total_active_energy_delivered_phase",
+        name="total active energy delivered phase {}",
+        enumeration=Phase,
+        value_fn=SchneiderModbus.tag_energy_active_delivered_total_phase,
+        polling_tier=PollingTier.ENERGY,
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement="Wh",
+        state_class=SensorStateClass.TOTAL,
+        feature_classes=POWERTAGS_ENERGY_PER_PHASE,
+        gateways=LINK_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="partial_active_energy_received",
+        name="partial active energy received",
+        value_fn=SchneiderModbus.tag_energy_active_received_partial,
+        polling_tier=PollingTier.ENERGY,
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement="Wh",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        feature_classes=POWERTAGS_WITHOUT_C,
+        gateways=LINK_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="total_active_energy_received",
+        name="total active energy received",
+        value_fn=SchneiderModbus.tag_energy_active_received_total,
+        polling_tier=PollingTier.ENERGY,
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement="Wh",
+        state_class=SensorStateClass.TOTAL,
+        feature_classes=POWERTAGS_WITHOUT_C,
+        gateways=LINK_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="partial_active_energy_received_phase",
+        name="partial active energy received phase {}",
+        enumeration=Phase,
+        value_fn=SchneiderModbus.tag_energy_active_received_partial_phase,
+        polling_tier=PollingTier.ENERGY,
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement="Wh",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        feature_classes=POWERTAGS_ENERGY_PER_PHASE,
+        gateways=LINK_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="total_active_energy_received_phase",
+        name="total active energy received phase {}",
+        enumeration=Phase,
+        value_fn=SchneiderModbus.tag_energy_active_received_total_phase,
+        polling_tier=PollingTier.ENERGY,
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement="Wh",
+        state_class=SensorStateClass.TOTAL,
+        feature_classes=POWERTAGS_ENERGY_PER_PHASE,
+        gateways=LINK_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="partial_energy_delivered_and_received",
+        name="partial energy delivered and received",
+        value_fn=SchneiderModbus.tag_energy_active_delivered_plus_received_partial,
+        last_reset_fn=SchneiderModbus.tag_load_operating_time_start,
+        polling_tier=PollingTier.ENERGY,
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement="Wh",
+        state_class=SensorStateClass.TOTAL,
+        feature_classes=POWERTAGS_63,
+        gateways=ALL_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="partial_reactive_energy_delivered",
+        name="partial reactive energy delivered",
+        value_fn=SchneiderModbus.tag_energy_reactive_delivered_partial,
+        polling_tier=PollingTier.ENERGY,
+        device_class=SensorDeviceClass.REACTIVE_ENERGY,
+        native_unit_of_measurement="VARh",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        feature_classes=POWERTAGS_ROPE_250_630,
+        gateways=ALL_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="total_reactive_energy_delivered",
+        name="total reactive energy delivered",
+        value_fn=SchneiderModbus.tag_energy_reactive_delivered_total,
+        polling_tier=PollingTier.ENERGY,
+        device_class=SensorDeviceClass.REACTIVE_ENERGY,
+        native_unit_of_measurement="VARh",
+        state_class=SensorStateClass.TOTAL,
+        feature_classes=POWERTAGS_ROPE,
+        gateways=LINK_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="partial_reactive_energy_delivered_phase",
+        name="partial reactive energy delivered phase {}",
+        enumeration=Phase,
+        value_fn=SchneiderModbus.tag_energy_reactive_delivered_partial_phase,
+        polling_tier=PollingTier.ENERGY,
+        device_class=SensorDeviceClass.REACTIVE_ENERGY,
+        native_unit_of_measurement="VARh",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        feature_classes=POWERTAGS_ROPE_250_630,
+        gateways=LINK_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="total_reactive_energy_delivered_phase",
+        name="total reactive energy delivered phase {}",
+        enumeration=Phase,
+        value_fn=SchneiderModbus.tag_energy_reactive_delivered_total_phase,
+        polling_tier=PollingTier.ENERGY,
+        device_class=SensorDeviceClass.REACTIVE_ENERGY,
+        native_unit_of_measurement="VARh",
+        state_class=SensorStateClass.TOTAL,
+        feature_classes=POWERTAGS_ROPE_250_630,
+        gateways=LINK_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="partial_reactive_energy_received",
+        name="partial reactive energy received",
+        value_fn=SchneiderModbus.tag_energy_reactive_received_partial,
+        polling_tier=PollingTier.ENERGY,
+        device_class=SensorDeviceClass.REACTIVE_ENERGY,
+        native_unit_of_measurement="VARh",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        feature_classes=POWERTAGS_ROPE_250_630,
+        gateways=ALL_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="total_reactive_energy_received",
+        name="total reactive energy received",
+        value_fn=SchneiderModbus.tag_energy_reactive_received_total,
+        polling_tier=PollingTier.ENERGY,
+        device_class=SensorDeviceClass.REACTIVE_ENERGY,
+        native_unit_of_measurement="VARh",
+        state_class=SensorStateClass.TOTAL,
+        feature_classes=POWERTAGS_ROPE_250_630,
+        gateways=LINK_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="partial_reactive_energy_received_phase",
+        name="partial reactive energy received phase {}",
+        enumeration=Phase,
+        value_fn=SchneiderModbus.tag_energy_reactive_received_partial_phase,
+        polling_tier=PollingTier.ENERGY,
+        device_class=SensorDeviceClass.REACTIVE_ENERGY,
+        native_unit_of_measurement="VARh",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        feature_classes=POWERTAGS_ROPE_250_630,
+        gateways=LINK_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="total_reactive_energy_received_phase",
+        name="total reactive energy received phase {}",
+        enumeration=Phase,
+        value_fn=SchneiderModbus.tag_energy_reactive_received_total_phase,
+        polling_tier=PollingTier.ENERGY,
+        device_class=SensorDeviceClass.REACTIVE_ENERGY,
+        native_unit_of_measurement="VARh",
+        state_class=SensorStateClass.TOTAL,
+        feature_classes=POWERTAGS_ROPE_250_630,
+        gateways=LINK_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="partial_apparent_energy",
+        name="partial apparent energy",
+        value_fn=SchneiderModbus.tag_energy_apparent_partial,
+        polling_tier=PollingTier.ENERGY,
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement="VAh",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        feature_classes=POWERTAGS_ROPE,
+        gateways=ALL_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="total_apparent_energy",
+        name="total apparent energy",
+        value_fn=SchneiderModbus.tag_energy_apparent_total,
+        polling_tier=PollingTier.ENERGY,
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement="VAh",
+        state_class=SensorStateClass.TOTAL,
+        feature_classes=POWERTAGS_ROPE,
+        gateways=ALL_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="partial_apparent_energy_phase",
+        name="partial apparent energy phase {}",
+        enumeration=Phase,
+        value_fn=SchneiderModbus.tag_energy_apparent_partial_phase,
+        polling_tier=PollingTier.ENERGY,
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement="VAh",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        feature_classes=POWERTAGS_ROPE,
+        gateways=LINK_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="total_apparent_energy_phase",
+        name="total apparent energy phase {}",
+        enumeration=Phase,
+        value_fn=SchneiderModbus.tag_energy_apparent_total_phase,
+        polling_tier=PollingTier.ENERGY,
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement="VAh",
+        state_class=SensorStateClass.TOTAL,
+        feature_classes=POWERTAGS_ROPE,
+        gateways=LINK_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="current",
+        name="current {}",
+        enumeration=Phase,
+        value_fn=SchneiderModbus.tag_current,
+        fixed_attributes_fn=rated_current,
+        deadband=0.01,
+        device_class=SensorDeviceClass.CURRENT,
+        native_unit_of_measurement="A",
+        state_class=SensorStateClass.MEASUREMENT,
+        feature_classes=POWERTAGS,
+        gateways=ALL_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="current_neutral",
+        name="current neutral",
+        value_fn=SchneiderModbus.tag_current_neutral,
+        fixed_attributes_fn=rated_current,
+        deadband=0.01,
+        device_class=SensorDeviceClass.CURRENT,
+        native_unit_of_measurement="A",
+        state_class=SensorStateClass.MEASUREMENT,
+        feature_classes=POWERTAGS_ROPE,
+        gateways=ALL_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="voltage",
+        name="voltage {}",
+        enumeration=LineVoltage,
+        value_fn=SchneiderModbus.tag_voltage,
+        fixed_attributes_fn=rated_voltage,
+        deadband=0.1,
+        device_class=SensorDeviceClass.VOLTAGE,
+        native_unit_of_measurement="V",
+        state_class=SensorStateClass.MEASUREMENT,
+        feature_classes=POWERTAGS,
+        gateways=ALL_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="frequency",
+        name="frequency",
+        value_fn=SchneiderModbus.tag_ac_frequency,
+        deadband=0.01,
+        device_class=SensorDeviceClass.FREQUENCY,
+        native_unit_of_measurement="Hz",
+        state_class=SensorStateClass.MEASUREMENT,
+        feature_classes=POWERTAGS_ROPE_250_630,
+        gateways=ALL_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="device_temperature",
+        name="temperature",
+        value_fn=SchneiderModbus.tag_device_temperature,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement="°C",
+        state_class=SensorStateClass.MEASUREMENT,
+        feature_classes=POWERTAGS,
+        gateways=ALL_GATEWAYS,
+        firmware_version_fn=lambda firmware_version: major_version(firmware_version) >= 4,
+    ),
+    PowerTagSensorEntityDescription(
+        key="active_power",
+        name="active power",
+        value_fn=SchneiderModbus.tag_power_active_total,
+        deadband=0.5,
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement="W",
+        state_class=SensorStateClass.MEASUREMENT,
+        feature_classes=POWERTAGS,
+        gateways=ALL_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="active_power_phase",
+        name="active power phase {}",
+        enumeration=Phase,
+        value_fn=SchneiderModbus.tag_power_active,
+        deadband=0.5,
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement="W",
+        state_class=SensorStateClass.MEASUREMENT,
+        feature_classes=POWERTAGS_POWER_PER_PHASE,
+        gateways=ALL_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="demand_active_power",
+        name="demand active power",
+        value_fn=SchneiderModbus.tag_power_active_demand_total,
+        attributes_fn=demand_maximum,
+        deadband=0.5,
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement="W",
+        state_class=SensorStateClass.MEASUREMENT,
+        feature_classes=frozenset([FeatureClass.C]),
+        gateways=ALL_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="battery_voltage",
+        name="battery voltage",
+        value_fn=SchneiderModbus.env_battery_voltage,
+        polling_tier=PollingTier.DIAGNOSTIC,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        device_class=SensorDeviceClass.VOLTAGE,
+        native_unit_of_measurement="V",
+        state_class=SensorStateClass.MEASUREMENT,
+        feature_classes=HUMIDITY_SENSORS,
+        gateways=PANEL_SERVER,
+    ),
+    PowerTagSensorEntityDescription(
+        key="temperature",
+        name="temperature",
+        value_fn=SchneiderModbus.env_temperature,
+        fixed_attributes_fn=temperature_range,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement="°C",
+        state_class=SensorStateClass.MEASUREMENT,
+        feature_classes=ENVIRONMENT_SENSORS,
+        gateways=PANEL_SERVER,
+    ),
+    PowerTagSensorEntityDescription(
+        key="humidity",
+        name="humidity",
+        value_fn=SchneiderModbus.env_humidity,
+        scale=100,
+        fixed_attributes_fn=humidity_range,
+        device_class=SensorDeviceClass.HUMIDITY,
+        native_unit_of_measurement="%",
+        state_class=SensorStateClass.MEASUREMENT,
+        feature_classes=HUMIDITY_SENSORS,
+        gateways=PANEL_SERVER,
+    ),
+    PowerTagSensorEntityDescription(
+        key="co2",
+        name="CO2",
+        value_fn=SchneiderModbus.env_co2,
+        scale=1000,
+        device_class=SensorDeviceClass.CO2,
+        native_unit_of_measurement="ppm",
+        state_class=SensorStateClass.MEASUREMENT,
+        feature_classes=frozenset([FeatureClass.CO2]),
+        gateways=PANEL_SERVER,
+    ),
+    PowerTagSensorEntityDescription(
+        key="rssi_tag",
+        name="RSSI in tag",
+        value_fn=SchneiderModbus.tag_radio_rssi_inside_tag,
+        attributes_fn=rssi_minimum,
+        polling_tier=PollingTier.DIAGNOSTIC,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        native_unit_of_measurement="dBm",
+        state_class=SensorStateClass.MEASUREMENT,
+        feature_classes=WIRELESS_DEVICES,
+        gateways=LINK_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="rssi_gateway",
+        name="RSSI in gateway",
+        value_fn=SchneiderModbus.tag_radio_rssi_inside_gateway,
+        attributes_fn=rssi_minimum,
+        polling_tier=PollingTier.DIAGNOSTIC,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        native_unit_of_measurement="dBm",
+        state_class=SensorStateClass.MEASUREMENT,
+        feature_classes=WIRELESS_DEVICES,
+        gateways=LINK_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="lqi_tag",
+        name="LQI in tag",
+        value_fn=SchneiderModbus.tag_radio_lqi_tag,
+        attributes_fn=lqi_minimum,
+        polling_tier=PollingTier.DIAGNOSTIC,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        feature_classes=WIRELESS_DEVICES,
+        gateways=LINK_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="lqi_gateway",
+        name="LQI in gateway",
+        value_fn=SchneiderModbus.tag_radio_lqi_gateway,
+        attributes_fn=lqi_minimum,
+        polling_tier=PollingTier.DIAGNOSTIC,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        feature_classes=WIRELESS_DEVICES,
+        gateways=LINK_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="per_tag",
+        name="packet error rate in tag",
+        value_fn=SchneiderModbus.tag_radio_per_tag,
+        attributes_fn=per_maximum,
+        polling_tier=PollingTier.DIAGNOSTIC,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        feature_classes=WIRELESS_DEVICES,
+        gateways=LINK_GATEWAYS,
+    ),
+    PowerTagSensorEntityDescription(
+        key="per_gateway",
+        name="packet error rate in gateway",
+        value_fn=SchneiderModbus.tag_radio_per_gateway,
+        attributes_fn=per_maximum,
+        polling_tier=PollingTier.DIAGNOSTIC,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        feature_classes=WIRELESS_DEVICES,
+        gateways=LINK_GATEWAYS,
+    ),
+)
@@ -0,0 +1,76 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import DOMAIN, SERVICE_RESET_ENERGY, ATTR_CONFIG_ENTRY_ID, CONF_CLIENT, CONF_INVENTORY
+from .device_features import (
+    FeatureClass,
+    RESETTABLE_ACTIVE_ENERGY,
+    RESETTABLE_REACTIVE_ENERGY,
+    RESETTABLE_APPARENT_ENERGY,
+)
+from .inventory import Inventory
+from .schneider_modbus import SchneiderModbus, TypeOfGateway
+
+_LOGGER = logging.getLogger(__name__)
+
+RESET_ENERGY_SCHEMA = vol.Schema({vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string})
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Registers the services of the integration, which are shared by all gateways."""
+
+    async def handle_reset_energy(call: ServiceCall) -> None:
+        entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+        data = hass.data.get(DOMAIN, {}).get(entry_id)
+        if data is None:
+            raise ServiceValidationError(f"{entry_id} is not a loaded PowerTag gateway")
+        await async_reset_energy(data[CONF_CLIENT], data[CONF_INVENTORY])
+
+    hass.services.async_register(DOMAIN, SERVICE_RESET_ENERGY, handle_reset_energy, schema=RESET_ENERGY_SCHEMA)
+
+
+def energy_resets(client: SchneiderModbus, feature_class: FeatureClass) -> list[Callable[[int], Awaitable[None]]]:
+    """The resets of the partial energy counters a tag has, the same ones its buttons offer."""
+    resets = []
+    if feature_class in RESETTABLE_ACTIVE_ENERGY:
+        resets += [client.tag_reset_energy_active_delivered_partial, client.tag_reset_energy_active_received_partial]
+    if client.type_of_gateway is not TypeOfGateway.SMARTLINK and feature_class in RESETTABLE_REACTIVE_ENERGY:
+        resets += [
+            client.tag_reset_energy_reactive_delivered_partial, client.tag_reset_energy_reactive_received_partial
+        ]
+    if client.type_of_gateway is TypeOfGateway.PANEL_SERVER and feature_class in RESETTABLE_APPARENT_ENERGY:
+        resets.append(client.tag_reset_energy_apparent_partial)
+    return resets
+
+
+async def async_reset_energy(client: SchneiderModbus, inventory: Inventory) -> None:
+    """Resets the partial energy counters of all tags of the gateway in one pass, rather than tag by tag.
+
+    Raises HomeAssistantError naming the tags whose counters could not all be reset.
+    """
+    resets = [
+        (tag.modbus_address, reset)
+        for tag in inventory.tags
+        for reset in energy_resets(client, tag.feature_class)
+    ]
+    _LOGGER.debug(f"Resetting {len(resets)} energy counters")
+    results = await asyncio.gather(
+        *[reset(modbus_address) for modbus_address, reset in resets], return_exceptions=True
+    )
+
+    failed = {}
+    for (modbus_address, reset), result in zip(resets, results):
+        if isinstance(result, Exception):
+            _LOGGER.error(f"{reset.__name__} failed for the tag at address {modbus_address}: {result!r}")
+            failed.setdefault(modbus_address, result)
+    if failed:
+        addresses = ", ".join(str(modbus_address) for modbus_address in sorted(failed))
+        raise HomeAssistantError(
+            f"Could not reset the energy counters of the tags at addresses {addresses}"
+        ) from next(iter(failed.values()))
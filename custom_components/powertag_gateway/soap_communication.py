@@ -1,21 +1,47 @@
+import asyncio
 import logging
+import socket
 import uuid
+import xml.etree.ElementTree as ElementTree
+from io import BytesIO
 
-import requests
+from aiohttp import ClientError, ClientTimeout
 from homeassistant.core import HomeAssistant
-from requests import Response
-from wsdiscovery import QName
-from wsdiscovery.discovery import ThreadedWSDiscovery as WSDiscovery
-from wsdiscovery.service import Service
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 NAMESPACE_SCHNEIDER = "http://www.schneider-electric.com"
 NAMESPACE_SCHNEIDER_CYBERSECURITY = "http://www.schneider-electric.com/CyberSecurity"
+NAMESPACE_ADDRESSING = "http://schemas.xmlsoap.org/ws/2004/08/addressing"
+NAMESPACE_DISCOVERY = "http://schemas.xmlsoap.org/ws/2005/04/discovery"
 
 LOCAL_NAME_GATEWAY_SERVER = "GatewayServer"
 LOCAL_NAME_PANEL_SERVER = "EcoStruxurePanelServer"
 
+MULTICAST_ADDRESS = ("239.255.255.250", 3702)
+
+# Seconds to collect the answers to a probe, which is sent more than once as multicast datagrams can get lost
+PROBE_TIMEOUT = 2
+PROBE_REPEAT = 2
+
+# Seconds a device gets to send its metadata
+TRANSFER_GET_TIMEOUT = 3
+
 _LOGGER = logging.getLogger(__name__)
 
+probe_template = """<?xml version="1.0" encoding="utf-8"?>
+<soap:Envelope xmlns:soap="http://www.w3.org/2003/05/soap-envelope" xmlns:wsa="http://schemas.xmlsoap.org/ws/2004/08/addressing" xmlns:wsd="http://schemas.xmlsoap.org/ws/2005/04/discovery" xmlns:dn="http://www.schneider-electric.com">
+    <soap:Header>
+        <wsa:To>urn:schemas-xmlsoap-org:ws:2005:04:discovery</wsa:To>
+        <wsa:Action>http://schemas.xmlsoap.org/ws/2005/04/discovery/Probe</wsa:Action>
+        <wsa:MessageID>urn:uuid:{{MessageID}}</wsa:MessageID>
+    </soap:Header>
+    <soap:Body>
+        <wsd:Probe>
+            <wsd:Types>dn:GatewayServer</wsd:Types>
+        </wsd:Probe>
+    </soap:Body>
+</soap:Envelope>"""
+
 template = """<?xml version="1.0" encoding="utf-8"?>
 <soap:Envelope xmlns:soap="http://www.w3.org/2003/05/soap-envelope" xmlns:wsa="http://schemas.xmlsoap.org/ws/2004/08/addressing">
     <soap:Header>
@@ -33,47 +59,108 @@ template = """<?xml version="1.0" encoding="utf-8"?>
 </soap:Envelope>"""
 
 
-async def dpws_discovery(hass: HomeAssistant) -> list[Service]:
+class Service:
+    """A device that answered the probe: its endpoint reference, (namespace, local name) types and addresses."""
+
+    def __init__(self, epr: str, types: list[tuple[str, str]], xaddrs: list[str]):
+        self.epr = epr
+        self.types = types
+        self.xaddrs = xaddrs
+
+    def is_gateway(self) -> bool:
+        return (NAMESPACE_SCHNEIDER, LOCAL_NAME_GATEWAY_SERVER) in self.types and bool(self.xaddrs)
+
+
+def parse_probe_matches(data: bytes) -> list[Service]:
+    """The services of a ProbeMatches message, with the prefixes of their types resolved to namespaces."""
+    # ElementTree resolves the prefixes of tags, but not those within text, like the types
+    prefixes = {}
+    root = None
+    for event, item in ElementTree.iterparse(BytesIO(data), events=["start-ns", "start"]):
+        if event == "start-ns":
+            prefix, namespace = item
+            prefixes[prefix] = namespace
+        elif root is None:
+            root = item
+    if root is None:
+        return []
+
+    services = []
+    for match in root.iter(f"{{{NAMESPACE_DISCOVERY}}}ProbeMatch"):
+        epr = match.findtext(f"{{{NAMESPACE_ADDRESSING}}}EndpointReference/{{{NAMESPACE_ADDRESSING}}}Address", "")
+        types = []
+        for qname in match.findtext(f"{{{NAMESPACE_DISCOVERY}}}Types", "").split():
+            prefix, _, local_name = qname.rpartition(":")
+            types.append((prefixes.get(prefix, ""), local_name))
+        xaddrs = match.findtext(f"{{{NAMESPACE_DISCOVERY}}}XAddrs", "").split()
+        services.append(Service(epr.strip(), types, xaddrs))
+    return services
+
+
+class ProbeProtocol(asyncio.DatagramProtocol):
+    def __init__(self):
+        self.services: dict[str, Service] = {}
+
+    def datagram_received(self, data: bytes, addr):
+        try:
+            services = parse_probe_matches(data)
+        except ElementTree.ParseError as e:
+            _LOGGER.debug(f"Ignoring malformed answer from {addr[0]}: {e}")
+            return
+        for service in services:
+            self.services.setdefault(service.epr, service)
+
+    def error_received(self, exc: Exception):
+        _LOGGER.debug(f"Error while probing: {exc}")
+
+
+async def dpws_discovery(timeout: float = PROBE_TIMEOUT) -> list[Service]:
     """Search a Link Gateway from the network"""
     _LOGGER.info("Attempting to discover EnergyTag Gateway")
 
-    def blocking_discovery():
-        wsd = WSDiscovery()
-        wsd.start()
-        services = wsd.searchServices(
-            types=[QName(NAMESPACE_SCHNEIDER, LOCAL_NAME_GATEWAY_SERVER)]
-        )
-        wsd.stop()
-        return services
+    transport, protocol = await asyncio.get_running_loop().create_datagram_endpoint(
+        ProbeProtocol, local_addr=("0.0.0.0", 0), family=socket.AF_INET
+    )
+    try:
+        for _ in range(PROBE_REPEAT):
+            transport.sendto(probe_template.replace("{{MessageID}}", str(uuid.uuid4())).encode(), MULTICAST_ADDRESS)
+            await asyncio.sleep(timeout / PROBE_REPEAT)
+    finally:
+        transport.close()
+
+    return [service for service in protocol.services.values() if service.is_gateway()]
 
-    return await hass.async_add_executor_job(blocking_discovery)
 
 class Soapy:
-    def __init__(self, service: Service, hass=HomeAssistant):
+    def __init__(self, service: Service, hass: HomeAssistant):
         message_id = uuid.uuid4()
         our_id = uuid.uuid4()
 
         self.get_device = template \
-            .replace("{{To}}", service.getEPR()) \
+            .replace("{{To}}", service.epr) \
             .replace("{{MessageID}}", str(message_id)) \
             .replace("{{OurID}}", str(our_id))
         self.hass = hass
-        self.address = service.getXAddrs()[0]
+        self.address = service.xaddrs[0]
         self.service = service
 
-    def address(self):
-        return self.service.getXAddrs()[0]
-
     def is_panel_server(self) -> bool:
-        schneiderCyberSecurity = [type for type in self.service.getTypes() if
-                                  type.getNamespace() == NAMESPACE_SCHNEIDER_CYBERSECURITY]
-        if not schneiderCyberSecurity:
-            return False
-
-        return schneiderCyberSecurity[0].getLocalname() == LOCAL_NAME_PANEL_SERVER
-
-    async def transfer_get(self) -> Response:
-        return await self.hass.async_add_executor_job(self.fetch_device)
-
-    def fetch_device(self):
-        return requests.post(self.address, data=self.get_device)
+        return (NAMESPACE_SCHNEIDER_CYBERSECURITY, LOCAL_NAME_PANEL_SERVER) in self.service.types
+
+    async def transfer_get(self) -> str | None:
+        """The metadata of the device, or None when it didn't send it."""
+        session = async_get_clientsession(self.hass)
+        try:
+            async with session.post(
+                self.address,
+                data=self.get_device,
+                headers={"Content-Type": "application/soap+xml; charset=utf-8"},
+                timeout=ClientTimeout(total=TRANSFER_GET_TIMEOUT),
+            ) as response:
+                if response.status != 200:
+                    _LOGGER.debug(f"{self.address} answered the Transfer-Get with status {response.status}")
+                    return None
+                return await response.text()
+        except (ClientError, asyncio.TimeoutError) as e:
+            _LOGGER.debug(f"Could not get the metadata from {self.address}: {e!r}")
+            return None
@@ -0,0 +1,243 @@
+"""Benchmarks startup and poll cycles of the integration against the simulated gateway, and reports them as JSON.
+
+For every combination of gateway type, tag count and product mix, it measures the startup scan, a cold poll cycle
+(before the read planner learned which registers are needed) and the average warm poll cycle: wall-clock time,
+Modbus PDUs, bytes on the wire and the CPU time spent decoding values in the entities. It also measures a warm cycle
+of each polling tier on its own, which is what the ticks in between a full cycle cost.
+
+Requires Home Assistant to be installed, as it drives the actual entity classes.
+
+    python tools/benchmark.py --tags 1,10,50,99 --latency 0.005 --output benchmark.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "tools"))
+
+import pymodbus  # noqa: E402
+
+import simulator  # noqa: E402
+from custom_components.powertag_gateway import UniqueIdVersion  # noqa: E402
+from custom_components.powertag_gateway.binary_sensor import list_binary_sensors  # noqa: E402
+from custom_components.powertag_gateway.const import (  # noqa: E402
+    CONF_CLIENT,
+    CONF_DEVICE_UNIQUE_ID_VERSION,
+    CONF_INVENTORY,
+    DOMAIN,
+)
+from custom_components.powertag_gateway.coordinator import (  # noqa: E402
+    PollingTier,
+    async_update_slaves,
+    polling_tier,
+)
+from custom_components.powertag_gateway.entity_base import async_setup_entities  # noqa: E402
+from custom_components.powertag_gateway.inventory import Inventory, use_register_map  # noqa: E402
+from custom_components.powertag_gateway.schneider_modbus import SchneiderModbus, TypeOfGateway  # noqa: E402
+from custom_components.powertag_gateway.sensor import list_sensors  # noqa: E402
+
+PRODUCT_MIXES = {
+    "mixed": None,
+    "single-phase": ["A9MEM1520", "A9MEM1560", "A9MEM1561"],
+    "three-phase": ["A9MEM1540", "A9MEM1570", "A9MEM1571", "LV434021"],
+    "environment": ["SED-TRH-G-5045", "SED-CO2-G-5045", "EMS59440"],
+}
+
+
+class SimulatorThread:
+    """Runs the simulated gateway on its own event loop, so its CPU time isn't attributed to the integration."""
+
+    def __init__(self, gateway: simulator.GatewaySimulator):
+        self.gateway = gateway
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+
+    def start(self) -> int:
+        self._thread.start()
+        return asyncio.run_coroutine_threadsafe(self.gateway.start(), self.loop).result()
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self.gateway.stop(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+class TrafficCounter:
+    def __init__(self, stats: simulator.SimulatorStats):
+        self._stats = stats
+        self._pdus = stats.requests
+        self._bytes = stats.bytes_received + stats.bytes_sent
+
+    def result(self) -> dict:
+        return {
+            "pdus": self._stats.requests - self._pdus,
+            "bytes": self._stats.bytes_received + self._stats.bytes_sent - self._bytes,
+        }
+
+
+def time_decoding(entities: dict[int, list]) -> list[float]:
+    """Wraps the updates of the entities to accumulate the CPU time they take, excluding the simulator's."""
+    decode_time = [0.0]
+    for slave_entities in entities.values():
+        for entity in slave_entities:
+            async_update = entity.async_update
+
+            async def timed_update(async_update=async_update):
+                start = time.thread_time()
+                try:
+                    await async_update()
+                finally:
+                    decode_time[0] += time.thread_time() - start
+
+            entity.async_update = timed_update
+    return decode_time
+
+
+async def run_scenario(
+    type_of_gateway: TypeOfGateway, tag_count: int, mix: str, cycles: int, latency: float, loss: float,
+    pool_size: int = 1, pipeline_window: int = 1, max_concurrent: int = 1, pipelining: bool = True
+) -> dict:
+    products = PRODUCT_MIXES[mix]
+    if products is None and type_of_gateway is TypeOfGateway.SMARTLINK:
+        products = simulator.DEFAULT_SMARTLINK_PRODUCTS
+    gateway = simulator.GatewaySimulator.with_tag_count(
+        tag_count, simulator.TypeOfGateway(type_of_gateway.value), products, latency=latency, loss_rate=loss,
+        max_concurrent_requests=max_concurrent, pipelining=pipelining, seed=0
+    )
+    simulator_thread = SimulatorThread(gateway)
+    port = simulator_thread.start()
+    client = None
+    try:
+        traffic = TrafficCounter(gateway.stats)
+        start = time.perf_counter()
+        client = await SchneiderModbus.create(
+            "127.0.0.1", type_of_gateway, port, pool_size=pool_size, pipeline_window=pipeline_window
+        )
+        inventory = await Inventory.create(client, "http://127.0.0.1")
+        use_register_map(client, inventory)
+
+        # The platforms only need the entry's data, which is all async_setup_entities looks at
+        entry = SimpleNamespace(entry_id="benchmark")
+        hass = SimpleNamespace(data={DOMAIN: {entry.entry_id: {
+            CONF_CLIENT: client,
+            CONF_INVENTORY: inventory,
+            CONF_DEVICE_UNIQUE_ID_VERSION: UniqueIdVersion.V2,
+        }}})
+        all_entities = async_setup_entities(hass, entry, list_sensors() + list_binary_sensors())
+        startup = {"seconds": time.perf_counter() - start, **traffic.result()}
+
+        entities: dict[int, list] = {}
+        for entity in all_entities:
+            if hasattr(entity, "async_update"):
+                entities.setdefault(entity._slave_id, []).append(entity)
+        decode_time = time_decoding(entities)
+
+        results = []
+        for _ in range(cycles + 1):
+            traffic = TrafficCounter(gateway.stats)
+            decode_time[0] = 0.0
+            start = time.perf_counter()
+            await async_update_slaves(client, entities)
+            results.append({
+                "seconds": time.perf_counter() - start,
+                "decode_cpu_seconds": decode_time[0],
+                **traffic.result(),
+            })
+        cold, warm = results[0], results[1:]
+
+        tiers = {}
+        for tier in PollingTier:
+            traffic = TrafficCounter(gateway.stats)
+            start = time.perf_counter()
+            await async_update_slaves(client, {
+                slave_id: [entity for entity in slave_entities if polling_tier(entity) is tier]
+                for slave_id, slave_entities in entities.items()
+            })
+            tiers[tier.name.lower()] = {"seconds": time.perf_counter() - start, **traffic.result()}
+
+        return {
+            "gateway": type_of_gateway.value,
+            "tags": tag_count,
+            "mix": mix,
+            "pool_size": pool_size,
+            "pipeline_window": pipeline_window,
+            "identified_tags": len(inventory.tags),
+            "entities": sum(len(slave_entities) for slave_entities in entities.values()),
+            "startup": startup,
+            "cold_cycle": cold,
+            "cycle": {
+                "seconds_mean": sum(r["seconds"] for r in warm) / len(warm),
+                "seconds_min": min(r["seconds"] for r in warm),
+                "seconds_max": max(r["seconds"] for r in warm),
+                "decode_cpu_seconds_mean": sum(r["decode_cpu_seconds"] for r in warm) / len(warm),
+                "pdus": warm[-1]["pdus"],
+                "bytes": warm[-1]["bytes"],
+            },
+            "tier_cycles": tiers,
+        }
+    finally:
+        if client is not None:
+            client.close()
+        simulator_thread.stop()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--gateways", default=",".join(t.value for t in TypeOfGateway),
+                        help="comma separated gateway types")
+    parser.add_argument("--tags", default="1,10,50,99", help="comma separated tag counts")
+    parser.add_argument("--mixes", default="mixed", help=f"comma separated product mixes of {list(PRODUCT_MIXES)}")
+    parser.add_argument("--cycles", type=int, default=5, help="warm poll cycles to average over")
+    parser.add_argument("--latency", type=float, default=0.002, help="simulated seconds per request")
+    parser.add_argument("--loss", type=float, default=0.0, help="fraction of requests that get no response")
+    parser.add_argument("--pool-size", type=int, default=1, help="Modbus TCP connections the integration opens")
+    parser.add_argument("--pipeline-window", type=int, default=1,
+                        help="requests the integration keeps in flight per connection")
+    parser.add_argument("--no-pipelining", action="store_true",
+                        help="have the simulated gateway drop requests that arrive while it's busy")
+    parser.add_argument("--max-concurrent", type=int, default=1,
+                        help="requests the simulated gateway handles at the same time")
+    parser.add_argument("--output", help="file to write the JSON report to, instead of stdout")
+    args = parser.parse_args()
+
+    scenarios = []
+    for gateway in args.gateways.split(","):
+        type_of_gateway = [t for t in TypeOfGateway if t.value == gateway][0]
+        for mix in args.mixes.split(","):
+            if mix == "environment" and type_of_gateway is TypeOfGateway.SMARTLINK:
+                continue
+            for tag_count in [int(tags) for tags in args.tags.split(",")]:
+                print(f"Benchmarking {gateway} with {tag_count} {mix} tags...", file=sys.stderr)
+                scenarios.append(await run_scenario(
+                    type_of_gateway, tag_count, mix, args.cycles, args.latency, args.loss,
+                    args.pool_size, args.pipeline_window, args.max_concurrent, not args.no_pipelining
+                ))
+
+    manifest = json.loads((ROOT / "custom_components" / "powertag_gateway" / "manifest.json").read_text())
+    report = {
+        "version": manifest["version"],
+        "python": platform.python_version(),
+        "pymodbus": pymodbus.__version__,
+        "latency": args.latency,
+        "loss": args.loss,
+        "max_concurrent": args.max_concurrent,
+        "scenarios": scenarios,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
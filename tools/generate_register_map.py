@@ -0,0 +1,562 @@
+"""Generates custom_components/powertag_gateway/register_map.py from the Modbus spreadsheet in doc/.
+
+Every tab of the spreadsheet that lists registers becomes a register table, and the commercial references tab tells
+which table applies to which device. The values the integration reads are looked up in those tables by their Panel
+Server address. The spreadsheet only documents the Panel Server, so where the PowerTag Link and Smartlink differ is
+maintained here in GATEWAY_VARIANTS. Only the standard library is needed to read the spreadsheet.
+
+    python tools/generate_register_map.py
+"""
+
+import argparse
+import re
+from collections import namedtuple
+import xml.etree.ElementTree as ElementTree
+import zipfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SPREADSHEET = ROOT / "doc" / "DOCA0241EN-06.xlsx"
+OUTPUT = ROOT / "custom_components" / "powertag_gateway" / "register_map.py"
+
+MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+RELATIONSHIPS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+
+# Tab names of the spreadsheet, and the name of their register table
+TABLES = {
+    "Panel Server": "PANEL_SERVER",
+    "PTE63-PoTag QO": "POWERTAG_63",
+    "PTEnergy250_630-PoTag Efram": "POWERTAG_250_630",
+    "PTE Rope-PoTag  Rope": "POWERTAG_ROPE",
+    "TH110": "TH110",
+    "CL110": "CL110",
+    "CO2 sensors": "CO2",
+    "Temperature sensors TRH": "TEMPERATURE_TRH",
+    "PowerLogic HeatTag": "HEATTAG",
+    "Acti9 Active": "ACTI9_ACTIVE",
+    "Wireless indication auxiliary": "WIRELESS_INDICATION_AUXILIARY",
+    "Partial Discharge Box": "PARTIAL_DISCHARGE_BOX",
+    "PowerTagC2DI": "POWERTAG_C_2DI",
+    "PowerTagCIO": "POWERTAG_C_IO",
+}
+COMMERCIAL_REFERENCES_TAB = "Commercial References"
+
+# Feature classes of the wireless devices that use a register table, by the name of the table
+TABLE_FEATURE_CLASSES = {
+    "POWERTAG_63": ("A1", "A2", "P1", "F1", "F2", "F3"),
+    "POWERTAG_250_630": ("M0", "M1", "M2", "M3"),
+    "POWERTAG_ROPE": ("FL", "R1"),
+    "ACTI9_ACTIVE": ("C",),
+    "TH110": ("TEMP0",),
+    "TEMPERATURE_TRH": ("TEMP1",),
+    "CO2": ("CO2",),
+}
+
+# Names of TypeOfGateway
+GATEWAYS = ("PANEL_SERVER", "POWERTAG_LINK", "SMARTLINK")
+
+# Slaves a register is read from: the wireless device, the gateway at slave 255 or the synthesis table of the Link
+TAG = "TAG"
+GATEWAY = "GATEWAY"
+SYNTHESIS_TABLE = "SYNTHESIS_TABLE"
+
+# A register the spreadsheet doesn't document
+Undocumented = namedtuple("Undocumented", ["address", "count", "type", "unit", "section", "description"])
+
+
+def phases(name: str, a, b, c) -> dict:
+    return {f"{name}_a": a, f"{name}_b": b, f"{name}_c": c}
+
+
+# Values of the wireless devices the integration reads, by the name of their accessor in schneider_modbus, and their
+# register on the Panel Server. None for values the Panel Server doesn't have.
+TAG_VALUES = {
+    **phases("tag_current", 0x0BB7, 0x0BB9, 0x0BBB),
+    "tag_current_neutral": 0x0BBD,
+    "tag_voltage_a_b": 0x0BCB,
+    "tag_voltage_b_c": 0x0BCD,
+    "tag_voltage_c_a": 0x0BCF,
+    "tag_voltage_a_n": 0x0BD3,
+    "tag_voltage_b_n": 0x0BD5,
+    "tag_voltage_c_n": 0x0BD7,
+    **phases("tag_power_active", 0x0BED, 0x0BEF, 0x0BF1),
+    "tag_power_active_total": 0x0BF3,
+    **phases("tag_power_reactive", 0x0BF5, 0x0BF7, 0x0BF9),
+    "tag_power_reactive_total": 0x0BFB,
+    **phases("tag_power_apparent", 0x0BFD, 0x0BFF, 0x0C01),
+    "tag_power_apparent_total": 0x0C03,
+    **phases("tag_power_factor", 0x0C05, 0x0C07, 0x0C09),
+    "tag_power_factor_total": 0x0C0B,
+    "tag_power_factor_sign_convention": 0x0C0D,
+    "tag_ac_frequency": 0x0C25,
+    "tag_device_temperature": 0x0C3B,
+    "tag_energy_active_delivered_plus_received_total": 0x0C83,
+    "tag_energy_active_delivered_plus_received_partial": 0x0CB7,
+    "tag_energy_active_delivered_partial": 0x1390,
+    "tag_energy_active_delivered_total": 0x1394,
+    "tag_energy_active_received_partial": 0x1398,
+    "tag_energy_active_received_total": 0x139C,
+    **phases("tag_energy_active_delivered_partial_phase", 0x13B8, 0x13E0, 0x1408),
+    **phases("tag_energy_active_delivered_total_phase", 0x13BC, 0x13E4, 0x140C),
+    **phases("tag_energy_active_received_partial_phase", 0x13C0, 0x13E8, 0x1410),
+    **phases("tag_energy_active_received_total_phase", 0x13C4, 0x13EC, 0x1414),
+    "tag_energy_reactive_delivered_partial": 0x1438,
+    "tag_energy_reactive_delivered_total": 0x143C,
+    "tag_energy_reactive_received_partial": 0x1448,
+    "tag_energy_reactive_received_total": 0x144C,
+    **phases("tag_energy_reactive_delivered_partial_phase", 0x1470, 0x1498, 0x14C0),
+    **phases("tag_energy_reactive_delivered_total_phase", 0x1474, 0x149C, 0x14C4),
+    **phases("tag_energy_reactive_received_partial_phase", 0x1478, 0x14A0, 0x14C8),
+    **phases("tag_energy_reactive_received_total_phase", 0x147C, 0x14A4, 0x14CC),
+    "tag_energy_apparent_partial": 0x14F4,
+    "tag_energy_apparent_total": 0x14F8,
+    **phases("tag_energy_apparent_partial_phase", 0x150C, 0x1534, 0x155C),
+    **phases("tag_energy_apparent_total_phase", 0x1510, 0x1538, 0x1560),
+    "tag_power_active_demand_total": Undocumented(
+        0x0EB5, 2, "FLOAT32", "W", "Power Demand Data", "Demand total active power"
+    ),
+    "tag_power_active_power_demand_total_maximum": Undocumented(
+        0x0EB9, 2, "FLOAT32", "W", "Power Demand Data", "Maximum demand total active power"
+    ),
+    "tag_power_active_demand_total_maximum_timestamp": Undocumented(
+        0x0EBB, 4, "DATETIME", None, "Power Demand Data", "Date and time of the maximum demand total active power"
+    ),
+    "tag_alarm_validity": 0x0CE1,
+    "tag_alarm_bitmask": 0x0CE3,
+    **phases("tag_current_at_voltage_loss", 0x0CE7, 0x0CE5, 0x0CE9),
+    "tag_load_operating_time": Undocumented(
+        0x0CEB, 2, "UINT32", "s", "Load Operating Time", "Load operating time counter."
+    ),
+    "tag_load_operating_time_active_power_threshold": 0x0CED,
+    "tag_load_operating_time_start": Undocumented(
+        0x0CEF, 4, "DATETIME", None, "Load Operating Time",
+        "Date and time stamp of last Set or reset of Load operating time counter."
+    ),
+    "tag_name": 0x7918,
+    "tag_circuit": 0x7922,
+    "tag_usage": 0x7925,
+    "tag_phase_sequence": 0x7926,
+    "tag_position": 0x7927,
+    "tag_circuit_diagnostic": Undocumented(0x7928, 1, "UINT16", None, "Configuration", "Circuit diagnostics"),
+    "tag_rated_current": 0x7929,
+    "tag_electrical_network_system_type": 0x792A,
+    "tag_rated_voltage": 0x792B,
+    "tag_power_supply_type": 0x792F,
+    "tag_product_identifier": None,
+    "tag_slave_address": 0x7931,
+    "tag_rf_id": 0x7932,
+    "tag_wireless_product_identifier": 0x7937,
+    "tag_vendor_name": 0x7944,
+    "tag_product_code": 0x7954,
+    "tag_firmware_revision": 0x7964,
+    "tag_hardware_revision": 0x796A,
+    "tag_serial_number": 0x7970,
+    "tag_product_range": 0x797A,
+    "tag_product_model": 0x7982,
+    "tag_product_family": 0x798A,
+    "tag_radio_communication_valid": 0x79A8,
+    "tag_wireless_communication_valid": 0x79A9,
+    "tag_radio_per_tag": 0x79B4,
+    "tag_radio_rssi_inside_tag": 0x79B6,
+    "tag_radio_lqi_tag": 0x79B8,
+    "tag_radio_per_gateway": 0x79AF,
+    "tag_radio_rssi_inside_gateway": 0x79B1,
+    "tag_radio_lqi_gateway": 0x79B3,
+    "tag_radio_per_maximum": 0x79B4,
+    "tag_radio_rssi_minimum": 0x79B6,
+    "tag_radio_lqi_minimum": 0x79B8,
+    "env_battery_voltage": 0x0CF3,
+    "env_temperature": 0x0FA0,
+    "env_temperature_maximum": 0x0FA2,
+    "env_temperature_minimum": 0x0FA4,
+    "env_humidity": 0x0FA6,
+    "env_humidity_maximum": 0x0FA8,
+    "env_humidity_minimum": 0x0FAA,
+    "env_co2": 0x0FAE,
+}
+
+# Values of the gateway itself, like TAG_VALUES
+GATEWAY_VALUES = {
+    "hardware_version": 0x0050,
+    "serial_number": 0x0064,
+    "firmware_version": 0x0078,
+    "status": None,
+    "health": 0x009E,
+    "date_time": 0x0073,
+    "product_id": 0xF002,
+    "manufacturer": 0x009F,
+    "product_code": 0x003C,
+    "product_range": 0x000A,
+    "product_model": 0xF003,
+    "name": 0x1605,
+    "product_vendor_url": 0x002A,
+}
+
+# Where the other gateways differ from the Panel Server: the register of a value on them, or None when they don't have
+# it. Other values are at the same address as on the Panel Server. Addresses are looked up in the spreadsheet.
+GATEWAY_VARIANTS = {
+    "POWERTAG_LINK": {
+        GATEWAY: {
+            "status": Undocumented(0x0070, 1, "UINT16", None, "Status", "Gateway status and diagnostic register"),
+            "health": None,
+        },
+        SYNTHESIS_TABLE: {
+            "product_id": Undocumented(0x0001, 1, "UINT16", None, "Identification", "Product ID"),
+            "manufacturer": Undocumented(0x0002, 16, "ASCII", None, "Identification", "Manufacturer name"),
+            "product_code": Undocumented(0x0012, 16, "ASCII", None, "Identification", "Commercial reference"),
+            "product_range": Undocumented(0x0022, 8, "ASCII", None, "Identification", "Product range"),
+            "product_model": Undocumented(0x002A, 8, "ASCII", None, "Identification", "Product model"),
+            "name": Undocumented(0x0032, 10, "ASCII", None, "Identification", "Asset name"),
+            "product_vendor_url": Undocumented(0x003C, 17, "ASCII", None, "Identification", "Vendor URL"),
+        },
+    },
+    "SMARTLINK": {
+        TAG: {
+            "tag_energy_active_delivered_partial": 0x0C87,
+            "tag_energy_active_delivered_total": Undocumented(
+                0x0000, 4, "INT64", "Wh", "Energy", "Total active energy delivered (not resettable)"
+            ),
+            "tag_energy_active_received_partial": 0x0CC7,
+            "tag_energy_active_received_total": 0x0C8B,
+            "tag_energy_reactive_delivered_partial": 0x0CCF,
+            "tag_energy_reactive_received_partial": 0x0CD7,
+            "tag_rated_voltage": None,
+            "tag_power_supply_type": None,
+            "tag_product_identifier": Undocumented(
+                0x7930, 1, "UINT16", None, "Device identification", "Wireless device code type"
+            ),
+            "tag_product_code": None,
+            "tag_product_family": None,
+        },
+        GATEWAY: {
+            "hardware_version": Undocumented(0x006A, 3, "ASCII", None, "Identification", "Hardware version"),
+            "firmware_version": Undocumented(0x006D, 3, "ASCII", None, "Identification", "Firmware version"),
+            "status": Undocumented(0x0070, 1, "UINT16", None, "Status", "Gateway status and diagnostic register"),
+            "health": None,
+            "product_id": None,
+            "manufacturer": None,
+            "product_code": None,
+            "product_range": None,
+            "product_model": None,
+            "name": None,
+            "product_vendor_url": None,
+        },
+    },
+}
+
+TYPES = {
+    "UINT16": "UINT16",
+    "UINT32": "UINT32",
+    "UINT64": "UINT64",
+    "INT64": "INT64",
+    "FLOAT32": "FLOAT32",
+    "BITMAP": "BITMAP",
+    "ASCII": "ASCII",
+    "DATE-TIME": "DATETIME",
+}
+
+HEADER = '''"""Modbus registers of the gateways and their wireless devices, per device family.
+
+Generated by tools/generate_register_map.py from {source}, do not edit.
+"""
+
+import enum
+import functools
+
+
+class RegisterTable(enum.Enum):
+{tables}
+
+
+# Names of TypeOfGateway
+GATEWAYS = {gateways!r}
+
+
+class Register:
+    """A register: its 0-based address, size in registers, data type and unit.
+
+    The slave is where it's read from: TAG for the wireless device, GATEWAY for the gateway at slave 255, or
+    SYNTHESIS_TABLE for the synthesis table of the PowerTag Link. The gateways are the ones known to have it at this
+    address, and the feature classes those of the wireless devices whose register table documents it.
+    """
+
+    __slots__ = (
+        "address", "count", "type", "unit", "writable", "section", "description", "slave", "gateways",
+        "feature_classes",
+    )
+
+    def __init__(
+        self,
+        address: int,
+        count: int,
+        type: str,
+        unit: str | None,
+        writable: bool,
+        section: str,
+        description: str,
+        slave: str,
+        gateways: tuple[str, ...] = ("PANEL_SERVER",),
+        feature_classes: tuple[str, ...] = (),
+    ):
+        self.address = address
+        self.count = count
+        self.type = type
+        self.unit = unit
+        self.writable = writable
+        self.section = section
+        self.description = description
+        self.slave = slave
+        self.gateways = frozenset(gateways)
+        self.feature_classes = frozenset(feature_classes)
+
+    def __repr__(self):
+        return f"Register(0x{{self.address:04X}}, {{self.count}}, {{self.type}}, {{self.description!r}})"
+
+
+class Value:
+    """A value the integration reads, by the register that holds it on each gateway that has it."""
+
+    __slots__ = ("name", "registers", "feature_classes")
+
+    def __init__(self, name: str, feature_classes: tuple[str, ...], **registers: Register):
+        self.name = name
+        self.registers = registers
+        self.feature_classes = frozenset(feature_classes)
+
+    @property
+    def description(self) -> str:
+        return next(iter(self.registers.values())).description
+
+    def __repr__(self):
+        return f"Value({{self.name}}, {{self.registers!r}})"
+
+
+def _table(slave: str, feature_classes: tuple[str, ...], *registers: tuple) -> dict[int, Register]:
+    return {{
+        register[0]: Register(*register[:7], slave, *register[7:], feature_classes=feature_classes)
+        for register in registers
+    }}
+
+
+@functools.lru_cache(maxsize=None)
+def mapped_ranges(table: RegisterTable) -> tuple[tuple[int, int], ...]:
+    """The (start, end) ranges of consecutive documented registers, which the gateway allows to be read at once."""
+    ranges: list[list[int]] = []
+    for address, register in sorted(REGISTERS[table].items()):
+        end = address + register.count
+        if ranges and address <= ranges[-1][1]:
+            ranges[-1][1] = max(ranges[-1][1], end)
+        else:
+            ranges.append([address, end])
+    return tuple((start, end) for start, end in ranges)
+
+
+def register(table: RegisterTable, address: int) -> Register | None:
+    return REGISTERS[table].get(address)
+'''
+
+
+class Workbook:
+    def __init__(self, path: Path):
+        self._zip = zipfile.ZipFile(path)
+        shared_strings = ElementTree.fromstring(self._zip.read("xl/sharedStrings.xml"))
+        self._strings = ["".join(text.text or "" for text in item.iter(f"{MAIN}t")) for item in shared_strings]
+
+        workbook = ElementTree.fromstring(self._zip.read("xl/workbook.xml"))
+        relationships = ElementTree.fromstring(self._zip.read("xl/_rels/workbook.xml.rels"))
+        targets = {relationship.get("Id"): relationship.get("Target") for relationship in relationships}
+        self.sheets = {
+            sheet.get("name"): "xl/" + targets[sheet.get(f"{RELATIONSHIPS}id")]
+            for sheet in workbook.iter(f"{MAIN}sheet")
+        }
+
+    def rows(self, name: str) -> list[dict[str, str]]:
+        """Non-empty cell values of each row of a tab, by column letter."""
+        sheet = ElementTree.fromstring(self._zip.read(self.sheets[name]))
+        rows = []
+        for row in sheet.iter(f"{MAIN}row"):
+            cells = {}
+            for cell in row.iter(f"{MAIN}c"):
+                value = cell.find(f"{MAIN}v")
+                if value is not None:
+                    text = self._strings[int(value.text)] if cell.get("t") == "s" else value.text
+                else:
+                    text = "".join(t.text or "" for t in cell.iter(f"{MAIN}t"))
+                if text and text.strip():
+                    cells[re.sub(r"\d", "", cell.get("r"))] = text.strip()
+            if cells:
+                rows.append(cells)
+        return rows
+
+
+def summarize(description: str) -> str:
+    """First line of a description, without the enumerations that follow it."""
+    return re.sub(r"\s+", " ", re.split(r"[\n•]", description)[0]).strip()
+
+
+def read_registers(workbook: Workbook, tab: str) -> list[tuple]:
+    rows = workbook.rows(tab)
+    header = {value: column for column, value in rows[0].items()}
+    registers = []
+    for row in rows[1:]:
+        unit = row.get(header["Unit"], "-")
+        registers.append((
+            int(row[header["Address (hexa)"]], 16),
+            int(row[header["N°"]]),
+            TYPES[row[header["Type"]].upper()],
+            None if unit == "-" else unit,
+            "W" in row[header["RW"]],
+            row.get(header["Section"], ""),
+            summarize(row.get(header["Description"], "")),
+        ))
+    return sorted(registers)
+
+
+def read_commercial_references(workbook: Workbook) -> dict[str, str]:
+    references = {}
+    for row in workbook.rows(COMMERCIAL_REFERENCES_TAB):
+        if row.get("D") in TABLES and row.get("A"):
+            references[row["A"]] = TABLES[row["D"]]
+    return references
+
+
+def resolve_values(
+    tables: dict[str, list[tuple]], values: dict, slave: str
+) -> tuple[dict[str, dict[str, tuple]], dict[tuple[str, int], set[str]]]:
+    """The register of each value per gateway, as a documented (table, address) or an Undocumented register.
+
+    Also returns the gateways that have each documented (table, address).
+    """
+    documented = {}
+    for table, registers in tables.items():
+        for address, *_ in registers:
+            documented.setdefault(address, []).append(table)
+    if slave == GATEWAY:
+        documented = {
+            address: [table for table in names if table == "PANEL_SERVER"] for address, names in documented.items()
+        }
+    else:
+        documented = {
+            address: [table for table in names if table != "PANEL_SERVER"] for address, names in documented.items()
+        }
+
+    def locate(name: str, register):
+        if isinstance(register, Undocumented):
+            return register
+        if not documented.get(register):
+            raise ValueError(f"{name}: register 0x{register:04X} is not in the spreadsheet")
+        return register
+
+    gateways_of = {}
+    resolved = {}
+    for name, register in values.items():
+        variants = {}
+        for gateway in GATEWAYS:
+            register_slave, variant = slave, register
+            for overlay_slave, overlay in GATEWAY_VARIANTS.get(gateway, {}).items():
+                if name in overlay and (overlay_slave == slave or slave == GATEWAY):
+                    register_slave, variant = overlay_slave, overlay[name]
+            if variant is None:
+                continue
+            variant = locate(name, variant)
+            variants[gateway] = (register_slave, variant)
+            if not isinstance(variant, Undocumented):
+                for table in documented[variant]:
+                    gateways_of.setdefault((table, variant), set()).add(gateway)
+        resolved[name] = variants
+    return resolved, gateways_of
+
+
+def value_lines(
+    name: str, variants: dict[str, tuple], tables: dict[str, list[tuple]]
+) -> list[str]:
+    feature_classes = set()
+    for _, register in variants.values():
+        if isinstance(register, Undocumented):
+            continue
+        for table, registers in tables.items():
+            if any(address == register for address, *_ in registers):
+                feature_classes.update(TABLE_FEATURE_CLASSES.get(table, ()))
+    lines = [f"    {name!r}: Value(", f"        {name!r}, {tuple(sorted(feature_classes))!r},"]
+    for gateway, (slave, register) in variants.items():
+        if isinstance(register, Undocumented):
+            gateways = tuple(g for g, (_, r) in variants.items() if r == register)
+            lines.append(
+                f"        {gateway}=Register("
+                f"0x{register.address:04X}, {register.count}, {register.type!r}, {register.unit!r}, False, "
+                f"{register.section!r}, {register.description!r}, {slave!r}, {gateways!r}),"
+            )
+        else:
+            table = next(
+                table for table, registers in tables.items()
+                if any(address == register for address, *_ in registers)
+                and (table == "PANEL_SERVER") == (slave == GATEWAY)
+            )
+            lines.append(f"        {gateway}=REGISTERS[RegisterTable.{table}][0x{register:04X}],")
+    lines.append("    ),")
+    return lines
+
+
+def generate(spreadsheet: Path) -> str:
+    workbook = Workbook(spreadsheet)
+    lines = [HEADER.format(
+        source=spreadsheet.relative_to(ROOT).as_posix(),
+        tables="\n".join(f'    {name} = "{tab}"' for tab, name in TABLES.items()),
+        gateways=GATEWAYS,
+    )]
+
+    tables = {name: read_registers(workbook, tab) for tab, name in TABLES.items()}
+    tag_values, tag_gateways = resolve_values(tables, TAG_VALUES, TAG)
+    gateway_values, gateway_gateways = resolve_values(tables, GATEWAY_VALUES, GATEWAY)
+    gateways_of = {**tag_gateways, **gateway_gateways}
+
+    lines.append("")
+    lines.append("REGISTERS: dict[RegisterTable, dict[int, Register]] = {")
+    for name, registers in tables.items():
+        slave = GATEWAY if name == "PANEL_SERVER" else TAG
+        lines.append(f"    RegisterTable.{name}: _table({slave!r}, {TABLE_FEATURE_CLASSES.get(name, ())!r},")
+        for address, count, type_, unit, writable, section, description in registers:
+            gateways = gateways_of.get((name, address), set()) | {"PANEL_SERVER"}
+            extra = "" if gateways == {"PANEL_SERVER"} else f", {tuple(g for g in GATEWAYS if g in gateways)!r}"
+            lines.append(
+                f"        (0x{address:04X}, {count}, {type_!r}, {unit!r}, {writable}, {section!r}, {description!r}"
+                f"{extra}),"
+            )
+        lines.append("    ),")
+    lines.append("}")
+
+    lines.append("")
+    lines.append("# Values the integration reads, by the name of their accessor")
+    lines.append("VALUES: dict[str, Value] = {")
+    for name, variants in {**gateway_values, **tag_values}.items():
+        lines += value_lines(name, variants, tables)
+    lines.append("}")
+
+    lines.append("")
+    lines.append("# Register table of each feature class")
+    lines.append("FEATURE_CLASS_TABLES: dict[str, RegisterTable] = {")
+    for table, feature_classes in TABLE_FEATURE_CLASSES.items():
+        for feature_class in feature_classes:
+            lines.append(f"    {feature_class!r}: RegisterTable.{table},")
+    lines.append("}")
+
+    lines.append("")
+    lines.append("COMMERCIAL_REFERENCES: dict[str, RegisterTable] = {")
+    for reference, name in read_commercial_references(workbook).items():
+        lines.append(f"    {reference!r}: RegisterTable.{name},")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--spreadsheet", type=Path, default=SPREADSHEET)
+    parser.add_argument("--output", type=Path, default=OUTPUT)
+    args = parser.parse_args()
+
+    args.output.write_text(generate(args.spreadsheet.resolve()), encoding="utf-8")
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,535 @@
+"""Simulated PowerTag gateway speaking Modbus TCP, to exercise SchneiderModbus without hardware.
+
+Emulates the registers read by schneider_modbus.py for a PowerTag Link, Panel Server or Smartlink: the gateway
+identity at slave 255, the synthesis table, the node address table and any number of wireless devices with
+time-varying metering values. Latency, packet loss and invalid values can be injected.
+
+    python tools/simulator.py --gateway "Panel server" --tags 99 --port 5020
+"""
+
+import argparse
+import asyncio
+import logging
+import math
+import random
+import struct
+import sys
+import time
+import types
+from datetime import datetime
+from pathlib import Path
+
+# The modules of the integration are imported without running its __init__, which needs Home Assistant
+_package = sys.modules["powertag_gateway"] = types.ModuleType("powertag_gateway")
+_package.__path__ = [str(Path(__file__).resolve().parent.parent / "custom_components" / "powertag_gateway")]
+
+from powertag_gateway.register_map import COMMERCIAL_REFERENCES, mapped_ranges  # noqa: E402
+from powertag_gateway.schneider_modbus import (  # noqa: E402
+    FIRST_SMARTLINK_TAG_ADDRESS,
+    GATEWAY_SLAVE_ID,
+    SYNTHESIS_TABLE_SLAVE_ID_START,
+    ProductType,
+    TypeOfGateway,
+)
+
+# Wireless devices are numbered from 100, except on the Smartlink which fixes them
+FIRST_TAG_ADDRESS = 100
+
+READ_HOLDING_REGISTERS = 0x03
+WRITE_SINGLE_REGISTER = 0x06
+WRITE_MULTIPLE_REGISTERS = 0x10
+
+ILLEGAL_FUNCTION = 0x01
+ILLEGAL_DATA_ADDRESS = 0x02
+GATEWAY_TARGET_FAILED_TO_RESPOND = 0x0B
+
+INVALID_UINT16 = 0xFFFF
+INVALID_UINT32 = 0x8000_0000
+INVALID_UINT64 = 0x8000_0000_0000_0000
+
+ENVIRONMENT_SENSORS = {
+    "EMS59440": "Temperature sensor",
+    "SED-TRH-G-5045": "Temperature and humidity sensor",
+    "SED-CO2-G-5045": "CO2 sensor",
+}
+
+DEFAULT_PRODUCTS = [
+    "A9MEM1540", "A9MEM1570", "A9MEM1520", "A9MEM1561", "LV434021", "A9MEM1580", "A9MEM1591",
+    "SED-TRH-G-5045", "SED-CO2-G-5045",
+]
+# The Smartlink identifies devices by a type code, which environment sensors don't have
+DEFAULT_SMARTLINK_PRODUCTS = ["A9MEM1540", "A9MEM1570", "A9MEM1520", "A9MEM1561", "LV434021"]
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SimulatedDevice:
+    """Register space of a single slave ID.
+
+    Reads outside the sections are refused like the real gateways do, unwritten registers within them are invalid.
+    """
+
+    def __init__(self, sections: list[tuple[int, int]]):
+        self.sections = sections
+        self.registers: dict[int, int] = {}
+
+    def covers(self, address: int, count: int) -> bool:
+        return any(start <= address and address + count <= start + length for start, length in self.sections)
+
+    def refresh(self, now: float):
+        pass
+
+    def read(self, address: int, count: int) -> list[int] | None:
+        if not self.covers(address, count):
+            return None
+        return [self.registers.get(register, INVALID_UINT16) for register in range(address, address + count)]
+
+    def write(self, address: int, values: list[int]) -> bool:
+        if not self.covers(address, len(values)):
+            return False
+        for offset, value in enumerate(values):
+            self.registers[address + offset] = value
+        return True
+
+    def set_words(self, address: int, words: list[int]):
+        for offset, word in enumerate(words):
+            self.registers[address + offset] = word
+
+    def set_uint16(self, address: int, value: int | None):
+        self.registers[address] = INVALID_UINT16 if value is None else value
+
+    def set_uint32(self, address: int, value: int | None):
+        self.set_words(address, list(struct.unpack(">2H", struct.pack(">I", INVALID_UINT32 if value is None else value))))
+
+    def set_uint64(self, address: int, value: int | None):
+        self.set_words(address, list(struct.unpack(">4H", struct.pack(">Q", INVALID_UINT64 if value is None else value))))
+
+    def get_uint64(self, address: int) -> int:
+        return struct.unpack(">Q", struct.pack(">4H", *self.read(address, 4)))[0]
+
+    def set_float32(self, address: int, value: float | None):
+        self.set_words(address, list(struct.unpack(">2H", struct.pack(">f", math.nan if value is None else value))))
+
+    def set_string(self, address: int, count: int, text: str):
+        raw = text.encode("utf-8")[:count * 2].ljust(count * 2, b"\x00")
+        self.set_words(address, list(struct.unpack(f">{count}H", raw)))
+
+    def set_date_time(self, address: int, value: datetime | None):
+        if value is None:
+            self.set_words(address, [INVALID_UINT16] * 4)
+            return
+        self.set_words(address, [
+            value.year - 2000,
+            value.month << 8 | value.day,
+            value.hour << 8 | value.minute,
+            value.second * 1000 + value.microsecond // 1000,
+        ])
+
+
+class SimulatedGatewayDevice(SimulatedDevice):
+    """The gateway itself at slave ID 255, including the node address table of the Panel Server."""
+
+    def __init__(self, type_of_gateway: TypeOfGateway, tag_addresses: list[int]):
+        super().__init__([(0x0000, 0x0400), (0x1605, 32), (0xF002, 17)])
+        serial = "SIM" + {
+            TypeOfGateway.PANEL_SERVER: "PAS",
+            TypeOfGateway.POWERTAG_LINK: "LNK",
+            TypeOfGateway.SMARTLINK: "SMT",
+        }[type_of_gateway] + "0001"
+
+        self.set_string(0x0064, 6, serial)
+        self.set_uint16(0x0070, 0b0010)  # Operating
+        if type_of_gateway is TypeOfGateway.SMARTLINK:
+            self.set_string(0x006A, 3, "002")
+            self.set_string(0x006D, 3, "004")
+        else:
+            self.set_string(0x0050, 6, "002.000")
+            self.set_string(0x0078, 6, "004.012.000")
+
+        if type_of_gateway is TypeOfGateway.PANEL_SERVER:
+            self.set_uint16(0x009E, 0)  # Nominal
+            self.set_uint16(0xF002, 17350)
+            self.set_string(0x009F, 16, "Schneider Electric")
+            self.set_string(0x003C, 16, "PAS600")
+            self.set_string(0x000A, 16, "EcoStruxure Panel Server")
+            self.set_string(0xF003, 16, "Panel Server Universal")
+            self.set_string(0x1605, 32, "Simulated Panel Server")
+            self.set_string(0x002A, 17, "www.se.com")
+            for node_index, tag_address in enumerate(tag_addresses):
+                self.set_uint16(0x01F8 + node_index * 5, tag_address)
+
+    def refresh(self, now: float):
+        self.set_date_time(0x0073, datetime.fromtimestamp(now))
+
+
+class SimulatedSynthesisTable(SimulatedDevice):
+    """Synthesis table of the PowerTag Link, listing the nodes in its node address table."""
+
+    def __init__(self, tag_addresses: list[int]):
+        super().__init__([(0x0000, 0x0190)])
+        self.set_uint16(0x0001, 17200)
+        self.set_string(0x0002, 16, "Schneider Electric")
+        self.set_string(0x0012, 16, "A9XMWD20")
+        self.set_string(0x0022, 8, "Acti9")
+        self.set_string(0x002A, 8, "PowerTag Link")
+        self.set_string(0x0032, 10, "Simulated Link")
+        self.set_string(0x003C, 17, "www.se.com")
+        for node_index, tag_address in enumerate(tag_addresses):
+            self.set_uint16(0x012C + node_index, tag_address)
+
+
+class SimulatedTag(SimulatedDevice):
+    """A wireless device with metering values that vary over time."""
+
+    def __init__(self, modbus_address: int, commercial_reference: str, node_index: int,
+                 type_of_gateway: TypeOfGateway, invalid_rate: float, rng: random.Random):
+        table = COMMERCIAL_REFERENCES.get(commercial_reference)
+        super().__init__([(start, end - start) for start, end in mapped_ranges(table)] if table else [])
+        self.commercial_reference = commercial_reference
+        self.type_of_gateway = type_of_gateway
+        self.invalid_rate = invalid_rate
+        self.rng = rng
+        self.last_refresh = None
+
+        product_type = ProductType.__members__.get(commercial_reference)
+        description = product_type.value[2] if product_type else ENVIRONMENT_SENSORS[commercial_reference]
+        self.is_environment_sensor = commercial_reference in ENVIRONMENT_SENSORS
+        self.has_co2 = commercial_reference == "SED-CO2-G-5045"
+        self.has_humidity = commercial_reference != "EMS59440"
+        self.is_three_phase = "3P" in description or commercial_reference.startswith(("LV4340", "A9MEM159"))
+        self.has_neutral = "+N" in description or commercial_reference in ["LV434021", "LV434023"]
+        self.phases = [0, 2, 4] if self.is_three_phase else [0]
+
+        self.rated_current = 630 if commercial_reference.startswith("LV4340") else 63
+        self.base_current = rng.uniform(0.05, 0.6) * self.rated_current
+        self.power_factor = rng.uniform(0.85, 0.99)
+        self.period = rng.uniform(30, 300)
+        self.offset = rng.uniform(0, 2 * math.pi)
+
+        self.set_string(0x7918, 10, f"Circuit {node_index}")
+        self.set_string(0x7922, 3, f"Q{node_index}")
+        self.set_uint16(0x7925, 7)  # Lighting
+        self.set_uint16(0x7926, 4 if self.is_three_phase else 1)  # ABC or A
+        self.set_uint16(0x7927, 1)
+        self.set_uint16(0x7928, 0)
+        self.set_uint16(0x7929, self.rated_current)
+        self.set_uint16(0x792A, 11 if self.has_neutral else 3)
+        self.set_float32(0x792B, 230.0)
+        self.set_uint16(0x792E, 0)
+        self.set_uint16(0x792F, 0)
+        self.set_uint16(0x7930, product_type.value[0] if product_type else None)
+        self.set_uint16(0x7931, modbus_address)
+        self.set_uint64(0x7932, 0x0004_A300_0000_0000 + modbus_address)
+        self.set_uint16(0x7937, product_type.value[1] if product_type else None)
+        self.set_string(0x7944, 16, "Schneider Electric")
+        self.set_string(0x7954, 16, commercial_reference)
+        self.set_string(0x7964, 6, "001.005.008")
+        self.set_string(0x796A, 6, "000.000.003")
+        self.set_string(0x7970, 10, f"SIM{modbus_address:07d}")
+        self.set_string(0x797A, 8, "Acti9")
+        self.set_string(0x7982, 8, description[:16])
+        self.set_string(0x798A, 8, "PowerTag" if not self.is_environment_sensor else "Sensor")
+        self.set_uint16(0x79A8, 1)
+        self.set_uint16(0x79A9, 1)
+
+        self.set_uint32(0x0CE1, 0b1)
+        self.set_uint32(0x0CE3, 0)
+        self.set_uint32(0x0CEB, 0)
+        self.set_float32(0x0CED, 10.0)
+        self.set_date_time(0x0CEF, datetime(2024, 1, 1))
+        self.set_float32(0x0CF3, 3.0)
+        for energy_address in self.energy_addresses():
+            self.set_uint64(energy_address, rng.randint(0, 10_000_000))
+
+    def covers(self, address: int, count: int) -> bool:
+        # Registers the documentation doesn't list for this device are refused, unless the simulation has them
+        return super().covers(address, count) or all(
+            SimulatedDevice.covers(self, register, 1) or register in self.registers
+            for register in range(address, address + count)
+        )
+
+    def energy_addresses(self) -> list[int]:
+        if self.is_environment_sensor:
+            return []
+        addresses = [0x0000, 0x0C83, 0x0C87, 0x0C8B, 0x0CB7, 0x0CC7, 0x0CCF, 0x0CD7]
+        if self.type_of_gateway is not TypeOfGateway.SMARTLINK:
+            addresses += [0x1390, 0x1394, 0x1398, 0x139C, 0x1438, 0x143C, 0x1448, 0x144C, 0x1488, 0x14F4, 0x14F8]
+            for phase in self.phases:
+                for base in [0x13B8, 0x13BC, 0x13C0, 0x13C4, 0x1470, 0x1474, 0x1478, 0x147C, 0x150C, 0x1510]:
+                    addresses.append(base + phase * 0x14)
+        return addresses
+
+    def value(self, value: float) -> float | None:
+        return None if self.rng.random() < self.invalid_rate else value
+
+    def refresh(self, now: float):
+        elapsed = now - self.last_refresh if self.last_refresh is not None else 0.0
+        self.last_refresh = now
+        wave = math.sin(2 * math.pi * now / self.period + self.offset)
+
+        self.set_float32(0x0C3B, self.value(30 + 5 * wave))
+        self.set_uint16(0x79B3, 200 + int(20 * wave))
+        self.set_uint16(0x79B8, 190 + int(20 * wave))
+        self.set_float32(0x79AF, self.value(abs(wave)))
+        self.set_float32(0x79B1, self.value(-60 + 5 * wave))
+        self.set_float32(0x79B4, self.value(abs(wave) / 2))
+        self.set_float32(0x79B6, self.value(-62 + 5 * wave))
+
+        if self.is_environment_sensor:
+            self.set_float32(0x0FA0, self.value(21 + 2 * wave))
+            self.set_float32(0x0FA2, 25.0)
+            self.set_float32(0x0FA4, 17.0)
+            if self.has_humidity:
+                self.set_float32(0x0FA6, self.value(0.45 + 0.05 * wave))
+                self.set_float32(0x0FA8, 0.6)
+                self.set_float32(0x0FAA, 0.3)
+            if self.has_co2:
+                self.set_float32(0x0FAE, self.value(600 + 150 * wave))
+            return
+
+        voltage = 230 + 2 * wave
+        sin_phi = math.sqrt(1 - self.power_factor ** 2)
+        power_total = 0.0
+        for phase in self.phases:
+            current = self.base_current * (1 + 0.2 * math.sin(2 * math.pi * now / self.period + self.offset + phase))
+            active = voltage * current * self.power_factor
+            power_total += active
+            self.set_float32(0x0BB7 + phase, self.value(current))
+            self.set_float32(0x0BED + phase, self.value(active))
+            self.set_float32(0x0BF5 + phase, self.value(voltage * current * sin_phi))
+            self.set_float32(0x0BFD + phase, self.value(voltage * current))
+            self.set_float32(0x0C05 + phase, self.value(self.power_factor))
+            self.set_float32(0x0CE5 + phase, self.value(0.0))
+            self.set_float32(0x0BCB + 8 + phase, self.value(voltage))
+            if self.is_three_phase:
+                self.set_float32(0x0BCB + phase, self.value(voltage * math.sqrt(3)))
+
+        if self.has_neutral:
+            self.set_float32(0x0BBD, self.value(0.1 * self.base_current))
+        self.set_float32(0x0BF3, self.value(power_total))
+        self.set_float32(0x0BFB, self.value(power_total * sin_phi / self.power_factor))
+        self.set_float32(0x0C03, self.value(power_total / self.power_factor))
+        self.set_float32(0x0C0B, self.value(self.power_factor))
+        self.set_uint16(0x0C0D, 0)
+        self.set_float32(0x0C25, self.value(50 + 0.05 * wave))
+        self.set_float32(0x0EB5, self.value(power_total))
+        self.set_float32(0x0EB9, self.value(power_total * 1.2))
+        self.set_date_time(0x0EBB, datetime.fromtimestamp(now - 3600))
+
+        high_load = self.base_current * 1.1 > 0.5 * self.rated_current
+        self.set_uint32(0x0CE3, 0b1 << 12 if high_load else 0)
+
+        energy = round(power_total * elapsed / 3600)
+        if energy:
+            for energy_address in self.energy_addresses():
+                self.set_uint64(energy_address, self.get_uint64(energy_address) + energy)
+
+
+class SimulatorStats:
+    def __init__(self):
+        self.requests = 0
+        self.responses = 0
+        self.dropped = 0
+        self.exceptions = 0
+        self.registers_read = 0
+        self.bytes_received = 0
+        self.bytes_sent = 0
+        self.connections = 0
+
+    def as_dict(self) -> dict:
+        return dict(vars(self))
+
+
+class GatewaySimulator:
+    """Modbus TCP server emulating a gateway with its wireless devices."""
+
+    def __init__(
+        self,
+        type_of_gateway: TypeOfGateway = TypeOfGateway.PANEL_SERVER,
+        products: list[str] | None = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        loss_rate: float = 0.0,
+        invalid_rate: float = 0.0,
+        max_concurrent_requests: int = 1,
+        pipelining: bool = True,
+        synthetic_slave_id: int = SYNTHESIS_TABLE_SLAVE_ID_START,
+        seed: int | None = None,
+    ):
+        self.type_of_gateway = type_of_gateway
+        self.latency = latency
+        self.jitter = jitter
+        self.loss_rate = loss_rate
+        # Modbus addresses of tags that are switched off or out of range, which the gateway never answers for
+        self.offline_tags: set[int] = set()
+        self.stats = SimulatorStats()
+        self._rng = random.Random(seed)
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
+        self.pipelining = pipelining
+        self._server: asyncio.Server | None = None
+        self._connections: dict[asyncio.StreamWriter, asyncio.Task] = {}
+
+        if products is None:
+            products = DEFAULT_SMARTLINK_PRODUCTS if type_of_gateway is TypeOfGateway.SMARTLINK else DEFAULT_PRODUCTS
+
+        first_address = FIRST_SMARTLINK_TAG_ADDRESS if type_of_gateway is TypeOfGateway.SMARTLINK else FIRST_TAG_ADDRESS
+        tag_addresses = [first_address + i for i in range(len(products))]
+        self.devices: dict[int, SimulatedDevice] = {
+            GATEWAY_SLAVE_ID: SimulatedGatewayDevice(type_of_gateway, tag_addresses)
+        }
+        if type_of_gateway is TypeOfGateway.POWERTAG_LINK:
+            self.devices[synthetic_slave_id] = SimulatedSynthesisTable(tag_addresses)
+        for node_index, (tag_address, product) in enumerate(zip(tag_addresses, products), start=1):
+            self.devices[tag_address] = SimulatedTag(
+                tag_address, product, node_index, type_of_gateway, invalid_rate, self._rng
+            )
+
+    @classmethod
+    def with_tag_count(cls, tag_count: int, type_of_gateway: TypeOfGateway = TypeOfGateway.PANEL_SERVER,
+                       products: list[str] | None = None, **kwargs):
+        """Simulates tag_count wireless devices, cycling through the given commercial references."""
+        if products is None:
+            products = DEFAULT_SMARTLINK_PRODUCTS if type_of_gateway is TypeOfGateway.SMARTLINK else DEFAULT_PRODUCTS
+        return cls(type_of_gateway, [products[i % len(products)] for i in range(tag_count)], **kwargs)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Starts listening and returns the port, which is picked at random when 0."""
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._connections):
+                writer.close()
+            await asyncio.gather(*self._connections.values(), return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.stats.connections += 1
+        self._connections[writer] = asyncio.current_task()
+        pending = set()
+        try:
+            while True:
+                header = await reader.readexactly(7)
+                transaction_id, _, length, unit_id = struct.unpack(">HHHB", header)
+                pdu = await reader.readexactly(length - 1)
+                self.stats.requests += 1
+                self.stats.bytes_received += len(header) + len(pdu)
+
+                if pending and not self.pipelining:
+                    # Like gateways that only handle one request per connection at a time
+                    self.stats.dropped += 1
+                    continue
+
+                # Requests are handled as they arrive, so pipelined requests overlap up to max_concurrent_requests
+                task = asyncio.ensure_future(self._respond(writer, transaction_id, unit_id, pdu))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            for task in pending:
+                task.cancel()
+            self._connections.pop(writer, None)
+            writer.close()
+
+    async def _respond(self, writer: asyncio.StreamWriter, transaction_id: int, unit_id: int, pdu: bytes):
+        async with self._semaphore:
+            delay = self.latency + self._rng.uniform(0, self.jitter)
+            if delay:
+                await asyncio.sleep(delay)
+            if self._rng.random() < self.loss_rate or unit_id in self.offline_tags:
+                self.stats.dropped += 1
+                return
+            response = self.handle_pdu(unit_id, pdu)
+
+        frame = struct.pack(">HHHB", transaction_id, 0, len(response) + 1, unit_id) + response
+        self.stats.responses += 1
+        self.stats.bytes_sent += len(frame)
+        writer.write(frame)
+
+    def handle_pdu(self, unit_id: int, pdu: bytes) -> bytes:
+        function_code = pdu[0]
+        device = self.devices.get(unit_id)
+        if device is None:
+            return self._exception(function_code, GATEWAY_TARGET_FAILED_TO_RESPOND)
+
+        if function_code == READ_HOLDING_REGISTERS:
+            address, count = struct.unpack(">HH", pdu[1:5])
+            device.refresh(time.time())
+            registers = device.read(address, count)
+            if registers is None:
+                return self._exception(function_code, ILLEGAL_DATA_ADDRESS)
+            self.stats.registers_read += count
+            return struct.pack(f">BB{count}H", function_code, count * 2, *registers)
+
+        if function_code == WRITE_SINGLE_REGISTER:
+            address, value = struct.unpack(">HH", pdu[1:5])
+            if not device.write(address, [value]):
+                return self._exception(function_code, ILLEGAL_DATA_ADDRESS)
+            return pdu[:5]
+
+        if function_code == WRITE_MULTIPLE_REGISTERS:
+            address, count, _ = struct.unpack(">HHB", pdu[1:6])
+            values = list(struct.unpack(f">{count}H", pdu[6:6 + count * 2]))
+            if not device.write(address, values):
+                return self._exception(function_code, ILLEGAL_DATA_ADDRESS)
+            return pdu[:5]
+
+        return self._exception(function_code, ILLEGAL_FUNCTION)
+
+    def _exception(self, function_code: int, exception_code: int) -> bytes:
+        self.stats.exceptions += 1
+        return struct.pack(">BB", function_code | 0x80, exception_code)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--gateway", choices=[t.value for t in TypeOfGateway], default=TypeOfGateway.PANEL_SERVER.value)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5020)
+    parser.add_argument("--tags", type=int, default=len(DEFAULT_PRODUCTS), help="number of wireless devices")
+    parser.add_argument("--products", help="comma separated commercial references to cycle through")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds before each response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra seconds before each response")
+    parser.add_argument("--loss", type=float, default=0.0, help="fraction of requests that get no response")
+    parser.add_argument("--invalid", type=float, default=0.0, help="fraction of metering values that read invalid")
+    parser.add_argument("--offline", type=int, default=0, help="number of devices, from the last, that never answer")
+    parser.add_argument("--max-concurrent", type=int, default=1, help="requests the gateway handles at once")
+    parser.add_argument("--no-pipelining", action="store_true",
+                        help="drop requests that arrive while another one on the same connection is pending")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    type_of_gateway = [t for t in TypeOfGateway if t.value == args.gateway][0]
+    simulator = GatewaySimulator.with_tag_count(
+        args.tags,
+        type_of_gateway,
+        args.products.split(",") if args.products else None,
+        latency=args.latency,
+        jitter=args.jitter,
+        loss_rate=args.loss,
+        invalid_rate=args.invalid,
+        max_concurrent_requests=args.max_concurrent,
+        pipelining=not args.no_pipelining,
+        seed=args.seed,
+    )
+    tag_addresses = sorted(address for address, device in simulator.devices.items() if isinstance(device, SimulatedTag))
+    simulator.offline_tags.update(tag_addresses[len(tag_addresses) - args.offline:] if args.offline else [])
+    port = await simulator.start(args.host, args.port)
+    _LOGGER.info(f"Simulating a {type_of_gateway.value} with {args.tags} devices on {args.host}:{port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await simulator.stop()
+        _LOGGER.info(f"Served {simulator.stats.as_dict()}")
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass